@@ -425,6 +425,30 @@ class TestArc2D(unittest.TestCase):
         expected_end = Point2D(0, 1)
         self.assertAlmostEqual(arc.ep.x, expected_end.x)
         self.assertAlmostEqual(arc.ep.y, expected_end.y)
+
+    def test_contains_angle(self):
+        arc = Arc2D(Point2D(0, 0), Point2D(1, 0), Point2D(0, 1))
+        self.assertTrue(arc.contains_angle(radians(45)))
+        self.assertFalse(arc.contains_angle(radians(135)))
+
+    def test_bounding_box_includes_quadrant_extremes(self):
+        arc = Arc2D(Point2D(0, 0), Point2D(1, 0), Point2D(-1, 0.0))
+        min_x, min_y, max_x, max_y = arc.bounding_box()
+        self.assertAlmostEqual(min_x, -1)
+        self.assertAlmostEqual(min_y, 0)
+        self.assertAlmostEqual(max_x, 1)
+        self.assertAlmostEqual(max_y, 1)
+
+    def test_reverse(self):
+        sp, ep = Point2D(1, 0), Point2D(0, 1)
+        arc = Arc2D(Point2D(0, 0), sp, ep)
+        length, clockwise = arc.arc_length(), arc.is_clockwise()
+        self.assertIs(arc.reverse(), arc)
+        self.assertIs(arc.sp, ep)
+        self.assertIs(arc.ep, sp)
+        self.assertAlmostEqual(arc.arc_length(), length)
+        self.assertNotEqual(arc.is_clockwise(), clockwise)
+        self.assertEqual(arc.bounding_box(), Arc2D(Point2D(0, 0), sp, ep).bounding_box())
 if __name__ == "__main__":
     unittest.main()
     
\ No newline at end of file
@@ -0,0 +1,2 @@
+from .arcfit import PolylineCompressor, compress_polyline
+__all__ = ['PolylineCompressor', 'compress_polyline']
@@ -0,0 +1,327 @@
+"""
+Compression of dense polylines into lines, arcs and biarcs.
+
+A PolylineCompressor consumes polyline vertices as they arrive and emits
+Line2D and Arc2D pieces that stay within a deviation bound of every vertex
+they replace.  From the current anchor vertex it searches for the farthest
+vertex that can be reached by a single piece, either
+
+1. a line from the anchor to that vertex, or
+2. the arc through the anchor, the middle vertex of the run and that vertex,
+
+then for the farthest vertex reached by a biarc: two arcs meeting with a
+common tangent, leaving the anchor along the direction in which the
+previous piece ended (so the pieces join with tangent continuity) and
+arriving along the local direction of the polyline.  The biarc is used when
+it replaces at least twice as many vertices as the single piece.
+
+The candidate end vertex grows by doubling and is then refined by
+bisection, so a run of k vertices costs O(k log k).  At most `window`
+vertices are buffered, which bounds both the memory and the length of a
+single piece.
+
+Arc2D sweeps from its start angle to its end angle without crossing angle
+zero, so arcs that would cross the positive x direction of their center are
+not emitted; the run is split there instead.
+"""
+from math import atan2, hypot, pi, sqrt
+from typing import Iterable, Iterator, Optional, Sequence
+
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+
+# Arcs larger than this multiple of the run's chord are treated as lines.
+_MAX_RADIUS_RATIO = 1e6
+
+
+def _angle(x: float, y: float) -> float:
+    angle = atan2(y, x)
+    return angle + 2 * pi if angle < 0 else angle
+
+
+class _Arc:
+    """Circular piece from (sx, sy) to (ex, ey) around (cx, cy), sweeping between its angles without crossing 0."""
+
+    def __init__(self, cx: float, cy: float, sx: float, sy: float, ex: float, ey: float):
+        self.cx, self.cy = cx, cy
+        self.sx, self.sy, self.ex, self.ey = sx, sy, ex, ey
+        self.radius = hypot(sx - cx, sy - cy)
+        start, end = _angle(sx - cx, sy - cy), _angle(ex - cx, ey - cy)
+        self.low, self.high = min(start, end), max(start, end)
+        self.counterclockwise = end > start
+
+    def contains_angle(self, angle: float) -> bool:
+        return self.low <= angle <= self.high
+
+    def distance(self, x: float, y: float) -> float:
+        if self.contains_angle(_angle(x - self.cx, y - self.cy)):
+            return abs(hypot(x - self.cx, y - self.cy) - self.radius)
+        return min(hypot(x - self.sx, y - self.sy), hypot(x - self.ex, y - self.ey))
+
+    def end_tangent(self) -> tuple[float, float]:
+        rx, ry = (self.ex - self.cx) / self.radius, (self.ey - self.cy) / self.radius
+        return (-ry, rx) if self.counterclockwise else (ry, -rx)
+
+
+def _segment_distance(px: float, py: float, x0: float, y0: float, x1: float, y1: float) -> float:
+    dx, dy = x1 - x0, y1 - y0
+    length2 = dx * dx + dy * dy
+    t = 0.0 if length2 == 0 else max(0.0, min(1.0, ((px - x0) * dx + (py - y0) * dy) / length2))
+    return hypot(x0 + t * dx - px, y0 + t * dy - py)
+
+
+def _tangent_arc(px: float, py: float, tx: float, ty: float, qx: float, qy: float) -> Optional[_Arc]:
+    # Arc leaving p along t and reaching q; None when q lies on the tangent line.
+    nx, ny = -ty, tx
+    vx, vy = qx - px, qy - py
+    along = nx * vx + ny * vy
+    chord2 = vx * vx + vy * vy
+    if abs(along) <= 1e-12 * sqrt(chord2):
+        return None
+    s = chord2 / (2 * along)
+    arc = _Arc(px + s * nx, py + s * ny, px, py, qx, qy)
+    # The arc turns left when the center lies on the left of t; otherwise it would cross angle zero.
+    return arc if arc.counterclockwise == (along > 0) else None
+
+
+class PolylineCompressor:
+    def __init__(self, tolerance: int | float, biarcs: bool = True, window: int = 4096):
+        """
+        Initialize a streaming polyline compressor.
+        :param tolerance: Largest distance allowed between a replaced vertex and the emitted pieces.
+        :param biarcs: Also try biarcs, used when they reach twice as far as a single piece.
+        :param window: Largest number of vertices buffered (and replaced by one line, arc or biarc).
+        """
+        if not isinstance(tolerance, (int, float)):
+            raise TypeError("Tolerance must be a numeric value.")
+        if tolerance <= 0:
+            raise ValueError("Tolerance must be positive.")
+        if window < 3:
+            raise ValueError("Window must hold at least 3 vertices.")
+        self.tolerance = tolerance
+        self.biarcs = biarcs
+        self.window = window
+        self.xs = []
+        self.ys = []
+        self._anchor = None
+        self._tangent = None
+        self.vertex_count = 0
+        self.piece_count = 0
+
+    def push(self, x: int | float, y: int | float) -> list[Line2D | Arc2D]:
+        """
+        Add a vertex.
+        :param x: X-coordinate.
+        :param y: Y-coordinate.
+        :return: Pieces completed by this vertex (often none).
+        """
+        if self.xs and x == self.xs[-1] and y == self.ys[-1]:
+            return []
+        self.xs.append(x)
+        self.ys.append(y)
+        self.vertex_count += 1
+        pieces = []
+        while len(self.xs) > self.window:
+            pieces.extend(self._emit())
+        return pieces
+
+    def extend(self, coords: Sequence[float]) -> list[Line2D | Arc2D]:
+        """
+        Add vertices from a flat buffer [x, y, x, y, ...].
+        :param coords: Point buffer.
+        :return: Pieces completed by these vertices.
+        """
+        if len(coords) % 2 != 0:
+            raise ValueError("Buffer length must be a multiple of 2.")
+        pieces = []
+        for k in range(0, len(coords), 2):
+            pieces.extend(self.push(coords[k], coords[k + 1]))
+        return pieces
+
+    def finish(self) -> list[Line2D | Arc2D]:
+        """
+        Emit the pieces covering the buffered vertices and reset the compressor for a new polyline.
+        :return: The remaining pieces.
+        """
+        pieces = []
+        while len(self.xs) > 1:
+            pieces.extend(self._emit())
+        self.xs, self.ys = [], []
+        self._anchor, self._tangent = None, None
+        return pieces
+
+    def _point(self, index: int) -> Point2D:
+        if index == 0 and self._anchor is not None:
+            return self._anchor
+        return Point2D(self.xs[index], self.ys[index])
+
+    def _search(self, fit, good: int) -> tuple[int, Optional[tuple]]:
+        # Farthest end vertex accepted by fit: doubling from good, then bisection.
+        last = len(self.xs) - 1
+        found = None
+        probe = max(2, 2 * good)
+        bad = None
+        while good < last:
+            probe = min(probe, last)
+            candidate = fit(probe)
+            if candidate is None:
+                bad = probe
+                break
+            good, found = probe, candidate
+            probe = 2 * probe
+        if bad is not None:
+            while bad - good > 1:
+                middle = (good + bad) // 2
+                candidate = fit(middle)
+                if candidate is None:
+                    bad = middle
+                else:
+                    good, found = middle, candidate
+        return good, found
+
+    def _emit(self) -> list[Line2D | Arc2D]:
+        good, fit = self._search(self._fit, 1)
+        fit = fit or ('line',)
+        if self.biarcs and self._tangent is not None:
+            # A biarc costs two pieces, so it must reach at least twice as far as a single piece.
+            reach, biarc = self._search(self._fit_biarc, 2 * good - 1)
+            if biarc is not None and reach >= 2 * good:
+                good, fit = reach, biarc
+        pieces = self._build(good, fit)
+        del self.xs[:good]
+        del self.ys[:good]
+        self.piece_count += len(pieces)
+        return pieces
+
+    def _fit(self, end: int) -> Optional[tuple]:
+        if self._line_fits(end):
+            return ('line',)
+        arc = self._three_point_arc(end)
+        if arc is not None and self._fits(end, (arc,)):
+            return ('arc', arc)
+        return None
+
+    def _fit_biarc(self, end: int) -> Optional[tuple]:
+        pieces = self._biarc(end)
+        if pieces is not None and self._fits(end, pieces):
+            return ('biarc',) + pieces
+        return None
+
+    def _line_fits(self, end: int) -> bool:
+        xs, ys, tolerance = self.xs, self.ys, self.tolerance
+        x0, y0, x1, y1 = xs[0], ys[0], xs[end], ys[end]
+        if x0 == x1 and y0 == y1:
+            # A closed loop within tolerance would give a line of zero length and no direction.
+            return False
+        return all(_segment_distance(xs[k], ys[k], x0, y0, x1, y1) <= tolerance for k in range(1, end))
+
+    def _fits(self, end: int, pieces: tuple) -> bool:
+        xs, ys, tolerance = self.xs, self.ys, self.tolerance
+        for k in range(1, end):
+            x, y = xs[k], ys[k]
+            if min(piece.distance(x, y) for piece in pieces) > tolerance:
+                return False
+        return True
+
+    def _three_point_arc(self, end: int) -> Optional[_Arc]:
+        xs, ys = self.xs, self.ys
+        middle = end // 2
+        ax, ay, mx, my, bx, by = xs[0], ys[0], xs[middle], ys[middle], xs[end], ys[end]
+        d = 2 * ((mx - ax) * (by - ay) - (my - ay) * (bx - ax))
+        chord = hypot(bx - ax, by - ay)
+        if d == 0:
+            return None
+        m2 = (mx - ax) ** 2 + (my - ay) ** 2
+        b2 = (bx - ax) ** 2 + (by - ay) ** 2
+        cx = ax + ((by - ay) * m2 - (my - ay) * b2) / d
+        cy = ay + ((mx - ax) * b2 - (bx - ax) * m2) / d
+        arc = _Arc(cx, cy, ax, ay, bx, by)
+        if arc.radius > _MAX_RADIUS_RATIO * chord or not arc.contains_angle(_angle(mx - cx, my - cy)):
+            return None
+        return arc
+
+    def _end_tangent(self, end: int) -> Optional[tuple[float, float]]:
+        xs, ys = self.xs, self.ys
+        after = min(end + 1, len(xs) - 1)
+        dx, dy = xs[after] - xs[end - 1], ys[after] - ys[end - 1]
+        length = hypot(dx, dy)
+        return None if length == 0 else (dx / length, dy / length)
+
+    def _biarc(self, end: int) -> Optional[tuple]:
+        xs, ys = self.xs, self.ys
+        t0 = self._tangent
+        t1 = self._end_tangent(end)
+        if t0 is None or t1 is None:
+            return None
+        (ax, ay), (bx, by) = (xs[0], ys[0]), (xs[end], ys[end])
+        vx, vy = bx - ax, by - ay
+        vv = vx * vx + vy * vy
+        cosine = t0[0] * t1[0] + t0[1] * t1[1]
+        vt = vx * (t0[0] + t1[0]) + vy * (t0[1] + t1[1])
+        if 1 - cosine <= 1e-12:
+            along = vx * t1[0] + vy * t1[1]
+            if along <= 0:
+                return None
+            d = vv / (4 * along)
+        else:
+            d = (-vt + sqrt(vt * vt + 2 * (1 - cosine) * vv)) / (2 * (1 - cosine))
+        if d <= 0:
+            return None
+        jx = (ax + d * t0[0] + bx - d * t1[0]) / 2
+        jy = (ay + d * t0[1] + by - d * t1[1]) / 2
+        first = _tangent_arc(ax, ay, t0[0], t0[1], jx, jy)
+        # The second arc is built backwards from b along -t1.
+        second = _tangent_arc(bx, by, -t1[0], -t1[1], jx, jy)
+        if first is None or second is None:
+            return None
+        chord = sqrt(vv)
+        if max(first.radius, second.radius) > _MAX_RADIUS_RATIO * chord:
+            return None
+        return first, _Arc(second.cx, second.cy, jx, jy, bx, by)
+
+    def _build(self, end: int, fit: tuple) -> list[Line2D | Arc2D]:
+        start = self._point(0)
+        finish = Point2D(self.xs[end], self.ys[end])
+        if fit[0] == 'line':
+            dx, dy = finish.x - start.x, finish.y - start.y
+            length = hypot(dx, dy)
+            self._tangent = (dx / length, dy / length)
+            pieces = [Line2D(start, finish)]
+        elif fit[0] == 'arc':
+            arc = fit[1]
+            self._tangent = arc.end_tangent()
+            pieces = [Arc2D(Point2D(arc.cx, arc.cy), start, finish)]
+        else:
+            first, second = fit[1], fit[2]
+            joint = Point2D(first.ex, first.ey)
+            self._tangent = second.end_tangent()
+            pieces = [Arc2D(Point2D(first.cx, first.cy), start, joint),
+                      Arc2D(Point2D(second.cx, second.cy), joint, finish)]
+        self._anchor = finish
+        return pieces
+
+
+def compress_polyline(coords: Sequence[float] | Iterable[Point2D], tolerance: int | float, biarcs: bool = True,
+                      window: int = 4096) -> Iterator[Line2D | Arc2D]:
+    """
+    Replace the vertices of a polyline by lines, arcs and biarcs within a tolerance.
+    Consecutive pieces share their end points.
+    :param coords: Flat point buffer [x, y, x, y, ...] or iterable of Point2D vertices.
+    :param tolerance: Largest distance allowed between a vertex and the emitted pieces.
+    :param biarcs: Also try biarcs, used when they reach twice as far as a single piece.
+    :param window: Largest number of vertices replaced by one piece.
+    :return: Iterator over the emitted Line2D and Arc2D pieces, produced as the input is consumed.
+    """
+    compressor = PolylineCompressor(tolerance, biarcs, window)
+    iterator = iter(coords)
+    for value in iterator:
+        if isinstance(value, Point2D):
+            pieces = compressor.push(value.x, value.y)
+        else:
+            y = next(iterator, None)
+            if y is None:
+                raise ValueError("Buffer length must be a multiple of 2.")
+            pieces = compressor.push(value, y)
+        yield from pieces
+    yield from compressor.finish()
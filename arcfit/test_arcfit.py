@@ -0,0 +1,110 @@
+import unittest
+from math import atan2, cos, hypot, pi, sin, sqrt
+
+from .arcfit import PolylineCompressor, compress_polyline
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+
+
+def _distance(piece, x, y):
+    if isinstance(piece, Line2D):
+        (x0, y0), (x1, y1) = (piece.sp.x, piece.sp.y), (piece.ep.x, piece.ep.y)
+        dx, dy = x1 - x0, y1 - y0
+        t = max(0.0, min(1.0, ((x - x0) * dx + (y - y0) * dy) / (dx * dx + dy * dy)))
+        return hypot(x0 + t * dx - x, y0 + t * dy - y)
+    angle = atan2(y - piece.cp.y, x - piece.cp.x) % (2 * pi)
+    if piece.contains_angle(angle):
+        return abs(hypot(x - piece.cp.x, y - piece.cp.y) - piece.radius_cp_sp())
+    return min(hypot(x - p.x, y - p.y) for p in (piece.sp, piece.ep))
+
+
+def _wave(n):
+    coords = []
+    for k in range(n):
+        t = k * 0.01
+        coords += [t, sin(t) + 0.3 * sin(3 * t)]
+    return coords
+
+
+class TestArcFit(unittest.TestCase):
+    def test_collinear_points_become_one_line(self):
+        pieces = list(compress_polyline([0, 0, 1, 1, 2, 2, 3, 3, 3, 3, 4, 4], 1e-6))
+        self.assertEqual(pieces, [Line2D(0, 0, 4, 4)])
+
+    def test_points_on_arc_become_one_arc(self):
+        coords = [v for k in range(50) for v in (2 + 5 * cos(0.2 + 0.02 * k), 1 + 5 * sin(0.2 + 0.02 * k))]
+        pieces = list(compress_polyline(coords, 1e-6))
+        self.assertEqual(len(pieces), 1)
+        self.assertIsInstance(pieces[0], Arc2D)
+        self.assertAlmostEqual(pieces[0].cp.x, 2)
+        self.assertAlmostEqual(pieces[0].cp.y, 1)
+        self.assertAlmostEqual(pieces[0].radius_cp_sp(), 5)
+        self.assertTrue(pieces[0].is_counter_clockwise())
+
+    def test_every_vertex_within_tolerance(self):
+        coords = _wave(600)
+        pieces = list(compress_polyline(coords, 1e-3))
+        self.assertLess(len(pieces), 60)
+        for k in range(0, len(coords), 2):
+            self.assertLessEqual(min(_distance(p, coords[k], coords[k + 1]) for p in pieces), 1e-3 + 1e-12)
+        for a, b in zip(pieces, pieces[1:]):
+            self.assertIs(a.ep, b.sp)
+
+    def test_full_circle_does_not_cross_angle_zero(self):
+        points = [Point2D(3 * cos(2 * pi * k / 400), 3 * sin(2 * pi * k / 400)) for k in range(1, 400)]
+        pieces = list(compress_polyline(points, 1e-4))
+        self.assertLess(len(pieces), 6)
+        total = sum(p.arc_length() if isinstance(p, Arc2D) else p.length() for p in pieces)
+        self.assertAlmostEqual(total, 2 * pi * 3 * 398 / 400, places=3)
+
+    def test_s_curve_is_tangent_continuous(self):
+        # A line followed by two quarter-turn arcs of opposite curvature.
+        coords = [v for k in range(10) for v in (-5 + 0.5 * k, 0)]
+        coords += [v for k in range(30) for v in (5 * cos(pi / 2 - pi / 120 * k), -5 + 5 * sin(pi / 2 - pi / 120 * k))]
+        cx, cy = 5 * sqrt(2), 5 * sqrt(0.5) - 5 + 5 * sqrt(0.5)
+        coords += [v for k in range(31) for v in (cx + 5 * cos(5 * pi / 4 + pi / 120 * k), cy + 5 * sin(5 * pi / 4 + pi / 120 * k))]
+        pieces = list(compress_polyline(coords, 1e-6))
+        self.assertEqual([type(p) for p in pieces], [Line2D, Arc2D, Arc2D])
+        self.assertTrue(pieces[1].is_clockwise())
+        self.assertTrue(pieces[2].is_counter_clockwise())
+        for a, b in zip(pieces, pieces[1:]):
+            # Tangent continuity: the joint lies on the line through both centers (or is a line's end).
+            joint = a.ep
+            if isinstance(a, Arc2D):
+                ax, ay = joint.x - a.cp.x, joint.y - a.cp.y
+                bx, by = joint.x - b.cp.x, joint.y - b.cp.y
+                self.assertAlmostEqual(ax * by - ay * bx, 0, places=6)
+            else:
+                self.assertAlmostEqual(joint.x - b.cp.x, 0, places=6)
+
+    def test_streaming_with_small_window(self):
+        compressor = PolylineCompressor(1e-3, window=16)
+        coords = _wave(200)
+        emitted = compressor.extend(coords[:200])
+        self.assertTrue(emitted)
+        emitted += compressor.extend(coords[200:]) + compressor.finish()
+        self.assertEqual(compressor.vertex_count, 200)
+        self.assertEqual(compressor.piece_count, len(emitted))
+        self.assertEqual((emitted[-1].ep.x, emitted[-1].ep.y), (coords[-2], coords[-1]))
+        self.assertEqual(compressor.finish(), [])
+
+    def test_closed_loop_within_tolerance(self):
+        loop = [0, 0, 0.01, 0.02, 0.03, 0.01, 0, 0]
+        pieces = list(compress_polyline(loop, 0.1))
+        self.assertEqual(len(pieces), 2)
+        self.assertEqual((pieces[0].sp.x, pieces[0].sp.y, pieces[-1].ep.x, pieces[-1].ep.y), (0, 0, 0, 0))
+        for k in range(0, len(loop), 2):
+            self.assertLessEqual(min(_distance(piece, loop[k], loop[k + 1]) for piece in pieces), 0.1)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            PolylineCompressor(0)
+        with self.assertRaises(ValueError):
+            PolylineCompressor(1, window=2)
+        with self.assertRaises(ValueError):
+            list(compress_polyline([0, 0, 1], 0.1))
+
+
+if __name__ == '__main__':
+    unittest.main()
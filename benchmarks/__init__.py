@@ -0,0 +1,4 @@
+from .benchmarks import (BENCHMARKS, SyntheticData, benchmark, compare_results, load_results, meta_differences,
+                         run_benchmarks, save_results)
+__all__ = ['BENCHMARKS', 'SyntheticData', 'benchmark', 'compare_results', 'load_results', 'meta_differences',
+           'run_benchmarks', 'save_results']
@@ -0,0 +1,473 @@
+"""
+Benchmarks for the Point2D, Line2D and Arc2D hot paths, the batched kernels
+and the algorithms built on them (tiling, triangulation, boolean
+operations, clipping, hatching).
+
+Usage from the repository root:
+
+    python -m benchmarks run --output baseline.json
+    python -m benchmarks compare baseline.json --threshold 0.1
+
+`run` times every registered benchmark on a seeded synthetic dataset and
+writes the results as JSON.  `compare` runs the benchmarks again (or loads
+a second result file with --current) and exits with status 1 if any
+benchmark is slower than the baseline by more than the threshold, or if a
+benchmark of the baseline is missing from the current results.  Timings
+are only comparable on the same dataset: `compare` runs on the size and seed
+recorded in the baseline unless told otherwise and refuses (exit status 2)
+to compare results of different datasets.  Results recorded with another
+Python or on another platform are compared with a warning.
+
+benchmarks/example_baseline.json is an example of the result format,
+recorded once on a single machine.  Its timings say nothing about other
+machines; record a baseline on the machine that runs the comparison.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from array import array
+from datetime import datetime, timezone
+from math import pi, cos, sin
+from typing import Callable, Optional
+
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+from polygon2d.polygon2d import Polygon2D
+from kernels import kernels
+from tiling.tiling import TiledGeometry, write_geometry_file
+from earclip.earclip import triangulate_rings
+from boolean.boolean import union_all
+from clipping.clipping import ClipIndex, clip_arcs, clip_segments
+from hatching.hatching import Hatcher
+
+BENCHMARKS = {}
+
+
+def benchmark(name: str) -> Callable:
+    """
+    Register a benchmark.
+    The decorated function receives a SyntheticData instance and returns a
+    zero-argument callable that performs len(data) operations.
+    :param name: Unique benchmark name, conventionally "<module>.<operation>".
+    :return: The decorator.
+    """
+    def register(func: Callable) -> Callable:
+        if name in BENCHMARKS:
+            raise ValueError("Benchmark %r is already registered." % name)
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+class SyntheticData:
+    def __init__(self, size: int = 1000, seed: int = 12345):
+        """
+        Generate a reproducible dataset of points, lines and arcs.
+        :param size: Number of items of each kind.
+        :param seed: Random seed; the same seed always yields the same data.
+        """
+        if size < 1:
+            raise ValueError("size must be positive")
+        rng = random.Random(seed)
+        self.size = size
+        self.seed = seed
+        self.coords = [(rng.uniform(-100, 100), rng.uniform(-100, 100)) for _ in range(2 * size)]
+        self.points = [Point2D(x, y) for x, y in self.coords]
+        self.lines = [Line2D(self.points[2 * i].clone(), self.points[2 * i + 1].clone()) for i in range(size)]
+        self.short_lines = []
+        for x, y in self.coords[:size]:
+            self.short_lines.append(Line2D(x, y, x + rng.uniform(-5, 5), y + rng.uniform(-5, 5)))
+        self.arc_params = []
+        self.arcs = []
+        for x, y in self.coords[:size]:
+            radius = rng.uniform(1, 50)
+            start = rng.uniform(0, pi)
+            end = start + rng.uniform(0.1, 0.9 * pi)
+            sp = Point2D(x + radius * cos(start), y + radius * sin(start))
+            mp = Point2D(x + radius * cos(0.5 * (start + end)), y + radius * sin(0.5 * (start + end)))
+            ep = Point2D(x + radius * cos(end), y + radius * sin(end))
+            self.arc_params.append((sp, mp, ep, radius))
+            self.arcs.append(Arc2D(Point2D(x, y), sp, ep))
+        self.segments = kernels.pack_lines(self.lines)
+        self.short_segments = kernels.pack_lines(self.short_lines)
+        self.point_buffer = kernels.pack_points(self.points[:size])
+        self.arc_buffer = kernels.pack_arcs(self.arcs)
+        # A star-shaped outline with one vertex per item, for the polygon algorithms.
+        self.star = array('d')
+        for k in range(size):
+            angle = 2 * pi * k / size
+            radius = rng.uniform(70, 100)
+            self.star.extend((radius * cos(angle), radius * sin(angle)))
+
+    def __len__(self) -> int:
+        return self.size
+
+
+@benchmark("point2d.init")
+def _point_init(data: SyntheticData) -> Callable:
+    coords = data.coords[:data.size]
+    return lambda: [Point2D(x, y) for x, y in coords]
+
+
+@benchmark("point2d.add")
+def _point_add(data: SyntheticData) -> Callable:
+    pairs = list(zip(data.points[0::2], data.points[1::2]))
+    return lambda: [a + b for a, b in pairs]
+
+
+@benchmark("point2d.mul")
+def _point_mul(data: SyntheticData) -> Callable:
+    points = data.points[:data.size]
+    return lambda: [point * 1.5 for point in points]
+
+
+@benchmark("point2d.distance_to")
+def _point_distance_to(data: SyntheticData) -> Callable:
+    pairs = list(zip(data.points[0::2], data.points[1::2]))
+    return lambda: [a.distance_to(b) for a, b in pairs]
+
+
+@benchmark("line2d.init")
+def _line_init(data: SyntheticData) -> Callable:
+    pairs = list(zip(data.points[0::2], data.points[1::2]))
+    return lambda: [Line2D(a, b) for a, b in pairs]
+
+
+@benchmark("line2d.length")
+def _line_length(data: SyntheticData) -> Callable:
+    return lambda: [line.length() for line in data.lines]
+
+
+@benchmark("line2d.distance_to_point")
+def _line_distance_to_point(data: SyntheticData) -> Callable:
+    pairs = list(zip(data.lines, data.points[:data.size]))
+    return lambda: [line.distance_to_point(point) for line, point in pairs]
+
+
+@benchmark("line2d.intersection_with_line")
+def _line_intersection(data: SyntheticData) -> Callable:
+    pairs = list(zip(data.lines, data.lines[1:] + data.lines[:1]))
+    return lambda: [a.intersection_with_line(b) for a, b in pairs]
+
+
+@benchmark("arc2d.arc_length")
+def _arc_length(data: SyntheticData) -> Callable:
+    return lambda: [arc.arc_length() for arc in data.arcs]
+
+
+@benchmark("arc2d.create_from_sp_mp_ep")
+def _arc_create_3p(data: SyntheticData) -> Callable:
+    return lambda: [Arc2D.create_from_sp_mp_ep(sp, mp, ep) for sp, mp, ep, _ in data.arc_params]
+
+
+@benchmark("arc2d.create_from_sp_ep_rd_cw")
+def _arc_create_rd(data: SyntheticData) -> Callable:
+    return lambda: [Arc2D.create_from_sp_ep_rd_cw(sp, ep, radius, False) for sp, _, ep, radius in data.arc_params]
+
+
+@benchmark("kernels.segment_lengths")
+def _kernel_segment_lengths(data: SyntheticData) -> Callable:
+    return lambda: kernels.segment_lengths(data.segments)
+
+
+@benchmark("kernels.arc_lengths")
+def _kernel_arc_lengths(data: SyntheticData) -> Callable:
+    return lambda: kernels.arc_lengths(data.arc_buffer)
+
+
+@benchmark("kernels.line_point_distances")
+def _kernel_line_point_distances(data: SyntheticData) -> Callable:
+    return lambda: kernels.line_point_distances(data.segments, data.point_buffer)
+
+
+@benchmark("kernels.segment_intersections")
+def _kernel_segment_intersections(data: SyntheticData) -> Callable:
+    return lambda: kernels.segment_intersections(data.short_segments)
+
+
+@benchmark("kernels.transform_points")
+def _kernel_transform_points(data: SyntheticData) -> Callable:
+    matrix = (cos(0.3), -sin(0.3), 5.0, sin(0.3), cos(0.3), -2.0)
+    return lambda: kernels.transform_points(data.point_buffer, matrix)
+
+
+@benchmark("kernels.line_intersections")
+def _kernel_line_intersections(data: SyntheticData) -> Callable:
+    shifted = data.segments[4:] + data.segments[:4]
+    return lambda: kernels.line_intersections(data.segments, shifted)
+
+
+@benchmark("tiling.measure")
+def _tiling_measure(data: SyntheticData) -> Callable:
+    def run():
+        with tempfile.TemporaryDirectory() as workdir:
+            path = os.path.join(workdir, "source.geo")
+            write_geometry_file(path, data.short_lines)
+            with TiledGeometry(path, 25.0, workdir=workdir) as tiled:
+                return tiled.measure()
+    return run
+
+
+@benchmark("earclip.triangulate_rings")
+def _earclip_triangulate(data: SyntheticData) -> Callable:
+    offsets = array('q', [0, data.size])
+    return lambda: triangulate_rings(data.star, offsets)
+
+
+@benchmark("boolean.union_all")
+def _boolean_union_all(data: SyntheticData) -> Callable:
+    squares = [Polygon2D([Point2D(x, y), Point2D(x + 8, y), Point2D(x + 8, y + 8), Point2D(x, y + 8)])
+               for x, y in data.coords[:data.size]]
+    return lambda: union_all(squares)
+
+
+@benchmark("clipping.clip_segments")
+def _clipping_segments(data: SyntheticData) -> Callable:
+    return lambda: clip_segments(data.segments, (-50, -50, 50, 50))
+
+
+@benchmark("clipping.clip_arcs")
+def _clipping_arcs(data: SyntheticData) -> Callable:
+    return lambda: clip_arcs(data.arc_buffer, (-50, -50, 50, 50))
+
+
+@benchmark("clipping.clip_index")
+def _clipping_index(data: SyntheticData) -> Callable:
+    index = ClipIndex(data.short_segments)
+    return lambda: index.clip((-50, -50, 50, 50))
+
+
+@benchmark("hatching.hatch")
+def _hatching_hatch(data: SyntheticData) -> Callable:
+    points = [Point2D(data.star[k], data.star[k + 1]) for k in range(0, len(data.star), 2)]
+    hatcher = Hatcher(Polygon2D(points))
+    # About one hatch line per outline vertex.
+    return lambda: hatcher.hatch(200 / data.size, 30)
+
+
+def time_callable(func: Callable, ops: int, repeat: int = 5, min_time: float = 0.05) -> float:
+    """
+    Time a callable and return the best observed time per operation.
+    The callable is run in a loop long enough to take at least min_time seconds,
+    and the fastest of `repeat` such loops is kept to reduce scheduling noise.
+    :param func: Zero-argument callable performing `ops` operations per call.
+    :param ops: Number of operations per call.
+    :param repeat: Number of timed loops.
+    :param min_time: Minimum duration of one timed loop in seconds.
+    :return: Seconds per operation.
+    """
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1 << 20:
+            break
+        loops *= 2
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        best = min(best, (time.perf_counter() - start) / loops)
+    return best / ops
+
+
+def run_benchmarks(names: Optional[list[str]] = None, size: int = 1000, seed: int = 12345,
+                   repeat: int = 5, min_time: float = 0.05) -> dict:
+    """
+    Run benchmarks and collect their results.
+    :param names: Benchmarks to run, or name prefixes such as "line2d." (all if None).
+    :param size: Dataset size (operations per call).
+    :param seed: Dataset seed.
+    :param repeat: Number of timed loops per benchmark.
+    :param min_time: Minimum duration of one timed loop in seconds.
+    :return: A JSON-serializable result dictionary.
+    """
+    selected = [name for name in sorted(BENCHMARKS)
+                if names is None or any(name == wanted or name.startswith(wanted) for wanted in names)]
+    if not selected:
+        raise ValueError("No benchmark matches %r." % (names,))
+    data = SyntheticData(size, seed)
+    results = {}
+    # Some constructors print diagnostics; keep them out of the report and the timings' I/O.
+    with contextlib.redirect_stdout(io.StringIO()):
+        for name in selected:
+            results[name] = {"seconds_per_op": time_callable(BENCHMARKS[name](data), size, repeat, min_time)}
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "size": size,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def save_results(results: dict, path: str) -> None:
+    """Write benchmark results to a JSON file."""
+    with open(path, "w") as stream:
+        json.dump(results, stream, indent=2, sort_keys=True)
+        stream.write("\n")
+
+
+def load_results(path: str) -> dict:
+    """Read benchmark results from a JSON file."""
+    with open(path) as stream:
+        results = json.load(stream)
+    if "results" not in results:
+        raise ValueError("%s is not a benchmark result file." % path)
+    return results
+
+
+DATASET_KEYS = ("size", "seed")
+ENVIRONMENT_KEYS = ("implementation", "python", "platform")
+
+
+def meta_differences(baseline: dict, current: dict, keys: tuple = DATASET_KEYS + ENVIRONMENT_KEYS) -> list[tuple]:
+    """
+    Find where two result sets were recorded differently.
+    :param baseline: Baseline results.
+    :param current: Current results.
+    :param keys: Meta keys to check; keys absent from either result set are skipped.
+    :return: Rows (key, baseline_value, current_value) for every differing key.
+    """
+    base, cur = baseline.get("meta", {}), current.get("meta", {})
+    return [(key, base[key], cur[key]) for key in keys if key in base and key in cur and base[key] != cur[key]]
+
+
+def _describe(differences: list) -> str:
+    return ", ".join("%s %s != %s" % row for row in differences)
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = 0.1) -> list[tuple]:
+    """
+    Compare two result sets.
+    :param baseline: Baseline results.
+    :param current: Current results.
+    :param threshold: Allowed relative slowdown (0.1 means 10%).
+    :return: Rows (name, baseline_seconds, current_seconds, ratio, status) where status is
+             "regression", "improvement" or "ok", or "missing" / "added" for benchmarks found
+             only in the baseline / only in the current results (their other timing and ratio are None).
+    :raises ValueError: If the result sets were recorded on different datasets.
+    """
+    if threshold < 0:
+        raise ValueError("threshold cannot be negative")
+    differences = meta_differences(baseline, current, DATASET_KEYS)
+    if differences:
+        raise ValueError("Results of different datasets cannot be compared: %s." % _describe(differences))
+    rows = []
+    for name in sorted(set(baseline["results"]) | set(current["results"])):
+        if name not in current["results"]:
+            rows.append((name, baseline["results"][name]["seconds_per_op"], None, None, "missing"))
+            continue
+        if name not in baseline["results"]:
+            rows.append((name, None, current["results"][name]["seconds_per_op"], None, "added"))
+            continue
+        base = baseline["results"][name]["seconds_per_op"]
+        cur = current["results"][name]["seconds_per_op"]
+        ratio = cur / base if base > 0 else float('inf')
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append((name, base, cur, ratio, status))
+    return rows
+
+
+def format_results(results: dict) -> str:
+    """Format results as an aligned text table."""
+    lines = ["%-36s %14s" % ("benchmark", "us/op")]
+    for name, entry in sorted(results["results"].items()):
+        lines.append("%-36s %14.4f" % (name, entry["seconds_per_op"] * 1e6))
+    return "\n".join(lines)
+
+
+def format_comparison(rows: list) -> str:
+    """Format comparison rows as an aligned text table."""
+    lines = ["%-36s %14s %14s %8s  %s" % ("benchmark", "baseline us", "current us", "ratio", "status")]
+    for name, base, cur, ratio, status in rows:
+        base = "-" if base is None else "%.4f" % (base * 1e6)
+        cur = "-" if cur is None else "%.4f" % (cur * 1e6)
+        ratio = "-" if ratio is None else "%.3f" % ratio
+        lines.append("%-36s %14s %14s %8s  %s" % (name, base, cur, ratio, status))
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Command line entry point.
+    :param argv: Arguments (sys.argv[1:] if None).
+    :return: Process exit status.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    for command in ("run", "compare"):
+        sub = commands.add_parser(command)
+        sub.add_argument("--only", nargs="*", help="benchmark names or prefixes to run")
+        # compare defaults to the dataset recorded in the baseline.
+        sub.add_argument("--size", type=int, default=1000 if command == "run" else None)
+        sub.add_argument("--seed", type=int, default=12345 if command == "run" else None)
+        sub.add_argument("--repeat", type=int, default=5)
+        sub.add_argument("--min-time", type=float, default=0.05)
+        if command == "run":
+            sub.add_argument("--output", help="write results to this JSON file")
+        else:
+            sub.add_argument("baseline", help="baseline JSON file")
+            sub.add_argument("--current", help="compare this result file instead of running the benchmarks")
+            sub.add_argument("--threshold", type=float, default=0.1, help="allowed relative slowdown")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        current = run_benchmarks(args.only, args.size, args.seed, args.repeat, args.min_time)
+        print(format_results(current))
+        if args.output:
+            save_results(current, args.output)
+        return 0
+    baseline = load_results(args.baseline)
+    if args.current:
+        current = load_results(args.current)
+    else:
+        meta = baseline.get("meta", {})
+        size = meta.get("size", 1000) if args.size is None else args.size
+        seed = meta.get("seed", 12345) if args.seed is None else args.seed
+        current = run_benchmarks(args.only, size, seed, args.repeat, args.min_time)
+    differences = meta_differences(baseline, current, DATASET_KEYS)
+    if differences:
+        print("Refusing to compare results of different datasets: %s" % _describe(differences), file=sys.stderr)
+        return 2
+    differences = meta_differences(baseline, current, ENVIRONMENT_KEYS)
+    if differences:
+        print("Warning: baseline recorded elsewhere, timings may not be comparable: %s" % _describe(differences),
+              file=sys.stderr)
+    if args.only:
+        # Benchmarks left out on purpose are not missing.
+        baseline["results"] = {name: entry for name, entry in baseline["results"].items()
+                               if any(name == wanted or name.startswith(wanted) for wanted in args.only)}
+    rows = compare_results(baseline, current, args.threshold)
+    print(format_comparison(rows))
+    status = 0
+    regressions = [row[0] for row in rows if row[4] == "regression"]
+    if regressions:
+        print("%d regression(s) beyond %.0f%%: %s" % (len(regressions), args.threshold * 100, ", ".join(regressions)),
+              file=sys.stderr)
+        status = 1
+    missing = [row[0] for row in rows if row[4] == "missing"]
+    if missing:
+        print("%d benchmark(s) of the baseline not run: %s" % (len(missing), ", ".join(missing)), file=sys.stderr)
+        status = 1
+    return status
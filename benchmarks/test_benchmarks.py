@@ -0,0 +1,125 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from .benchmarks import (BENCHMARKS, SyntheticData, benchmark, compare_results, load_results, main,
+                         meta_differences, run_benchmarks, save_results, time_callable)
+
+
+def _results(meta=None, **timings):
+    return {"meta": meta or {}, "results": {name: {"seconds_per_op": value} for name, value in timings.items()}}
+
+
+class TestBenchmarks(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        for name in os.listdir(self.tmpdir):
+            os.remove(os.path.join(self.tmpdir, name))
+        os.rmdir(self.tmpdir)
+
+    def test_synthetic_data_is_reproducible(self):
+        first = SyntheticData(20, seed=3)
+        second = SyntheticData(20, seed=3)
+        self.assertEqual(first.coords, second.coords)
+        self.assertEqual(list(first.segments), list(second.segments))
+        self.assertEqual(len(first), 20)
+
+    def test_registry_covers_hot_paths(self):
+        for name in ("point2d.init", "point2d.distance_to", "line2d.intersection_with_line",
+                     "arc2d.arc_length", "arc2d.create_from_sp_mp_ep", "kernels.segment_lengths",
+                     "kernels.transform_points", "tiling.measure", "earclip.triangulate_rings", "boolean.union_all",
+                     "clipping.clip_segments", "clipping.clip_index", "hatching.hatch"):
+            self.assertIn(name, BENCHMARKS)
+
+    def test_duplicate_registration_raises(self):
+        with self.assertRaises(ValueError):
+            benchmark("point2d.init")(lambda data: None)
+
+    def test_time_callable(self):
+        self.assertGreater(time_callable(lambda: sum(range(100)), 100, repeat=2, min_time=0.001), 0)
+
+    def test_run_selected_benchmarks(self):
+        results = run_benchmarks(["line2d.length", "kernels."], size=10, repeat=1, min_time=0.001)
+        self.assertIn("line2d.length", results["results"])
+        self.assertIn("kernels.segment_lengths", results["results"])
+        self.assertNotIn("point2d.init", results["results"])
+        self.assertEqual(results["meta"]["size"], 10)
+        with self.assertRaises(ValueError):
+            run_benchmarks(["nothing"])
+
+    def test_save_and_load(self):
+        path = os.path.join(self.tmpdir, "baseline.json")
+        save_results(_results(a=1e-6), path)
+        self.assertEqual(load_results(path)["results"]["a"]["seconds_per_op"], 1e-6)
+        with open(path, "w") as stream:
+            json.dump({"other": 1}, stream)
+        with self.assertRaises(ValueError):
+            load_results(path)
+
+    def test_compare_results(self):
+        rows = compare_results(_results(a=1.0, b=1.0, c=1.0, d=1.0), _results(a=1.05, b=1.5, c=0.5, e=1.0),
+                               threshold=0.1)
+        self.assertEqual([(row[0], row[4]) for row in rows], [("a", "ok"), ("b", "regression"), ("c", "improvement"),
+                                                              ("d", "missing"), ("e", "added")])
+        self.assertEqual(rows[3][2:4], (None, None))
+        self.assertEqual(rows[4][1], None)
+
+    def test_main_exit_status(self):
+        baseline = os.path.join(self.tmpdir, "baseline.json")
+        faster = os.path.join(self.tmpdir, "faster.json")
+        slower = os.path.join(self.tmpdir, "slower.json")
+        save_results(_results(a=1.0), baseline)
+        save_results(_results(a=0.9), faster)
+        save_results(_results(a=2.0), slower)
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(main(["compare", baseline, "--current", faster]), 0)
+            self.assertEqual(main(["compare", baseline, "--current", slower]), 1)
+            self.assertEqual(main(["compare", baseline, "--current", slower, "--threshold", "1.5"]), 0)
+            # A benchmark dropped or renamed since the baseline fails the comparison.
+            save_results(_results(b=1.0), slower)
+            self.assertEqual(main(["compare", baseline, "--current", slower]), 1)
+
+    def test_compare_refuses_other_datasets(self):
+        baseline = _results({"size": 1000, "seed": 1, "python": "3.11.7"}, a=1.0)
+        self.assertEqual(meta_differences(baseline, _results({"size": 1000, "seed": 1}, a=1.0)), [])
+        self.assertEqual(meta_differences(baseline, _results({"size": 500, "seed": 1, "python": "3.12.1"}, a=1.0)),
+                         [("size", 1000, 500), ("python", "3.11.7", "3.12.1")])
+        with self.assertRaises(ValueError):
+            compare_results(baseline, _results({"size": 1000, "seed": 2}, a=1.0))
+        # Another interpreter only warns.
+        rows = compare_results(baseline, _results({"size": 1000, "seed": 1, "python": "3.12.1"}, a=1.0))
+        self.assertEqual(rows[0][4], "ok")
+
+    def test_main_checks_meta(self):
+        baseline = os.path.join(self.tmpdir, "baseline.json")
+        current = os.path.join(self.tmpdir, "current.json")
+        save_results(_results({"size": 1000, "seed": 1, "platform": "here"}, a=1.0), baseline)
+        stderr = io.StringIO()
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(stderr):
+            save_results(_results({"size": 10, "seed": 1, "platform": "here"}, a=1.0), current)
+            self.assertEqual(main(["compare", baseline, "--current", current]), 2)
+            self.assertIn("size 1000 != 10", stderr.getvalue())
+            save_results(_results({"size": 1000, "seed": 1, "platform": "there"}, a=1.0), current)
+            self.assertEqual(main(["compare", baseline, "--current", current]), 0)
+            self.assertIn("platform here != there", stderr.getvalue())
+
+    def test_compare_runs_on_the_baseline_dataset(self):
+        baseline = os.path.join(self.tmpdir, "baseline.json")
+        save_results(run_benchmarks(["point2d.add"], size=20, seed=7, repeat=1, min_time=0.0), baseline)
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            self.assertEqual(main(["compare", baseline, "--only", "point2d.add", "--repeat", "1", "--min-time", "0",
+                                   "--threshold", "1000"]), 0)
+            self.assertEqual(main(["compare", baseline, "--only", "point2d.add", "--size", "30"]), 2)
+
+    def test_example_baseline(self):
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "example_baseline.json")
+        self.assertEqual(sorted(load_results(path)["results"]), sorted(BENCHMARKS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,4 @@
+from .boolean import (Region2D, boolean, union, intersection, difference, xor, union_all, as_regions, UNION,
+                      INTERSECTION, DIFFERENCE, XOR)
+__all__ = ['Region2D', 'boolean', 'union', 'intersection', 'difference', 'xor', 'union_all', 'as_regions', 'UNION',
+           'INTERSECTION', 'DIFFERENCE', 'XOR']
@@ -0,0 +1,577 @@
+"""
+Boolean operations (union, intersection, difference, xor) on regions bounded
+by lines and arcs.
+
+A Region2D is an outer ring and holes, each ring a closed sequence of Line2D
+and Arc2D pieces; Polygon2D instances are accepted wherever a region is.
+Rings are normalized on construction so that the interior lies on the left
+(outer rings counterclockwise, holes clockwise).
+
+The operations follow the edge-classification scheme of the Martinez-Rueda
+clipper:
+
+1. the boundaries of all regions are split at their mutual crossings and at
+   the ends of overlapping stretches (collinear lines, co-circular arcs),
+   with exact line-line, line-arc and arc-arc intersections;
+2. every resulting sub-edge is classified by whether the regions of each
+   operand cover its left and right sides.  Regions owning the sub-edge know
+   this from its direction; any other region is tested with a crossing
+   count at the sub-edge midpoint;
+3. a sub-edge is kept when the result of the operation differs on its two
+   sides, directed so that the result lies on its left.  Coincident
+   sub-edges from different regions are classified once, which settles
+   shared and touching boundaries;
+4. kept sub-edges are linked into rings (taking the leftmost turn where
+   several continue from one vertex), runs of sub-edges cut from the same
+   edge are merged back, and holes are attached to the smallest outer ring
+   around them.
+
+Instead of a sweep-line status structure, crossings and coverage tests are
+found through uniform grids: one over region bounding boxes, which also
+splits the input into groups of mutually overlapping regions that are
+processed independently (a region overlapping nothing is passed through or
+dropped as a whole), and one over the edges of each group.  This keeps the
+union of many scattered outlines close to linear in their size.
+"""
+from math import atan2, floor, hypot, pi, sin
+from typing import Iterable, Iterator, Self, Sequence
+
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D, TOLERANCE_LENGTH
+from polygon2d.polygon2d import Polygon2D
+from pieces.pieces import (ARC, LINE, arc_parameter, bounds, crossers, emit, inside, intersections, line_record,
+                           point_at, record, tangents)
+
+UNION = 0
+INTERSECTION = 1
+DIFFERENCE = 2
+XOR = 3
+
+_OPERATIONS = {
+    UNION: lambda a, b: a or b,
+    INTERSECTION: lambda a, b: a and b,
+    DIFFERENCE: lambda a, b: a and not b,
+    XOR: lambda a, b: a != b,
+}
+
+
+def _reversed(piece: list) -> list:
+    if piece[0] == LINE:
+        return line_record(piece[3], piece[4], piece[1], piece[2])
+    return [ARC, piece[3], piece[4], piece[1], piece[2], piece[5], piece[6], piece[7], piece[8] + piece[9], -piece[9]]
+
+
+def _signed_area(ring: list) -> float:
+    twice = 0.0
+    for piece in ring:
+        twice += piece[1] * piece[4] - piece[3] * piece[2]
+        if piece[0] == ARC:
+            # Circular segment between the chord and the arc.
+            sweep = piece[9]
+            twice += piece[7] * piece[7] * (sweep - sin(sweep))
+    return twice / 2
+
+
+class Region2D:
+    def __init__(self, rings: Iterable[Sequence[Line2D | Arc2D]], tolerance: int | float = TOLERANCE_LENGTH):
+        """
+        Initialize a region from its outer ring and holes.
+        :param rings: The outer ring, then the holes; each a closed sequence of Line2D and Arc2D pieces
+                      placed end to start, in either orientation.
+        :param tolerance: Largest gap allowed between consecutive pieces.
+        """
+        if not isinstance(tolerance, (int, float)):
+            raise TypeError("Tolerance must be a numeric value.")
+        if tolerance < 0:
+            raise ValueError("Tolerance cannot be negative.")
+        records = []
+        for ring in rings:
+            ring = [record(piece) for piece in ring]
+            if not ring:
+                raise ValueError("A ring needs at least one piece.")
+            for k, piece in enumerate(ring):
+                previous = ring[k - 1]
+                if hypot(piece[1] - previous[3], piece[2] - previous[4]) > tolerance:
+                    raise ValueError("Ring piece %d does not start where the previous one ends." % k)
+            records.append(ring)
+        if not records:
+            raise ValueError("A region needs an outer ring.")
+        self._set_rings(records)
+
+    @classmethod
+    def from_polygon(cls, polygon: Polygon2D) -> Self:
+        """
+        Convert a polygon to a region bounded by lines.
+        :param polygon: A Polygon2D instance.
+        :return: A new Region2D.
+        """
+        if not isinstance(polygon, Polygon2D):
+            raise TypeError("Argument must be a Polygon2D instance.")
+        coords, offsets = polygon.coords, polygon.offsets
+        rings = []
+        for r in range(len(offsets) - 1):
+            first, stop = offsets[r], offsets[r + 1]
+            rings.append([line_record(coords[2 * v], coords[2 * v + 1], coords[2 * w], coords[2 * w + 1])
+                          for v, w in zip(range(first, stop), [*range(first + 1, stop), first])])
+        return cls._from_records(rings)
+
+    @classmethod
+    def _from_records(cls, rings: list[list]) -> Self:
+        region = cls.__new__(cls)
+        region._set_rings(rings)
+        return region
+
+    def _set_rings(self, rings: list[list]) -> None:
+        # Outer ring counterclockwise and holes clockwise, so that the interior is on the left of every edge.
+        self._rings = []
+        for index, ring in enumerate(rings):
+            if (_signed_area(ring) > 0) != (index == 0):
+                ring = [_reversed(piece) for piece in reversed(ring)]
+            else:
+                ring = list(ring)
+            for k, piece in enumerate(ring):
+                # Close gaps left within tolerance, so that no ray slips between two pieces.
+                previous = ring[k - 1]
+                if piece[1] != previous[3] or piece[2] != previous[4]:
+                    ring[k] = piece = list(piece)
+                    piece[1], piece[2] = previous[3], previous[4]
+            self._rings.append(ring)
+        boxes = [bounds(piece) for piece in self._rings[0]]
+        self._bounds = (min(b[0] for b in boxes), min(b[1] for b in boxes),
+                        max(b[2] for b in boxes), max(b[3] for b in boxes))
+        self._crossers = None
+
+    @property
+    def ring_count(self) -> int:
+        """Get the number of rings (the outer ring and the holes)."""
+        return len(self._rings)
+
+    def ring(self, index: int) -> list[Line2D | Arc2D]:
+        """
+        Get the pieces of a ring; consecutive pieces share their end points.
+        :param index: Ring index (0 for the outer ring, then the holes).
+        :return: List of Line2D and Arc2D pieces, counterclockwise for the outer ring and clockwise for holes.
+        """
+        if not 0 <= index < len(self._rings):
+            raise IndexError("Ring index %d out of range." % index)
+        ring = self._rings[index]
+        first = Point2D(ring[0][1], ring[0][2])
+        point = first
+        pieces = []
+        for k, piece in enumerate(ring):
+            end = first if k == len(ring) - 1 else Point2D(piece[3], piece[4])
+            pieces.extend(emit(piece, point, end))
+            point = end
+        return pieces
+
+    def records(self) -> list[list]:
+        """
+        Get the rings as piece records (see pieces.pieces), without converting them to Line2D and Arc2D.
+        :return: The outer ring, then the holes; the lists are shared with the region and must not be modified.
+        """
+        return self._rings
+
+    def area(self) -> float:
+        """Get the area enclosed by the outer ring minus the areas of the holes."""
+        return sum(_signed_area(ring) for ring in self._rings)
+
+    def bounding_box(self) -> tuple[float, float, float, float]:
+        """Get the bounding box (min_x, min_y, max_x, max_y) of the outer ring."""
+        return self._bounds
+
+    def is_polygonal(self) -> bool:
+        """Check whether every ring is made of lines only."""
+        return all(piece[0] == LINE for ring in self._rings for piece in ring)
+
+    def to_polygon(self, tolerance: int | float = TOLERANCE_LENGTH) -> Polygon2D:
+        """
+        Convert a region bounded by lines to a polygon.
+        :param tolerance: Boundary tolerance of the polygon.
+        :return: A new Polygon2D.
+        """
+        if not self.is_polygonal():
+            raise ValueError("Region has arcs and cannot be converted to a polygon.")
+        rings = [[Point2D(piece[1], piece[2]) for piece in ring] for ring in self._rings]
+        return Polygon2D(rings[0], rings[1:], tolerance)
+
+    def contains(self, point: Point2D) -> bool:
+        """
+        Check if a point lies inside the region (points on the boundary may go either way).
+        :param point: A Point2D instance.
+        :return: True if the point is inside.
+        """
+        if not isinstance(point, Point2D):
+            raise TypeError("Argument must be a Point2D instance.")
+        return self._covers(point.x, point.y)
+
+    def _covers(self, px: float, py: float) -> bool:
+        low_x, low_y, high_x, high_y = self._bounds
+        if not (low_x <= px <= high_x and low_y <= py <= high_y):
+            return False
+        if self._crossers is None:
+            self._crossers = crossers(self._rings)
+        return inside(self._crossers, px, py)
+
+    def __repr__(self) -> str:
+        return "Region2D(%d pieces, %d holes)" % (sum(len(ring) for ring in self._rings), len(self._rings) - 1)
+
+
+def _overlapping_pairs(boxes: Sequence[tuple[float, float, float, float]]) -> Iterator[tuple[int, int]]:
+    # Pairs of touching or overlapping boxes through a uniform grid sized to the mean box.  Each pair is
+    # reported from the cell holding the low corner of the overlap only.
+    if len(boxes) < 2:
+        return
+    cell = sum(max(b[2] - b[0], b[3] - b[1]) for b in boxes) / len(boxes)
+    if cell <= 0:
+        cell = max(max(b[2] for b in boxes) - min(b[0] for b in boxes),
+                   max(b[3] for b in boxes) - min(b[1] for b in boxes), 1.0)
+    grid = {}
+    for index, (x0, y0, x1, y1) in enumerate(boxes):
+        for col in range(floor(x0 / cell), floor(x1 / cell) + 1):
+            for row in range(floor(y0 / cell), floor(y1 / cell) + 1):
+                grid.setdefault((col, row), []).append(index)
+    for (col, row), members in grid.items():
+        for a in range(len(members)):
+            i = members[a]
+            ax0, ay0, ax1, ay1 = boxes[i]
+            for b in range(a + 1, len(members)):
+                j = members[b]
+                bx0, by0, bx1, by1 = boxes[j]
+                if bx0 > ax1 or ax0 > bx1 or by0 > ay1 or ay0 > by1:
+                    continue
+                if floor(max(ax0, bx0) / cell) == col and floor(max(ay0, by0) / cell) == row:
+                    yield i, j
+
+
+def _overlaps(a: list, b: list, snap: float) -> list[tuple[int, float, float, float]]:
+    # Ends of one piece lying inside the other along a shared line or circle, as (0 or 1, parameter, x, y)
+    # where the first field tells whether the split point belongs to a or to b.
+    found = []
+    if a[0] != b[0]:
+        return found
+    if a[0] == LINE:
+        rx, ry = a[3] - a[1], a[4] - a[2]
+        length = hypot(rx, ry)
+        if length == 0 or abs(rx * (b[4] - b[2]) - ry * (b[3] - b[1])) > snap * hypot(b[3] - b[1], b[4] - b[2]):
+            return found
+        if abs(rx * (b[2] - a[2]) - ry * (b[1] - a[1])) > snap * length:
+            return found
+        for owner, piece, other in ((0, a, b), (1, b, a)):
+            dx, dy = piece[3] - piece[1], piece[4] - piece[2]
+            length2 = dx * dx + dy * dy
+            for x, y in ((other[1], other[2]), (other[3], other[4])):
+                t = ((x - piece[1]) * dx + (y - piece[2]) * dy) / length2 if length2 else 0.0
+                if 0 < t < 1 and hypot(x - piece[1], y - piece[2]) > snap and hypot(x - piece[3], y - piece[4]) > snap:
+                    found.append((owner, t, x, y))
+        return found
+    if hypot(a[5] - b[5], a[6] - b[6]) > snap or abs(a[7] - b[7]) > snap:
+        return found
+    for owner, piece, other in ((0, a, b), (1, b, a)):
+        for x, y in ((other[1], other[2]), (other[3], other[4])):
+            t = arc_parameter(piece, atan2(y - piece[6], x - piece[5]))
+            if t is not None and hypot(x - piece[1], y - piece[2]) > snap and hypot(x - piece[3], y - piece[4]) > snap:
+                found.append((owner, t, x, y))
+    return found
+
+
+class _Snapper:
+    def __init__(self, snap: float):
+        # Points closer than snap are merged into the first one seen, so that split points computed from
+        # different pairs of edges coincide exactly.
+        self.snap = snap
+        self.cells = {}
+
+    def __call__(self, x: float, y: float) -> tuple[float, float]:
+        snap = self.snap
+        col, row = floor(x / snap), floor(y / snap)
+        for c in (col - 1, col, col + 1):
+            for r in (row - 1, row, row + 1):
+                for point in self.cells.get((c, r), ()):
+                    if hypot(point[0] - x, point[1] - y) <= snap:
+                        return point
+        point = (x, y)
+        self.cells.setdefault((col, row), []).append(point)
+        return point
+
+
+class _Overlay:
+    def __init__(self, regions: list[Region2D], operands: list[int], operation: int, tolerance: float):
+        self.regions = regions
+        self.operands = operands
+        self.keep = _OPERATIONS[operation]
+        self.tolerance = tolerance
+        self.boxes = [region.bounding_box() for region in regions]
+        self._region_grid = {}
+        self._region_cell = 1.0
+        if regions:
+            self._region_cell = max(sum(max(b[2] - b[0], b[3] - b[1]) for b in self.boxes) / len(regions), 1e-300)
+            for index, (x0, y0, x1, y1) in enumerate(self.boxes):
+                for col in range(floor(x0 / self._region_cell), floor(x1 / self._region_cell) + 1):
+                    for row in range(floor(y0 / self._region_cell), floor(y1 / self._region_cell) + 1):
+                        self._region_grid.setdefault((col, row), []).append(index)
+
+    def run(self) -> list[Region2D]:
+        parent = list(range(len(self.regions)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        margin = self.tolerance
+        boxes = [(b[0] - margin, b[1] - margin, b[2] + margin, b[3] + margin) for b in self.boxes]
+        for i, j in _overlapping_pairs(boxes):
+            parent[find(i)] = find(j)
+        groups = {}
+        for index in range(len(self.regions)):
+            groups.setdefault(find(index), []).append(index)
+        results = []
+        for members in groups.values():
+            if len(members) == 1:
+                # A region overlapping nothing is kept or dropped as a whole.
+                index = members[0]
+                if self.keep(self.operands[index] == 0, self.operands[index] == 1):
+                    results.append(self.regions[index])
+            else:
+                results.extend(self._overlay(members))
+        return results
+
+    def _covering(self, px: float, py: float) -> list[int]:
+        cell = self._region_cell
+        return self._region_grid.get((floor(px / cell), floor(py / cell)), [])
+
+    def _overlay(self, members: list[int]) -> list[Region2D]:
+        edges, owners = [], []
+        for index in members:
+            for ring in self.regions[index]._rings:
+                edges.extend(ring)
+                owners.extend([index] * len(ring))
+        boxes = [bounds(edge) for edge in edges]
+        extent = max(max(b[2] for b in boxes) - min(b[0] for b in boxes),
+                     max(b[3] for b in boxes) - min(b[1] for b in boxes))
+        snap = max(self.tolerance, 1e-12 * extent, 1e-300)
+        canonical = _Snapper(snap)
+        splits = []
+        for edge in edges:
+            splits.append([(0.0, canonical(edge[1], edge[2])), (1.0, canonical(edge[3], edge[4]))])
+        margin = snap
+        for i, j in _overlapping_pairs([(b[0] - margin, b[1] - margin, b[2] + margin, b[3] + margin)
+                                        for b in boxes]):
+            a, b = edges[i], edges[j]
+            for t, u, x, y in intersections(a, b):
+                point = canonical(x, y)
+                splits[i].append((t, point))
+                splits[j].append((u, point))
+            for owner, t, x, y in _overlaps(a, b, snap):
+                splits[i if owner == 0 else j].append((t, canonical(x, y)))
+        groups = {}
+        for e, edge in enumerate(edges):
+            points = sorted(splits[e])
+            for (t0, p0), (t1, p1) in zip(points, points[1:]):
+                if p0 == p1:
+                    continue
+                if edge[0] == LINE:
+                    sub = line_record(p0[0], p0[1], p1[0], p1[1])
+                    key = (LINE, min(p0, p1), max(p0, p1))
+                else:
+                    sub = [ARC, p0[0], p0[1], p1[0], p1[1], edge[5], edge[6], edge[7], edge[8] + t0 * edge[9],
+                           (t1 - t0) * edge[9]]
+                    mx, my = point_at(sub, 0.5)
+                    low, high = min(p0, p1), max(p0, p1)
+                    side = (high[0] - low[0]) * (my - low[1]) - (high[1] - low[1]) * (mx - low[0]) > 0
+                    key = (ARC, low, high, side)
+                candidates = groups.setdefault(key, [])
+                for group in candidates:
+                    if edge[0] == LINE or abs(group[0][0][7] - edge[7]) <= snap:
+                        group.append((sub, owners[e]))
+                        break
+                else:
+                    candidates.append([(sub, owners[e])])
+        kept = []
+        for candidates in groups.values():
+            for group in candidates:
+                edge = self._classify(group)
+                if edge is not None:
+                    kept.append(edge)
+        return self._assemble(kept, snap)
+
+    def _classify(self, group: list) -> list | None:
+        # Which operands cover each side of a sub-edge, and the kept directed edge if the result changes across it.
+        reference = group[0][0]
+        start = (reference[1], reference[2])
+        net = {}
+        for sub, owner in group:
+            net[owner] = net.get(owner, 0) + (1 if (sub[1], sub[2]) == start else -1)
+        operands = self.operands
+        left, right = [False, False], [False, False]
+        for owner, direction in net.items():
+            if direction > 0:
+                left[operands[owner]] = True
+            elif direction < 0:
+                right[operands[owner]] = True
+        mx, my = point_at(reference, 0.5)
+        for index in self._covering(mx, my):
+            operand = operands[index]
+            if index in net or (left[operand] and right[operand]):
+                continue
+            if self.regions[index]._covers(mx, my):
+                left[operand] = right[operand] = True
+        on_left, on_right = self.keep(*left), self.keep(*right)
+        if on_left == on_right:
+            return None
+        return reference if on_left else _reversed(reference)
+
+    def _assemble(self, kept: list, snap: float) -> list[Region2D]:
+        outgoing = {}
+        for k, edge in enumerate(kept):
+            outgoing.setdefault((edge[1], edge[2]), []).append(k)
+        used = [False] * len(kept)
+        outers, holes = [], []
+        for first in range(len(kept)):
+            if used[first]:
+                continue
+            used[first] = True
+            ring = [kept[first]]
+            origin = (kept[first][1], kept[first][2])
+            while True:
+                edge = ring[-1]
+                end = (edge[3], edge[4])
+                if end == origin:
+                    break
+                candidates = [k for k in outgoing.get(end, ()) if not used[k]]
+                if not candidates:
+                    ring = None
+                    break
+                if len(candidates) > 1:
+                    # Leftmost turn: rings touching at a vertex stay separate.
+                    _, _, tx, ty = tangents(edge)
+
+                    def turn(k: int) -> float:
+                        ux, uy, _, _ = tangents(kept[k])
+                        return atan2(tx * uy - ty * ux, tx * ux + ty * uy)
+
+                    candidates.sort(key=turn)
+                k = candidates[-1]
+                used[k] = True
+                ring.append(kept[k])
+            if ring is None:
+                continue
+            ring = _merged(ring, snap)
+            area = _signed_area(ring)
+            if area > 0:
+                outers.append((area, ring))
+            elif area < 0:
+                holes.append(ring)
+        outers.sort(key=lambda item: item[0])
+        regions = [Region2D._from_records([ring]) for _, ring in outers]
+        assigned = [[ring] for _, ring in outers]
+        for hole in holes:
+            px, py = point_at(hole[0], 0.5)
+            for index, region in enumerate(regions):
+                if region._covers(px, py):
+                    assigned[index].append(hole)
+                    break
+        return [Region2D._from_records(rings) for rings in assigned]
+
+
+def _continues(first: list, second: list, snap: float) -> bool:
+    # Whether second carries on first along the same line or circle in the same direction.
+    if first[0] != second[0]:
+        return False
+    if first[0] == LINE:
+        px, py, qx, qy, rx, ry = first[1], first[2], first[3], first[4], second[3], second[4]
+        dx, dy = rx - px, ry - py
+        length = hypot(dx, dy)
+        return (length > 0 and abs(dx * (qy - py) - dy * (qx - px)) <= snap * length
+                and (qx - px) * dx + (qy - py) * dy > 0 and (rx - qx) * dx + (ry - qy) * dy > 0)
+    # Merged arcs stay within half a turn, so a full circle never collapses to one piece.
+    return ((first[9] > 0) == (second[9] > 0) and abs(first[9] + second[9]) <= pi + 1e-12 and hypot(first[5] - second[5], first[6] - second[6]) <= snap
+            and abs(first[7] - second[7]) <= snap)
+
+
+def _merged(ring: list, snap: float) -> list:
+    # Join runs of sub-edges along the same line or circle, starting the ring at the beginning of a run.
+    start = next((k for k in range(len(ring)) if not _continues(ring[k - 1], ring[k], snap)), 0)
+    merged = []
+    for edge in ring[start:] + ring[:start]:
+        if merged and _continues(merged[-1], edge, snap):
+            last = merged[-1]
+            if edge[0] == ARC:
+                last[9] += edge[9]
+            last[3], last[4] = edge[3], edge[4]
+        else:
+            merged.append(list(edge))
+    return merged
+
+
+def as_regions(shapes: Region2D | Polygon2D | Iterable[Region2D | Polygon2D]) -> list[Region2D]:
+    """
+    Convert shapes to a list of regions.
+    :param shapes: A Region2D or Polygon2D, or an iterable of them.
+    :return: List of Region2D; polygons are converted with Region2D.from_polygon.
+    """
+    if isinstance(shapes, (Region2D, Polygon2D)):
+        shapes = [shapes]
+    regions = []
+    for shape in shapes:
+        if isinstance(shape, Polygon2D):
+            shape = Region2D.from_polygon(shape)
+        elif not isinstance(shape, Region2D):
+            raise TypeError("Shapes must be Region2D or Polygon2D instances.")
+        regions.append(shape)
+    return regions
+
+
+def boolean(subject: Region2D | Polygon2D | Iterable[Region2D | Polygon2D],
+            clip: Region2D | Polygon2D | Iterable[Region2D | Polygon2D], operation: int,
+            tolerance: int | float = TOLERANCE_LENGTH) -> list[Region2D]:
+    """
+    Apply a boolean operation to two sets of regions.
+    The regions within each set may overlap; each set stands for the union of its regions.
+    :param subject: Region, polygon, or iterable of them.
+    :param clip: Region, polygon, or iterable of them.
+    :param operation: UNION, INTERSECTION, DIFFERENCE (subject minus clip) or XOR.
+    :param tolerance: Distance within which vertices and crossings are merged.
+    :return: List of disjoint result regions.
+    """
+    if operation not in _OPERATIONS:
+        raise ValueError("Unknown boolean operation %r." % (operation,))
+    if not isinstance(tolerance, (int, float)):
+        raise TypeError("Tolerance must be a numeric value.")
+    if tolerance < 0:
+        raise ValueError("Tolerance cannot be negative.")
+    subject, clip = as_regions(subject), as_regions(clip)
+    return _Overlay(subject + clip, [0] * len(subject) + [1] * len(clip), operation, tolerance).run()
+
+
+def union(subject, clip, tolerance: int | float = TOLERANCE_LENGTH) -> list[Region2D]:
+    """Union of two regions or sets of regions (see boolean)."""
+    return boolean(subject, clip, UNION, tolerance)
+
+
+def intersection(subject, clip, tolerance: int | float = TOLERANCE_LENGTH) -> list[Region2D]:
+    """Intersection of two regions or sets of regions (see boolean)."""
+    return boolean(subject, clip, INTERSECTION, tolerance)
+
+
+def difference(subject, clip, tolerance: int | float = TOLERANCE_LENGTH) -> list[Region2D]:
+    """Subject minus clip for regions or sets of regions (see boolean)."""
+    return boolean(subject, clip, DIFFERENCE, tolerance)
+
+
+def xor(subject, clip, tolerance: int | float = TOLERANCE_LENGTH) -> list[Region2D]:
+    """Symmetric difference of two regions or sets of regions (see boolean)."""
+    return boolean(subject, clip, XOR, tolerance)
+
+
+def union_all(shapes: Iterable[Region2D | Polygon2D], tolerance: int | float = TOLERANCE_LENGTH) -> list[Region2D]:
+    """
+    Union of many regions at once, e.g. the part outlines of a nest.
+    Regions are grouped by overlapping bounding boxes and every group is merged in a single pass.
+    :param shapes: Iterable of Region2D and Polygon2D instances.
+    :param tolerance: Distance within which vertices and crossings are merged.
+    :return: List of disjoint result regions.
+    """
+    return boolean(shapes, (), UNION, tolerance)
@@ -0,0 +1,143 @@
+import random
+import unittest
+from math import hypot, pi
+
+from .boolean import (Region2D, boolean, union, intersection, difference, xor, union_all, as_regions, UNION,
+                      INTERSECTION, DIFFERENCE, XOR)
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from .test_shapes import square, circle
+
+
+class TestBoolean(unittest.TestCase):
+    def test_overlapping_squares(self):
+        first, second = square(0, 0, 2), square(1, 1, 2)
+        expected = {UNION: [7], INTERSECTION: [1], DIFFERENCE: [3], XOR: [3, 3]}
+        for operation, areas in expected.items():
+            result = boolean(first, second, operation)
+            self.assertEqual(sorted(round(region.area(), 9) for region in result), areas)
+        merged, = union(first, second)
+        self.assertEqual(len(merged.ring(0)), 8)
+        self.assertTrue(merged.is_polygonal())
+        self.assertAlmostEqual(merged.to_polygon().area(), 7)
+
+    def test_shared_and_touching_edges(self):
+        merged, = union(square(0, 0, 1), square(1, 0, 1))
+        self.assertEqual(len(merged.ring(0)), 4)
+        self.assertAlmostEqual(merged.area(), 2)
+        # Squares touching at a corner stay two regions.
+        self.assertEqual(len(union(square(0, 0, 1), square(1, 1, 1))), 2)
+        self.assertEqual(intersection(square(0, 0, 1), square(1, 0, 1)), [])
+        self.assertEqual(len(difference(square(0, 0, 1), square(1, 0, 1))), 1)
+
+    def test_holes(self):
+        region, = difference(square(0, 0, 10), square(3, 3, 2))
+        self.assertEqual(region.ring_count, 2)
+        self.assertAlmostEqual(region.area(), 96)
+        self.assertFalse(region.contains(Point2D(4, 4)))
+        self.assertTrue(region.contains(Point2D(1, 1)))
+        frame = [square(i, j, 1) for i in range(5) for j in range(5) if i in (0, 4) or j in (0, 4)]
+        region, = union_all(frame)
+        self.assertEqual([len(region.ring(k)) for k in range(region.ring_count)], [4, 4])
+        self.assertAlmostEqual(region.area(), 16)
+        filled, = union(region, square(1, 1, 3))
+        self.assertEqual(filled.ring_count, 1)
+        self.assertAlmostEqual(filled.area(), 25)
+
+    def test_contains_across_closing_gap(self):
+        # The last quarter of the circle ends 1e-12 below its start; the gap is closed.
+        disc = circle(0, 0, 1)
+        self.assertTrue(disc.contains(Point2D(0.5, -1e-13)))
+        self.assertTrue(disc.contains(Point2D(0.5, 1e-13)))
+        self.assertFalse(disc.contains(Point2D(1.5, -1e-13)))
+        records = disc.records()
+        self.assertEqual([piece[1:3] for piece in records[0]],
+                         [piece[3:5] for piece in records[0][-1:] + records[0][:-1]])
+
+    def test_arcs(self):
+        disc = circle(0, 0, 1)
+        self.assertAlmostEqual(disc.area(), pi)
+        quarter, = intersection(disc, square(0, 0, 2))
+        self.assertAlmostEqual(quarter.area(), pi / 4)
+        self.assertEqual(sorted(type(piece).__name__ for piece in quarter.ring(0)), ['Arc2D', 'Line2D', 'Line2D'])
+        sheet, = difference(square(-2, -2, 4), disc)
+        self.assertAlmostEqual(sheet.area(), 16 - pi)
+        for piece in sheet.ring(1):
+            self.assertAlmostEqual(hypot(piece.sp.x, piece.sp.y), 1)
+        lens = intersection(disc, circle(1, 0, 1))
+        self.assertAlmostEqual(lens[0].area(), 2 * pi / 3 - 3 ** 0.5 / 2)
+
+    def test_matches_point_sampling(self):
+        random.seed(2)
+        circles = [(random.uniform(0, 10), random.uniform(0, 10), random.uniform(0.5, 2)) for _ in range(25)]
+        squares = [(random.uniform(0, 10), random.uniform(0, 10), random.uniform(0.5, 3)) for _ in range(25)]
+        subject = [circle(*spec) for spec in circles]
+        clip = [square(*spec) for spec in squares]
+
+        def in_subject(x, y):
+            return any(hypot(x - cx, y - cy) < radius for cx, cy, radius in circles)
+
+        def in_clip(x, y):
+            return any(sx < x < sx + size and sy < y < sy + size for sx, sy, size in squares)
+
+        rules = {UNION: lambda a, b: a or b, INTERSECTION: lambda a, b: a and b,
+                 DIFFERENCE: lambda a, b: a and not b, XOR: lambda a, b: a != b}
+        for operation, rule in rules.items():
+            result = boolean(subject, clip, operation)
+            for _ in range(400):
+                x, y = random.uniform(-2, 14), random.uniform(-2, 14)
+                covered = sum(region.contains(Point2D(x, y)) for region in result)
+                self.assertLessEqual(covered, 1)
+                self.assertEqual(covered == 1, rule(in_subject(x, y), in_clip(x, y)))
+
+    def test_union_all_of_a_grid(self):
+        squares = [square(i, j, 1) for i in range(12) for j in range(12) if (i, j) != (5, 6)]
+        region, = union_all(squares)
+        self.assertEqual(region.ring_count, 2)
+        self.assertEqual(len(region.ring(0)), 4)
+        self.assertAlmostEqual(region.area(), 143)
+        # Regions overlapping nothing pass through untouched.
+        far = Region2D.from_polygon(square(100, 100, 1))
+        self.assertIn(far, union_all([far, square(0, 0, 1)]))
+
+    def test_region_rings(self):
+        points = [Point2D(0, 0), Point2D(0, 3), Point2D(3, 3), Point2D(3, 0)]
+        region = Region2D([[Line2D(points[k], points[(k + 1) % 4]) for k in range(4)]])
+        ring = region.ring(0)
+        self.assertAlmostEqual(region.area(), 9)
+        # The clockwise outer ring is turned counterclockwise, and consecutive pieces share points.
+        self.assertEqual((ring[0].ep.x, ring[0].ep.y), (3, 0))
+        for first, second in zip(ring, ring[1:] + ring[:1]):
+            self.assertIs(first.ep, second.sp)
+        self.assertEqual(region.bounding_box(), (0, 0, 3, 3))
+        self.assertEqual(region.records()[0][0][1:5], [0, 0, 3, 0])
+
+    def test_as_regions(self):
+        region = Region2D.from_polygon(square(0, 0, 1))
+        self.assertEqual(as_regions(region), [region])
+        converted = as_regions([region, square(2, 0, 1)])
+        self.assertEqual(len(converted), 2)
+        self.assertIs(converted[0], region)
+        self.assertAlmostEqual(converted[1].area(), 1)
+        with self.assertRaises(TypeError):
+            as_regions([Point2D(0, 0)])
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            union(square(0, 0, 1), [Point2D(0, 0)])
+        with self.assertRaises(ValueError):
+            boolean(square(0, 0, 1), square(0, 0, 1), 7)
+        with self.assertRaises(ValueError):
+            xor(square(0, 0, 1), square(0, 0, 1), tolerance=-1)
+        with self.assertRaises(ValueError):
+            Region2D([])
+        with self.assertRaises(ValueError):
+            Region2D([[Line2D(Point2D(0, 0), Point2D(1, 0)), Line2D(Point2D(2, 0), Point2D(0, 0))]])
+        with self.assertRaises(ValueError):
+            circle(0, 0, 1).to_polygon()
+        with self.assertRaises(IndexError):
+            circle(0, 0, 1).ring(1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+"""
+Shapes shared by the tests of packages working on regions; not part of the
+public API and holds no tests itself.
+"""
+from math import cos, pi, sin
+
+from point2d.point2d import Point2D
+from arc2d.arc2d import Arc2D
+from polygon2d.polygon2d import Polygon2D
+from .boolean import Region2D
+
+
+def square(x: int | float, y: int | float, size: int | float) -> Polygon2D:
+    """
+    Build an axis-aligned square.
+    :param x: X-coordinate of the lower left corner.
+    :param y: Y-coordinate of the lower left corner.
+    :param size: Side length.
+    :return: Counterclockwise Polygon2D.
+    """
+    return Polygon2D([Point2D(x, y), Point2D(x + size, y), Point2D(x + size, y + size), Point2D(x, y + size)])
+
+
+def circle(cx: int | float, cy: int | float, radius: int | float) -> Region2D:
+    """
+    Build a disc bounded by four quarter arcs.
+    :param cx: X-coordinate of the center.
+    :param cy: Y-coordinate of the center.
+    :param radius: Radius.
+    :return: Region2D.
+    """
+    points = [Point2D(cx + radius * cos(k * pi / 2), cy + radius * sin(k * pi / 2)) for k in range(4)]
+    # The last quarter ends just below angle zero so that Arc2D reads it counterclockwise.
+    points.append(Point2D(cx + radius, cy - 1e-12 * radius))
+    return Region2D([[Arc2D(Point2D(cx, cy), points[k], points[k + 1]) for k in range(4)]])
@@ -0,0 +1,2 @@
+from .chaining import Chain, chain_entities
+__all__ = ['Chain', 'chain_entities']
@@ -0,0 +1,135 @@
+"""
+Chaining of unordered Line2D/Arc2D pieces into continuous paths.
+
+End points are hashed through the Mesh2D snapping grid, so pieces whose ends
+are within the tolerance are linked in linear expected time.  Chains run
+through vertices shared by exactly two pieces and stop at free ends and at
+branch vertices (three or more pieces); the remaining pieces form closed
+loops.  Pieces running against the chain direction are reversed as with
+Line2D.reverse and Arc2D.reverse: either in place or as reversed copies
+sharing the original Point2D objects.
+"""
+from typing import Iterable, Iterator
+
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D, TOLERANCE_LENGTH
+from mesh.mesh import Mesh2D
+
+
+class Chain:
+    def __init__(self, entities: list, indices: list[int], reversed_flags: list[bool], closed: bool):
+        """
+        Initialize an ordered chain of pieces.
+        :param entities: Oriented Line2D/Arc2D pieces; each one starts where the previous one ends.
+        :param indices: Position of each piece in the chained input.
+        :param reversed_flags: True for pieces running against their input direction.
+        :param closed: True if the chain ends where it starts.
+        """
+        self.entities = entities
+        self.indices = indices
+        self.reversed = reversed_flags
+        self.closed = closed
+
+    @property
+    def start(self) -> Point2D:
+        """Get the start point of the chain."""
+        return self.entities[0].sp
+
+    @property
+    def end(self) -> Point2D:
+        """Get the end point of the chain."""
+        return self.entities[-1].ep
+
+    def length(self) -> float:
+        """Get the total length of the chain."""
+        return sum(entity.length() if isinstance(entity, Line2D) else entity.arc_length()
+                   for entity in self.entities)
+
+    def reverse(self) -> "Chain":
+        """
+        Reverse the chain, replacing every piece with a reversed copy sharing its points.
+        :return: The chain itself.
+        """
+        self.entities = [_reversed_copy(entity) for entity in reversed(self.entities)]
+        self.indices.reverse()
+        self.reversed = [not flag for flag in reversed(self.reversed)]
+        return self
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def __iter__(self) -> Iterator:
+        return iter(self.entities)
+
+    def __repr__(self) -> str:
+        return "Chain(%d pieces, %s)" % (len(self.entities), "closed" if self.closed else "open")
+
+
+def _reversed_copy(entity):
+    if isinstance(entity, Line2D):
+        return Line2D(entity.ep, entity.sp)
+    return Arc2D(entity.cp, entity.ep, entity.sp)
+
+
+def chain_entities(entities: Iterable[Line2D | Arc2D], tolerance: int | float = TOLERANCE_LENGTH,
+                   in_place: bool = False) -> list[Chain]:
+    """
+    Join pieces into open and closed chains.
+    Open chains are listed first, starting from free ends and branch vertices in input order,
+    followed by closed loops starting at their lowest-indexed piece.
+    :param entities: Iterable of Line2D and Arc2D instances.
+    :param tolerance: Distance below which end points are considered connected.
+    :param in_place: Reverse input pieces in place instead of returning reversed copies.
+    :return: List of Chain objects covering every piece exactly once.
+    """
+    pieces = list(entities)
+    mesh = Mesh2D(tolerance)
+    ends = []
+    for piece in pieces:
+        if isinstance(piece, Line2D):
+            sp, ep = piece.points
+        elif isinstance(piece, Arc2D):
+            _, sp, ep = piece.points
+        else:
+            raise TypeError("Entities must be Line2D or Arc2D instances.")
+        ends.append((mesh.snap_vertex(sp.x, sp.y), mesh.snap_vertex(ep.x, ep.y)))
+    incidence = [[] for _ in range(mesh.vertex_count)]
+    for index, (start, end) in enumerate(ends):
+        incidence[start].append(index)
+        incidence[end].append(index)
+    used = bytearray(len(pieces))
+
+    def walk(first: int, vertex: int) -> Chain:
+        origin = vertex
+        oriented, indices, flags = [], [], []
+        index = first
+        while True:
+            used[index] = 1
+            start, end = ends[index]
+            flipped = start != vertex
+            piece = pieces[index]
+            if flipped:
+                piece = piece.reverse() if in_place else _reversed_copy(piece)
+            oriented.append(piece)
+            indices.append(index)
+            flags.append(flipped)
+            vertex = start if flipped else end
+            linked = incidence[vertex]
+            if len(linked) != 2:
+                break
+            index = linked[0] if not used[linked[0]] else linked[1]
+            if used[index]:
+                break
+        return Chain(oriented, indices, flags, vertex == origin)
+
+    chains = []
+    for vertex, linked in enumerate(incidence):
+        if len(linked) != 2:
+            for index in linked:
+                if not used[index]:
+                    chains.append(walk(index, vertex))
+    for index in range(len(pieces)):
+        if not used[index]:
+            chains.append(walk(index, ends[index][0]))
+    return chains
@@ -0,0 +1,104 @@
+import random
+import unittest
+from math import pi
+
+from .chaining import chain_entities
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+
+
+def _assert_continuous(test, chain):
+    for previous, current in zip(chain.entities, chain.entities[1:]):
+        test.assertLess(previous.ep.distance_to(current.sp), 1e-6)
+    if chain.closed:
+        test.assertLess(chain.end.distance_to(chain.start), 1e-6)
+
+
+class TestChaining(unittest.TestCase):
+    def test_closed_square_from_shuffled_reversed_pieces(self):
+        pts = [Point2D(0, 0), Point2D(2, 0), Point2D(2, 2), Point2D(0, 2)]
+        lines = [Line2D(pts[k], pts[(k + 1) % 4]) for k in range(4)]
+        lines[1].reverse()
+        lines[3].reverse()
+        shuffled = [lines[2], lines[0], lines[3], lines[1]]
+        chains = chain_entities(shuffled)
+        self.assertEqual(len(chains), 1)
+        chain = chains[0]
+        self.assertTrue(chain.closed)
+        self.assertEqual(sorted(chain.indices), [0, 1, 2, 3])
+        self.assertAlmostEqual(chain.length(), 8)
+        _assert_continuous(self, chain)
+        # Input pieces are left untouched by default.
+        self.assertEqual(lines[1].sp, pts[2])
+
+    def test_open_chain_with_arc(self):
+        arc = Arc2D(Point2D(1, 0), Point2D(2, 0), Point2D(0, 0))
+        pieces = [Line2D(Point2D(3, 0), Point2D(2, 0)), arc, Line2D(Point2D(-1, 0), Point2D(0, 0))]
+        chains = chain_entities(pieces)
+        self.assertEqual(len(chains), 1)
+        chain = chains[0]
+        self.assertFalse(chain.closed)
+        self.assertEqual(len(chain), 3)
+        self.assertAlmostEqual(chain.length(), 2 + pi)
+        _assert_continuous(self, chain)
+        self.assertEqual({chain.start.x, chain.end.x}, {3, -1})
+
+    def test_reversed_arc_keeps_points(self):
+        arc = Arc2D(Point2D(1, 0), Point2D(2, 0), Point2D(0, 0))
+        pieces = [Line2D(Point2D(2, 0), Point2D(3, 0)), arc]
+        chain = chain_entities(pieces)[0]
+        flipped = [entity for entity, flag in zip(chain.entities, chain.reversed) if flag]
+        self.assertEqual(len(flipped), 1)
+        for entity in chain.entities:
+            if isinstance(entity, Arc2D):
+                self.assertAlmostEqual(entity.arc_length(), arc.arc_length())
+
+    def test_in_place(self):
+        line = Line2D(Point2D(1, 0), Point2D(0, 0))
+        chain = chain_entities([Line2D(Point2D(-1, 0), Point2D(0, 0)), line], in_place=True)[0]
+        self.assertIn(line, chain.entities)
+        self.assertTrue(any(entity is line for entity in chain.entities))
+
+    def test_branch_splits_chains(self):
+        center = Point2D(0, 0)
+        pieces = [Line2D(center, Point2D(1, 0)), Line2D(center, Point2D(0, 1)), Line2D(Point2D(-1, 0), center)]
+        chains = chain_entities(pieces)
+        self.assertEqual(len(chains), 3)
+        self.assertTrue(all(len(chain) == 1 for chain in chains))
+
+    def test_tolerance(self):
+        pieces = [Line2D(Point2D(0, 0), Point2D(1, 0)), Line2D(Point2D(1.0005, 0), Point2D(2, 0))]
+        self.assertEqual(len(chain_entities(pieces)), 2)
+        self.assertEqual(len(chain_entities(pieces, tolerance=1e-3)), 1)
+
+    def test_many_random_polylines(self):
+        rng = random.Random(4)
+        pieces = []
+        for p in range(50):
+            points = [Point2D(p * 100 + k, rng.uniform(0, 10)) for k in range(20)]
+            pieces += [Line2D(points[k], points[k + 1]) for k in range(19)]
+        rng.shuffle(pieces)
+        for piece in pieces[::3]:
+            piece.reverse()
+        chains = chain_entities(pieces)
+        self.assertEqual(len(chains), 50)
+        self.assertEqual(sum(len(chain) for chain in chains), len(pieces))
+        for chain in chains:
+            _assert_continuous(self, chain)
+
+    def test_chain_reverse(self):
+        pieces = [Line2D(Point2D(0, 0), Point2D(1, 0)), Line2D(Point2D(1, 0), Point2D(2, 0))]
+        chain = chain_entities(pieces)[0]
+        start, end = chain.start, chain.end
+        chain.reverse()
+        self.assertEqual((chain.start, chain.end), (end, start))
+        _assert_continuous(self, chain)
+
+    def test_type_error(self):
+        with self.assertRaises(TypeError):
+            chain_entities([Point2D(0, 0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
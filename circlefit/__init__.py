@@ -0,0 +1,2 @@
+from .circlefit import CircleFit, fit_circle, fit_circles
+__all__ = ['CircleFit', 'fit_circle', 'fit_circles']
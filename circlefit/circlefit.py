@@ -0,0 +1,259 @@
+"""
+Least-squares circle and arc fitting.
+
+Three methods fit a circle to a group of points given as a flat buffer
+[x, y, x, y, ...]:
+
+- "kasa": algebraic fit minimizing the sum of (x^2 + y^2 + Dx + Ey + F)^2,
+  a linear solve; fast but biased towards small radii on short arcs;
+- "pratt": algebraic fit with Pratt's normalization, solved with Chernov's
+  Newton iteration on the characteristic polynomial; nearly unbiased and
+  the default;
+- "geometric": Gauss-Newton minimization of the sum of squared distances
+  to the circle, started from the Pratt fit.
+
+All methods work on coordinates centered on the group mean for accuracy.
+fit_circles fits many groups given in the ragged layout of the rings
+module (coordinates plus offsets).  Every result carries the residual
+statistics of the geometric distances |p - c| - r and can build the Arc2D
+from the first to the last point of its group.
+"""
+from math import hypot, isfinite, sqrt
+from typing import Iterable, Optional, Sequence
+
+from point2d.point2d import Point2D
+from arc2d.arc2d import Arc2D
+
+METHODS = ('kasa', 'pratt', 'geometric')
+
+
+class CircleFit:
+    def __init__(self, cx: float, cy: float, radius: float, rms: float, max_error: float, count: int,
+                 first: tuple[float, float], last: tuple[float, float]):
+        """
+        Initialize a fitted circle.
+        :param cx: Center x-coordinate.
+        :param cy: Center y-coordinate.
+        :param radius: Circle radius.
+        :param rms: Root mean square of the point-to-circle distances.
+        :param max_error: Largest absolute point-to-circle distance.
+        :param count: Number of fitted points.
+        :param first: First point of the group.
+        :param last: Last point of the group.
+        """
+        self.cx = cx
+        self.cy = cy
+        self.radius = radius
+        self.rms = rms
+        self.max_error = max_error
+        self.count = count
+        self.first = first
+        self.last = last
+
+    @property
+    def center(self) -> Point2D:
+        """Get the circle center."""
+        return Point2D(self.cx, self.cy)
+
+    def _project(self, x: float, y: float) -> Point2D:
+        d = hypot(x - self.cx, y - self.cy)
+        return Point2D(self.cx + (x - self.cx) * self.radius / d, self.cy + (y - self.cy) * self.radius / d)
+
+    def arc(self) -> Arc2D:
+        """
+        Build the Arc2D from the first to the last fitted point, both projected onto the circle.
+        Arc2D sweeps from its start angle to its end angle without crossing angle zero.
+        :return: A new Arc2D.
+        """
+        return Arc2D(self.center, self._project(*self.first), self._project(*self.last))
+
+    def __repr__(self) -> str:
+        return "CircleFit(center=(%g, %g), radius=%g, rms=%g, max_error=%g, count=%d)" % (
+            self.cx, self.cy, self.radius, self.rms, self.max_error, self.count)
+
+
+def _solve3(m: list[list[float]], b: list[float]) -> Optional[list[float]]:
+    # Gaussian elimination with partial pivoting on a 3x3 system.
+    a = [row[:] + [value] for row, value in zip(m, b)]
+    for col in range(3):
+        pivot = max(range(col, 3), key=lambda r: abs(a[r][col]))
+        if a[pivot][col] == 0:
+            return None
+        a[col], a[pivot] = a[pivot], a[col]
+        for r in range(col + 1, 3):
+            f = a[r][col] / a[col][col]
+            for c in range(col, 4):
+                a[r][c] -= f * a[col][c]
+    x = [0.0, 0.0, 0.0]
+    for r in (2, 1, 0):
+        x[r] = (a[r][3] - sum(a[r][c] * x[c] for c in range(r + 1, 3))) / a[r][r]
+    return x
+
+
+def _moments(points: Sequence[float], first: int, last: int) -> tuple:
+    n = last - first
+    mx = my = 0.0
+    for v in range(first, last):
+        mx += points[2 * v]
+        my += points[2 * v + 1]
+    mx /= n
+    my /= n
+    sxx = syy = sxy = sxz = syz = szz = 0.0
+    for v in range(first, last):
+        x, y = points[2 * v] - mx, points[2 * v + 1] - my
+        z = x * x + y * y
+        sxx += x * x
+        syy += y * y
+        sxy += x * y
+        sxz += x * z
+        syz += y * z
+        szz += z * z
+    return mx, my, sxx / n, syy / n, sxy / n, sxz / n, syz / n, szz / n
+
+
+def _kasa(moments: tuple) -> Optional[tuple[float, float, float]]:
+    mx, my, mxx, myy, mxy, mxz, myz, _ = moments
+    det = mxx * myy - mxy * mxy
+    if det == 0:
+        return None
+    # Centered normal equations: [mxx mxy; mxy myy] c = (mxz, myz) / 2.
+    ux = (mxz * myy - myz * mxy) / (2 * det)
+    uy = (myz * mxx - mxz * mxy) / (2 * det)
+    return mx + ux, my + uy, sqrt(ux * ux + uy * uy + mxx + myy)
+
+
+def _pratt(moments: tuple) -> Optional[tuple[float, float, float]]:
+    mx, my, mxx, myy, mxy, mxz, myz, mzz = moments
+    mz = mxx + myy
+    cov = mxx * myy - mxy * mxy
+    a2 = 4 * cov - 3 * mz * mz - mzz
+    a1 = mzz * mz + 4 * cov * mz - mxz * mxz - myz * myz - mz * mz * mz
+    a0 = mxz * mxz * myy + myz * myz * mxx - mzz * cov - 2 * mxz * myz * mxy + mz * mz * cov
+    # Newton iteration from 0 towards the smallest root of the characteristic polynomial.
+    x, y = 0.0, a0
+    for _ in range(20):
+        dy = a1 + x * (2 * a2 + 16 * x * x)
+        if dy == 0:
+            break
+        step = x - y / dy
+        if step == x or not isfinite(step):
+            break
+        new_y = a0 + step * (a1 + step * (a2 + 4 * step * step))
+        if abs(new_y) >= abs(y):
+            break
+        x, y = step, new_y
+    det = x * x - x * mz + cov
+    if det == 0:
+        return None
+    ux = (mxz * (myy - x) - myz * mxy) / (2 * det)
+    uy = (myz * (mxx - x) - mxz * mxy) / (2 * det)
+    return mx + ux, my + uy, sqrt(ux * ux + uy * uy + mz + 2 * x)
+
+
+def _geometric(points: Sequence[float], first: int, last: int, start: tuple[float, float, float],
+               iterations: int) -> tuple[float, float, float]:
+    # Each pass evaluates the cost of the current estimate together with the normal equations;
+    # a step that does not lower the cost is undone.
+    cx, cy, r = start
+    previous, cost = None, float('inf')
+    for _ in range(iterations + 1):
+        total = aa = ab = ac = bb = bc = ga = gb = gc = 0.0
+        n = 0
+        for v in range(first, last):
+            dx, dy = points[2 * v] - cx, points[2 * v + 1] - cy
+            d = hypot(dx, dy)
+            if d == 0:
+                continue
+            ux, uy = dx / d, dy / d
+            e = d - r
+            total += e * e
+            # The residual d - r has the Jacobian row (-ux, -uy, -1).
+            aa += ux * ux
+            ab += ux * uy
+            ac += ux
+            bb += uy * uy
+            bc += uy
+            ga += ux * e
+            gb += uy * e
+            gc += e
+            n += 1
+        if previous is not None and not total < cost:
+            cx, cy, r = previous
+            break
+        converged = previous is not None and cost - total <= 1e-10 * cost
+        cost, previous = total, (cx, cy, r)
+        if converged:
+            break
+        step = _solve3([[aa, ab, ac], [ab, bb, bc], [ac, bc, float(n)]], [ga, gb, gc])
+        if step is None:
+            break
+        cx, cy, r = cx + step[0], cy + step[1], r + step[2]
+    else:
+        cx, cy, r = previous
+    return cx, cy, r
+
+
+def _fit_group(points: Sequence[float], first: int, last: int, method: str, iterations: int) -> Optional[CircleFit]:
+    if last - first < 3:
+        return None
+    moments = _moments(points, first, last)
+    circle = _kasa(moments) if method == 'kasa' else _pratt(moments)
+    if circle is None or not all(isfinite(value) for value in circle):
+        return None
+    if method == 'geometric':
+        circle = _geometric(points, first, last, circle, iterations)
+    cx, cy, r = circle
+    total, worst = 0.0, 0.0
+    for v in range(first, last):
+        e = hypot(points[2 * v] - cx, points[2 * v + 1] - cy) - r
+        total += e * e
+        worst = max(worst, abs(e))
+    return CircleFit(cx, cy, r, sqrt(total / (last - first)), worst, last - first,
+                     (points[2 * first], points[2 * first + 1]), (points[2 * last - 2], points[2 * last - 1]))
+
+
+def _check_method(method: str, iterations: int) -> None:
+    if method not in METHODS:
+        raise ValueError("Method must be one of %s." % ", ".join(METHODS))
+    if iterations < 0:
+        raise ValueError("Iterations cannot be negative.")
+
+
+def fit_circle(points: Iterable[Point2D] | Sequence[float], method: str = 'pratt', iterations: int = 20) -> CircleFit:
+    """
+    Fit a circle to one group of points.
+    :param points: Iterable of Point2D instances or a flat point buffer.
+    :param method: "kasa", "pratt" or "geometric".
+    :param iterations: Maximum Gauss-Newton iterations of the geometric fit.
+    :return: The fitted circle.
+    """
+    _check_method(method, iterations)
+    points = list(points)
+    if points and isinstance(points[0], Point2D):
+        if not all(isinstance(point, Point2D) for point in points):
+            raise TypeError("Points must be Point2D instances.")
+        points = [value for point in points for value in (point.x, point.y)]
+    if len(points) % 2 != 0:
+        raise ValueError("Buffer length must be a multiple of 2.")
+    fit = _fit_group(points, 0, len(points) // 2, method, iterations)
+    if fit is None:
+        raise ValueError("A circle needs at least 3 points that are not collinear.")
+    return fit
+
+
+def fit_circles(coords: Sequence[float], offsets: Sequence[int], method: str = 'pratt', iterations: int = 20,
+                start: int = 0, stop: Optional[int] = None) -> list[Optional[CircleFit]]:
+    """
+    Fit a circle to every group of a ragged point layout.
+    :param coords: Flat point buffer of all groups.
+    :param offsets: Group offsets: group g spans points offsets[g] to offsets[g + 1].
+    :param method: "kasa", "pratt" or "geometric".
+    :param iterations: Maximum Gauss-Newton iterations of the geometric fit.
+    :param start: First group to fit.
+    :param stop: One past the last group to fit (all groups if None).
+    :return: One CircleFit per group in [start, stop), or None for groups with fewer than 3 points
+             or collinear points.
+    """
+    _check_method(method, iterations)
+    stop = len(offsets) - 1 if stop is None else stop
+    return [_fit_group(coords, offsets[g], offsets[g + 1], method, iterations) for g in range(start, stop)]
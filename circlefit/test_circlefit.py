@@ -0,0 +1,77 @@
+import random
+import unittest
+from array import array
+from math import cos, sin
+
+from .circlefit import CircleFit, fit_circle, fit_circles
+from point2d.point2d import Point2D
+from arc2d.arc2d import Arc2D
+
+
+def _arc_points(cx, cy, r, a0, a1, n, noise=0.0, rng=None):
+    coords = []
+    for k in range(n):
+        t = a0 + (a1 - a0) * k / (n - 1)
+        e = rng.gauss(0, noise) if noise else 0.0
+        coords += [cx + (r + e) * cos(t), cy + (r + e) * sin(t)]
+    return coords
+
+
+class TestCircleFit(unittest.TestCase):
+    def test_exact_points_all_methods(self):
+        coords = _arc_points(1000, -500, 7, 0.2, 1.4, 12)
+        for method in ('kasa', 'pratt', 'geometric'):
+            fit = fit_circle(coords, method)
+            self.assertIsInstance(fit, CircleFit)
+            self.assertAlmostEqual(fit.cx, 1000, places=6)
+            self.assertAlmostEqual(fit.cy, -500, places=6)
+            self.assertAlmostEqual(fit.radius, 7, places=6)
+            self.assertLess(fit.rms, 1e-6)
+            self.assertEqual(fit.count, 12)
+
+    def test_point2d_input_and_arc(self):
+        points = [Point2D(x, y) for x, y in ((2, 0), (0, 2), (-2, 0))]
+        fit = fit_circle(points)
+        self.assertAlmostEqual(fit.radius, 2)
+        arc = fit.arc()
+        self.assertIsInstance(arc, Arc2D)
+        self.assertAlmostEqual(arc.sp.x, 2)
+        self.assertAlmostEqual(arc.ep.x, -2)
+        self.assertAlmostEqual(arc.radius_cp_sp(), 2)
+
+    def test_noisy_short_arc_geometric_beats_kasa(self):
+        rng = random.Random(4)
+        coords = _arc_points(0, 0, 50, 0.3, 0.9, 40, noise=0.05, rng=rng)
+        kasa, pratt, geometric = (fit_circle(coords, method) for method in ('kasa', 'pratt', 'geometric'))
+        self.assertLessEqual(geometric.rms, pratt.rms + 1e-12)
+        self.assertLessEqual(geometric.rms, kasa.rms + 1e-12)
+        self.assertLess(abs(geometric.radius - 50), 2)
+        self.assertGreaterEqual(geometric.max_error, geometric.rms)
+
+    def test_batched_groups(self):
+        coords = array('d', _arc_points(0, 0, 1, 0.1, 1.0, 5) + [0, 0, 1, 1] + _arc_points(5, 5, 3, 2.0, 3.0, 6)
+                       + [0, 0, 1, 0, 2, 0])
+        offsets = [0, 5, 7, 13, 16]
+        fits = fit_circles(coords, offsets, 'geometric')
+        self.assertEqual(len(fits), 4)
+        self.assertAlmostEqual(fits[0].radius, 1)
+        self.assertIsNone(fits[1])
+        self.assertAlmostEqual(fits[2].cx, 5)
+        self.assertAlmostEqual(fits[2].radius, 3)
+        self.assertIsNone(fits[3])
+        self.assertEqual(len(fit_circles(coords, offsets, start=2, stop=3)), 1)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            fit_circle([0, 0, 1, 0, 2, 0])
+        with self.assertRaises(ValueError):
+            fit_circle([0, 0, 1, 1], 'pratt')
+        with self.assertRaises(ValueError):
+            fit_circle([0, 0, 1, 1, 2, 0], 'median')
+        with self.assertRaises(ValueError):
+            fit_circle([0, 0, 1, 1, 2])
+        self.assertIn('radius', repr(fit_circle([0, 1, 1, 0, -1, 0])))
+
+
+if __name__ == '__main__':
+    unittest.main()
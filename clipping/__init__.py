@@ -0,0 +1,2 @@
+from .clipping import ClipIndex, clip_segments, clip_arcs
+__all__ = ['ClipIndex', 'clip_segments', 'clip_arcs']
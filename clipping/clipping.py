@@ -0,0 +1,305 @@
+"""
+Clipping of segment and arc buffers to an axis-aligned box.
+
+Inputs use the flat buffer layouts of the kernels module (4 floats per
+segment, 6 per arc: center, start point, end point).  Clipping keeps only
+the parts of every item inside the box and emits them compactly: a new
+buffer in the same layout holding the surviving pieces, plus an array('q')
+giving, for each piece, the index of the item it was cut from.  An arc may
+leave several sub-arcs; a segment leaves at most one piece.
+
+clip_segments tests both ends against the box first, which accepts or
+rejects most segments without arithmetic (the Cohen-Sutherland outcode
+test), and clips the rest with Liang-Barsky.  clip_arcs cuts each arc at
+the box edges it crosses and keeps the sub-arcs whose midpoints lie inside.
+
+A viewer clipping the same drawing at every pan or zoom should build a
+ClipIndex once.  It reorders the items by the cells of a uniform grid and
+keeps the bounds of every cell's items, so that a query skips cells outside
+the box, copies the cells inside it as contiguous slices, and clips item by
+item only in the cells straddling the box edges.  A query then costs little
+more than the number of cells along the box outline plus the size of the
+output.
+"""
+from array import array
+from math import acos, asin, atan2, ceil, cos, floor, pi, sin, sqrt
+from typing import Optional, Sequence
+
+from kernels.kernels import ARC_STRIDE, SEGMENT_STRIDE, item_count
+
+TWO_PI = 2 * pi
+# Items per cell of a ClipIndex by default.
+CELL_ITEMS = 32
+
+
+def _check_box(box: Sequence[float]) -> tuple[float, float, float, float]:
+    if len(box) != 4 or not all(isinstance(value, (int, float)) for value in box):
+        raise TypeError("Box must be a (min_x, min_y, max_x, max_y) sequence of numbers.")
+    min_x, min_y, max_x, max_y = box
+    if min_x > max_x or min_y > max_y:
+        raise ValueError("Box minimum must not exceed its maximum.")
+    return float(min_x), float(min_y), float(max_x), float(max_y)
+
+
+def _clip_segment_range(segments: Sequence[float], box: tuple[float, float, float, float], start: int, stop: int,
+                        out: array, index: array, ids: Optional[Sequence[int]] = None) -> None:
+    min_x, min_y, max_x, max_y = box
+    for i in range(start, stop):
+        k = SEGMENT_STRIDE * i
+        ax, ay, bx, by = segments[k], segments[k + 1], segments[k + 2], segments[k + 3]
+        if min_x <= ax <= max_x and min_y <= ay <= max_y and min_x <= bx <= max_x and min_y <= by <= max_y:
+            out.extend((ax, ay, bx, by))
+        else:
+            if ((ax < min_x and bx < min_x) or (ax > max_x and bx > max_x)
+                    or (ay < min_y and by < min_y) or (ay > max_y and by > max_y)):
+                continue
+            # Liang-Barsky: narrow [t0, t1] against each of the four edges.
+            dx, dy = bx - ax, by - ay
+            t0, t1 = 0.0, 1.0
+            if dx != 0:
+                r0, r1 = (min_x - ax) / dx, (max_x - ax) / dx
+                if dx < 0:
+                    r0, r1 = r1, r0
+                t0, t1 = max(t0, r0), min(t1, r1)
+            if dy != 0:
+                r0, r1 = (min_y - ay) / dy, (max_y - ay) / dy
+                if dy < 0:
+                    r0, r1 = r1, r0
+                t0, t1 = max(t0, r0), min(t1, r1)
+            if t0 >= t1:
+                continue
+            out.extend((ax + t0 * dx if t0 > 0 else ax, ay + t0 * dy if t0 > 0 else ay,
+                        ax + t1 * dx if t1 < 1 else bx, ay + t1 * dy if t1 < 1 else by))
+        index.append(i if ids is None else ids[i])
+
+
+def clip_segments(segments: Sequence[float], box: Sequence[float], start: int = 0,
+                  stop: Optional[int] = None) -> tuple[array, array]:
+    """
+    Clip segments to an axis-aligned box.
+    Segments only touching the box at a point are dropped; segments along its edges are kept.
+    :param segments: Segment buffer.
+    :param box: The box (min_x, min_y, max_x, max_y).
+    :param start: First segment to process.
+    :param stop: One past the last segment to process (all segments if None).
+    :return: Buffer of the clipped segments and array('q') of the index of each one's source segment.
+    """
+    n = item_count(segments, SEGMENT_STRIDE)
+    box = _check_box(box)
+    out, index = array('d'), array('q')
+    _clip_segment_range(segments, box, start, n if stop is None else stop, out, index)
+    return out, index
+
+
+def _normalized(angle: float) -> float:
+    return angle + TWO_PI if angle < 0 else angle
+
+
+def _arc_angles(arcs: Sequence[float], k: int) -> tuple[float, float, float]:
+    # Radius and start/end angles as Arc2D reads them; the arc covers the angles between the two.
+    cx, cy = arcs[k], arcs[k + 1]
+    sx, sy = arcs[k + 2] - cx, arcs[k + 3] - cy
+    return sqrt(sx * sx + sy * sy), _normalized(atan2(sy, sx)), _normalized(atan2(arcs[k + 5] - cy, arcs[k + 4] - cx))
+
+
+def _arc_bounds(arcs: Sequence[float], k: int) -> tuple[float, float, float, float]:
+    cx, cy = arcs[k], arcs[k + 1]
+    radius, first, last = _arc_angles(arcs, k)
+    low, high = min(first, last), max(first, last)
+    xs = [arcs[k + 2], arcs[k + 4]]
+    ys = [arcs[k + 3], arcs[k + 5]]
+    for quarter in range(4):
+        if low <= quarter * pi / 2 <= high:
+            xs.append(cx + radius * cos(quarter * pi / 2))
+            ys.append(cy + radius * sin(quarter * pi / 2))
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _clip_arc_range(arcs: Sequence[float], box: tuple[float, float, float, float], start: int, stop: int,
+                    out: array, index: array, ids: Optional[Sequence[int]] = None) -> None:
+    min_x, min_y, max_x, max_y = box
+    for i in range(start, stop):
+        k = ARC_STRIDE * i
+        x0, y0, x1, y1 = _arc_bounds(arcs, k)
+        if x1 < min_x or x0 > max_x or y1 < min_y or y0 > max_y:
+            continue
+        source = i if ids is None else ids[i]
+        if min_x <= x0 and x1 <= max_x and min_y <= y0 and y1 <= max_y:
+            out.extend(arcs[k:k + ARC_STRIDE])
+            index.append(source)
+            continue
+        cx, cy = arcs[k], arcs[k + 1]
+        radius, first, last = _arc_angles(arcs, k)
+        if radius == 0:
+            continue
+        low, high = min(first, last), max(first, last)
+        # Angles where the circle meets the edge lines, with the coordinate fixed by the edge.
+        cuts = []
+        for x in (min_x, max_x):
+            if abs(x - cx) < radius:
+                angle = acos((x - cx) / radius)
+                cuts.append((angle, x, None))
+                cuts.append((TWO_PI - angle, x, None))
+        for y in (min_y, max_y):
+            if abs(y - cy) < radius:
+                angle = asin((y - cy) / radius)
+                cuts.append((_normalized(angle), None, y))
+                cuts.append((pi - angle, None, y))
+        cuts = sorted(cut for cut in cuts if low < cut[0] < high)
+        first_end = (arcs[k + 2], arcs[k + 3]) if first <= last else (arcs[k + 4], arcs[k + 5])
+        last_end = (arcs[k + 4], arcs[k + 5]) if first <= last else (arcs[k + 2], arcs[k + 3])
+        points = [(low, first_end)]
+        for angle, x, y in cuts:
+            points.append((angle, (cx + radius * cos(angle) if x is None else x,
+                                   cy + radius * sin(angle) if y is None else y)))
+        points.append((high, last_end))
+        kept = []
+        for (a, p), (b, q) in zip(points, points[1:]):
+            if b <= a:
+                continue
+            middle = 0.5 * (a + b)
+            mx, my = cx + radius * cos(middle), cy + radius * sin(middle)
+            if min_x <= mx <= max_x and min_y <= my <= max_y:
+                if kept and kept[-1][1] == p:
+                    kept[-1] = (kept[-1][0], q)
+                else:
+                    kept.append((p, q))
+        if first > last:
+            # Clockwise arcs run from the high angle down to the low one.
+            kept = [(q, p) for p, q in reversed(kept)]
+        for p, q in kept:
+            out.extend((cx, cy, p[0], p[1], q[0], q[1]))
+            index.append(source)
+
+
+def clip_arcs(arcs: Sequence[float], box: Sequence[float], start: int = 0,
+              stop: Optional[int] = None) -> tuple[array, array]:
+    """
+    Clip arcs to an axis-aligned box, splitting them at the box edges.
+    Sub-arcs keep the direction of their arc; as in Arc2D, an arc runs between its start and end angles
+    (measured in [0, 2*pi)) without crossing angle zero.
+    :param arcs: Arc buffer.
+    :param box: The box (min_x, min_y, max_x, max_y).
+    :param start: First arc to process.
+    :param stop: One past the last arc to process (all arcs if None).
+    :return: Buffer of the sub-arcs inside the box and array('q') of the index of each one's source arc.
+    """
+    n = item_count(arcs, ARC_STRIDE)
+    box = _check_box(box)
+    out, index = array('d'), array('q')
+    _clip_arc_range(arcs, box, start, n if stop is None else stop, out, index)
+    return out, index
+
+
+class ClipIndex:
+    def __init__(self, buffer: Sequence[float], stride: int = SEGMENT_STRIDE, cell_items: int = CELL_ITEMS):
+        """
+        Index a segment or arc buffer for repeated clipping.
+        :param buffer: Segment buffer, or arc buffer when stride is ARC_STRIDE.
+        :param stride: SEGMENT_STRIDE or ARC_STRIDE.
+        :param cell_items: Average number of items per grid cell.
+        """
+        if stride not in (SEGMENT_STRIDE, ARC_STRIDE):
+            raise ValueError("Stride must be SEGMENT_STRIDE or ARC_STRIDE.")
+        if not isinstance(cell_items, int) or cell_items < 1:
+            raise ValueError("Cell items must be a positive integer.")
+        n = item_count(buffer, stride)
+        self.stride = stride
+        self._clip_range = _clip_segment_range if stride == SEGMENT_STRIDE else _clip_arc_range
+        bounds = array('d')
+        for i in range(n):
+            k = stride * i
+            if stride == SEGMENT_STRIDE:
+                ax, ay, bx, by = buffer[k], buffer[k + 1], buffer[k + 2], buffer[k + 3]
+                bounds.extend((min(ax, bx), min(ay, by), max(ax, bx), max(ay, by)))
+            else:
+                bounds.extend(_arc_bounds(buffer, k))
+        self._low_x = min(bounds[0::4], default=0.0)
+        self._low_y = min(bounds[1::4], default=0.0)
+        width = max(bounds[2::4], default=0.0) - self._low_x
+        height = max(bounds[3::4], default=0.0) - self._low_y
+        cells = max(n // cell_items, 1)
+        self._cell = max(sqrt(width * height / cells), width / cells, height / cells, 1e-300)
+        self._cols = int(width // self._cell) + 1
+        self._rows = int(height // self._cell) + 1
+        # Counting sort of the items by the cell holding their bounding box center, row by row.
+        cell_of = array('q', bytes(8 * n))
+        counts = array('q', bytes(8 * (self._cols * self._rows + 1)))
+        for i in range(n):
+            col = min(int((0.5 * (bounds[4 * i] + bounds[4 * i + 2]) - self._low_x) // self._cell), self._cols - 1)
+            row = min(int((0.5 * (bounds[4 * i + 1] + bounds[4 * i + 3]) - self._low_y) // self._cell), self._rows - 1)
+            cell_of[i] = row * self._cols + col
+            counts[cell_of[i] + 1] += 1
+        for c in range(1, len(counts)):
+            counts[c] += counts[c - 1]
+        self.offsets = array('q', counts)
+        self.order = array('q', bytes(8 * n))
+        for i in range(n):
+            c = cell_of[i]
+            self.order[counts[c]] = i
+            counts[c] += 1
+        self.buffer = array('d')
+        inf = float('inf')
+        self._cell_bounds = array('d', [inf, inf, -inf, -inf] * (self._cols * self._rows))
+        reach = 0
+        cell_bounds = self._cell_bounds
+        for i in self.order:
+            self.buffer.extend(buffer[stride * i:stride * i + stride])
+            c = cell_of[i]
+            cell_bounds[4 * c] = min(cell_bounds[4 * c], bounds[4 * i])
+            cell_bounds[4 * c + 1] = min(cell_bounds[4 * c + 1], bounds[4 * i + 1])
+            cell_bounds[4 * c + 2] = max(cell_bounds[4 * c + 2], bounds[4 * i + 2])
+            cell_bounds[4 * c + 3] = max(cell_bounds[4 * c + 3], bounds[4 * i + 3])
+            # How many cells an item reaches beyond its own, which widens the cells a query must visit.
+            half = max(bounds[4 * i + 2] - bounds[4 * i], bounds[4 * i + 3] - bounds[4 * i + 1]) / 2
+            reach = max(reach, ceil(half / self._cell))
+        self._reach = reach
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def clip(self, box: Sequence[float]) -> tuple[array, array]:
+        """
+        Clip the indexed items to an axis-aligned box, as clip_segments or clip_arcs.
+        :param box: The box (min_x, min_y, max_x, max_y).
+        :return: Buffer of the clipped pieces and array('q') of the index of each one's source item.
+        """
+        box = _check_box(box)
+        min_x, min_y, max_x, max_y = box
+        out, index = array('d'), array('q')
+        if not self.order:
+            return out, index
+        cell, reach, cols = self._cell, self._reach, self._cols
+        col0 = max(int(floor((min_x - self._low_x) / cell)) - reach, 0)
+        col1 = min(int(floor((max_x - self._low_x) / cell)) + reach, cols - 1)
+        row0 = max(int(floor((min_y - self._low_y) / cell)) - reach, 0)
+        row1 = min(int(floor((max_y - self._low_y) / cell)) + reach, self._rows - 1)
+        stride, offsets, bounds, buffer, order = self.stride, self.offsets, self._cell_bounds, self.buffer, self.order
+        for row in range(row0, row1 + 1):
+            # Runs of consecutive accepted cells are copied as one slice.
+            run = None
+            for c in range(row * cols + col0, row * cols + col1 + 1):
+                first, stop = offsets[c], offsets[c + 1]
+                if first == stop:
+                    continue
+                x0, y0, x1, y1 = bounds[4 * c], bounds[4 * c + 1], bounds[4 * c + 2], bounds[4 * c + 3]
+                if min_x <= x0 and x1 <= max_x and min_y <= y0 and y1 <= max_y:
+                    if run is None:
+                        run = first
+                    continue
+                if run is not None:
+                    out.extend(buffer[stride * run:stride * first])
+                    index.extend(order[run:first])
+                    run = None
+                if x1 < min_x or x0 > max_x or y1 < min_y or y0 > max_y:
+                    continue
+                self._clip_range(buffer, box, first, stop, out, index, order)
+            if run is not None:
+                stop = offsets[row * cols + col1 + 1]
+                out.extend(buffer[stride * run:stride * stop])
+                index.extend(order[run:stop])
+        return out, index
+
+    def __repr__(self) -> str:
+        return "ClipIndex(%d %s, %dx%d cells)" % (len(self.order), "segments" if self.stride == SEGMENT_STRIDE
+                                                  else "arcs", self._cols, self._rows)
@@ -0,0 +1,131 @@
+import random
+import unittest
+from array import array
+from math import atan2, cos, pi, sin
+
+from .clipping import ClipIndex, clip_segments, clip_arcs
+from kernels.kernels import ARC_STRIDE, arc_lengths
+
+
+def _angle(x, y):
+    angle = atan2(y, x)
+    return angle + 2 * pi if angle < 0 else angle
+
+
+def _pieces(buffer, index, stride):
+    return sorted((index[k], tuple(buffer[stride * k:stride * (k + 1)])) for k in range(len(index)))
+
+
+class TestClipping(unittest.TestCase):
+    def setUp(self):
+        self.box = (0, 0, 10, 10)
+
+    def test_segments(self):
+        segments = array('d', [1, 1, 9, 9,       # inside
+                               -5, 5, 15, 5,     # crossing both sides
+                               20, 20, 30, 30,   # outside
+                               -5, 8, 8, -5,     # cutting a corner
+                               0, 2, 0, 8,       # along an edge
+                               -2, 10, 10, 22,   # touching a corner
+                               5, 5, 5, 5])      # a point inside
+        out, index = clip_segments(segments, self.box)
+        self.assertEqual(list(index), [0, 1, 3, 4, 6])
+        self.assertEqual(list(out[:8]), [1, 1, 9, 9, 0, 5, 10, 5])
+        self.assertEqual([round(value, 12) for value in out[8:12]], [0, 3, 3, 0])
+        self.assertEqual(list(out[12:]), [0, 2, 0, 8, 5, 5, 5, 5])
+
+    def test_segment_range(self):
+        segments = array('d', [1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6])
+        out, index = clip_segments(segments, self.box, 1, 2)
+        self.assertEqual(list(index), [1])
+        self.assertEqual(list(out), [3, 3, 4, 4])
+        self.assertEqual(len(clip_segments(array('d'), self.box)[1]), 0)
+
+    def test_arcs(self):
+        # The upper half of a circle sticking out of the box on three sides comes back as two sub-arcs.
+        arcs = array('d', [5, 5, 11, 5, -1, 5,
+                           5, 5, 5, -1, -1, 5])
+        out, index = clip_arcs(arcs, self.box)
+        self.assertEqual(list(index), [0, 0, 1])
+        root = 11 ** 0.5
+        expected = [(10, 5 + root, 5 + root, 10), (5 - root, 10, 0, 5 + root), (5 - root, 0, 0, 5 - root)]
+        for k, points in enumerate(expected):
+            cx, cy, sx, sy, ex, ey = out[6 * k:6 * k + 6]
+            self.assertEqual((cx, cy), (5, 5))
+            for value, target in zip((sx, sy, ex, ey), points):
+                self.assertAlmostEqual(value, target)
+        # Sub-arcs keep the direction of their source arc.
+        self.assertGreater(_angle(out[4] - 5, out[5] - 5), _angle(out[2] - 5, out[3] - 5))
+        self.assertLess(_angle(out[16] - 5, out[17] - 5), _angle(out[14] - 5, out[15] - 5))
+        # A wide box keeps the arcs whole.
+        out, index = clip_arcs(arcs, (-10, -10, 20, 20))
+        self.assertEqual(list(out), list(arcs))
+        self.assertEqual(list(clip_arcs(arcs, (0, 0, 10, 20))[1]), [0, 1])
+        self.assertEqual(len(clip_arcs(arcs, (20, 20, 30, 30))[1]), 0)
+
+    def test_arcs_match_sampling(self):
+        random.seed(2)
+        arcs = array('d')
+        for _ in range(200):
+            cx, cy, radius = random.uniform(0, 100), random.uniform(0, 100), random.uniform(0.5, 30)
+            first, last = random.uniform(0, 2 * pi), random.uniform(0, 2 * pi)
+            arcs.extend((cx, cy, cx + radius * cos(first), cy + radius * sin(first), cx + radius * cos(last),
+                         cy + radius * sin(last)))
+        box = (20, 30, 70, 60)
+        out, index = clip_arcs(arcs, box)
+        lengths = [0.0] * 200
+        for k, length in enumerate(arc_lengths(out)):
+            lengths[index[k]] += length
+            for x, y in (out[6 * k + 2:6 * k + 4], out[6 * k + 4:6 * k + 6]):
+                self.assertTrue(box[0] - 1e-9 <= x <= box[2] + 1e-9 and box[1] - 1e-9 <= y <= box[3] + 1e-9)
+        for k in range(200):
+            cx, cy, sx, sy, ex, ey = arcs[6 * k:6 * k + 6]
+            radius = ((sx - cx) ** 2 + (sy - cy) ** 2) ** 0.5
+            low, high = sorted((_angle(sx - cx, sy - cy), _angle(ex - cx, ey - cy)))
+            inside = 0
+            for m in range(1000):
+                angle = low + (high - low) * (m + 0.5) / 1000
+                x, y = cx + radius * cos(angle), cy + radius * sin(angle)
+                inside += box[0] <= x <= box[2] and box[1] <= y <= box[3]
+            self.assertAlmostEqual(lengths[k], radius * (high - low) * inside / 1000, delta=3e-3 * radius * pi)
+
+    def test_index_matches_direct_clipping(self):
+        random.seed(4)
+        segments = array('d')
+        for _ in range(3000):
+            x, y = random.uniform(0, 100), random.uniform(0, 100)
+            segments.extend((x, y, x + random.uniform(-8, 8), y + random.uniform(-8, 8)))
+        arcs = array('d')
+        for _ in range(1000):
+            cx, cy, radius = random.uniform(0, 100), random.uniform(0, 100), random.uniform(0.5, 6)
+            first, last = random.uniform(0, 2 * pi), random.uniform(0, 2 * pi)
+            arcs.extend((cx, cy, cx + radius * cos(first), cy + radius * sin(first), cx + radius * cos(last),
+                         cy + radius * sin(last)))
+        segment_index, arc_index = ClipIndex(segments, cell_items=8), ClipIndex(arcs, ARC_STRIDE, 8)
+        self.assertEqual((len(segment_index), len(arc_index)), (3000, 1000))
+        for _ in range(20):
+            x, y = random.uniform(-20, 100), random.uniform(-20, 100)
+            box = (x, y, x + random.uniform(0, 60), y + random.uniform(0, 60))
+            self.assertEqual(_pieces(*segment_index.clip(box), 4), _pieces(*clip_segments(segments, box), 4))
+            self.assertEqual(_pieces(*arc_index.clip(box), 6), _pieces(*clip_arcs(arcs, box), 6))
+        everything = (-50, -50, 150, 150)
+        self.assertEqual(_pieces(*segment_index.clip(everything), 4), _pieces(segments, range(3000), 4))
+
+    def test_errors(self):
+        segments = array('d', [0, 0, 1, 1])
+        with self.assertRaises(TypeError):
+            clip_segments(segments, (0, 0, 1))
+        with self.assertRaises(TypeError):
+            clip_segments(segments, (0, 0, 1, '1'))
+        with self.assertRaises(ValueError):
+            clip_segments(segments, (2, 0, 1, 1))
+        with self.assertRaises(ValueError):
+            clip_arcs(segments, (0, 0, 1, 1))
+        with self.assertRaises(ValueError):
+            ClipIndex(segments, stride=5)
+        with self.assertRaises(ValueError):
+            ClipIndex(segments, cell_items=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,2 @@
+from .delaunay import Delaunay2D
+__all__ = ['Delaunay2D']
@@ -0,0 +1,417 @@
+"""
+Delaunay triangulation and Voronoi diagram of point sets.
+
+Points are inserted one by one into a large enclosing triangle.  Each new
+point is located by walking from the triangle created last, splits the
+triangle (or the two triangles sharing the edge) it falls in, and Lawson
+edge flips restore the empty-circumcircle property around it.  Inserting
+the points along a Hilbert curve keeps every walk short, so the expected
+cost is O(n log n) for the sort and O(1) per insertion afterwards.
+
+Triangles are stored as flat arrays: vertices 3t, 3t+1, 3t+2 of triangle t
+in counterclockwise order, and neighbors[3t + i] the triangle across the
+edge opposite vertex i (-1 on the convex hull).  Vertex indices are the
+positions of the input points; duplicated points are triangulated once.
+
+The enclosing triangle lies SUPER_SCALE times the extent of the input away,
+so triangles whose circumcircle is larger than that (nearly collinear
+points on the hull) can be missing from the hull.  Orientation and
+incircle tests are evaluated in floating point with an error bound and
+redone exactly with fractions when the result is within it, which keeps
+the walks and flips consistent on grids and near the enclosing triangle.
+
+Voronoi edges join the circumcenters of adjacent triangles; the edges of
+hull sites are rays, cut at a given length.
+"""
+from array import array
+from fractions import Fraction
+from math import hypot
+from typing import Iterable, Optional, Sequence
+
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+
+SUPER_SCALE = 1e5
+# Relative error bounds of the floating-point predicates; closer calls are decided exactly.
+_ORIENTATION_BOUND = 4e-16
+_INCIRCLE_BOUND = 1.2e-15
+_HILBERT_ORDER = 16
+_NEXT = (1, 2, 0)
+_PREV = (2, 0, 1)
+
+
+def _hilbert_index(x: int, y: int, order: int) -> int:
+    index = 0
+    s = 1 << (order - 1)
+    while s:
+        rx = 1 if x & s else 0
+        ry = 1 if y & s else 0
+        index += s * s * ((3 * rx) ^ ry)
+        if ry == 0:
+            if rx == 1:
+                x = s - 1 - x
+                y = s - 1 - y
+            x, y = y, x
+        s >>= 1
+    return index
+
+
+def _orientation_exact(ax: float, ay: float, bx: float, by: float, px: float, py: float) -> float:
+    ax, ay, bx, by, px, py = (Fraction(value) for value in (ax, ay, bx, by, px, py))
+    det = (bx - ax) * (py - ay) - (by - ay) * (px - ax)
+    return float((det > 0) - (det < 0))
+
+
+def _orientation(ax: float, ay: float, bx: float, by: float, px: float, py: float) -> float:
+    # Positive when p lies to the left of the line from a to b.
+    left, right = (bx - ax) * (py - ay), (by - ay) * (px - ax)
+    det = left - right
+    if abs(det) > _ORIENTATION_BOUND * (abs(left) + abs(right)):
+        return det
+    return _orientation_exact(ax, ay, bx, by, px, py)
+
+
+def _incircle_exact(ax: float, ay: float, bx: float, by: float, cx: float, cy: float, dx: float, dy: float) -> float:
+    dx, dy = Fraction(dx), Fraction(dy)
+    ax, ay, bx, by, cx, cy = (Fraction(ax) - dx, Fraction(ay) - dy, Fraction(bx) - dx, Fraction(by) - dy,
+                              Fraction(cx) - dx, Fraction(cy) - dy)
+    det = ((ax * ax + ay * ay) * (bx * cy - cx * by)
+           - (bx * bx + by * by) * (ax * cy - cx * ay)
+           + (cx * cx + cy * cy) * (ax * by - bx * ay))
+    return float((det > 0) - (det < 0))
+
+
+class Delaunay2D:
+    def __init__(self, points: Iterable[Point2D] | Sequence[float]):
+        """
+        Triangulate a point set.
+        :param points: Iterable of Point2D instances or a flat point buffer [x, y, x, y, ...].
+        """
+        values = list(points)
+        if values and isinstance(values[0], Point2D):
+            if not all(isinstance(point, Point2D) for point in values):
+                raise TypeError("Points must be Point2D instances.")
+            values = [value for point in values for value in (point.x, point.y)]
+        if len(values) % 2 != 0:
+            raise ValueError("Buffer length must be a multiple of 2.")
+        self.coords = array('d', values)
+        n = len(values) // 2
+        # Index of the point each input point was merged with (itself unless duplicated).
+        self.index_map = array('q', range(n))
+        self.triangles = array('q')
+        self.neighbors = array('q')
+        # Built on first use by voronoi_cell: triangles around each vertex and the default ray length.
+        self._incidence = None
+        self._ray = None
+        if n >= 3:
+            self._triangulate(n)
+
+    def _triangulate(self, n: int) -> None:
+        xs = list(self.coords[0::2])
+        ys = list(self.coords[1::2])
+        min_x, max_x, min_y, max_y = min(xs), max(xs), min(ys), max(ys)
+        span = max(max_x - min_x, max_y - min_y)
+        if span == 0:
+            self.index_map = array('q', [0] * n)
+            return
+        side = (1 << _HILBERT_ORDER) - 1
+        scale = side / span
+        order = sorted(range(n), key=lambda k: _hilbert_index(int((xs[k] - min_x) * scale),
+                                                              int((ys[k] - min_y) * scale), _HILBERT_ORDER))
+        mid_x, mid_y = (min_x + max_x) / 2, (min_y + max_y) / 2
+        far = SUPER_SCALE * span
+        xs += [mid_x - 2 * far, mid_x + 2 * far, mid_x]
+        ys += [mid_y - far, mid_y - far, mid_y + 2 * far]
+        V = [n, n + 1, n + 2]
+        N = [-1, -1, -1]
+        last = 0
+        index_map = self.index_map
+        for p in order:
+            px, py = xs[p], ys[p]
+            t, edge = self._locate(V, N, xs, ys, px, py, last)
+            duplicate = -1
+            for k in range(3):
+                v = V[3 * t + k]
+                if xs[v] == px and ys[v] == py:
+                    duplicate = v
+            if duplicate >= 0:
+                index_map[p] = duplicate
+                continue
+            if edge < 0 or N[3 * t + edge] < 0:
+                last = self._split_triangle(V, N, xs, ys, t, p)
+            else:
+                last = self._split_edge(V, N, xs, ys, t, edge, p)
+        self._finish(V, N, n)
+
+    @staticmethod
+    def _locate(V: list, N: list, xs: list, ys: list, px: float, py: float, t: int) -> tuple[int, int]:
+        # Remembering stochastic walk: the edge tested first is picked pseudo-randomly and the edge just
+        # crossed is skipped, so the walk ends even where rounding near the enclosing triangle leaves
+        # the triangulation slightly non-Delaunay.  Returns the triangle and the index of the edge p lies
+        # on (-1 if strictly inside).
+        came = -1
+        seed = 12345
+        while True:
+            seed = (seed * 1103515245 + 12345) & 0x7fffffff
+            start = seed % 3
+            on_edge = -1
+            for step in range(3):
+                i = (start + step) % 3
+                neighbor = N[3 * t + i]
+                if neighbor == came and came >= 0:
+                    continue
+                a, b = V[3 * t + (i + 1) % 3], V[3 * t + (i + 2) % 3]
+                left, right = (xs[b] - xs[a]) * (py - ys[a]), (ys[b] - ys[a]) * (px - xs[a])
+                orientation = left - right
+                if abs(orientation) <= _ORIENTATION_BOUND * (abs(left) + abs(right)):
+                    orientation = _orientation_exact(xs[a], ys[a], xs[b], ys[b], px, py)
+                if orientation < 0:
+                    came, t = t, neighbor
+                    break
+                if orientation == 0:
+                    on_edge = i
+            else:
+                if on_edge < 0 and came >= 0:
+                    # The skipped edge can hold p too.
+                    for i in range(3):
+                        if N[3 * t + i] == came:
+                            a, b = V[3 * t + (i + 1) % 3], V[3 * t + (i + 2) % 3]
+                            if _orientation(xs[a], ys[a], xs[b], ys[b], px, py) == 0:
+                                on_edge = i
+                return t, on_edge
+
+    def _split_triangle(self, V: list, N: list, xs: list, ys: list, t: int, p: int) -> int:
+        a, b, c = V[3 * t], V[3 * t + 1], V[3 * t + 2]
+        na, nb, nc = N[3 * t], N[3 * t + 1], N[3 * t + 2]
+        t1, t2 = len(V) // 3, len(V) // 3 + 1
+        V[3 * t:3 * t + 3] = (p, b, c)
+        N[3 * t:3 * t + 3] = (na, t1, t2)
+        V.extend((a, p, c, a, b, p))
+        N.extend((t, nb, t2, t, t1, nc))
+        self._relink(N, nb, t, t1)
+        self._relink(N, nc, t, t2)
+        stack = [(t, 0), (t1, 1), (t2, 2)]
+        self._legalize(V, N, xs, ys, stack)
+        return t
+
+    def _split_edge(self, V: list, N: list, xs: list, ys: list, t: int, i: int, p: int) -> int:
+        o = N[3 * t + i]
+        a, b, c = V[3 * t + i], V[3 * t + (i + 1) % 3], V[3 * t + (i + 2) % 3]
+        ntb, ntc = N[3 * t + (i + 1) % 3], N[3 * t + (i + 2) % 3]
+        j = [N[3 * o + k] for k in range(3)].index(t)
+        d = V[3 * o + j]
+        noc, nob = N[3 * o + (j + 1) % 3], N[3 * o + (j + 2) % 3]
+        t2, o2 = len(V) // 3, len(V) // 3 + 1
+        V[3 * t:3 * t + 3] = (a, b, p)
+        N[3 * t:3 * t + 3] = (o2, t2, ntc)
+        V[3 * o:3 * o + 3] = (d, c, p)
+        N[3 * o:3 * o + 3] = (t2, o2, nob)
+        V.extend((a, p, c, d, p, b))
+        N.extend((o, ntb, t, t, noc, o))
+        self._relink(N, ntb, t, t2)
+        self._relink(N, noc, o, o2)
+        self._legalize(V, N, xs, ys, [(t, 2), (t2, 1), (o, 2), (o2, 1)])
+        return t
+
+    @staticmethod
+    def _relink(N: list, triangle: int, old: int, new: int) -> None:
+        if triangle >= 0:
+            for k in range(3 * triangle, 3 * triangle + 3):
+                if N[k] == old:
+                    N[k] = new
+                    return
+
+    @staticmethod
+    def _legalize(V: list, N: list, xs: list, ys: list, stack: list) -> None:
+        # Float incircle test of the quad; only results within the rounding error bound are decided exactly.
+        while stack:
+            t, i = stack.pop()
+            o = N[3 * t + i]
+            if o < 0:
+                continue
+            i1, i2 = _NEXT[i], _PREV[i]
+            p, q, r = V[3 * t + i], V[3 * t + i1], V[3 * t + i2]
+            k = 3 * o
+            j = 0 if N[k] == t else 1 if N[k + 1] == t else 2
+            d = V[k + j]
+            dx, dy = xs[d], ys[d]
+            adx, ady, bdx, bdy, cdx, cdy = xs[p] - dx, ys[p] - dy, xs[q] - dx, ys[q] - dy, xs[r] - dx, ys[r] - dy
+            alift, blift, clift = adx * adx + ady * ady, bdx * bdx + bdy * bdy, cdx * cdx + cdy * cdy
+            bc1, bc2, ca1, ca2, ab1, ab2 = bdx * cdy, cdx * bdy, cdx * ady, adx * cdy, adx * bdy, bdx * ady
+            det = alift * (bc1 - bc2) + blift * (ca1 - ca2) + clift * (ab1 - ab2)
+            permanent = (alift * (abs(bc1) + abs(bc2)) + blift * (abs(ca1) + abs(ca2))
+                         + clift * (abs(ab1) + abs(ab2)))
+            if det <= _INCIRCLE_BOUND * permanent:
+                if det < -_INCIRCLE_BOUND * permanent:
+                    continue
+                if _incircle_exact(xs[p], ys[p], xs[q], ys[q], xs[r], ys[r], dx, dy) <= 0:
+                    continue
+            ntq, ntr = N[3 * t + i1], N[3 * t + i2]
+            nor, noq = N[k + _NEXT[j]], N[k + _PREV[j]]
+            V[3 * t:3 * t + 3] = (p, q, d)
+            N[3 * t:3 * t + 3] = (nor, o, ntr)
+            V[k:k + 3] = (p, d, r)
+            N[k:k + 3] = (noq, ntq, t)
+            if nor >= 0:
+                m = 3 * nor
+                N[m if N[m] == o else m + 1 if N[m + 1] == o else m + 2] = t
+            if ntq >= 0:
+                m = 3 * ntq
+                N[m if N[m] == t else m + 1 if N[m + 1] == t else m + 2] = o
+            stack.append((t, 0))
+            stack.append((o, 0))
+
+    def _finish(self, V: list, N: list, n: int) -> None:
+        count = len(V) // 3
+        renumber = [-1] * count
+        kept = 0
+        for t in range(count):
+            if V[3 * t] < n and V[3 * t + 1] < n and V[3 * t + 2] < n:
+                renumber[t] = kept
+                kept += 1
+        triangles = array('q')
+        neighbors = array('q')
+        for t in range(count):
+            if renumber[t] >= 0:
+                triangles.extend(V[3 * t:3 * t + 3])
+                neighbors.extend(renumber[m] if m >= 0 else -1 for m in N[3 * t:3 * t + 3])
+        self.triangles = triangles
+        self.neighbors = neighbors
+
+    @property
+    def triangle_count(self) -> int:
+        """Get the number of triangles."""
+        return len(self.triangles) // 3
+
+    def triangle(self, index: int) -> tuple[Point2D, Point2D, Point2D]:
+        """
+        Get the corners of a triangle.
+        :param index: Triangle index.
+        :return: Three Point2D instances in counterclockwise order.
+        """
+        if not 0 <= index < len(self.triangles) // 3:
+            raise IndexError("Triangle index %d out of range." % index)
+        coords = self.coords
+        return tuple(Point2D(coords[2 * v], coords[2 * v + 1]) for v in self.triangles[3 * index:3 * index + 3])
+
+    def edges(self) -> list[tuple[int, int]]:
+        """Get every triangulation edge once as a (smaller, larger) vertex index pair."""
+        triangles, neighbors = self.triangles, self.neighbors
+        found = []
+        for t in range(len(triangles) // 3):
+            for i in range(3):
+                other = neighbors[3 * t + i]
+                if other < t:
+                    a, b = triangles[3 * t + (i + 1) % 3], triangles[3 * t + (i + 2) % 3]
+                    found.append((a, b) if a < b else (b, a))
+        return found
+
+    def circumcenters(self) -> array:
+        """
+        Get the circumcenter of every triangle (the Voronoi vertices).
+        :return: Point buffer with one (x, y) per triangle.
+        """
+        out = array('d', bytes(16 * (len(self.triangles) // 3)))
+        for t in range(len(self.triangles) // 3):
+            out[2 * t], out[2 * t + 1] = self._circumcenter(t)
+        return out
+
+    def _circumcenter(self, t: int) -> tuple[float, float]:
+        coords = self.coords
+        a, b, c = self.triangles[3 * t:3 * t + 3]
+        ax, ay = coords[2 * a], coords[2 * a + 1]
+        bx, by = coords[2 * b] - ax, coords[2 * b + 1] - ay
+        cx, cy = coords[2 * c] - ax, coords[2 * c + 1] - ay
+        d = 2 * (bx * cy - by * cx)
+        b2, c2 = bx * bx + by * by, cx * cx + cy * cy
+        return ax + (cy * b2 - by * c2) / d, ay + (bx * c2 - cx * b2) / d
+
+    def _default_ray(self) -> float:
+        if self._ray is None:
+            xs, ys = self.coords[0::2], self.coords[1::2]
+            self._ray = hypot(max(xs) - min(xs), max(ys) - min(ys))
+        return self._ray
+
+    def _hull_ray(self, t: int, i: int, ray: float) -> tuple[float, float, float, float]:
+        coords, triangles = self.coords, self.triangles
+        a, b = triangles[3 * t + (i + 1) % 3], triangles[3 * t + (i + 2) % 3]
+        ex, ey = coords[2 * b] - coords[2 * a], coords[2 * b + 1] - coords[2 * a + 1]
+        length = hypot(ex, ey)
+        # Counterclockwise triangles have the outside on the right of each edge.
+        nx, ny = ey / length, -ex / length
+        x, y = self._circumcenter(t)
+        return x, y, x + ray * nx, y + ray * ny
+
+    def _incident_triangles(self) -> tuple[array, array]:
+        # Triangles around every vertex in increasing order, as offsets into one flat buffer.
+        if self._incidence is None:
+            triangles = self.triangles
+            offsets = array('q', bytes(8 * (len(self.coords) // 2 + 1)))
+            for v in triangles:
+                offsets[v + 1] += 1
+            for v in range(1, len(offsets)):
+                offsets[v] += offsets[v - 1]
+            fill = array('q', offsets)
+            incident = array('q', bytes(8 * len(triangles)))
+            for k, v in enumerate(triangles):
+                incident[fill[v]] = k // 3
+                fill[v] += 1
+            self._incidence = offsets, incident
+        return self._incidence
+
+    def voronoi_segments(self, ray_length: Optional[float] = None) -> array:
+        """
+        Get the Voronoi edges as a segment buffer [x1, y1, x2, y2, ...].
+        Each interior triangulation edge gives the segment joining the circumcenters on either side;
+        each hull edge gives a ray from its triangle's circumcenter, outwards along the edge normal.
+        :param ray_length: Length of the hull rays (the diagonal of the input bounding box if None).
+        :return: array('d') with one segment per triangulation edge.
+        """
+        ray = self._default_ray() if ray_length is None else ray_length
+        centers = self.circumcenters()
+        triangles, neighbors = self.triangles, self.neighbors
+        out = array('d')
+        for t in range(len(triangles) // 3):
+            for i in range(3):
+                other = neighbors[3 * t + i]
+                if other > t:
+                    out.extend((centers[2 * t], centers[2 * t + 1], centers[2 * other], centers[2 * other + 1]))
+                elif other < 0:
+                    out.extend(self._hull_ray(t, i, ray))
+        return out
+
+    def voronoi_cell(self, vertex: int, ray_length: Optional[float] = None) -> list[Line2D]:
+        """
+        Get the edges of the Voronoi cell of one input point.
+        :param vertex: Input point index (duplicates share the cell of the point they were merged with).
+        :param ray_length: Length of the rays bounding cells of hull points.
+        :return: List of Line2D edges of the cell (rays for hull points), in no particular order.
+        """
+        if not 0 <= vertex < len(self.index_map):
+            raise IndexError("Vertex index %d out of range." % vertex)
+        vertex = self.index_map[vertex]
+        if not self.triangles:
+            return []
+        offsets, incident = self._incident_triangles()
+        ray = self._default_ray() if ray_length is None else ray_length
+        triangles, neighbors = self.triangles, self.neighbors
+        cell = []
+        # Only the triangles around the vertex hold its cell edges: the two edges of each
+        # triangle that meet at the vertex, an interior edge taken from its lower triangle.
+        for t in incident[offsets[vertex]:offsets[vertex + 1]]:
+            for i in range(3):
+                if triangles[3 * t + i] == vertex:
+                    continue
+                other = neighbors[3 * t + i]
+                if other > t:
+                    x1, y1 = self._circumcenter(t)
+                    x2, y2 = self._circumcenter(other)
+                elif other < 0:
+                    x1, y1, x2, y2 = self._hull_ray(t, i, ray)
+                else:
+                    continue
+                cell.append(Line2D(Point2D(x1, y1), Point2D(x2, y2)))
+        return cell
+
+    def __repr__(self) -> str:
+        return "Delaunay2D(%d points, %d triangles)" % (len(self.coords) // 2, self.triangle_count)
@@ -0,0 +1,117 @@
+import random
+import unittest
+from math import hypot
+
+from .delaunay import Delaunay2D
+from point2d.point2d import Point2D
+from hull.hull import convex_hull
+
+
+def _orientation(coords, a, b, c):
+    ax, ay = coords[2 * a], coords[2 * a + 1]
+    return (coords[2 * b] - ax) * (coords[2 * c + 1] - ay) - (coords[2 * b + 1] - ay) * (coords[2 * c] - ax)
+
+
+def _in_circumcircle(coords, a, b, c, d):
+    dx, dy = coords[2 * d], coords[2 * d + 1]
+    ax, ay = coords[2 * a] - dx, coords[2 * a + 1] - dy
+    bx, by = coords[2 * b] - dx, coords[2 * b + 1] - dy
+    cx, cy = coords[2 * c] - dx, coords[2 * c + 1] - dy
+    return ((ax * ax + ay * ay) * (bx * cy - cx * by) - (bx * bx + by * by) * (ax * cy - cx * ay)
+            + (cx * cx + cy * cy) * (ax * by - bx * ay))
+
+
+class TestDelaunay(unittest.TestCase):
+    def setUp(self):
+        random.seed(11)
+        self.points = [Point2D(random.gauss(0, 10), random.gauss(0, 4)) for _ in range(400)]
+        self.mesh = Delaunay2D(self.points)
+
+    def test_empty_circumcircles(self):
+        mesh = self.mesh
+        for t in range(mesh.triangle_count):
+            a, b, c = mesh.triangles[3 * t:3 * t + 3]
+            self.assertGreater(_orientation(mesh.coords, a, b, c), 0)
+            for d in range(len(self.points)):
+                if d not in (a, b, c):
+                    self.assertLessEqual(_in_circumcircle(mesh.coords, a, b, c, d), 1e-9)
+
+    def test_triangle_count_matches_hull(self):
+        n, h = len(self.points), len(convex_hull(self.points))
+        self.assertEqual(self.mesh.triangle_count, 2 * n - 2 - h)
+        self.assertEqual(len(self.mesh.edges()), 3 * n - 3 - h)
+
+    def test_neighbors_share_edges(self):
+        mesh = self.mesh
+        for t in range(mesh.triangle_count):
+            for i in range(3):
+                o = mesh.neighbors[3 * t + i]
+                if o >= 0:
+                    self.assertIn(t, mesh.neighbors[3 * o:3 * o + 3])
+                    edge = {mesh.triangles[3 * t + (i + 1) % 3], mesh.triangles[3 * t + (i + 2) % 3]}
+                    self.assertTrue(edge <= set(mesh.triangles[3 * o:3 * o + 3]))
+
+    def test_grid_with_duplicates(self):
+        coords = [float(v) for i in range(6) for j in range(6) for v in (i, j)] + [2.0, 3.0]
+        mesh = Delaunay2D(coords)
+        self.assertEqual(mesh.triangle_count, 2 * 5 * 5)
+        self.assertEqual(mesh.index_map[36], 2 * 6 + 3)
+        self.assertNotIn(36, mesh.triangles)
+        area = sum(_orientation(mesh.coords, *mesh.triangles[3 * t:3 * t + 3]) for t in range(mesh.triangle_count))
+        self.assertAlmostEqual(area / 2, 25)
+
+    def test_degenerate_inputs(self):
+        self.assertEqual(Delaunay2D([]).triangle_count, 0)
+        self.assertEqual(Delaunay2D([0, 0, 1, 1]).triangle_count, 0)
+        self.assertEqual(Delaunay2D([0, 0, 1, 1, 2, 2, 3, 3]).triangle_count, 0)
+        self.assertEqual(list(Delaunay2D([1, 1, 1, 1, 1, 1]).index_map), [0, 0, 0])
+        with self.assertRaises(TypeError):
+            Delaunay2D([Point2D(0, 0), (1, 1)])
+        with self.assertRaises(ValueError):
+            Delaunay2D([0, 0, 1])
+        with self.assertRaises(IndexError):
+            self.mesh.triangle(self.mesh.triangle_count)
+
+    def test_voronoi_segments(self):
+        mesh = self.mesh
+        segments = mesh.voronoi_segments(ray_length=5)
+        self.assertEqual(len(segments) // 4, len(mesh.edges()))
+        coords = mesh.coords
+        centers = mesh.circumcenters()
+        for t in range(mesh.triangle_count):
+            a = mesh.triangles[3 * t]
+            radius = hypot(centers[2 * t] - coords[2 * a], centers[2 * t + 1] - coords[2 * a + 1])
+            for v in mesh.triangles[3 * t:3 * t + 3]:
+                self.assertAlmostEqual(hypot(centers[2 * t] - coords[2 * v], centers[2 * t + 1] - coords[2 * v + 1]),
+                                       radius, delta=1e-9 * max(1.0, radius))
+        rays = [k for k in range(len(segments) // 4)
+                if abs(hypot(segments[4 * k + 2] - segments[4 * k], segments[4 * k + 3] - segments[4 * k + 1]) - 5) < 1e-9]
+        self.assertGreaterEqual(len(rays), len(convex_hull(self.points)))
+
+    def test_voronoi_cell_of_grid_point(self):
+        coords = [float(v) for i in range(5) for j in range(5) for v in (i, j)]
+        mesh = Delaunay2D(coords)
+        cell = mesh.voronoi_cell(2 * 5 + 2)
+        length = sum(line.length() for line in cell)
+        self.assertAlmostEqual(length, 4)
+        for line in cell:
+            for point in line.points:
+                self.assertAlmostEqual(max(abs(point.x - 2), abs(point.y - 2)), 0.5)
+
+    def test_voronoi_cells_share_the_voronoi_segments(self):
+        # Every Voronoi edge bounds the cells of both end points of its triangulation edge.
+        segments = self.mesh.voronoi_segments()
+        expected = sorted(tuple(segments[4 * k:4 * k + 4]) for k in range(len(segments) // 4)) * 2
+        found = [(line.sp.x, line.sp.y, line.ep.x, line.ep.y)
+                 for v in range(len(self.points)) for line in self.mesh.voronoi_cell(v)]
+        self.assertEqual(sorted(found), sorted(expected))
+        self.assertEqual(Delaunay2D([0.0, 0.0, 1.0, 1.0, 2.0, 2.0]).voronoi_cell(1), [])
+
+    def test_duplicate_points_share_a_cell(self):
+        mesh = Delaunay2D([0.0, 0.0, 4.0, 0.0, 0.0, 4.0, 4.0, 4.0, 2.0, 2.0, 2.0, 2.0])
+        self.assertEqual(len(mesh.voronoi_cell(5)), 4)
+        self.assertEqual(mesh.voronoi_cell(4), mesh.voronoi_cell(5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,2 @@
+from .earclip import triangulate_polygon, triangulate_rings
+__all__ = ['triangulate_polygon', 'triangulate_rings']
@@ -0,0 +1,458 @@
+"""
+Polygon triangulation by ear clipping.
+
+Rings are turned into circular linked lists of nodes, the outer ring
+counterclockwise and the holes clockwise.  Each hole is bridged to the
+outer ring, leftmost hole first: a ray cast to the left from the hole's
+leftmost vertex finds the nearest outer edge, and the vertex of that edge
+(or a reflex vertex hiding it) that sees the hole becomes the bridge; the
+two bridge vertices are duplicated so the result is a single ring.
+
+A vertex is an ear when it is convex and no reflex vertex lies in the
+triangle it forms with its neighbors.  Only reflex vertices can block an
+ear, so they are kept in a uniform grid over the bounding box, hashed by
+cell, with about one cell per reflex vertex; an ear test scans the cells
+overlapped by the triangle's bounding box (or the indexed vertices, when
+there are fewer of them than cells) instead of the whole ring.  Clipping
+an ear never turns a convex vertex reflex, so the grid only needs entries
+dropped (lazily, through a flag) as reflex vertices become convex; it is
+rebuilt whenever half of its entries have gone stale.  Reflex vertices
+are skipped by the clipping walk without a test, and a neighbor left
+collinear by a clipped ear is dropped at once, so runs of collinear
+vertices do not force repeated turns around the ring.
+
+When a full turn around the ring finds no ear, collinear and duplicate
+vertices are removed, then small self-intersections are cut off, and
+finally the ring is split along a valid diagonal and both halves are
+triangulated separately.  The approach and these recovery passes follow
+the earcut library.
+
+Triangles are index triples into the input vertices, counterclockwise.
+Vertices dropped as duplicated or collinear with their neighbors leave
+T-junctions, so a ring of n vertices can give fewer than n - 2 triangles.
+"""
+from array import array
+from math import sqrt
+from typing import Iterable, Sequence
+
+from point2d.point2d import Point2D
+
+
+def _cross(ax: float, ay: float, bx: float, by: float, cx: float, cy: float) -> float:
+    return (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+
+def _point_in_triangle(ax: float, ay: float, bx: float, by: float, cx: float, cy: float,
+                       px: float, py: float) -> bool:
+    # Inclusive test for a counterclockwise triangle.
+    return ((cx - px) * (ay - py) >= (ax - px) * (cy - py) and (ax - px) * (by - py) >= (bx - px) * (ay - py)
+            and (bx - px) * (cy - py) >= (cx - px) * (by - py))
+
+
+class _EarClipper:
+    def __init__(self, coords: Sequence[float]):
+        self.coords = coords
+        # Node arrays: coordinates, input vertex index, links and reflex flag.
+        self.xs = []
+        self.ys = []
+        self.index = []
+        self.prev = []
+        self.next = []
+        self.reflex = []
+        self.reflex_count = 0
+        self.triangles = array('q')
+
+    def _node(self, i: int, x: float, y: float, last: int) -> int:
+        p = len(self.xs)
+        self.xs.append(x)
+        self.ys.append(y)
+        self.index.append(i)
+        self.reflex.append(False)
+        if last < 0:
+            self.prev.append(p)
+            self.next.append(p)
+        else:
+            following = self.next[last]
+            self.prev.append(last)
+            self.next.append(following)
+            self.prev[following] = p
+            self.next[last] = p
+        return p
+
+    def _remove(self, p: int) -> None:
+        self.next[self.prev[p]] = self.next[p]
+        self.prev[self.next[p]] = self.prev[p]
+        if self.reflex[p]:
+            self.reflex[p] = False
+            self.reflex_count -= 1
+
+    def _equals(self, p: int, q: int) -> bool:
+        return self.xs[p] == self.xs[q] and self.ys[p] == self.ys[q]
+
+    def _area(self, p: int, q: int, r: int) -> float:
+        xs, ys = self.xs, self.ys
+        return _cross(xs[p], ys[p], xs[q], ys[q], xs[r], ys[r])
+
+    def link(self, first: int, stop: int, counterclockwise: bool) -> int:
+        """Link the vertices first..stop-1 into a ring of the given orientation; return a node or -1."""
+        coords = self.coords
+        if stop - first > 1 and coords[2 * first] == coords[2 * stop - 2] and coords[2 * first + 1] == coords[2 * stop - 1]:
+            stop -= 1
+        twice_area = 0.0
+        j = stop - 1
+        for i in range(first, stop):
+            twice_area += (coords[2 * j] - coords[2 * i]) * (coords[2 * i + 1] + coords[2 * j + 1])
+            j = i
+        order = range(first, stop) if (twice_area > 0) == counterclockwise else range(stop - 1, first - 1, -1)
+        last = -1
+        for i in order:
+            last = self._node(i, coords[2 * i], coords[2 * i + 1], last)
+        return last
+
+    def filter(self, start: int, end: int = -1) -> int:
+        """Remove duplicate and collinear nodes between start and end; return a remaining node."""
+        if end < 0:
+            end = start
+        p = start
+        while True:
+            again = False
+            if self._equals(p, self.next[p]) or self._area(self.prev[p], p, self.next[p]) == 0:
+                self._remove(p)
+                p = end = self.prev[p]
+                if p == self.next[p]:
+                    break
+                again = True
+            else:
+                p = self.next[p]
+            if not again and p == end:
+                break
+        return end
+
+    def _locally_inside(self, a: int, b: int) -> bool:
+        if self._area(self.prev[a], a, self.next[a]) > 0:
+            return self._area(a, b, self.next[a]) <= 0 and self._area(a, self.prev[a], b) <= 0
+        return self._area(a, b, self.prev[a]) > 0 or self._area(a, self.next[a], b) > 0
+
+    def _split(self, a: int, b: int) -> int:
+        # Join a and b by a diagonal, duplicating both; return the copy of b on the other ring.
+        a2 = self._node(self.index[a], self.xs[a], self.ys[a], -1)
+        b2 = self._node(self.index[b], self.xs[b], self.ys[b], -1)
+        an, bp = self.next[a], self.prev[b]
+        self.next[a], self.prev[b] = b, a
+        self.next[a2], self.prev[an] = an, a2
+        self.next[b2], self.prev[a2] = a2, b2
+        self.next[bp], self.prev[b2] = b2, bp
+        return b2
+
+    def _hole_bridge(self, hole: int, outer: int) -> int:
+        xs, ys = self.xs, self.ys
+        hx, hy = xs[hole], ys[hole]
+        qx = float('-inf')
+        m = -1
+        p = outer
+        while True:
+            q = self.next[p]
+            if xs[q] == hx and ys[q] == hy:
+                return q
+            if ys[q] <= hy <= ys[p] and ys[q] != ys[p]:
+                x = xs[p] + (hy - ys[p]) * (xs[q] - xs[p]) / (ys[q] - ys[p])
+                if qx < x <= hx:
+                    qx = x
+                    m = p if xs[p] < xs[q] else q
+                    if x == hx:
+                        return m
+            p = q
+            if p == outer:
+                break
+        if m < 0:
+            return -1
+        # Reflex vertices inside the triangle (hole, ray hit, m) hide m; take the one closest in angle to the ray.
+        stop, mx, my = m, xs[m], ys[m]
+        tan_min = float('inf')
+        p = m
+        while True:
+            px, py = xs[p], ys[p]
+            if hx >= px >= mx and hx != px and _point_in_triangle(hx if hy < my else qx, hy, mx, my,
+                                                                   qx if hy < my else hx, hy, px, py):
+                tan = abs(hy - py) / (hx - px)
+                if self._locally_inside(p, hole) and (
+                        tan < tan_min or (tan == tan_min and (px > xs[m] or (px == xs[m] and (
+                            self._area(self.prev[m], m, self.prev[p]) > 0
+                            and self._area(self.next[p], m, self.next[m]) > 0))))):
+                    m, tan_min = p, tan
+            p = self.next[p]
+            if p == stop:
+                break
+        return m
+
+    def bridge_holes(self, outer: int, holes: list[int]) -> int:
+        """Merge every hole ring into the outer ring."""
+        xs, ys = self.xs, self.ys
+        leftmost = []
+        for hole in holes:
+            best = p = hole
+            while True:
+                if xs[p] < xs[best] or (xs[p] == xs[best] and ys[p] < ys[best]):
+                    best = p
+                p = self.next[p]
+                if p == hole:
+                    break
+            leftmost.append(best)
+        leftmost.sort(key=lambda p: (xs[p], ys[p]))
+        for hole in leftmost:
+            bridge = self._hole_bridge(hole, outer)
+            if bridge < 0:
+                continue
+            reverse = self._split(bridge, hole)
+            self.filter(reverse, self.next[reverse])
+            outer = self.filter(bridge, self.next[bridge])
+        return outer
+
+    def _build_index(self, start: int) -> None:
+        xs, ys, prev, next_ = self.xs, self.ys, self.prev, self.next
+        reflex_nodes = []
+        p = start
+        min_x = max_x = xs[p]
+        min_y = max_y = ys[p]
+        while True:
+            x, y = xs[p], ys[p]
+            if x < min_x:
+                min_x = x
+            elif x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            elif y > max_y:
+                max_y = y
+            a, c = prev[p], next_[p]
+            is_reflex = (x - xs[a]) * (ys[c] - ys[a]) - (y - ys[a]) * (xs[c] - xs[a]) <= 0
+            self.reflex[p] = is_reflex
+            if is_reflex:
+                reflex_nodes.append(p)
+            p = c
+            if p == start:
+                break
+        self.reflex_count = len(reflex_nodes)
+        self.grid_nodes = reflex_nodes
+        # Square cells, about one per reflex vertex over the bounding box.
+        width, height = max_x - min_x, max_y - min_y
+        cell = sqrt(width * height / max(len(reflex_nodes), 1)) or max(width, height)
+        self.grid_x, self.grid_y = min_x, min_y
+        self.grid_scale = 1 / cell if cell > 0 else 0.0
+        self.grid_cols = cols = int(width * self.grid_scale) + 1
+        scale = self.grid_scale
+        grid = {}
+        for p in reflex_nodes:
+            key = int((ys[p] - min_y) * scale) * cols + int((xs[p] - min_x) * scale)
+            bucket = grid.get(key)
+            if bucket is None:
+                grid[key] = [p]
+            else:
+                bucket.append(p)
+        self.grid = grid
+
+    def _is_ear(self, ear: int) -> bool:
+        xs, ys, reflex = self.xs, self.ys, self.reflex
+        a, c = self.prev[ear], self.next[ear]
+        ax, ay, bx, by, cx, cy = xs[a], ys[a], xs[ear], ys[ear], xs[c], ys[c]
+        if (bx - ax) * (cy - ay) - (by - ay) * (cx - ax) <= 0:
+            return False
+        if self.reflex_count == 0:
+            return True
+        low_x = ax if ax < bx else bx
+        low_x = low_x if low_x < cx else cx
+        low_y = ay if ay < by else by
+        low_y = low_y if low_y < cy else cy
+        high_x = ax if ax > bx else bx
+        high_x = high_x if high_x > cx else cx
+        high_y = ay if ay > by else by
+        high_y = high_y if high_y > cy else cy
+        gx, gy, scale, cols = self.grid_x, self.grid_y, self.grid_scale, self.grid_cols
+        col0, col1 = int((low_x - gx) * scale), int((high_x - gx) * scale)
+        row0, row1 = int((low_y - gy) * scale), int((high_y - gy) * scale)
+        if (col1 - col0 + 1) * (row1 - row0 + 1) > len(self.grid_nodes):
+            # Scanning the vertices is cheaper than visiting the cells.
+            buckets = (self.grid_nodes,)
+        else:
+            grid = self.grid
+            buckets = [grid[key] for row in range(row0, row1 + 1)
+                       for key in range(row * cols + col0, row * cols + col1 + 1) if key in grid]
+        for bucket in buckets:
+            for p in bucket:
+                if reflex[p] and p != a and p != c:
+                    px, py = xs[p], ys[p]
+                    if ((cx - px) * (ay - py) >= (ax - px) * (cy - py)
+                            and (ax - px) * (by - py) >= (bx - px) * (ay - py)
+                            and (bx - px) * (cy - py) >= (cx - px) * (by - py)
+                            and (px != ax or py != ay)):
+                        return False
+        return True
+
+    def _intersects(self, p1: int, q1: int, p2: int, q2: int) -> bool:
+        xs, ys = self.xs, self.ys
+
+        def sign(value: float) -> int:
+            return (value > 0) - (value < 0)
+
+        def on_segment(p: int, q: int, r: int) -> bool:
+            return (min(xs[p], xs[r]) <= xs[q] <= max(xs[p], xs[r])
+                    and min(ys[p], ys[r]) <= ys[q] <= max(ys[p], ys[r]))
+
+        o1, o2 = sign(self._area(p1, q1, p2)), sign(self._area(p1, q1, q2))
+        o3, o4 = sign(self._area(p2, q2, p1)), sign(self._area(p2, q2, q1))
+        if o1 != o2 and o3 != o4:
+            return True
+        return ((o1 == 0 and on_segment(p1, p2, q1)) or (o2 == 0 and on_segment(p1, q2, q1))
+                or (o3 == 0 and on_segment(p2, p1, q2)) or (o4 == 0 and on_segment(p2, q1, q2)))
+
+    def _cure(self, start: int) -> int:
+        # Cut off local self-intersections a-p-p.next-b as triangles.
+        p = start
+        while True:
+            a, b = self.prev[p], self.next[self.next[p]]
+            if (not self._equals(a, b) and self._intersects(a, p, self.next[p], b)
+                    and self._locally_inside(a, b) and self._locally_inside(b, a)):
+                self.triangles.extend((self.index[a], self.index[p], self.index[b]))
+                self._remove(self.next[p])
+                self._remove(p)
+                p = start = b
+            p = self.next[p]
+            if p == start:
+                break
+        return self.filter(p)
+
+    def _valid_diagonal(self, a: int, b: int) -> bool:
+        index, xs, ys = self.index, self.xs, self.ys
+        if index[self.next[a]] == index[b] or index[self.prev[a]] == index[b]:
+            return False
+        p = a
+        while True:
+            q = self.next[p]
+            if (index[p] != index[a] and index[q] != index[a] and index[p] != index[b] and index[q] != index[b]
+                    and self._intersects(p, q, a, b)):
+                return False
+            p = q
+            if p == a:
+                break
+        if self._equals(a, b):
+            return self._area(self.prev[a], a, self.next[a]) < 0 and self._area(self.prev[b], b, self.next[b]) < 0
+        if not (self._locally_inside(a, b) and self._locally_inside(b, a)):
+            return False
+        # The midpoint of the diagonal must be inside the ring.
+        mx, my = (xs[a] + xs[b]) / 2, (ys[a] + ys[b]) / 2
+        inside = False
+        p = a
+        while True:
+            q = self.next[p]
+            if (ys[p] > my) != (ys[q] > my) and mx < (xs[q] - xs[p]) * (my - ys[p]) / (ys[q] - ys[p]) + xs[p]:
+                inside = not inside
+            p = q
+            if p == a:
+                break
+        return inside and (self._area(self.prev[a], a, self.prev[b]) != 0 or self._area(a, self.prev[b], b) != 0)
+
+    def _split_clip(self, start: int) -> None:
+        a = start
+        while True:
+            b = self.next[self.next[a]]
+            while b != self.prev[a]:
+                if self.index[a] != self.index[b] and self._valid_diagonal(a, b):
+                    c = self._split(a, b)
+                    a = self.filter(a, self.next[a])
+                    c = self.filter(c, self.next[c])
+                    self.clip(a)
+                    self.clip(c)
+                    return
+                b = self.next[b]
+            a = self.next[a]
+            if a == start:
+                return
+
+    def clip(self, ear: int, stage: int = 0) -> None:
+        """Clip the ears of the ring holding node ear, escalating through the recovery stages when stuck."""
+        if ear < 0:
+            return
+        self._build_index(ear)
+        xs, ys, prev, next_, reflex, index = self.xs, self.ys, self.prev, self.next, self.reflex, self.index
+        triangles = self.triangles
+        stop = ear
+        while prev[ear] != next_[ear]:
+            a, c = prev[ear], next_[ear]
+            if not reflex[ear] and self._is_ear(ear):
+                triangles.append(index[a])
+                triangles.append(index[ear])
+                triangles.append(index[c])
+                self._remove(ear)
+                # Neighbors of a clipped ear can only turn from reflex to convex, or become collinear
+                # and be dropped as the filter stage would.
+                for p in (a, c):
+                    if reflex[p]:
+                        u, w = prev[p], next_[p]
+                        turn = (xs[p] - xs[u]) * (ys[w] - ys[u]) - (ys[p] - ys[u]) * (xs[w] - xs[u])
+                        if turn > 0:
+                            reflex[p] = False
+                            self.reflex_count -= 1
+                        elif turn == 0 and next_[w] != u:
+                            self._remove(p)
+                ear = stop = next_[c]
+                # Drop the stale entries once most indexed vertices have turned convex.
+                if 2 * self.reflex_count < len(self.grid_nodes):
+                    self._build_index(ear)
+                continue
+            ear = c
+            if ear == stop:
+                if stage == 0:
+                    self.clip(self.filter(ear), 1)
+                elif stage == 1:
+                    self.clip(self._cure(self.filter(ear)), 2)
+                else:
+                    self._split_clip(ear)
+                return
+
+
+def triangulate_rings(coords: Sequence[float], offsets: Sequence[int]) -> array:
+    """
+    Triangulate a polygon given in the ragged ring layout (as kept by Polygon2D).
+    :param coords: Flat point buffer of all rings.
+    :param offsets: Ring offsets: ring r spans points offsets[r] to offsets[r + 1]; ring 0 is the outer
+                    boundary and the others are holes.  Orientation does not matter and the closing
+                    vertex may be repeated.
+    :return: array('q') of counterclockwise vertex index triples into coords.
+    """
+    if len(coords) % 2 != 0:
+        raise ValueError("Buffer length must be a multiple of 2.")
+    if len(offsets) < 2:
+        return array('q')
+    clipper = _EarClipper(coords)
+    outer = clipper.link(offsets[0], offsets[1], True)
+    if outer < 0 or clipper.next[outer] == clipper.prev[outer]:
+        return array('q')
+    holes = []
+    for r in range(1, len(offsets) - 1):
+        hole = clipper.link(offsets[r], offsets[r + 1], False)
+        if hole >= 0:
+            holes.append(hole)
+    if holes:
+        outer = clipper.bridge_holes(outer, holes)
+    clipper.clip(outer)
+    return clipper.triangles
+
+
+def triangulate_polygon(outer: Sequence[Point2D], holes: Iterable[Sequence[Point2D]] = ()) -> array:
+    """
+    Triangulate a polygon with holes.
+    :param outer: Vertices of the outer boundary.
+    :param holes: Sequences of vertices of the holes.
+    :return: array('q') of counterclockwise index triples into the vertices of outer followed by those
+             of every hole, as given.
+    """
+    coords = array('d')
+    offsets = array('q', [0])
+    for ring in [outer, *holes]:
+        for point in ring:
+            if not isinstance(point, Point2D):
+                raise TypeError("Rings must contain Point2D instances.")
+            coords.append(point.x)
+            coords.append(point.y)
+        offsets.append(len(coords) // 2)
+    return triangulate_rings(coords, offsets)
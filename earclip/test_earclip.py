@@ -0,0 +1,103 @@
+import random
+import unittest
+from math import cos, pi, sin
+
+from .earclip import triangulate_polygon, triangulate_rings
+from point2d.point2d import Point2D
+from polygon2d.polygon2d import Polygon2D
+
+
+def _points(*coords):
+    return [Point2D(coords[k], coords[k + 1]) for k in range(0, len(coords), 2)]
+
+
+def _signed_areas(coords, triangles):
+    areas = []
+    for k in range(0, len(triangles), 3):
+        a, b, c = triangles[k:k + 3]
+        ax, ay = coords[2 * a], coords[2 * a + 1]
+        areas.append(((coords[2 * b] - ax) * (coords[2 * c + 1] - ay)
+                      - (coords[2 * b + 1] - ay) * (coords[2 * c] - ax)) / 2)
+    return areas
+
+
+def _ring_area(coords, first, stop):
+    total = 0.0
+    for i in range(first, stop):
+        j = i + 1 if i + 1 < stop else first
+        total += coords[2 * i] * coords[2 * j + 1] - coords[2 * j] * coords[2 * i + 1]
+    return abs(total) / 2
+
+
+class TestEarClip(unittest.TestCase):
+    def setUp(self):
+        random.seed(5)
+        n = 300
+        self.coords = []
+        for i in range(n):
+            angle, radius = 2 * pi * i / n, random.uniform(0.3, 1.0)
+            self.coords += [radius * cos(angle), radius * sin(angle)]
+
+    def test_square_with_holes(self):
+        outer = _points(0, 0, 10, 0, 10, 10, 0, 10)
+        holes = [_points(2, 2, 2, 4, 4, 4, 4, 2), _points(6, 6, 8, 6, 7, 8)]
+        triangles = triangulate_polygon(outer, holes)
+        coords = [value for point in outer + holes[0] + holes[1] for value in (point.x, point.y)]
+        areas = _signed_areas(coords, triangles)
+        self.assertEqual(len(areas), 4 + 4 + 3 + 2 * 2 - 2)
+        self.assertTrue(all(area > 0 for area in areas))
+        self.assertAlmostEqual(sum(areas), 100 - 4 - 2)
+        self.assertEqual(set(triangles), set(range(11)))
+
+    def test_random_star_polygon(self):
+        triangles = triangulate_rings(self.coords, [0, 300])
+        areas = _signed_areas(self.coords, triangles)
+        self.assertEqual(len(areas), 298)
+        self.assertTrue(all(area > 0 for area in areas))
+        self.assertAlmostEqual(sum(areas), _ring_area(self.coords, 0, 300))
+
+    def test_no_vertex_inside_a_triangle(self):
+        triangles = triangulate_rings(self.coords, [0, 300])
+        xs, ys = self.coords[0::2], self.coords[1::2]
+        for k in range(0, len(triangles), 3):
+            a, b, c = triangles[k:k + 3]
+            for p in range(300):
+                if p not in (a, b, c):
+                    inside = all((xs[v] - xs[u]) * (ys[p] - ys[u]) - (ys[v] - ys[u]) * (xs[p] - xs[u]) > 1e-12
+                                 for u, v in ((a, b), (b, c), (c, a)))
+                    self.assertFalse(inside)
+
+    def test_clockwise_ring_with_closing_vertex(self):
+        ring = _points(0, 0, 0, 4, 2, 2, 4, 4, 4, 0, 0, 0)
+        triangles = triangulate_polygon(ring)
+        self.assertNotIn(5, triangles)
+        coords = [value for point in ring for value in (point.x, point.y)]
+        self.assertAlmostEqual(sum(_signed_areas(coords, triangles)), 12)
+
+    def test_collinear_runs(self):
+        coords = []
+        for k in range(50):
+            coords += [k, 0, k + 0.3, 2, k + 0.6, 2, k + 0.9, 0]
+        coords += [50, -1, 0, -1]
+        n = len(coords) // 2
+        areas = _signed_areas(coords, triangulate_rings(coords, [0, n]))
+        self.assertTrue(all(area > 0 for area in areas))
+        self.assertAlmostEqual(sum(areas), _ring_area(coords, 0, n))
+
+    def test_polygon2d_layout(self):
+        polygon = Polygon2D(_points(0, 0, 6, 0, 6, 6, 0, 6), [_points(1, 1, 2, 1, 2, 2, 1, 2)])
+        areas = _signed_areas(polygon.coords, triangulate_rings(polygon.coords, polygon.offsets))
+        self.assertAlmostEqual(sum(areas), polygon.area())
+
+    def test_degenerate_inputs(self):
+        self.assertEqual(len(triangulate_polygon(_points(0, 0, 1, 1))), 0)
+        self.assertEqual(len(triangulate_polygon(_points(0, 0, 1, 1, 2, 2))), 0)
+        self.assertEqual(len(triangulate_rings([], [0])), 0)
+        with self.assertRaises(TypeError):
+            triangulate_polygon([(0, 0), (1, 0), (0, 1)])
+        with self.assertRaises(ValueError):
+            triangulate_rings([0, 0, 1], [0, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
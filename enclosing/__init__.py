@@ -0,0 +1,2 @@
+from .enclosing import minimum_enclosing_circle, entity_enclosing_circle, circle_arc
+__all__ = ['minimum_enclosing_circle', 'entity_enclosing_circle', 'circle_arc']
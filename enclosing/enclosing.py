@@ -0,0 +1,161 @@
+"""
+Minimum enclosing circles.
+
+minimum_enclosing_circle implements Welzl's algorithm in its iterative,
+randomized incremental form: after shuffling, a point outside the current
+circle must lie on the boundary of the circle of the points seen so far,
+which leads to three nested loops (one, two and three boundary points) and
+expected O(n) work without recursion, so millions of points are handled
+without touching the recursion limit.
+
+For lines and arcs, entity_enclosing_circle starts from the end points and
+the axis extrema of the arcs, then adds the point of each arc farthest from
+the current center until every arc fits; the farthest point of an arc is
+not always one of its extrema.
+
+A full circle is represented as an Arc2D whose start and end points
+coincide (at angle 0 from the center).  Arc2D measures sweeps from the
+start angle to the end angle, so such an arc reports a zero sweep; read the
+circle through cp and radius_cp_sp().
+"""
+import random
+from math import atan2, cos, hypot, pi, sin
+from typing import Iterable, Optional
+
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D, TOLERANCE_LENGTH
+
+# Relative slack when testing whether a point lies in a circle.
+_CONTAIN_EPSILON = 1e-12
+
+
+def _two_point_circle(ax: float, ay: float, bx: float, by: float) -> tuple[float, float, float]:
+    cx, cy = (ax + bx) / 2, (ay + by) / 2
+    return cx, cy, hypot(ax - cx, ay - cy)
+
+
+def _three_point_circle(ax: float, ay: float, bx: float, by: float,
+                        px: float, py: float) -> tuple[float, float, float]:
+    bx, by, px, py = bx - ax, by - ay, px - ax, py - ay
+    d = 2 * (bx * py - by * px)
+    if d == 0:
+        # Collinear: the circle over the farthest pair encloses the third point.
+        circles = [_two_point_circle(0, 0, bx, by), _two_point_circle(0, 0, px, py), _two_point_circle(bx, by, px, py)]
+        cx, cy, r = max(circles, key=lambda circle: circle[2])
+        return ax + cx, ay + cy, r
+    b2, p2 = bx * bx + by * by, px * px + py * py
+    cx = (py * b2 - by * p2) / d
+    cy = (bx * p2 - px * b2) / d
+    return ax + cx, ay + cy, hypot(cx, cy)
+
+
+def _welzl(xs: list, ys: list, rng: random.Random) -> tuple[float, float, float]:
+    order = list(range(len(xs)))
+    rng.shuffle(order)
+    xs = [xs[k] for k in order]
+    ys = [ys[k] for k in order]
+    cx, cy, r = xs[0], ys[0], 0.0
+    limit = _CONTAIN_EPSILON
+    for i in range(1, len(xs)):
+        if hypot(xs[i] - cx, ys[i] - cy) <= limit:
+            continue
+        cx, cy, r = xs[i], ys[i], 0.0
+        limit = _CONTAIN_EPSILON
+        for j in range(i):
+            if hypot(xs[j] - cx, ys[j] - cy) <= limit:
+                continue
+            cx, cy, r = _two_point_circle(xs[i], ys[i], xs[j], ys[j])
+            limit = r + _CONTAIN_EPSILON * max(1.0, r)
+            for k in range(j):
+                if hypot(xs[k] - cx, ys[k] - cy) > limit:
+                    cx, cy, r = _three_point_circle(xs[i], ys[i], xs[j], ys[j], xs[k], ys[k])
+                    limit = r + _CONTAIN_EPSILON * max(1.0, r)
+        limit = r + _CONTAIN_EPSILON * max(1.0, r)
+    return cx, cy, r
+
+
+def minimum_enclosing_circle(points: Iterable[Point2D], seed: Optional[int] = None) -> tuple[Point2D, float]:
+    """
+    Find the smallest circle enclosing a point collection in expected linear time.
+    :param points: Iterable of Point2D instances.
+    :param seed: Seed of the shuffle (the result does not depend on it beyond rounding).
+    :return: (center, radius).
+    """
+    xs, ys = [], []
+    for point in points:
+        if not isinstance(point, Point2D):
+            raise TypeError("Points must be Point2D instances.")
+        xs.append(point.x)
+        ys.append(point.y)
+    if not xs:
+        raise ValueError("Cannot enclose an empty collection.")
+    cx, cy, r = _welzl(xs, ys, random.Random(seed))
+    return Point2D(cx, cy), r
+
+
+def _arc_geometry(arc: Arc2D) -> tuple[float, float, float, float, float]:
+    cp, sp, ep = arc.points
+    start = atan2(sp.y - cp.y, sp.x - cp.x) % (2 * pi)
+    end = atan2(ep.y - cp.y, ep.x - cp.x) % (2 * pi)
+    return cp.x, cp.y, hypot(sp.x - cp.x, sp.y - cp.y), min(start, end), max(start, end)
+
+
+def entity_enclosing_circle(entities: Iterable[Line2D | Arc2D], seed: Optional[int] = None,
+                            tolerance: int | float = TOLERANCE_LENGTH) -> tuple[Point2D, float]:
+    """
+    Find the smallest circle enclosing a set of lines and arcs.
+    :param entities: Iterable of Line2D and Arc2D instances.
+    :param seed: Seed of the shuffle.
+    :param tolerance: Distance by which an arc may stick out of the returned circle.
+    :return: (center, radius).
+    """
+    xs, ys = [], []
+    arcs = []
+    for entity in entities:
+        if isinstance(entity, Line2D):
+            for point in entity.points:
+                xs.append(point.x)
+                ys.append(point.y)
+        elif isinstance(entity, Arc2D):
+            _, sp, ep = entity.points
+            xs.extend((sp.x, ep.x))
+            ys.extend((sp.y, ep.y))
+            cx, cy, r, low, high = _arc_geometry(entity)
+            arcs.append((cx, cy, r, low, high))
+            for quarter in range(4):
+                angle = quarter * pi / 2
+                if low < angle < high:
+                    xs.append(cx + r * cos(angle))
+                    ys.append(cy + r * sin(angle))
+        else:
+            raise TypeError("Entities must be Line2D or Arc2D instances.")
+    if not xs:
+        raise ValueError("Cannot enclose an empty collection.")
+    rng = random.Random(seed)
+    while True:
+        cx, cy, r = _welzl(xs, ys, rng)
+        added = False
+        for ax, ay, ar, low, high in arcs:
+            # The farthest point of the full circle lies opposite the enclosing center.
+            angle = atan2(ay - cy, ax - cx) % (2 * pi)
+            if low <= angle <= high and hypot(ax - cx, ay - cy) + ar > r + tolerance:
+                xs.append(ax + ar * cos(angle))
+                ys.append(ay + ar * sin(angle))
+                added = True
+        if not added:
+            return Point2D(cx, cy), r
+
+
+def circle_arc(center: Point2D, radius: int | float) -> Arc2D:
+    """
+    Build the full-circle Arc2D of a circle: start and end points coincide at angle 0.
+    :param center: Circle center.
+    :param radius: Circle radius.
+    :return: Arc2D with sp == ep.
+    """
+    if not isinstance(center, Point2D):
+        raise TypeError("Center must be a Point2D instance.")
+    if radius < 0:
+        raise ValueError("Radius cannot be negative.")
+    return Arc2D(Point2D(center.x, center.y), Point2D(center.x + radius, center.y), Point2D(center.x + radius, center.y))
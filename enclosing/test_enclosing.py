@@ -0,0 +1,78 @@
+import random
+import unittest
+from itertools import combinations
+from math import cos, hypot, sin
+
+from .enclosing import minimum_enclosing_circle, entity_enclosing_circle, circle_arc, _two_point_circle, _three_point_circle
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+
+
+def _brute_force_radius(points):
+    coords = [(p.x, p.y) for p in points]
+    candidates = [_two_point_circle(*a, *b) for a, b in combinations(coords, 2)]
+    candidates += [_three_point_circle(*a, *b, *c) for a, b, c in combinations(coords, 3)]
+    return min(r for cx, cy, r in candidates
+               if all(hypot(x - cx, y - cy) <= r + 1e-9 for x, y in coords))
+
+
+class TestEnclosing(unittest.TestCase):
+    def assertEncloses(self, center, radius, points):
+        for p in points:
+            self.assertLessEqual(hypot(p.x - center.x, p.y - center.y), radius + 1e-9)
+
+    def test_matches_brute_force(self):
+        rng = random.Random(5)
+        for _ in range(20):
+            points = [Point2D(rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(rng.randint(2, 12))]
+            center, radius = minimum_enclosing_circle(points, seed=1)
+            self.assertEncloses(center, radius, points)
+            self.assertAlmostEqual(radius, _brute_force_radius(points))
+
+    def test_small_and_degenerate_inputs(self):
+        center, radius = minimum_enclosing_circle([Point2D(2, 3)])
+        self.assertEqual((center, radius), (Point2D(2, 3), 0))
+        center, radius = minimum_enclosing_circle([Point2D(0, 0), Point2D(1, 1), Point2D(2, 2), Point2D(1, 1)])
+        self.assertAlmostEqual(center.x, 1)
+        self.assertAlmostEqual(radius, hypot(1, 1))
+        with self.assertRaises(ValueError):
+            minimum_enclosing_circle([])
+        with self.assertRaises(TypeError):
+            minimum_enclosing_circle([(0, 0)])
+
+    def test_circle_points(self):
+        points = [Point2D(3 + 2 * cos(k * 0.1), -1 + 2 * sin(k * 0.1)) for k in range(63)]
+        center, radius = minimum_enclosing_circle(points, seed=2)
+        self.assertAlmostEqual(center.x, 3)
+        self.assertAlmostEqual(center.y, -1)
+        self.assertAlmostEqual(radius, 2)
+
+    def test_entities_include_arc_interior(self):
+        # The arc bulges beyond the circle over its end points and the line, away from any axis extremum.
+        arc = Arc2D(Point2D(0, 0), Point2D(10 * cos(0.3), 10 * sin(0.3)), Point2D(10 * cos(1.2), 10 * sin(1.2)))
+        line = Line2D(Point2D(10 * cos(0.3), 10 * sin(0.3)), Point2D(10 * cos(1.2), 10 * sin(1.2)))
+        center, radius = entity_enclosing_circle([arc, line], seed=3)
+        samples = [Point2D(10 * cos(0.3 + 0.9 * t / 200), 10 * sin(0.3 + 0.9 * t / 200)) for t in range(201)]
+        self.assertEncloses(center, radius + 1e-8, samples)
+        self.assertLessEqual(radius, minimum_enclosing_circle(samples)[1] + 1e-8)
+
+    def test_entities_arc_axis_extremum(self):
+        arc = Arc2D(Point2D(0, 0), Point2D(1, -0.0), Point2D(-1, 0))
+        center, radius = entity_enclosing_circle([arc])
+        self.assertAlmostEqual(radius, 1)
+        self.assertAlmostEqual(center.y, 0)
+        with self.assertRaises(TypeError):
+            entity_enclosing_circle([Point2D(0, 0)])
+
+    def test_circle_arc(self):
+        arc = circle_arc(Point2D(1, 2), 3)
+        self.assertEqual(arc.cp, Point2D(1, 2))
+        self.assertEqual(arc.sp, arc.ep)
+        self.assertAlmostEqual(arc.radius_cp_sp(), 3)
+        with self.assertRaises(ValueError):
+            circle_arc(Point2D(0, 0), -1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,2 @@
+from .hatching import Hatcher, hatch
+__all__ = ['Hatcher', 'hatch']
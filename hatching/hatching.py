@@ -0,0 +1,159 @@
+"""
+Hatching of regions bounded by lines and arcs with parallel scanlines.
+
+Hatch lines at an angle are found in a scanline frame: the boundary is
+rotated by minus the hatch angle, so that hatch lines become horizontal
+lines y = phase + k * spacing, and the spans found there are rotated back.
+
+In the scanline frame the boundary is cut into y-monotone edges (lines, and
+arcs split at their top and bottom points), each crossing every scanline
+between its lowest and highest y at most once.  The edges are sorted by
+their lowest y into an edge table and swept upward with an active-edge
+table: at every scanline the edges starting below it join the table, the
+edges ending below it leave, and only the active edges are intersected.
+Sorting their crossings by x and counting the winding of the boundary
+around them gives the inside spans.  The work is proportional to the edge
+count (for the sort) plus the number of crossings, instead of the number
+of scanlines times the number of edges.
+
+Edges cover the half-open range [lowest y, highest y), so that a scanline
+through a vertex counts it once where the boundary passes through and
+twice or not at all where it turns back.  Regions keep their outer rings
+counterclockwise and their holes clockwise; the nonzero winding rule then
+hatches the union of several regions, even where they overlap, without a
+boolean operation.
+"""
+from array import array
+from math import ceil, cos, floor, radians, sin, sqrt
+from typing import Iterable
+
+from polygon2d.polygon2d import Polygon2D
+from pieces.pieces import ARC, crossers
+from boolean.boolean import Region2D, as_regions
+
+
+def _rotated(piece: list, c: float, s: float, angle: float) -> list:
+    # The piece turned by -angle about the origin; c and s are the cosine and sine of the angle.
+    rotated = [piece[0], piece[1] * c + piece[2] * s, piece[2] * c - piece[1] * s,
+               piece[3] * c + piece[4] * s, piece[4] * c - piece[3] * s, 0.0, 0.0, piece[7], 0.0, piece[9]]
+    if piece[0] == ARC:
+        rotated[5], rotated[6] = piece[5] * c + piece[6] * s, piece[6] * c - piece[5] * s
+        rotated[8] = piece[8] - angle
+    return rotated
+
+
+class Hatcher:
+    def __init__(self, regions: Region2D | Polygon2D | Iterable[Region2D | Polygon2D]):
+        """
+        Prepare regions for hatching.
+        :param regions: A Region2D or Polygon2D, or several of them; overlapping regions are hatched as their union.
+        """
+        self.regions = as_regions(regions)
+        self._rings = [ring for region in self.regions for ring in region.records()]
+
+    def _edge_table(self, angle: float) -> list[tuple]:
+        # Y-monotone edges in the scanline frame as (low, high, winding, x, y, c, side), sorted by low.
+        # A line crosses y at x + (y - y0) * c, an arc at x + side * sqrt(c - (y - y0) ** 2).
+        c, s = cos(angle), sin(angle)
+        rings = []
+        for ring in self._rings:
+            ring = [_rotated(piece, c, s, angle) for piece in ring]
+            for previous, piece in zip(ring[-1:] + ring, ring):
+                # Close gaps left within tolerance, so that no scanline slips between two pieces.
+                piece[1], piece[2] = previous[3], previous[4]
+            rings.append(ring)
+        edges = []
+        for crosser in crossers(rings):
+            y0, y1 = crosser[0], crosser[1]
+            # Going down, an edge has the interior on its right: the winding rises when crossing it rightward.
+            winding = 1 if y1 < y0 else -1
+            low, high = (y1, y0) if y1 < y0 else (y0, y1)
+            if len(crosser) == 4:
+                x0, x1 = crosser[2], crosser[3]
+                edges.append((low, high, winding, x0, y0, (x1 - x0) / (y1 - y0), 0.0))
+            else:
+                cx, cy, radius, side = crosser[2:]
+                edges.append((low, high, winding, cx, cy, radius * radius, side))
+        edges.sort()
+        return edges
+
+    def hatch(self, spacing: int | float, angle: int | float = 0.0, phase: int | float = 0.0,
+              alternate: bool = False) -> array:
+        """
+        Hatch the regions with parallel lines.
+        :param spacing: Distance between hatch lines.
+        :param angle: Direction of the hatch lines, in degrees counterclockwise from the x axis.
+        :param phase: Offset of the hatch lines from the origin, across their direction.
+        :param alternate: Whether to reverse every other hatch line (zig-zag order, as in pocketing).
+        :return: Segment buffer of the inside spans, hatch line by hatch line and in order along each line.
+        """
+        if not all(isinstance(value, (int, float)) for value in (spacing, angle, phase)):
+            raise TypeError("Spacing, angle and phase must be numeric values.")
+        if spacing <= 0:
+            raise ValueError("Spacing must be positive.")
+        angle = radians(angle)
+        c, s = cos(angle), sin(angle)
+        edges = self._edge_table(angle)
+        out = array('d')
+        if not edges:
+            return out
+        top = max(edge[1] for edge in edges)
+        first = ceil((edges[0][0] - phase) / spacing)
+        last = floor((top - phase) / spacing)
+        active = []
+        following = 0
+        line = 0
+        for k in range(first, last + 1):
+            y = phase + k * spacing
+            active = [edge for edge in active if edge[1] > y]
+            while following < len(edges) and edges[following][0] <= y:
+                edge = edges[following]
+                if edge[1] > y:
+                    active.append(edge)
+                following += 1
+            crossings = []
+            for _, _, winding, x0, y0, slope, side in active:
+                if side:
+                    dy = y - y0
+                    crossings.append((x0 + side * sqrt(max(slope - dy * dy, 0.0)), winding))
+                else:
+                    crossings.append((x0 + (y - y0) * slope, winding))
+            crossings.sort()
+            spans = []
+            count = 0
+            start = 0.0
+            for x, winding in crossings:
+                if not count:
+                    start = x
+                    if spans and spans[-1][1] == x:
+                        # Regions sharing an edge give one span across it.
+                        start = spans.pop()[0]
+                count += winding
+                if not count and x > start:
+                    spans.append((start, x))
+            if not spans:
+                continue
+            if alternate and line % 2:
+                spans = [(x1, x0) for x0, x1 in reversed(spans)]
+            line += 1
+            ys, yc = y * s, y * c
+            for x0, x1 in spans:
+                out.extend((x0 * c - ys, x0 * s + yc, x1 * c - ys, x1 * s + yc))
+        return out
+
+    def __repr__(self) -> str:
+        return "Hatcher(%d regions, %d rings)" % (len(self.regions), len(self._rings))
+
+
+def hatch(regions: Region2D | Polygon2D | Iterable[Region2D | Polygon2D], spacing: int | float,
+          angle: int | float = 0.0, phase: int | float = 0.0, alternate: bool = False) -> array:
+    """
+    Hatch regions with parallel lines.
+    :param regions: A Region2D or Polygon2D, or several of them; overlapping regions are hatched as their union.
+    :param spacing: Distance between hatch lines.
+    :param angle: Direction of the hatch lines, in degrees counterclockwise from the x axis.
+    :param phase: Offset of the hatch lines from the origin, across their direction.
+    :param alternate: Whether to reverse every other hatch line (zig-zag order, as in pocketing).
+    :return: Segment buffer of the inside spans, hatch line by hatch line and in order along each line.
+    """
+    return Hatcher(regions).hatch(spacing, angle, phase, alternate)
@@ -0,0 +1,88 @@
+import random
+import unittest
+from math import cos, hypot, pi, sin
+
+from .hatching import Hatcher, hatch
+from point2d.point2d import Point2D
+from polygon2d.polygon2d import Polygon2D
+from boolean.test_shapes import square, circle
+
+
+def _spans(segments):
+    return [tuple(round(value, 9) for value in segments[k:k + 4]) for k in range(0, len(segments), 4)]
+
+
+def _length(segments):
+    return sum(hypot(segments[k + 2] - segments[k], segments[k + 3] - segments[k + 1])
+               for k in range(0, len(segments), 4))
+
+
+class TestHatching(unittest.TestCase):
+    def test_square(self):
+        spans = _spans(hatch(square(0, 0, 4), 1, phase=0.5))
+        self.assertEqual(spans, [(0, y + 0.5, 4, y + 0.5) for y in range(4)])
+        # Scanlines through vertices count the bottom edge but not the top one.
+        self.assertEqual(len(hatch(square(0, 0, 4), 1)), 16)
+        vertical = _spans(hatch(square(0, 0, 4), 1, 90, 0.5))
+        self.assertEqual(vertical, [(x + 0.5, 0, x + 0.5, 4) for x in (3, 2, 1, 0)])
+
+    def test_alternate(self):
+        spans = _spans(hatch(square(0, 0, 4), 1, phase=0.5, alternate=True))
+        self.assertEqual(spans, [(0, 0.5, 4, 0.5), (4, 1.5, 0, 1.5), (0, 2.5, 4, 2.5), (4, 3.5, 0, 3.5)])
+        # With a hole, the spans of a reversed line are reversed as well.
+        frame = Polygon2D([Point2D(0, 0), Point2D(6, 0), Point2D(6, 6), Point2D(0, 6)],
+                          [[Point2D(2, 2), Point2D(4, 2), Point2D(4, 4), Point2D(2, 4)]])
+        spans = _spans(hatch(frame, 1, phase=0.5, alternate=True))
+        self.assertEqual(spans[4:6], [(6, 3.5, 4, 3.5), (2, 3.5, 0, 3.5)])
+
+    def test_angles_and_arcs(self):
+        hatcher = Hatcher(circle(0, 0, 10))
+        for angle in (0, 30, 45, 90, 137):
+            segments = hatcher.hatch(0.01, angle)
+            self.assertAlmostEqual(_length(segments) * 0.01, 100 * pi, delta=0.01)
+            for k in range(0, len(segments), 2):
+                self.assertAlmostEqual(hypot(segments[k], segments[k + 1]), 10)
+        # Every span runs along the hatch direction.
+        segments = hatch(square(0, 0, 10), 0.5, 60)
+        for k in range(0, len(segments), 4):
+            dx, dy = segments[k + 2] - segments[k], segments[k + 3] - segments[k + 1]
+            self.assertAlmostEqual(dy, dx * 3 ** 0.5)
+
+    def test_holes_and_overlaps(self):
+        frame = Polygon2D([Point2D(0, 0), Point2D(10, 0), Point2D(10, 10), Point2D(0, 10)],
+                          [[Point2D(3, 3), Point2D(5, 3), Point2D(5, 5), Point2D(3, 5)]])
+        self.assertAlmostEqual(_length(hatch(frame, 0.001, 20)) * 0.001, 96, places=4)
+        # Overlapping regions are hatched once, as their union.
+        union = hatch([square(0, 0, 2), square(1, 1, 2)], 0.25, phase=0.125)
+        self.assertAlmostEqual(_length(union) * 0.25, 7)
+        self.assertIn((0, 1.375, 3, 1.375), _spans(union))
+        # Regions sharing an edge give a single span across it.
+        self.assertEqual(_spans(hatch([square(0, 0, 1), square(1, 0, 1)], 1, phase=0.5)), [(0, 0.5, 2, 0.5)])
+
+    def test_matches_point_sampling(self):
+        random.seed(5)
+        points = []
+        for k in range(2000):
+            angle = 2 * pi * k / 2000
+            radius = 50 + 10 * sin(37 * angle) + random.uniform(-1, 1)
+            points.append(Point2D(radius * cos(angle), radius * sin(angle)))
+        polygon = Polygon2D(points)
+        segments = hatch(polygon, 0.7, 33, 0.2)
+        self.assertGreater(len(segments), 0)
+        for k in range(0, len(segments), 4):
+            x0, y0, x1, y1 = segments[k:k + 4]
+            self.assertTrue(polygon.contains(Point2D((x0 + x1) / 2, (y0 + y1) / 2)))
+        self.assertAlmostEqual(_length(segments) * 0.7, polygon.area(), delta=0.01 * polygon.area())
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            Hatcher([Point2D(0, 0)])
+        with self.assertRaises(TypeError):
+            hatch(square(0, 0, 1), '1')
+        with self.assertRaises(ValueError):
+            hatch(square(0, 0, 1), 0)
+        self.assertEqual(len(hatch([], 1)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,2 @@
+from .hull import convex_hull, diameter, minimum_width, minimum_area_rectangle
+__all__ = ['convex_hull', 'diameter', 'minimum_width', 'minimum_area_rectangle']
@@ -0,0 +1,164 @@
+"""
+Convex hulls and rotating-calipers measurements.
+
+convex_hull sorts the points once and builds the lower and upper hulls with
+Andrew's monotone chain in O(n log n).  The measurements walk the hull
+with rotating calipers, advancing each antipodal pointer monotonically
+around the hull, so they cost O(h) for a hull of h vertices:
+
+- diameter: the farthest pair of points;
+- minimum_width: the smallest distance between two parallel supporting
+  lines, reached with one line flush with a hull edge;
+- minimum_area_rectangle: the smallest enclosing rectangle, which also has
+  a side flush with a hull edge.
+
+Hulls are counterclockwise lists of Point2D without collinear vertices.
+"""
+from math import atan2, hypot, pi, sqrt
+from typing import Iterable, Sequence
+
+from point2d.point2d import Point2D
+
+
+def _cross(ox: float, oy: float, ax: float, ay: float, bx: float, by: float) -> float:
+    return (ax - ox) * (by - oy) - (ay - oy) * (bx - ox)
+
+
+def convex_hull(points: Iterable[Point2D]) -> list[Point2D]:
+    """
+    Compute the convex hull of a point collection.
+    :param points: Iterable of Point2D instances.
+    :return: Hull vertices in counterclockwise order starting from the lowest-x (then lowest-y) point,
+             without collinear vertices; the input Point2D objects are returned, not copies.
+    """
+    pts = list(points)
+    if not all(isinstance(point, Point2D) for point in pts):
+        raise TypeError("Points must be Point2D instances.")
+    keyed = sorted({(point.x, point.y): point for point in reversed(pts)}.items())
+    if len(keyed) < 3:
+        return [point for _, point in keyed]
+    lower, upper = [], []
+    for chain, items in ((lower, keyed), (upper, reversed(keyed))):
+        for (x, y), point in items:
+            while len(chain) >= 2:
+                (ox, oy), _ = chain[-2]
+                (ax, ay), _ = chain[-1]
+                if _cross(ox, oy, ax, ay, x, y) > 0:
+                    break
+                chain.pop()
+            chain.append(((x, y), point))
+    return [point for _, point in lower[:-1] + upper[:-1]]
+
+
+def _coords(hull: Sequence[Point2D]) -> tuple[list[float], list[float]]:
+    if not all(isinstance(point, Point2D) for point in hull):
+        raise TypeError("Hull must contain Point2D instances.")
+    if not hull:
+        raise ValueError("Hull is empty.")
+    return [point.x for point in hull], [point.y for point in hull]
+
+
+def diameter(hull: Sequence[Point2D]) -> tuple[float, Point2D, Point2D]:
+    """
+    Find the farthest pair of points of a convex hull.
+    :param hull: Counterclockwise hull from convex_hull.
+    :return: (distance, first point, second point).
+    """
+    xs, ys = _coords(hull)
+    h = len(hull)
+    if h < 3:
+        return hypot(xs[-1] - xs[0], ys[-1] - ys[0]), hull[0], hull[-1]
+    best, pair = -1.0, (0, 0)
+    j = 1
+    for i in range(h):
+        k = (i + 1) % h
+        # Advance j while the triangle on edge (i, k) keeps growing.
+        while True:
+            n = (j + 1) % h
+            if _cross(xs[i], ys[i], xs[k], ys[k], xs[n], ys[n]) > _cross(xs[i], ys[i], xs[k], ys[k], xs[j], ys[j]):
+                j = n
+            else:
+                break
+        for a in (i, k):
+            d = hypot(xs[j] - xs[a], ys[j] - ys[a])
+            if d > best:
+                best, pair = d, (a, j)
+    return best, hull[pair[0]], hull[pair[1]]
+
+
+def minimum_width(hull: Sequence[Point2D]) -> tuple[float, float]:
+    """
+    Find the smallest width of a convex hull.
+    :param hull: Counterclockwise hull from convex_hull.
+    :return: (width, angle in [0, pi) of the supporting lines).
+    """
+    xs, ys = _coords(hull)
+    h = len(hull)
+    if h < 3:
+        angle = atan2(ys[-1] - ys[0], xs[-1] - xs[0]) % pi if h == 2 else 0.0
+        return 0.0, angle
+    best, best_angle = float('inf'), 0.0
+    j = 1
+    for i in range(h):
+        k = (i + 1) % h
+        while True:
+            n = (j + 1) % h
+            if _cross(xs[i], ys[i], xs[k], ys[k], xs[n], ys[n]) > _cross(xs[i], ys[i], xs[k], ys[k], xs[j], ys[j]):
+                j = n
+            else:
+                break
+        dx, dy = xs[k] - xs[i], ys[k] - ys[i]
+        width = _cross(xs[i], ys[i], xs[k], ys[k], xs[j], ys[j]) / sqrt(dx * dx + dy * dy)
+        if width < best:
+            best, best_angle = width, atan2(dy, dx) % pi
+    return best, best_angle
+
+
+def minimum_area_rectangle(hull: Sequence[Point2D]) -> tuple[float, list[Point2D], float]:
+    """
+    Find the smallest-area rectangle enclosing a convex hull.
+    :param hull: Counterclockwise hull from convex_hull.
+    :return: (area, four corners in counterclockwise order, angle in [0, pi) of the first side).
+    """
+    xs, ys = _coords(hull)
+    h = len(hull)
+    if h < 3:
+        angle = atan2(ys[-1] - ys[0], xs[-1] - xs[0]) % pi if h == 2 else 0.0
+        return 0.0, [Point2D(xs[0], ys[0]), Point2D(xs[-1], ys[-1]), Point2D(xs[-1], ys[-1]), Point2D(xs[0], ys[0])], angle
+
+    def along(index: int, ux: float, uy: float) -> float:
+        return xs[index] * ux + ys[index] * uy
+
+    best = None
+    # Pointers to the farthest vertex along the edge (right), away from it (top) and against it (left).
+    right = top = left = None
+    for i in range(h):
+        k = (i + 1) % h
+        dx, dy = xs[k] - xs[i], ys[k] - ys[i]
+        length = sqrt(dx * dx + dy * dy)
+        ux, uy = dx / length, dy / length
+        nx, ny = -uy, ux
+        if right is None:
+            right = max(range(h), key=lambda v: along(v, ux, uy))
+            top = max(range(h), key=lambda v: along(v, nx, ny))
+            left = min(range(h), key=lambda v: along(v, ux, uy))
+        while along((right + 1) % h, ux, uy) > along(right, ux, uy):
+            right = (right + 1) % h
+        while along((top + 1) % h, nx, ny) > along(top, nx, ny):
+            top = (top + 1) % h
+        while along((left + 1) % h, ux, uy) < along(left, ux, uy):
+            left = (left + 1) % h
+        base = along(i, ux, uy)
+        low, high = along(left, ux, uy) - base, along(right, ux, uy) - base
+        height = along(top, nx, ny) - along(i, nx, ny)
+        area = (high - low) * height
+        if best is None or area < best[0]:
+            best = (area, i, ux, uy, low, high, height)
+    area, i, ux, uy, low, high, height = best
+    ox, oy = xs[i], ys[i]
+    nx, ny = -uy, ux
+    corners = [Point2D(ox + low * ux, oy + low * uy),
+               Point2D(ox + high * ux, oy + high * uy),
+               Point2D(ox + high * ux + height * nx, oy + high * uy + height * ny),
+               Point2D(ox + low * ux + height * nx, oy + low * uy + height * ny)]
+    return area, corners, atan2(uy, ux) % pi
@@ -0,0 +1,92 @@
+import random
+import unittest
+from itertools import combinations
+from math import cos, hypot, pi, sin
+
+from .hull import convex_hull, diameter, minimum_width, minimum_area_rectangle
+from point2d.point2d import Point2D
+
+
+def _points(*coords):
+    return [Point2D(coords[k], coords[k + 1]) for k in range(0, len(coords), 2)]
+
+
+class TestHull(unittest.TestCase):
+    def setUp(self):
+        random.seed(3)
+        self.cloud = [Point2D(random.gauss(0, 10), random.gauss(0, 4)) for _ in range(300)]
+        self.hull = convex_hull(self.cloud)
+
+    def test_square_with_interior_and_collinear_points(self):
+        points = _points(0, 0, 2, 0, 4, 0, 4, 4, 0, 4, 1, 1, 3, 2, 0, 2, 4, 4)
+        hull = convex_hull(points)
+        self.assertEqual(hull, _points(0, 0, 4, 0, 4, 4, 0, 4))
+        self.assertIs(hull[0], points[0])
+
+    def test_small_inputs(self):
+        self.assertEqual(convex_hull([]), [])
+        self.assertEqual(convex_hull(_points(1, 1, 1, 1)), _points(1, 1))
+        self.assertEqual(convex_hull(_points(2, 2, 0, 0, 1, 1)), _points(0, 0, 2, 2))
+        with self.assertRaises(TypeError):
+            convex_hull([(0, 0)])
+
+    def test_hull_contains_all_points(self):
+        h = len(self.hull)
+        for i in range(h):
+            a, b = self.hull[i], self.hull[(i + 1) % h]
+            for p in self.cloud:
+                self.assertGreaterEqual((b.x - a.x) * (p.y - a.y) - (b.y - a.y) * (p.x - a.x), -1e-9)
+
+    def test_diameter_matches_brute_force(self):
+        distance, p, q = diameter(self.hull)
+        expected = max(hypot(a.x - b.x, a.y - b.y) for a, b in combinations(self.cloud, 2))
+        self.assertAlmostEqual(distance, expected)
+        self.assertAlmostEqual(hypot(p.x - q.x, p.y - q.y), expected)
+
+    def test_minimum_width_matches_brute_force(self):
+        width, angle = minimum_width(self.hull)
+        expected = float('inf')
+        for i in range(len(self.hull)):
+            a, b = self.hull[i], self.hull[(i + 1) % len(self.hull)]
+            length = hypot(b.x - a.x, b.y - a.y)
+            expected = min(expected, max(((b.x - a.x) * (p.y - a.y) - (b.y - a.y) * (p.x - a.x)) / length
+                                         for p in self.hull))
+        self.assertAlmostEqual(width, expected)
+        self.assertTrue(0 <= angle < pi)
+
+    def test_square_measurements(self):
+        square = convex_hull(_points(0, 0, 3, 0, 3, 3, 0, 3))
+        self.assertAlmostEqual(diameter(square)[0], hypot(3, 3))
+        self.assertEqual(minimum_width(square), (3, 0))
+        self.assertAlmostEqual(minimum_area_rectangle(square)[0], 9)
+
+    def test_minimum_area_rectangle_of_rotated_rectangle(self):
+        angle = 0.3
+        ux, uy, nx, ny = cos(angle), sin(angle), -sin(angle), cos(angle)
+        points = [Point2D(5 + a * ux + b * nx, -2 + a * uy + b * ny)
+                  for a, b in ((0, 0), (6, 0), (6, 2), (0, 2), (3, 1), (1, 0.5))]
+        area, corners, found = minimum_area_rectangle(convex_hull(points))
+        self.assertAlmostEqual(area, 12)
+        self.assertAlmostEqual(found, angle)
+        self.assertEqual(len(corners), 4)
+        for corner in corners:
+            self.assertTrue(any(hypot(corner.x - p.x, corner.y - p.y) < 1e-9 for p in points[:4]))
+
+    def test_minimum_area_rectangle_encloses_cloud(self):
+        area, corners, _ = minimum_area_rectangle(self.hull)
+        for i in range(4):
+            a, b = corners[i], corners[(i + 1) % 4]
+            for p in self.cloud:
+                self.assertGreaterEqual((b.x - a.x) * (p.y - a.y) - (b.y - a.y) * (p.x - a.x), -1e-7)
+        self.assertLessEqual(area, minimum_width(self.hull)[0] * diameter(self.hull)[0] + 1e-9)
+
+    def test_degenerate_hulls(self):
+        self.assertEqual(diameter(_points(1, 1))[0], 0)
+        self.assertEqual(minimum_width(_points(0, 0, 2, 2))[0], 0)
+        self.assertEqual(minimum_area_rectangle(_points(0, 0, 2, 0))[0], 0)
+        with self.assertRaises(ValueError):
+            diameter([])
+
+
+if __name__ == '__main__':
+    unittest.main()
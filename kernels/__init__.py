@@ -0,0 +1,6 @@
+from .kernels import (pack_points, pack_lines, pack_arcs, unpack_points, unpack_lines,
+                      segment_lengths, arc_lengths, transform_points, line_point_distances,
+                      segment_intersections, line_intersections, arc_centers_3p, arc_centers_rd)
+__all__ = ['pack_points', 'pack_lines', 'pack_arcs', 'unpack_points', 'unpack_lines',
+           'segment_lengths', 'arc_lengths', 'transform_points', 'line_point_distances',
+           'segment_intersections', 'line_intersections', 'arc_centers_3p', 'arc_centers_rd']
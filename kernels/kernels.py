@@ -0,0 +1,412 @@
+"""
+Batched geometry kernels over flat coordinate buffers.
+
+The kernels work on columnar data instead of Point2D/Line2D/Arc2D objects.
+A buffer is any indexable sequence of floats (array('d'), a memoryview cast
+to 'd', a list) holding interleaved coordinates:
+
+    points    [x, y, x, y, ...]                       2 floats per point
+    segments  [x1, y1, x2, y2, ...]                   4 floats per segment
+    arcs      [cx, cy, sx, sy, ex, ey, ...]           6 floats per arc
+
+Every kernel processes the items in [start, stop) and writes into an output
+buffer, so callers can split one job into ranges and run them anywhere
+(a thread, a process attached to shared memory) without copying the input.
+Results match the corresponding Point2D, Line2D and Arc2D methods.
+"""
+from array import array
+from math import atan2, floor, pi, sqrt
+from typing import Iterable, Optional, Sequence
+
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D, TOLERANCE_LENGTH
+
+POINT_STRIDE = 2
+SEGMENT_STRIDE = 4
+ARC_STRIDE = 6
+
+
+def pack_points(points: Iterable[Point2D]) -> array:
+    """
+    Pack Point2D instances into a flat point buffer.
+    :param points: Iterable of Point2D instances.
+    :return: array('d') of interleaved coordinates.
+    """
+    buffer = array('d')
+    for point in points:
+        buffer.append(point.x)
+        buffer.append(point.y)
+    return buffer
+
+
+def pack_lines(lines: Iterable[Line2D]) -> array:
+    """
+    Pack Line2D instances into a flat segment buffer.
+    :param lines: Iterable of Line2D instances.
+    :return: array('d') of interleaved coordinates.
+    """
+    buffer = array('d')
+    for line in lines:
+        buffer.extend(line.to_tuple())
+    return buffer
+
+
+def pack_arcs(arcs: Iterable[Arc2D]) -> array:
+    """
+    Pack Arc2D instances into a flat arc buffer.
+    :param arcs: Iterable of Arc2D instances.
+    :return: array('d') of interleaved center, start and end coordinates.
+    """
+    buffer = array('d')
+    for arc in arcs:
+        cp, sp, ep = arc.points
+        buffer.extend((cp.x, cp.y, sp.x, sp.y, ep.x, ep.y))
+    return buffer
+
+
+def unpack_points(buffer: Sequence[float]) -> list[Point2D]:
+    """
+    Build Point2D instances from a flat point buffer.
+    :param buffer: Interleaved point coordinates.
+    :return: List of Point2D instances.
+    """
+    return [Point2D(buffer[i], buffer[i + 1]) for i in range(0, len(buffer) - 1, POINT_STRIDE)]
+
+
+def unpack_lines(buffer: Sequence[float]) -> list[Line2D]:
+    """
+    Build Line2D instances from a flat segment buffer.
+    :param buffer: Interleaved segment coordinates.
+    :return: List of Line2D instances.
+    """
+    return [Line2D(buffer[i], buffer[i + 1], buffer[i + 2], buffer[i + 3])
+            for i in range(0, len(buffer) - 3, SEGMENT_STRIDE)]
+
+
+def item_count(buffer: Sequence[float], stride: int) -> int:
+    """
+    Get the number of items in a flat buffer.
+    :param buffer: Interleaved coordinates.
+    :param stride: Number of floats per item.
+    :return: Number of items.
+    """
+    if len(buffer) % stride != 0:
+        raise ValueError("Buffer length must be a multiple of %d." % stride)
+    return len(buffer) // stride
+
+
+def _output(out: Optional[Sequence[float]], size: int) -> Sequence[float]:
+    if out is None:
+        return array('d', bytes(8 * size))
+    if len(out) < size:
+        raise ValueError("Output buffer is too small.")
+    return out
+
+
+def segment_lengths(segments: Sequence[float], out: Optional[Sequence[float]] = None,
+                    start: int = 0, stop: Optional[int] = None) -> Sequence[float]:
+    """
+    Compute segment lengths, as Line2D.length().
+    :param segments: Segment buffer.
+    :param out: Output buffer with one float per segment (allocated if None).
+    :param start: First segment to process.
+    :param stop: One past the last segment to process (all segments if None).
+    :return: The output buffer.
+    """
+    n = item_count(segments, SEGMENT_STRIDE)
+    out = _output(out, n)
+    stop = n if stop is None else stop
+    for i in range(start, stop):
+        k = i * SEGMENT_STRIDE
+        dx = segments[k + 2] - segments[k]
+        dy = segments[k + 3] - segments[k + 1]
+        out[i] = sqrt(dx * dx + dy * dy)
+    return out
+
+
+def arc_lengths(arcs: Sequence[float], out: Optional[Sequence[float]] = None,
+                start: int = 0, stop: Optional[int] = None) -> Sequence[float]:
+    """
+    Compute arc lengths, as Arc2D.arc_length().
+    :param arcs: Arc buffer.
+    :param out: Output buffer with one float per arc (allocated if None).
+    :param start: First arc to process.
+    :param stop: One past the last arc to process (all arcs if None).
+    :return: The output buffer.
+    """
+    n = item_count(arcs, ARC_STRIDE)
+    out = _output(out, n)
+    stop = n if stop is None else stop
+    two_pi = 2 * pi
+    for i in range(start, stop):
+        k = i * ARC_STRIDE
+        cx, cy = arcs[k], arcs[k + 1]
+        sx, sy = arcs[k + 2] - cx, arcs[k + 3] - cy
+        start_angle = atan2(sy, sx)
+        end_angle = atan2(arcs[k + 5] - cy, arcs[k + 4] - cx)
+        if start_angle < 0:
+            start_angle += two_pi
+        if end_angle < 0:
+            end_angle += two_pi
+        out[i] = sqrt(sx * sx + sy * sy) * abs(end_angle - start_angle)
+    return out
+
+
+def transform_points(points: Sequence[float], matrix: Sequence[float], out: Optional[Sequence[float]] = None,
+                     start: int = 0, stop: Optional[int] = None) -> Sequence[float]:
+    """
+    Apply an affine transformation to points.
+    The matrix (a, b, c, d, e, f) maps (x, y) to (a*x + b*y + c, d*x + e*y + f).
+    Segment and arc buffers can be transformed as point buffers of twice or
+    three times the length.
+    :param points: Point buffer.
+    :param matrix: Six affine coefficients.
+    :param out: Output point buffer (allocated if None, may be the input buffer).
+    :param start: First point to process.
+    :param stop: One past the last point to process (all points if None).
+    :return: The output buffer.
+    """
+    if len(matrix) != 6:
+        raise ValueError("Affine matrix must have six coefficients.")
+    n = item_count(points, POINT_STRIDE)
+    out = _output(out, n * POINT_STRIDE)
+    stop = n if stop is None else stop
+    a, b, c, d, e, f = matrix
+    for k in range(start * POINT_STRIDE, stop * POINT_STRIDE, POINT_STRIDE):
+        x = points[k]
+        y = points[k + 1]
+        out[k] = a * x + b * y + c
+        out[k + 1] = d * x + e * y + f
+    return out
+
+
+def line_point_distances(segments: Sequence[float], points: Sequence[float], out: Optional[Sequence[float]] = None,
+                         start: int = 0, stop: Optional[int] = None) -> Sequence[float]:
+    """
+    Compute the distance from point i to the infinite line through segment i,
+    as Line2D.distance_to_point().  Degenerate segments give infinity.
+    :param segments: Segment buffer.
+    :param points: Point buffer with one point per segment.
+    :param out: Output buffer with one float per pair (allocated if None).
+    :param start: First pair to process.
+    :param stop: One past the last pair to process (all pairs if None).
+    :return: The output buffer.
+    """
+    n = item_count(segments, SEGMENT_STRIDE)
+    if item_count(points, POINT_STRIDE) != n:
+        raise ValueError("Segment and point buffers must hold the same number of items.")
+    out = _output(out, n)
+    stop = n if stop is None else stop
+    for i in range(start, stop):
+        k = i * SEGMENT_STRIDE
+        x1, y1, x2, y2 = segments[k], segments[k + 1], segments[k + 2], segments[k + 3]
+        px, py = points[2 * i], points[2 * i + 1]
+        dx = x2 - x1
+        dy = y2 - y1
+        denom = sqrt(dy * dy + dx * dx)
+        out[i] = abs(dy * px - dx * py + x2 * y1 - y2 * x1) / denom if denom != 0 else float('inf')
+    return out
+
+
+def segment_intersection(segments: Sequence[float], i: int, j: int) -> Optional[tuple[float, float]]:
+    """
+    Intersect two segments of a buffer, as Line2D.intersection_with_line() status 1.
+    :param segments: Segment buffer.
+    :param i: Index of the first segment.
+    :param j: Index of the second segment.
+    :return: The crossing point (x, y), or None if the segments do not cross.
+    """
+    a = i * SEGMENT_STRIDE
+    b = j * SEGMENT_STRIDE
+    ax = segments[a + 2] - segments[a]
+    ay = segments[a + 3] - segments[a + 1]
+    bx = segments[b] - segments[b + 2]
+    by = segments[b + 1] - segments[b + 3]
+    cx = segments[a] - segments[b]
+    cy = segments[a + 1] - segments[b + 1]
+    denominator = ay * bx - ax * by
+    if abs(denominator) < 1e-10:
+        return None
+    na = (by * cx - bx * cy) / denominator
+    nb = (ax * cy - ay * cx) / denominator
+    if 0 <= na <= 1 and 0 <= nb <= 1:
+        return segments[a] + ax * na, segments[a + 1] + ay * na
+    return None
+
+
+def segment_intersections(segments: Sequence[float], x_range: tuple[float, float] = (-float('inf'), float('inf'))
+                          ) -> list[tuple[int, int, float, float]]:
+    """
+    Find all crossing segment pairs inside a vertical strip using a uniform grid.
+    Segments overlapping the strip are hashed into every grid cell their bounding
+    box overlaps and only segments sharing a cell are tested.  A crossing is
+    reported by the single cell holding its reference point (the crossing clamped
+    into both bounding boxes), and only if that point lies in the half-open strip
+    [x_range[0], x_range[1]), so adjacent strips never report the same pair twice.
+    :param segments: Segment buffer.
+    :param x_range: The strip (low, high).
+    :return: List of (i, j, x, y) with i < j.
+    """
+    low, high = x_range
+    boxes = {}
+    extent = 0.0
+    for i in range(item_count(segments, SEGMENT_STRIDE)):
+        k = i * SEGMENT_STRIDE
+        x1, y1, x2, y2 = segments[k], segments[k + 1], segments[k + 2], segments[k + 3]
+        min_x, max_x = (x1, x2) if x1 <= x2 else (x2, x1)
+        if max_x < low or min_x >= high:
+            continue
+        min_y, max_y = (y1, y2) if y1 <= y2 else (y2, y1)
+        boxes[i] = (min_x, min_y, max_x, max_y)
+        extent += max(max_x - min_x, max_y - min_y)
+    if len(boxes) < 2:
+        return []
+    span_x = max(box[2] for box in boxes.values()) - min(box[0] for box in boxes.values())
+    span_y = max(box[3] for box in boxes.values()) - min(box[1] for box in boxes.values())
+    cell = max(extent / len(boxes), sqrt(span_x * span_y / len(boxes)), 1e-12)
+    grid = {}
+    for i, (min_x, min_y, max_x, max_y) in boxes.items():
+        for col in range(floor(min_x / cell), floor(max_x / cell) + 1):
+            for row in range(floor(min_y / cell), floor(max_y / cell) + 1):
+                grid.setdefault((col, row), []).append(i)
+    found = []
+    for (col, row), members in grid.items():
+        for n, i in enumerate(members):
+            box_a = boxes[i]
+            for j in members[n + 1:]:
+                box_b = boxes[j]
+                if box_b[0] > box_a[2] or box_b[2] < box_a[0] or box_b[1] > box_a[3] or box_b[3] < box_a[1]:
+                    continue
+                point = segment_intersection(segments, i, j)
+                if point is None:
+                    continue
+                ref_x = min(max(point[0], box_a[0], box_b[0]), box_a[2], box_b[2])
+                ref_y = min(max(point[1], box_a[1], box_b[1]), box_a[3], box_b[3])
+                if floor(ref_x / cell) == col and floor(ref_y / cell) == row and low <= ref_x < high:
+                    found.append((min(i, j), max(i, j), point[0], point[1]))
+    return found
+
+
+def line_intersections(segments_a: Sequence[float], segments_b: Sequence[float], out: Optional[Sequence[float]] = None,
+                       start: int = 0, stop: Optional[int] = None) -> Sequence[float]:
+    """
+    Intersect segment i of one buffer with segment i of another, as
+    Line2D.intersection_with_line().  Three floats are written per pair:
+    the status (0 parallel, 1 within both segments, 2 outside a segment)
+    followed by the intersection point ((0, 0) when parallel).
+    :param segments_a: Segment buffer.
+    :param segments_b: Segment buffer with the same number of segments.
+    :param out: Output buffer with three floats per pair (allocated if None).
+    :param start: First pair to process.
+    :param stop: One past the last pair to process (all pairs if None).
+    :return: The output buffer.
+    """
+    n = item_count(segments_a, SEGMENT_STRIDE)
+    if item_count(segments_b, SEGMENT_STRIDE) != n:
+        raise ValueError("Segment buffers must hold the same number of items.")
+    out = _output(out, 3 * n)
+    stop = n if stop is None else stop
+    for i in range(start, stop):
+        k = i * SEGMENT_STRIDE
+        x1, y1 = segments_a[k], segments_a[k + 1]
+        ax, ay = segments_a[k + 2] - x1, segments_a[k + 3] - y1
+        bx, by = segments_b[k] - segments_b[k + 2], segments_b[k + 1] - segments_b[k + 3]
+        cx, cy = x1 - segments_b[k], y1 - segments_b[k + 1]
+        denominator = ay * bx - ax * by
+        if abs(denominator) < 1e-10:
+            out[3 * i], out[3 * i + 1], out[3 * i + 2] = 0.0, 0.0, 0.0
+            continue
+        na = (by * cx - bx * cy) / denominator
+        nb = (ax * cy - ay * cx) / denominator
+        out[3 * i] = 1.0 if 0 <= na <= 1 and 0 <= nb <= 1 else 2.0
+        out[3 * i + 1] = x1 + ax * na
+        out[3 * i + 2] = y1 + ay * na
+    return out
+
+
+def _length(dx: float, dy: float) -> float:
+    # Squared by multiplication, which gives inf for huge coordinates where ** 2 raises OverflowError.
+    return sqrt(dx * dx + dy * dy)
+
+
+def arc_centers_3p(points: Sequence[float], out: Optional[Sequence[float]] = None,
+                   start: int = 0, stop: Optional[int] = None) -> Sequence[float]:
+    """
+    Compute arc centers from (start, mid, end) point triples, as
+    Arc2D.create_from_sp_mp_ep().  The input holds six floats per arc
+    (sx, sy, mx, my, ex, ey); two floats (cx, cy) are written per arc, NaN
+    when no arc can be built (coincident or collinear points).
+    :param points: Point triples buffer.
+    :param out: Output point buffer (allocated if None).
+    :param start: First triple to process.
+    :param stop: One past the last triple to process (all triples if None).
+    :return: The output buffer.
+    """
+    n = item_count(points, 6)
+    out = _output(out, 2 * n)
+    stop = n if stop is None else stop
+    nan = float('nan')
+    for i in range(start, stop):
+        k = 6 * i
+        sx, sy, mx, my, ex, ey = points[k], points[k + 1], points[k + 2], points[k + 3], points[k + 4], points[k + 5]
+        out[2 * i], out[2 * i + 1] = nan, nan
+        if (_length(sx - mx, sy - my) < TOLERANCE_LENGTH or _length(mx - ex, my - ey) < TOLERANCE_LENGTH or
+                _length(sx - ex, sy - ey) < TOLERANCE_LENGTH):
+            continue
+        d = 2 * (sx * (my - ey) + mx * (ey - sy) + ex * (sy - my))
+        if d == 0:
+            continue
+        s2, m2, e2 = sx * sx + sy * sy, mx * mx + my * my, ex * ex + ey * ey
+        cx = (s2 * (my - ey) + m2 * (ey - sy) + e2 * (sy - my)) / d
+        cy = (s2 * (ex - mx) + m2 * (sx - ex) + e2 * (mx - sx)) / d
+        if _length(cx - sx, cy - sy) < TOLERANCE_LENGTH or _length(cx - ex, cy - ey) < TOLERANCE_LENGTH:
+            continue
+        out[2 * i], out[2 * i + 1] = cx, cy
+    return out
+
+
+def _is_clockwise(cx: float, cy: float, sx: float, sy: float, ex: float, ey: float) -> bool:
+    start_angle = atan2(sy - cy, sx - cx)
+    end_angle = atan2(ey - cy, ex - cx)
+    if start_angle < 0:
+        start_angle += 2 * pi
+    if end_angle < 0:
+        end_angle += 2 * pi
+    return end_angle - start_angle <= 0
+
+
+def arc_centers_rd(params: Sequence[float], out: Optional[Sequence[float]] = None,
+                   start: int = 0, stop: Optional[int] = None) -> Sequence[float]:
+    """
+    Compute arc centers from start point, end point, radius and direction, as
+    Arc2D.create_from_sp_ep_rd_cw().  The input holds six floats per arc
+    (sx, sy, ex, ey, radius, cw) with cw 1.0 for clockwise and 0.0 for
+    counter-clockwise; two floats (cx, cy) are written per arc, NaN when no
+    arc can be built (coincident points, non-positive or too small radius).
+    :param params: Arc parameter buffer.
+    :param out: Output point buffer (allocated if None).
+    :param start: First arc to process.
+    :param stop: One past the last arc to process (all arcs if None).
+    :return: The output buffer.
+    """
+    n = item_count(params, 6)
+    out = _output(out, 2 * n)
+    stop = n if stop is None else stop
+    nan = float('nan')
+    for i in range(start, stop):
+        k = 6 * i
+        sx, sy, ex, ey, radius, cw = params[k], params[k + 1], params[k + 2], params[k + 3], params[k + 4], params[k + 5]
+        out[2 * i], out[2 * i + 1] = nan, nan
+        mx, my = 0.5 * (sx + ex), 0.5 * (sy + ey)
+        dx, dy = sx - mx, sy - my
+        length = sqrt(dx * dx + dy * dy)
+        if 2 * length < TOLERANCE_LENGTH or radius <= 0 or length > radius:
+            continue
+        scale = sqrt(radius * radius - length * length) / length
+        # The first candidate lies on the normal of mid->start, the second on the normal of mid->end.
+        for cx, cy in ((mx - dy * scale, my + dx * scale), (mx + dy * scale, my - dx * scale)):
+            if _is_clockwise(cx, cy, sx, sy, ex, ey) == (cw != 0):
+                out[2 * i], out[2 * i + 1] = cx, cy
+                break
+    return out
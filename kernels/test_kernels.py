@@ -0,0 +1,101 @@
+import unittest
+from array import array
+from math import isclose, isnan
+
+from .kernels import (pack_points, pack_lines, pack_arcs, unpack_points, unpack_lines, item_count,
+                      segment_lengths, arc_lengths, transform_points, line_point_distances,
+                      segment_intersection, segment_intersections, line_intersections,
+                      arc_centers_3p, arc_centers_rd)
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+
+
+class TestKernels(unittest.TestCase):
+    def setUp(self):
+        self.lines = [Line2D(0, 0, 3, 4), Line2D(1, 1, 1, 5), Line2D(0, 3, 4, 3), Line2D(2, 2, 2, 2)]
+        self.segments = pack_lines(self.lines)
+
+    def test_pack_and_unpack(self):
+        self.assertEqual(unpack_lines(self.segments), self.lines)
+        points = [Point2D(1, 2), Point2D(3, 4)]
+        self.assertEqual(unpack_points(pack_points(points)), points)
+        self.assertEqual(list(pack_arcs([Arc2D(Point2D(0, 0), Point2D(1, 0), Point2D(0, 1))])), [0, 0, 1, 0, 0, 1])
+
+    def test_item_count_rejects_ragged_buffer(self):
+        with self.assertRaises(ValueError):
+            item_count(array('d', [1, 2, 3]), 2)
+
+    def test_segment_lengths_match_line2d(self):
+        lengths = segment_lengths(self.segments)
+        for line, length in zip(self.lines, lengths):
+            self.assertAlmostEqual(length, line.length())
+
+    def test_segment_lengths_range(self):
+        out = array('d', [-1.0] * 4)
+        segment_lengths(self.segments, out, 1, 2)
+        self.assertEqual(list(out), [-1.0, 4.0, -1.0, -1.0])
+
+    def test_arc_lengths_match_arc2d(self):
+        arcs = [Arc2D(Point2D(0, 0), Point2D(2, 0), Point2D(0, 2)),
+                Arc2D(Point2D(1, 1), Point2D(1, 2), Point2D(2, 1))]
+        lengths = arc_lengths(pack_arcs(arcs))
+        for arc, length in zip(arcs, lengths):
+            self.assertAlmostEqual(length, arc.arc_length())
+
+    def test_transform_points(self):
+        points = pack_points([Point2D(1, 0), Point2D(0, 2)])
+        rotated = transform_points(points, (0, -1, 10, 1, 0, 20))
+        self.assertEqual(list(rotated), [10, 21, 8, 20])
+
+    def test_transform_points_in_place(self):
+        points = pack_points([Point2D(1, 2)])
+        transform_points(points, (2, 0, 0, 0, 2, 0), points)
+        self.assertEqual(list(points), [2, 4])
+
+    def test_line_point_distances_match_line2d(self):
+        queries = [Point2D(0, 5), Point2D(4, 4), Point2D(2, 0), Point2D(0, 0)]
+        distances = line_point_distances(self.segments, pack_points(queries))
+        for line, point, distance in zip(self.lines, queries, distances):
+            self.assertTrue(isclose(distance, line.distance_to_point(point)))
+
+    def test_segment_intersection(self):
+        self.assertEqual(segment_intersection(self.segments, 1, 2), (1, 3))
+        self.assertIsNone(segment_intersection(self.segments, 1, 3))
+
+    def test_segment_intersections(self):
+        found = sorted(segment_intersections(self.segments))
+        self.assertEqual([(i, j) for i, j, _, _ in found], [(0, 1), (0, 2), (1, 2)])
+
+    def test_segment_intersections_strips_do_not_duplicate(self):
+        left = segment_intersections(self.segments, (-float('inf'), 1.5))
+        right = segment_intersections(self.segments, (1.5, float('inf')))
+        self.assertEqual(sorted(left + right), sorted(segment_intersections(self.segments)))
+
+    def test_line_intersections_match_line2d(self):
+        others = [Line2D(0, 4, 4, 0), Line2D(0, 0, 0, 1), Line2D(10, 0, 10, 1), Line2D(0, 0, 1, 0)]
+        out = line_intersections(self.segments, pack_lines(others))
+        for i, (line, other) in enumerate(zip(self.lines, others)):
+            status, point = line.intersection_with_line(other)
+            self.assertEqual(out[3 * i], status)
+            self.assertAlmostEqual(out[3 * i + 1], point.x)
+            self.assertAlmostEqual(out[3 * i + 2], point.y)
+
+    def test_arc_centers_3p(self):
+        out = arc_centers_3p([1, 0, 0, 1, -1, 0, 0, 0, 1, 1, 2, 2])
+        self.assertAlmostEqual(out[0], 0)
+        self.assertAlmostEqual(out[1], 0)
+        self.assertTrue(isnan(out[2]) and isnan(out[3]))
+
+    def test_arc_centers_rd_match_arc2d(self):
+        for cw in (True, False):
+            success, arc = Arc2D.create_from_sp_ep_rd_cw(Point2D(0, 0), Point2D(2, 0), 2, cw)
+            out = arc_centers_rd([0, 0, 2, 0, 2, float(cw)])
+            self.assertTrue(success)
+            self.assertAlmostEqual(out[0], arc.cp.x)
+            self.assertAlmostEqual(out[1], arc.cp.y)
+        self.assertTrue(isnan(arc_centers_rd([0, 0, 5, 0, 1, 1.0])[0]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 from point2d.point2d import Point2D
+from trusted import trusted as _trust
 from typing import Self
 try:
     from .version import __version__
@@ -18,7 +19,7 @@ class Line2D:
             else:
                 raise TypeError("Line2D.init(line: Expected a Line2D instance.")
         elif len(points) == 2:
-            if not all(isinstance(pt, Point2D) for pt in points):
+            if not (_trust.armed and _trust.is_trusted()) and not all(isinstance(pt, Point2D) for pt in points):
                 raise TypeError("Line2D.init(points: Expected two Point2D instances.")
             self._pt1 = points[0]
             self._pt2 = points[1]
@@ -37,7 +38,7 @@ class Line2D:
     @property
     def sp(self) -> Point2D:
         """Get the start point of the line."""
-        if not isinstance(self._pt1, Point2D):
+        if not (_trust.armed and _trust.is_trusted()) and not isinstance(self._pt1, Point2D):
             raise TypeError("Start point must be a Point2D instance.")
         return self._pt1
     @sp.setter
@@ -55,7 +56,7 @@ class Line2D:
     @property
     def ep(self) -> Point2D:
         """Get the end point of the line."""
-        if not isinstance(self._pt2, Point2D):
+        if not (_trust.armed and _trust.is_trusted()) and not isinstance(self._pt2, Point2D):
             raise TypeError("End point must be a Point2D instance.")
         return self._pt2
     @ep.setter
@@ -181,12 +182,12 @@ class Line2D:
     
     def dx(self) -> int | float:
         """Get the x-coordinate difference between the start and end points."""
-        if self._pt1 is None or self._pt2 is None:
+        if not (_trust.armed and _trust.is_trusted()) and (self._pt1 is None or self._pt2 is None):
             raise ValueError("Start or end point is not defined.")
         return self._pt2.x - self._pt1.x
     def dy(self) -> int | float:
         """Get the y-coordinate difference between the start and end points."""
-        if self._pt1 is None or self._pt2 is None:
+        if not (_trust.armed and _trust.is_trusted()) and (self._pt1 is None or self._pt2 is None):
             raise ValueError("Start or end point is not defined.")
         return self._pt2.y - self._pt1.y
     
@@ -209,37 +210,35 @@ class Line2D:
 
     def unit_vector(self) -> Self:
         """Get the unit vector of the line."""
-        if self._pt1 is None or self._pt2 is None:
+        if not (_trust.armed and _trust.is_trusted()) and (self._pt1 is None or self._pt2 is None):
             raise ValueError("Start or end point is not defined.")
-        if self.length() == 0:
+        length = self.length()
+        if length == 0:
             raise ValueError("Cannot calculate unit vector for a zero-length line.")
-        if self.dx() == 0 and self.dy() == 0:
-            raise ValueError("Unit vector cannot be zero.")
-        unit_vector = Line2D(self._pt1, Point2D(self._pt1.x + self.dx() / self.length(), self._pt1.y + self.dy() / self.length()))
-        if not isinstance(unit_vector, Line2D):
-            raise TypeError("Unit vector must be a Line2D instance.")
+        unit_vector = Line2D(self._pt1, Point2D(self._pt1.x + self.dx() / length, self._pt1.y + self.dy() / length))
         if fabs(unit_vector.dx()) < 1e-9 and fabs(unit_vector.dy()) < 1e-9:
             raise ValueError("Unit vector cannot be zero.")
         return unit_vector
 
     def length(self) -> float:
         """Calculate the length of the line."""
-        if self._pt1 is None or self._pt2 is None:
+        if not (_trust.armed and _trust.is_trusted()) and (self._pt1 is None or self._pt2 is None):
             raise ValueError("Start or end point is not defined.")
-        return sqrt(self.dx() * self.dx() + self.dy() * self.dy())
+        dx = self._pt2.x - self._pt1.x
+        dy = self._pt2.y - self._pt1.y
+        return sqrt(dx * dx + dy * dy)
     def set_length(self, length: float) -> Self:
         """Set the length of the line."""
         if length < 0:
            raise ValueError("Length cannot be negative.")
-        if self._pt1 is None or self._pt2 is None:
-            raise ValueError("Start or end point is not defined.")
-        if not isinstance(length, (int, float)):
-            raise TypeError("Length must be a numeric value.")
+        if not (_trust.armed and _trust.is_trusted()):
+            if self._pt1 is None or self._pt2 is None:
+                raise ValueError("Start or end point is not defined.")
+            if not isinstance(length, (int, float)):
+                raise TypeError("Length must be a numeric value.")
         if self.length() == 0:
             raise ValueError("Cannot set length for a zero-length line.")
         unit_vector = self.unit_vector()
-        if not isinstance(unit_vector, Line2D):
-            raise TypeError("Unit vector must be a Line2D instance.")
         self._pt2 = Point2D(self._pt1.x + unit_vector.dx() * length, self._pt1.y + unit_vector.dy() * length)
         return self
     """
@@ -392,6 +391,12 @@ class Line2D:
             raise ValueError("Start or end point is not defined.")
         self._pt1, self._pt2 = self._pt2, self._pt1
         return self
+    def bounding_box(self) -> tuple[float, float, float, float]:
+        """Get the axis-aligned bounding box of the line as (min_x, min_y, max_x, max_y)."""
+        if not (_trust.armed and _trust.is_trusted()) and (self._pt1 is None or self._pt2 is None):
+            raise ValueError("Start or end point is not defined.")
+        return (min(self._pt1.x, self._pt2.x), min(self._pt1.y, self._pt2.y),
+                max(self._pt1.x, self._pt2.x), max(self._pt1.y, self._pt2.y))
     def is_valid(self) -> bool:
         """Check if the line is valid (both points are defined)."""
         return self._pt1 is not None and self._pt2 is not None
@@ -455,24 +460,26 @@ class Line2D:
     
     def interpolate(self, t: float) -> Point2D:
         """Interpolate a point on the line at parameter t (0 <= t <= 1)."""
-        if not isinstance(t, (int, float)):
-            raise TypeError("Parameter t must be a numeric value.")
+        if not (_trust.armed and _trust.is_trusted()):
+            if not isinstance(t, (int, float)):
+                raise TypeError("Parameter t must be a numeric value.")
+            if self._pt1 is None or self._pt2 is None:
+                raise ValueError("Start or end point is not defined.")
         if not (0 <= t <= 1):
             raise ValueError("Parameter t must be in the range [0, 1].")
-        if self._pt1 is None or self._pt2 is None:
-            raise ValueError("Start or end point is not defined.")
         x = self._pt1.x + t * self.dx()
         y = self._pt1.y + t * self.dy()
         return Point2D(x, y)
 
     def point_at_length(self, length: float) -> Point2D:
         """Get a point on the line at a specific length from the start point."""
-        if not isinstance(length, (int, float)):
-            raise TypeError("Length must be a numeric value.")
+        if not (_trust.armed and _trust.is_trusted()):
+            if not isinstance(length, (int, float)):
+                raise TypeError("Length must be a numeric value.")
+            if self._pt1 is None or self._pt2 is None:
+                raise ValueError("Start or end point is not defined.")
         if length < 0:
             raise ValueError("Length cannot be negative.")
-        if self._pt1 is None or self._pt2 is None:
-            raise ValueError("Start or end point is not defined.")
         if self.length() == 0:
             raise ValueError("Cannot get point at length for a zero-length line.")
         unit_vector = self.unit_vector()
@@ -480,13 +487,16 @@ class Line2D:
     
     def distance_to_point(self, pt: Point2D) -> float:
         """Calculate the distance from a point to the line."""
-        if not isinstance(pt, Point2D):
-            raise TypeError("Argument must be a Point2D instance.")
-        if self._pt1 is None or self._pt2 is None:
-            raise ValueError("Start or end point is not defined.")
+        if not (_trust.armed and _trust.is_trusted()):
+            if not isinstance(pt, Point2D):
+                raise TypeError("Argument must be a Point2D instance.")
+            if self._pt1 is None or self._pt2 is None:
+                raise ValueError("Start or end point is not defined.")
+        dx = self._pt2.x - self._pt1.x
+        dy = self._pt2.y - self._pt1.y
         # Using the formula for distance from a point to a line segment
-        num = abs(self.dy() * pt.x - self.dx() * pt.y + self._pt2.x * self._pt1.y - self._pt2.y * self._pt1.x)
-        denom = sqrt(self.dy() * self.dy() + self.dx() * self.dx())
+        num = abs(dy * pt.x - dx * pt.y + self._pt2.x * self._pt1.y - self._pt2.y * self._pt1.x)
+        denom = sqrt(dy * dy + dx * dx)
         return num / denom if denom != 0 else float('inf')
     
     def is_point_on_line(self, pt: Point2D) -> bool:
@@ -605,10 +615,11 @@ class Line2D:
                 1 = intersection within both segments
                 2 = intersection outside one or both segments
         """
-        if not isinstance(other, Line2D):
-            raise TypeError("Argument must be a Line2D instance.")
-        if self._pt1 is None or self._pt2 is None or other._pt1 is None or other._pt2 is None:
-            raise ValueError("Start or end point is not defined for one of the lines.")
+        if not (_trust.armed and _trust.is_trusted()):
+            if not isinstance(other, Line2D):
+                raise TypeError("Argument must be a Line2D instance.")
+            if self._pt1 is None or self._pt2 is None or other._pt1 is None or other._pt2 is None:
+                raise ValueError("Start or end point is not defined for one of the lines.")
         
         A = self._pt2 - self._pt1
         B = other._pt1 - other._pt2
@@ -855,6 +855,10 @@ class TestLine2D(unittest.TestCase):
         line = Line2D(Point2D(0, 0), Point2D(1, 0))
         with self.assertRaises(TypeError):
             line.angle_to_line("not a line")
+
+    def test_bounding_box(self):
+        line = Line2D(Point2D(3, -1), Point2D(1, 4))
+        self.assertEqual(line.bounding_box(), (1, -1, 3, 4))
   
     
 if __name__ == "__main__":
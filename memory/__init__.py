@@ -0,0 +1,2 @@
+from .memory import MemorySnapshot, collection_size, deep_size, memory_report, own_size
+__all__ = ['MemorySnapshot', 'collection_size', 'deep_size', 'memory_report', 'own_size']
@@ -0,0 +1,162 @@
+"""
+Memory accounting for geometry objects and collections.
+
+Every geometry object is charged for its own instance and non-geometry
+attribute values; Point2D instances referenced by Line2D or Arc2D objects
+are charged once per collection however many entities share them.
+Measuring reads the known attributes directly and never asks for an
+instance's __dict__, so no attribute dictionary is materialised.
+MemorySnapshot measures what a block of code allocates with tracemalloc
+and groups the geometry objects created inside the block and
+still alive at its end by type.
+"""
+import gc
+import sys
+import tracemalloc
+from typing import Iterable, Optional, Self
+
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+
+GEOMETRY_TYPES = (Point2D, Line2D, Arc2D)
+
+
+def own_size(obj) -> int:
+    """
+    Get the bytes held by one geometry object, excluding the geometry objects it references.
+    :param obj: A Point2D, Line2D or Arc2D instance.
+    :return: Size in bytes.
+    """
+    if not isinstance(obj, GEOMETRY_TYPES):
+        raise TypeError("Object must be a Point2D, Line2D or Arc2D instance.")
+    # Point2D counts its coordinates itself; Line2D and Arc2D only hold points.
+    return sys.getsizeof(obj)
+
+
+def _unique_geometry(objects: Iterable) -> list:
+    seen = set()
+    unique = []
+    pending = list(objects)
+    pending.reverse()
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        if not isinstance(obj, GEOMETRY_TYPES):
+            raise TypeError("Collection must only contain Point2D, Line2D or Arc2D instances.")
+        seen.add(id(obj))
+        unique.append(obj)
+        if not isinstance(obj, Point2D):
+            pending.extend(point for point in reversed(obj.points) if id(point) not in seen)
+    return unique
+
+
+def deep_size(obj) -> int:
+    """
+    Get the bytes held by one geometry object together with the points it references.
+    Points shared between the object's own references (such as a closed arc) are counted once.
+    :param obj: A Point2D, Line2D or Arc2D instance.
+    :return: Size in bytes.
+    """
+    return sum(own_size(item) for item in _unique_geometry([obj]))
+
+
+def memory_report(objects: Iterable) -> dict:
+    """
+    Account the memory of a collection of geometry objects.
+    Every object, including each shared Point2D, is counted once.
+    :param objects: Iterable of Point2D, Line2D or Arc2D instances.
+    :return: {"container": bytes, "total": bytes, "by_type": {type name: {"count": n, "bytes": b}}},
+             where container is the size of the collection object itself (0 for iterators).
+    """
+    container = sys.getsizeof(objects) if isinstance(objects, (list, tuple, set, frozenset, dict)) else 0
+    by_type = {}
+    for obj in _unique_geometry(objects):
+        entry = by_type.setdefault(type(obj).__name__, {"count": 0, "bytes": 0})
+        entry["count"] += 1
+        entry["bytes"] += own_size(obj)
+    total = container + sum(entry["bytes"] for entry in by_type.values())
+    return {"container": container, "total": total, "by_type": by_type}
+
+
+def collection_size(objects: Iterable) -> int:
+    """
+    Get the bytes held by a collection of geometry objects, counting shared points once.
+    :param objects: Iterable of Point2D, Line2D or Arc2D instances.
+    :return: Size in bytes.
+    """
+    return memory_report(objects)["total"]
+
+
+def _live_geometry() -> list:
+    return [obj for obj in gc.get_objects() if isinstance(obj, GEOMETRY_TYPES)]
+
+
+class MemorySnapshot:
+    def __init__(self, nframes: int = 1):
+        """
+        Measure the memory allocated inside a with block using tracemalloc.
+        :param nframes: Number of frames stored per allocation traceback.
+        """
+        if nframes < 1:
+            raise ValueError("nframes must be positive.")
+        self.nframes = nframes
+        self.peak = 0
+        self.by_type = {}
+        self._before = None
+        self._after = None
+        self._existing = set()
+        self._started = False
+
+    def __enter__(self) -> Self:
+        self._started = not tracemalloc.is_tracing()
+        if self._started:
+            tracemalloc.start(self.nframes)
+        self._existing = {id(obj) for obj in _live_geometry()}
+        tracemalloc.reset_peak()
+        self._before = tracemalloc.take_snapshot()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._after = tracemalloc.take_snapshot()
+        self.peak = tracemalloc.get_traced_memory()[1]
+        created = [obj for obj in _live_geometry() if id(obj) not in self._existing]
+        self.by_type = {}
+        for obj in created:
+            entry = self.by_type.setdefault(type(obj).__name__, {"count": 0, "bytes": 0})
+            entry["count"] += 1
+            entry["bytes"] += own_size(obj)
+        self._existing = set()
+        if self._started:
+            tracemalloc.stop()
+
+    @property
+    def allocated(self) -> int:
+        """Get the net number of bytes allocated inside the block and still alive at its end."""
+        return sum(stat.size_diff for stat in self.statistics())
+
+    def statistics(self, key_type: str = "filename", limit: Optional[int] = None) -> list:
+        """
+        Get the allocation differences between the start and the end of the block.
+        :param key_type: Grouping passed to tracemalloc ("filename", "lineno" or "traceback").
+        :param limit: Maximum number of statistics (all if None).
+        :return: List of tracemalloc.StatisticDiff, largest first.
+        """
+        if self._after is None:
+            raise RuntimeError("Snapshot has not been taken yet.")
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        after = self._after.filter_traces(filters)
+        before = self._before.filter_traces(filters)
+        return after.compare_to(before, key_type)[:limit]
+
+    def report(self, limit: int = 10) -> dict:
+        """
+        Summarize the block.
+        :param limit: Number of source files listed under "top".
+        :return: {"allocated": bytes, "peak": bytes, "by_type": {type name: {"count", "bytes"}},
+                  "top": [{"file", "bytes", "blocks"}]}
+        """
+        top = [{"file": str(stat.traceback), "bytes": stat.size_diff, "blocks": stat.count_diff}
+               for stat in self.statistics(limit=limit)]
+        return {"allocated": self.allocated, "peak": self.peak, "by_type": self.by_type, "top": top}
@@ -0,0 +1,75 @@
+import gc
+import sys
+import tracemalloc
+import unittest
+
+from .memory import MemorySnapshot, collection_size, deep_size, memory_report, own_size
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+
+
+class TestMemory(unittest.TestCase):
+    def test_own_size_of_point_matches_getsizeof(self):
+        point = Point2D(1.5, 2.5)
+        self.assertEqual(own_size(point), sys.getsizeof(point))
+
+    def test_deep_size_adds_referenced_points(self):
+        p1, p2 = Point2D(0.5, 0.5), Point2D(3.5, 4.5)
+        line = Line2D(p1, p2)
+        self.assertEqual(deep_size(line), own_size(line) + own_size(p1) + own_size(p2))
+
+    def test_shared_points_counted_once(self):
+        a, b, c = Point2D(0.5, 0.5), Point2D(1.5, 0.5), Point2D(1.5, 1.5)
+        lines = [Line2D(a, b), Line2D(b, c), Line2D(c, a)]
+        report = memory_report(lines)
+        self.assertEqual(report["by_type"]["Point2D"]["count"], 3)
+        self.assertEqual(report["by_type"]["Line2D"]["count"], 3)
+        expected = sys.getsizeof(lines) + sum(own_size(obj) for obj in lines + [a, b, c])
+        self.assertEqual(report["total"], expected)
+        self.assertEqual(collection_size(lines), expected)
+        self.assertLess(collection_size(lines), sum(deep_size(line) for line in lines) + sys.getsizeof(lines))
+
+    def test_arc_and_loose_points(self):
+        cp, sp, ep = Point2D(0, 0), Point2D(1.5, 0), Point2D(0, 1.5)
+        report = memory_report((Arc2D(cp, sp, ep), sp, Point2D(9.5, 9.5)))
+        self.assertEqual(report["by_type"]["Arc2D"]["count"], 1)
+        self.assertEqual(report["by_type"]["Point2D"]["count"], 4)
+
+    def test_measuring_does_not_grow_objects(self):
+        points = [Point2D(k + 0.5, k + 1.5) for k in range(1000)]
+        lines = [Line2D(points[k], points[k + 1]) for k in range(999)]
+        tracked = len(gc.get_objects())
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            first = collection_size(lines)
+            second = collection_size(lines)
+            retained = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(first, second)
+        self.assertEqual(len(gc.get_objects()), tracked)
+        # An attribute dictionary per object would keep tens of kilobytes.
+        self.assertLess(retained, 2000)
+
+    def test_rejects_non_geometry(self):
+        with self.assertRaises(TypeError):
+            own_size(1.0)
+        with self.assertRaises(TypeError):
+            memory_report([Point2D(0, 0), "point"])
+
+    def test_snapshot_groups_by_type(self):
+        with MemorySnapshot() as snapshot:
+            lines = [Line2D(Point2D(i + 0.5, 0.5), Point2D(i + 1.5, 2.5)) for i in range(50)]
+        report = snapshot.report()
+        self.assertEqual(report["by_type"]["Line2D"]["count"], 50)
+        self.assertEqual(report["by_type"]["Point2D"]["count"], 100)
+        self.assertGreater(report["allocated"], 0)
+        self.assertGreaterEqual(report["peak"], report["allocated"])
+        self.assertTrue(report["top"])
+        del lines
+
+
+if __name__ == '__main__':
+    unittest.main()
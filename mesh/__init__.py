@@ -0,0 +1,2 @@
+from .mesh import Mesh2D, MeshVertex
+__all__ = ['Mesh2D', 'MeshVertex']
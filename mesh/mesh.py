@@ -0,0 +1,318 @@
+"""
+Indexed shared-vertex geometry.
+
+A Mesh2D stores every vertex once in a flat coordinate array and describes
+segments as (i, j) vertex index pairs and arcs as (center, start, end) index
+triples, so connected drawings keep one copy of each shared endpoint and a
+vertex is moved in O(1) for every entity using it.
+
+Line2D and Arc2D objects are produced on demand as views whose points are
+MeshVertex instances reading and writing the mesh arrays.  Methods that
+move point coordinates in place (Line2D.rotate, Line2D.set_angle, setting
+x or y) write through to the mesh; methods that replace a point object
+(Line2D.set_length, the sp/ep setters) detach that end of the view.
+"""
+import sys
+from array import array
+from math import floor
+from typing import Iterable, Iterator, Optional, Self
+
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+
+
+class MeshVertex(Point2D):
+    def __init__(self, mesh: "Mesh2D", index: int):
+        """
+        Initialize a Point2D view of a mesh vertex.
+        :param mesh: The mesh holding the coordinates.
+        :param index: Vertex index in the mesh.
+        """
+        self._mesh = mesh
+        self.index = index
+        self.id = None
+
+    @property
+    def x(self):
+        """Get the x-coordinate of the vertex."""
+        return self._mesh.coords[2 * self.index]
+
+    @x.setter
+    def x(self, value):
+        """
+        Set the x-coordinate of the vertex for every entity sharing it.
+        :param value: New x-coordinate (must be int or float)
+        """
+        if not isinstance(value, (int, float)):
+            raise TypeError("x coordinate must be int or float")
+        self._mesh.move_vertex(self.index, value, self._mesh.coords[2 * self.index + 1])
+
+    @property
+    def y(self):
+        """Get the y-coordinate of the vertex."""
+        return self._mesh.coords[2 * self.index + 1]
+
+    @y.setter
+    def y(self, value):
+        """
+        Set the y-coordinate of the vertex for every entity sharing it.
+        :param value: New y-coordinate (must be int or float)
+        """
+        if not isinstance(value, (int, float)):
+            raise TypeError("y coordinate must be int or float")
+        self._mesh.move_vertex(self.index, self._mesh.coords[2 * self.index], value)
+
+    def __sizeof__(self):
+        """
+        Get the size of the view itself; the coordinates belong to the mesh.
+        :return: The size of the MeshVertex instance in bytes.
+        """
+        return object.__sizeof__(self) + sys.getsizeof(self.__dict__)
+
+
+class Mesh2D:
+    def __init__(self, tolerance: int | float = 0.0):
+        """
+        Initialize an empty mesh.
+        :param tolerance: Snapping distance used by snap_vertex and from_entities (0 merges exact duplicates only).
+        """
+        if not isinstance(tolerance, (int, float)):
+            raise TypeError("Tolerance must be a numeric value.")
+        if tolerance < 0:
+            raise ValueError("Tolerance cannot be negative.")
+        self.tolerance = tolerance
+        self.coords = array('d')
+        self.segment_indices = array('q')
+        self.arc_indices = array('q')
+        self._grid = None
+
+    @property
+    def vertex_count(self) -> int:
+        """Get the number of vertices."""
+        return len(self.coords) // 2
+
+    @property
+    def segment_count(self) -> int:
+        """Get the number of segments."""
+        return len(self.segment_indices) // 2
+
+    @property
+    def arc_count(self) -> int:
+        """Get the number of arcs."""
+        return len(self.arc_indices) // 3
+
+    def _check_vertex(self, index: int) -> None:
+        if not 0 <= index < len(self.coords) // 2:
+            raise IndexError("Vertex index %d out of range." % index)
+
+    def _cell(self, x: float, y: float) -> tuple:
+        if self.tolerance == 0:
+            return x, y
+        return floor(x / self.tolerance), floor(y / self.tolerance)
+
+    def _index(self) -> dict:
+        if self._grid is None:
+            self._grid = {}
+            coords = self.coords
+            for index in range(len(coords) // 2):
+                self._grid.setdefault(self._cell(coords[2 * index], coords[2 * index + 1]), []).append(index)
+        return self._grid
+
+    def release_index(self) -> None:
+        """Free the snapping grid; it is rebuilt on the next snap_vertex or find_vertex call."""
+        self._grid = None
+
+    def add_vertex(self, x: int | float, y: int | float) -> int:
+        """
+        Append a vertex without snapping.
+        :param x: X-coordinate.
+        :param y: Y-coordinate.
+        :return: Index of the new vertex.
+        """
+        index = len(self.coords) // 2
+        self.coords.append(x)
+        self.coords.append(y)
+        if self._grid is not None:
+            self._grid.setdefault(self._cell(x, y), []).append(index)
+        return index
+
+    def find_vertex(self, x: int | float, y: int | float) -> Optional[int]:
+        """
+        Find the vertex nearest to (x, y) within the snapping tolerance.
+        :param x: X-coordinate.
+        :param y: Y-coordinate.
+        :return: Vertex index, or None if no vertex is close enough.
+        """
+        grid = self._index()
+        if self.tolerance == 0:
+            found = grid.get((x, y))
+            return found[0] if found else None
+        coords = self.coords
+        cx, cy = self._cell(x, y)
+        best, best_d2 = None, self.tolerance * self.tolerance
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                for index in grid.get((gx, gy), ()):
+                    dx = coords[2 * index] - x
+                    dy = coords[2 * index + 1] - y
+                    d2 = dx * dx + dy * dy
+                    if d2 <= best_d2 and (best is None or d2 < best_d2 or index < best):
+                        best, best_d2 = index, d2
+        return best
+
+    def snap_vertex(self, x: int | float, y: int | float) -> int:
+        """
+        Get the vertex within the snapping tolerance of (x, y), adding one if there is none.
+        :param x: X-coordinate.
+        :param y: Y-coordinate.
+        :return: Vertex index.
+        """
+        index = self.find_vertex(x, y)
+        return self.add_vertex(x, y) if index is None else index
+
+    def move_vertex(self, index: int, x: int | float, y: int | float) -> None:
+        """
+        Move a vertex; every segment and arc using it follows.
+        :param index: Vertex index.
+        :param x: New x-coordinate.
+        :param y: New y-coordinate.
+        """
+        self._check_vertex(index)
+        coords = self.coords
+        if self._grid is not None:
+            cell = self._cell(coords[2 * index], coords[2 * index + 1])
+            members = self._grid[cell]
+            members.remove(index)
+            if not members:
+                del self._grid[cell]
+            self._grid.setdefault(self._cell(x, y), []).append(index)
+        coords[2 * index] = x
+        coords[2 * index + 1] = y
+
+    def add_segment(self, start: int, end: int) -> int:
+        """
+        Append a segment between two vertices.
+        :param start: Start vertex index.
+        :param end: End vertex index.
+        :return: Index of the new segment.
+        """
+        self._check_vertex(start)
+        self._check_vertex(end)
+        self.segment_indices.append(start)
+        self.segment_indices.append(end)
+        return len(self.segment_indices) // 2 - 1
+
+    def add_arc(self, center: int, start: int, end: int) -> int:
+        """
+        Append an arc given by its center, start and end vertices.
+        :param center: Center vertex index.
+        :param start: Start vertex index.
+        :param end: End vertex index.
+        :return: Index of the new arc.
+        """
+        for index in (center, start, end):
+            self._check_vertex(index)
+        self.arc_indices.extend((center, start, end))
+        return len(self.arc_indices) // 3 - 1
+
+    def vertex(self, index: int) -> MeshVertex:
+        """
+        Get a Point2D view of a vertex.
+        :param index: Vertex index.
+        :return: MeshVertex reading and writing the mesh coordinates.
+        """
+        self._check_vertex(index)
+        return MeshVertex(self, index)
+
+    def line(self, index: int) -> Line2D:
+        """
+        Get a Line2D view of a segment.
+        :param index: Segment index.
+        :return: Line2D whose points are MeshVertex views.
+        """
+        if not 0 <= index < len(self.segment_indices) // 2:
+            raise IndexError("Segment index %d out of range." % index)
+        return Line2D(MeshVertex(self, self.segment_indices[2 * index]), MeshVertex(self, self.segment_indices[2 * index + 1]))
+
+    def arc(self, index: int) -> Arc2D:
+        """
+        Get an Arc2D view of an arc.
+        :param index: Arc index.
+        :return: Arc2D whose points are MeshVertex views.
+        """
+        if not 0 <= index < len(self.arc_indices) // 3:
+            raise IndexError("Arc index %d out of range." % index)
+        return Arc2D(*(MeshVertex(self, self.arc_indices[3 * index + k]) for k in range(3)))
+
+    def lines(self) -> Iterator[Line2D]:
+        """Iterate over Line2D views of all segments."""
+        for index in range(len(self.segment_indices) // 2):
+            yield self.line(index)
+
+    def arcs(self) -> Iterator[Arc2D]:
+        """Iterate over Arc2D views of all arcs."""
+        for index in range(len(self.arc_indices) // 3):
+            yield self.arc(index)
+
+    def segment_buffer(self) -> array:
+        """
+        Pack the segments as (x1, y1, x2, y2) floats for the batched kernels.
+        :return: array('d') with four floats per segment.
+        """
+        coords = self.coords
+        out = array('d')
+        for index in self.segment_indices:
+            out.append(coords[2 * index])
+            out.append(coords[2 * index + 1])
+        return out
+
+    def arc_buffer(self) -> array:
+        """
+        Pack the arcs as (cx, cy, sx, sy, ex, ey) floats for the batched kernels.
+        :return: array('d') with six floats per arc.
+        """
+        coords = self.coords
+        out = array('d')
+        for index in self.arc_indices:
+            out.append(coords[2 * index])
+            out.append(coords[2 * index + 1])
+        return out
+
+    @classmethod
+    def from_entities(cls, entities: Iterable[Line2D | Arc2D], tolerance: int | float = 0.0) -> Self:
+        """
+        Convert Line2D and Arc2D objects into a mesh, merging points closer than the tolerance.
+        Segment k is the k-th Line2D of the input and arc k the k-th Arc2D.
+        :param entities: Iterable of Line2D and Arc2D instances.
+        :param tolerance: Snapping distance (0 merges exact duplicates only).
+        :return: A new Mesh2D.
+        """
+        mesh = cls(tolerance)
+        mesh._grid = {}
+        for entity in entities:
+            if isinstance(entity, Line2D):
+                sp, ep = entity.points
+                mesh.add_segment(mesh.snap_vertex(sp.x, sp.y), mesh.snap_vertex(ep.x, ep.y))
+            elif isinstance(entity, Arc2D):
+                cp, sp, ep = entity.points
+                mesh.add_arc(mesh.snap_vertex(cp.x, cp.y), mesh.snap_vertex(sp.x, sp.y), mesh.snap_vertex(ep.x, ep.y))
+            else:
+                raise TypeError("Entities must be Line2D or Arc2D instances.")
+        mesh.release_index()
+        return mesh
+
+    def __sizeof__(self) -> int:
+        """
+        Get the size of the mesh including its arrays and snapping grid.
+        :return: Size in bytes.
+        """
+        size = object.__sizeof__(self) + sys.getsizeof(self.__dict__) + sum(
+            sys.getsizeof(buffer) for buffer in (self.coords, self.segment_indices, self.arc_indices))
+        if self._grid is not None:
+            size += sys.getsizeof(self._grid) + sum(sys.getsizeof(cell) + sys.getsizeof(members)
+                                                    for cell, members in self._grid.items())
+        return size
+
+    def __repr__(self) -> str:
+        return "Mesh2D(vertices=%d, segments=%d, arcs=%d)" % (self.vertex_count, self.segment_count, self.arc_count)
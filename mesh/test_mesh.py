@@ -0,0 +1,97 @@
+import unittest
+
+from .mesh import Mesh2D, MeshVertex
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+from kernels import kernels
+from memory.memory import collection_size
+
+
+def _triangle():
+    a, b, c = Point2D(0, 0), Point2D(4, 0), Point2D(4, 3)
+    return [Line2D(a, b), Line2D(Point2D(4, 0), c), Line2D(Point2D(4, 3), Point2D(0, 0))]
+
+
+class TestMesh2D(unittest.TestCase):
+    def test_from_entities_shares_vertices(self):
+        mesh = Mesh2D.from_entities(_triangle())
+        self.assertEqual(mesh.vertex_count, 3)
+        self.assertEqual(mesh.segment_count, 3)
+        self.assertEqual(list(mesh.segment_indices), [0, 1, 1, 2, 2, 0])
+
+    def test_views_match_entities(self):
+        lines = _triangle()
+        mesh = Mesh2D.from_entities(lines)
+        for line, view in zip(lines, mesh.lines()):
+            self.assertEqual(view, line)
+            self.assertIsInstance(view.sp, MeshVertex)
+            self.assertAlmostEqual(view.length(), line.length())
+
+    def test_moving_shared_vertex_updates_all_views(self):
+        mesh = Mesh2D.from_entities(_triangle())
+        first, second = mesh.line(0), mesh.line(1)
+        first.ep.y = 1
+        self.assertEqual(second.sp, Point2D(4, 1))
+        mesh.move_vertex(1, 5, 5)
+        self.assertEqual(first.ep, Point2D(5, 5))
+        self.assertEqual(mesh.line(1).sp, Point2D(5, 5))
+
+    def test_write_through_from_line_methods(self):
+        mesh = Mesh2D.from_entities([Line2D(Point2D(0, 0), Point2D(2, 0))])
+        mesh.line(0).rotate(90)
+        self.assertAlmostEqual(mesh.coords[2], 0.0)
+        self.assertAlmostEqual(mesh.coords[3], 2.0)
+
+    def test_snapping_with_tolerance(self):
+        lines = [Line2D(Point2D(0, 0), Point2D(1, 0)), Line2D(Point2D(1.0004, 0.0003), Point2D(2, 0))]
+        self.assertEqual(Mesh2D.from_entities(lines).vertex_count, 4)
+        mesh = Mesh2D.from_entities(lines, tolerance=1e-3)
+        self.assertEqual(mesh.vertex_count, 3)
+        self.assertEqual(mesh.find_vertex(1.0009, 0.0), 1)
+        self.assertIsNone(mesh.find_vertex(1.01, 0.0))
+
+    def test_snap_after_move(self):
+        mesh = Mesh2D(tolerance=0.1)
+        index = mesh.snap_vertex(0, 0)
+        mesh.move_vertex(index, 10, 10)
+        self.assertEqual(mesh.snap_vertex(10.05, 10), index)
+        self.assertNotEqual(mesh.snap_vertex(0, 0), index)
+
+    def test_arcs(self):
+        arc = Arc2D(Point2D(0, 0), Point2D(1, 0), Point2D(0, 1))
+        mesh = Mesh2D.from_entities([arc, Line2D(Point2D(0, 1), Point2D(0, 0))])
+        self.assertEqual(mesh.vertex_count, 3)
+        self.assertEqual(mesh.arc_count, 1)
+        view = mesh.arc(0)
+        self.assertAlmostEqual(view.arc_length(), arc.arc_length())
+        self.assertEqual(list(mesh.arc_buffer()), list(kernels.pack_arcs([arc])))
+
+    def test_segment_buffer_matches_kernels(self):
+        lines = _triangle()
+        mesh = Mesh2D.from_entities(lines)
+        self.assertEqual(list(mesh.segment_buffer()), list(kernels.pack_lines(lines)))
+
+    def test_memory_smaller_than_objects(self):
+        lines = [Line2D(Point2D(float(i), 0.0), Point2D(float(i + 1), 0.0)) for i in range(1000)]
+        mesh = Mesh2D.from_entities(lines)
+        self.assertEqual(mesh.vertex_count, 1001)
+        self.assertLess(mesh.__sizeof__() * 5, collection_size(lines))
+
+    def test_errors(self):
+        mesh = Mesh2D()
+        with self.assertRaises(IndexError):
+            mesh.add_segment(0, 1)
+        with self.assertRaises(IndexError):
+            mesh.line(0)
+        with self.assertRaises(TypeError):
+            Mesh2D.from_entities([Point2D(0, 0)])
+        with self.assertRaises(ValueError):
+            Mesh2D(-1)
+        mesh.add_vertex(0, 0)
+        with self.assertRaises(TypeError):
+            mesh.vertex(0).x = "a"
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,2 @@
+from .offset import PathOffsetter, intersect_pieces, offset_path
+__all__ = ['PathOffsetter', 'intersect_pieces', 'offset_path']
@@ -0,0 +1,384 @@
+"""
+Offsetting of paths made of lines and arcs.
+
+Every piece of the source path is offset on its own: lines are shifted along
+their left normal and arcs change radius (an arc whose radius would become
+negative flips to the other side of its center, which is still the exact
+offset).  Consecutive offset pieces are then reconnected:
+
+- where the path turns away from the offset side, the gap is closed with an
+  arc of the offset radius around the corner (a round join);
+- where it turns towards it, the two pieces are trimmed at their
+  intersection next to the corner, or joined through the corner when they
+  do not meet there.
+
+The raw offset curve obtained this way can cross itself wherever the offset
+is larger than a feature of the path.  Raw pieces lying wholly within the
+offset distance of their nearest source vertex are dropped first, which on
+jagged contours removes most of the loops.  The self-intersections of the
+rest are found with a sort-and-sweep over the piece bounding boxes, the
+pieces are split there, and every sub-piece whose midpoint is closer to the
+source path than the offset distance is discarded.  Both tests use uniform
+grids over the source vertices and pieces that are built once per source
+path and reused for every distance, so the passes of a pocket share them.
+The remaining sub-pieces are chained back into paths through their shared
+end points.
+
+Positive distances offset to the left of the direction of travel (inwards
+for a counterclockwise contour), negative distances to the right.  Output
+arcs follow the Arc2D convention of not crossing angle zero; offset arcs
+that would cross it are split there, and arc ends on angle zero are nudged
+by one unit in the last place so that Arc2D reads their direction correctly.
+"""
+from math import atan2, cos, hypot, inf, pi, sin, sqrt
+from typing import Iterable, Optional
+
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D, TOLERANCE_LENGTH
+from path2d.path2d import Path2D
+from pieces.pieces import (ARC, LINE, arc_parameter, bounds, emit, intersections, line_record, point_at, record,
+                           tangents)
+
+
+# Pieces are handled as records, see pieces.pieces; this one is an arc by its center, radius and angles.
+def _arc(cx: float, cy: float, radius: float, start: float, sweep: float) -> list:
+    end = start + sweep
+    return [ARC, cx + radius * cos(start), cy + radius * sin(start), cx + radius * cos(end), cy + radius * sin(end),
+            cx, cy, radius, start, sweep]
+
+
+def _distance(piece: list, px: float, py: float) -> float:
+    if piece[0] == LINE:
+        x0, y0, dx, dy = piece[1], piece[2], piece[3] - piece[1], piece[4] - piece[2]
+        length2 = dx * dx + dy * dy
+        t = 0.0 if length2 == 0 else max(0.0, min(1.0, ((px - x0) * dx + (py - y0) * dy) / length2))
+        return hypot(x0 + t * dx - px, y0 + t * dy - py)
+    if arc_parameter(piece, atan2(py - piece[6], px - piece[5])) is not None:
+        return abs(hypot(px - piece[5], py - piece[6]) - piece[7])
+    return min(hypot(px - piece[1], py - piece[2]), hypot(px - piece[3], py - piece[4]))
+
+
+def intersect_pieces(first: Line2D | Arc2D, second: Line2D | Arc2D) -> list[Point2D]:
+    """
+    Intersect two lines or arcs (line-line, line-arc and arc-arc).
+    Overlapping collinear lines and concentric arcs report no intersection.
+    :param first: Line2D or Arc2D.
+    :param second: Line2D or Arc2D.
+    :return: List of intersection points (at most two).
+    """
+    return [Point2D(x, y) for _, _, x, y in intersections(record(first), record(second))]
+
+
+def _trim_end(piece: list, t: float, x: float, y: float) -> None:
+    if piece[0] == ARC:
+        piece[9] *= t
+    piece[3], piece[4] = x, y
+
+
+def _trim_start(piece: list, t: float, x: float, y: float) -> None:
+    if piece[0] == ARC:
+        piece[8] += t * piece[9]
+        piece[9] *= 1 - t
+    piece[1], piece[2] = x, y
+
+
+class PathOffsetter:
+    def __init__(self, pieces: Iterable[Line2D | Arc2D] | Path2D, closed: Optional[bool] = None,
+                 tolerance: int | float = TOLERANCE_LENGTH):
+        """
+        Prepare a source path for offsetting.
+        :param pieces: Line2D and Arc2D pieces placed end to start, or a Path2D.
+        :param closed: Whether the path is a closed contour (detected from its end points if None).
+        :param tolerance: Largest gap allowed between consecutive pieces; shorter output pieces are dropped.
+        """
+        if not isinstance(tolerance, (int, float)):
+            raise TypeError("Tolerance must be a numeric value.")
+        if tolerance < 0:
+            raise ValueError("Tolerance cannot be negative.")
+        self.tolerance = tolerance
+        if isinstance(pieces, Path2D):
+            pieces = pieces.pieces
+        self.source = [record(piece) for piece in pieces]
+        if not self.source:
+            raise ValueError("Path is empty.")
+        for k in range(1, len(self.source)):
+            previous, piece = self.source[k - 1], self.source[k]
+            if hypot(piece[1] - previous[3], piece[2] - previous[4]) > tolerance:
+                raise ValueError("Piece %d does not start where the path ends." % k)
+        first, last = self.source[0], self.source[-1]
+        self.closed = hypot(first[1] - last[3], first[2] - last[4]) <= tolerance if closed is None else closed
+        self._build_grid()
+
+    def _build_grid(self) -> None:
+        boxes = [bounds(piece) for piece in self.source]
+        self._low_x = min(b[0] for b in boxes)
+        self._low_y = min(b[1] for b in boxes)
+        extent = max(max(b[2] for b in boxes) - self._low_x, max(b[3] for b in boxes) - self._low_y)
+        self._extent = extent
+        self._cell = max(extent / max(sqrt(len(boxes)), 1.0), self.tolerance, 1e-300)
+        self._grid = {}
+        self._last_hit = 0
+        for index, (x0, y0, x1, y1) in enumerate(boxes):
+            for row in range(self._row(y0), self._row(y1) + 1):
+                for col in range(self._col(x0), self._col(x1) + 1):
+                    self._grid.setdefault((row, col), []).append(index)
+        self._vertices = {}
+        # Vertex k starts piece k; the last one ends the path.
+        for k, piece in enumerate(self.source + [line_record(self.source[-1][3], self.source[-1][4], 0.0, 0.0)]):
+            x, y = piece[1], piece[2]
+            self._vertices.setdefault((self._row(y), self._col(x)), []).append((k, x, y))
+        self._span = int(extent // self._cell) + 1
+
+    def _col(self, x: float) -> int:
+        return int((x - self._low_x) // self._cell)
+
+    def _row(self, y: float) -> int:
+        return int((y - self._low_y) // self._cell)
+
+    def _closer_than(self, px: float, py: float, limit: float) -> bool:
+        # Whether some source piece lies within limit of (px, py).  The last piece found and the pieces
+        # around the nearest vertex answer most queries before the grid cells are scanned.
+        source, grid = self.source, self._grid
+        if _distance(source[self._last_hit], px, py) < limit:
+            return True
+        vertex = self._nearest_vertex(px, py)[0]
+        for index in (vertex - 1, vertex):
+            if 0 <= index < len(source) or self.closed:
+                index %= len(source)
+                if _distance(source[index], px, py) < limit:
+                    self._last_hit = index
+                    return True
+        col0, col1 = self._col(px - limit), self._col(px + limit)
+        row0, row1 = self._row(py - limit), self._row(py + limit)
+        if (col1 - col0 + 1) * (row1 - row0 + 1) > len(grid):
+            candidates = range(len(source))
+        else:
+            candidates = {index for row in range(row0, row1 + 1) for col in range(col0, col1 + 1)
+                          for index in grid.get((row, col), ())}
+        for index in candidates:
+            if _distance(source[index], px, py) < limit:
+                self._last_hit = index
+                return True
+        return False
+
+    def _nearest_vertex(self, px: float, py: float) -> tuple[int, float, float]:
+        # Search rings of cells around the point until no closer vertex can remain.  The rings reach
+        # across the grid from a point inside it; a point farther out falls back to a scan of all vertices.
+        row, col = self._row(py), self._col(px)
+        best, best_distance = None, inf
+        for ring in range(self._span + 1):
+            for r in range(row - ring, row + ring + 1):
+                step = 1 if r in (row - ring, row + ring) else 2 * ring or 1
+                for c in range(col - ring, col + ring + 1, step):
+                    for vertex in self._vertices.get((r, c), ()):
+                        distance = hypot(vertex[1] - px, vertex[2] - py)
+                        if distance < best_distance:
+                            best, best_distance = vertex, distance
+            if best is not None and best_distance <= ring * self._cell:
+                return best
+        for vertices in self._vertices.values():
+            for vertex in vertices:
+                distance = hypot(vertex[1] - px, vertex[2] - py)
+                if distance < best_distance:
+                    best, best_distance = vertex, distance
+        return best
+
+    def _covered(self, piece: list, limit: float) -> bool:
+        # Whether a raw piece lies entirely within limit of its nearest source vertex, which makes
+        # every part of it invalid; dropping such pieces before the sweep removes most of the crossings.
+        mx, my = point_at(piece, 0.5)
+        _, qx, qy = self._nearest_vertex(mx, my)
+        if hypot(piece[1] - qx, piece[2] - qy) >= limit or hypot(piece[3] - qx, piece[4] - qy) >= limit:
+            return False
+        if piece[0] == LINE:
+            return True
+        # The farthest point of an arc lies at its ends or on the far side of its center.
+        cx, cy = piece[5], piece[6]
+        if arc_parameter(piece, atan2(cy - qy, cx - qx)) is None:
+            return True
+        return hypot(cx - qx, cy - qy) + piece[7] < limit
+
+    def _raw_offset(self, distance: float) -> list:
+        pieces = []
+        for piece in self.source:
+            if piece[0] == LINE:
+                tx, ty, _, _ = tangents(piece)
+                nx, ny = -ty * distance, tx * distance
+                pieces.append(line_record(piece[1] + nx, piece[2] + ny, piece[3] + nx, piece[4] + ny))
+            else:
+                # The left side of a counterclockwise arc faces its center.
+                radius = piece[7] - distance if piece[9] > 0 else piece[7] + distance
+                start = piece[8] if radius >= 0 else piece[8] + pi
+                pieces.append(_arc(piece[5], piece[6], abs(radius), start, piece[9]))
+        raw = []
+        count = len(pieces)
+        for k in range(count):
+            raw.append(pieces[k])
+            if k + 1 == count and not self.closed:
+                break
+            following = pieces[(k + 1) % count]
+            vertex = self.source[k]
+            vx, vy = vertex[3], vertex[4]
+            _, _, ax, ay = tangents(vertex)
+            bx, by, _, _ = tangents(self.source[(k + 1) % count])
+            cross, dot = ax * by - ay * bx, ax * bx + ay * by
+            current = raw[-1]
+            if hypot(following[1] - current[3], following[2] - current[4]) <= self.tolerance:
+                following[1], following[2] = current[3], current[4]
+                continue
+            if cross * distance < 0 or (cross == 0 and dot < 0):
+                # Round join around the corner, turning the same way as the path.
+                sweep = atan2(cross, dot) if cross != 0 else (-pi if distance > 0 else pi)
+                start = atan2(current[4] - vy, current[3] - vx)
+                join = _arc(vx, vy, abs(distance), start, sweep)
+                join[1], join[2] = current[3], current[4]
+                join[3], join[4] = following[1], following[2]
+                raw.append(join)
+                continue
+            hits = intersections(current, following)
+            if hits:
+                t, u, x, y = min(hits, key=lambda hit: (1 - hit[0]) + hit[1])
+                _trim_end(current, t, x, y)
+                _trim_start(following, u, x, y)
+                continue
+            raw.append(line_record(current[3], current[4], vx, vy))
+            raw.append(line_record(vx, vy, following[1], following[2]))
+        if self.closed:
+            # The last join or trim may have moved the start of the first piece.
+            first = raw[0]
+            last = raw[-1]
+            last[3], last[4] = first[1], first[2]
+        return raw
+
+    def _split(self, raw: list) -> list[list[tuple[float, float, float]]]:
+        # Split points (parameter, x, y) of every raw piece at its crossings with the others.
+        snap = max(self.tolerance, 1e-9 * self._extent)
+        splits = [[(0.0, piece[1], piece[2]), (1.0, piece[3], piece[4])] for piece in raw]
+        boxes = [bounds(piece) for piece in raw]
+        order = sorted(range(len(raw)), key=lambda k: boxes[k][0])
+        active = []
+        for i in order:
+            low_x, low_y, high_x, high_y = boxes[i]
+            active = [j for j in active if boxes[j][2] >= low_x]
+            for j in active:
+                if boxes[j][1] > high_y or boxes[j][3] < low_y:
+                    continue
+                a, b = raw[i], raw[j]
+                for t, u, x, y in intersections(a, b):
+                    # Crossings at piece ends reuse the exact end coordinates so the pieces chain up.
+                    for piece in (a, b):
+                        if hypot(x - piece[1], y - piece[2]) <= snap:
+                            x, y = piece[1], piece[2]
+                        elif hypot(x - piece[3], y - piece[4]) <= snap:
+                            x, y = piece[3], piece[4]
+                    for k, piece, param in ((i, a, t), (j, b, u)):
+                        if hypot(x - piece[1], y - piece[2]) > snap and hypot(x - piece[3], y - piece[4]) > snap:
+                            splits[k].append((param, x, y))
+            active.append(i)
+        for points in splits:
+            points.sort()
+        return splits
+
+    def offset(self, distance: int | float) -> list[list[Line2D | Arc2D]]:
+        """
+        Offset the path by a distance.
+        :param distance: Offset distance, positive to the left of the direction of travel.
+        :return: List of offset paths, each a list of Line2D and Arc2D pieces placed end to start.
+                 A closed source gives closed paths only (none when the offset consumes the contour).
+        """
+        if not isinstance(distance, (int, float)):
+            raise TypeError("Distance must be a numeric value.")
+        if distance == 0:
+            return [[self._copy(piece) for piece in self.source]]
+        limit = abs(distance) - max(self.tolerance, 1e-7 * abs(distance))
+        raw = [piece for piece in self._raw_offset(distance) if not self._covered(piece, limit)]
+        splits = self._split(raw)
+        # Valid sub-pieces keyed by their start point.
+        subs = []
+        starts = {}
+        for piece, points in zip(raw, splits):
+            for (t0, x0, y0), (t1, x1, y1) in zip(points, points[1:]):
+                if (x0, y0) == (x1, y1):
+                    continue
+                mx, my = point_at(piece, (t0 + t1) / 2)
+                if self._closer_than(mx, my, limit):
+                    continue
+                sub = line_record(x0, y0, x1, y1)
+                if piece[0] == ARC:
+                    sub = [ARC, x0, y0, x1, y1, piece[5], piece[6], piece[7], piece[8] + t0 * piece[9],
+                           (t1 - t0) * piece[9]]
+                starts.setdefault((x0, y0), []).append(len(subs))
+                subs.append(sub)
+        return self._chain(subs, starts)
+
+    def offsets(self, distances: Iterable[int | float]) -> list[list[list[Line2D | Arc2D]]]:
+        """
+        Offset the path by several distances, reusing the source index (e.g. the passes of a pocket).
+        :param distances: Offset distances.
+        :return: One offset() result per distance.
+        """
+        return [self.offset(distance) for distance in distances]
+
+    def _copy(self, piece: list) -> Line2D | Arc2D:
+        if piece[0] == LINE:
+            return Line2D(Point2D(piece[1], piece[2]), Point2D(piece[3], piece[4]))
+        return Arc2D(Point2D(piece[5], piece[6]), Point2D(piece[1], piece[2]), Point2D(piece[3], piece[4]))
+
+    def _chain(self, subs: list, starts: dict) -> list[list[Line2D | Arc2D]]:
+        incoming = {}
+        for sub in subs:
+            incoming[(sub[3], sub[4])] = incoming.get((sub[3], sub[4]), 0) + 1
+        used = [False] * len(subs)
+        # Open chains start where nothing arrives; everything left over forms loops.
+        heads = [k for k, sub in enumerate(subs) if (sub[1], sub[2]) not in incoming]
+        heads += range(len(subs))
+        paths = []
+        for head in heads:
+            if used[head]:
+                continue
+            chain = []
+            k = head
+            while k is not None and not used[k]:
+                used[k] = True
+                chain.append(subs[k])
+                candidates = [m for m in starts.get((subs[k][3], subs[k][4]), ()) if not used[m]]
+                k = candidates[0] if candidates else None
+            closed = (chain[-1][3], chain[-1][4]) == (chain[0][1], chain[0][2])
+            if self.closed and not closed:
+                continue
+            path = self._emit_chain(chain, closed)
+            if path:
+                paths.append(path)
+        return paths
+
+    def _emit_chain(self, chain: list, closed: bool) -> list[Line2D | Arc2D]:
+        # Consecutive output pieces share their Point2D end points; pieces shorter than the tolerance are merged away.
+        kept = [sub for sub in chain if hypot(sub[3] - sub[1], sub[4] - sub[2]) > self.tolerance
+                or (sub[0] == ARC and abs(sub[9]) * sub[7] > self.tolerance)]
+        if not kept:
+            return []
+        first = Point2D(kept[0][1], kept[0][2])
+        point = first
+        path = []
+        for index, sub in enumerate(kept):
+            if closed and index == len(kept) - 1:
+                end = first
+            else:
+                end = Point2D(sub[3], sub[4])
+            path.extend(emit(sub, point, end))
+            point = end
+        return path
+
+
+def offset_path(pieces: Iterable[Line2D | Arc2D] | Path2D, distance: int | float, closed: Optional[bool] = None,
+                tolerance: int | float = TOLERANCE_LENGTH) -> list[list[Line2D | Arc2D]]:
+    """
+    Offset a path of lines and arcs by one distance.
+    :param pieces: Line2D and Arc2D pieces placed end to start, or a Path2D.
+    :param distance: Offset distance, positive to the left of the direction of travel.
+    :param closed: Whether the path is a closed contour (detected from its end points if None).
+    :param tolerance: Largest gap allowed between consecutive pieces.
+    :return: List of offset paths, each a list of Line2D and Arc2D pieces.
+    """
+    return PathOffsetter(pieces, closed, tolerance).offset(distance)
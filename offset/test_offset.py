@@ -0,0 +1,165 @@
+import random
+import unittest
+from math import asin, cos, pi, sin, sqrt
+
+from .offset import PathOffsetter, intersect_pieces, offset_path, _distance
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+from path2d.path2d import Path2D
+
+
+def _polygon(coords):
+    points = [Point2D(x, y) for x, y in coords]
+    return [Line2D(points[k], points[(k + 1) % len(points)]) for k in range(len(points))]
+
+
+def _length(path):
+    return sum(piece.length() if isinstance(piece, Line2D) else piece.arc_length() for piece in path)
+
+
+class TestOffset(unittest.TestCase):
+    def setUp(self):
+        self.square = _polygon([(0, 0), (10, 0), (10, 10), (0, 10)])
+
+    def assertConnected(self, path, closed=True):
+        pairs = list(zip(path, path[1:] + path[:1] if closed else path[1:]))
+        for first, second in pairs:
+            end, start = first.points[-1], second.points[-2 if isinstance(second, Arc2D) else 0]
+            self.assertAlmostEqual(end.x, start.x, delta=1e-12)
+            self.assertAlmostEqual(end.y, start.y, delta=1e-12)
+
+    def test_outward_square_has_round_corners(self):
+        paths = offset_path(self.square, -1)
+        self.assertEqual(len(paths), 1)
+        path = paths[0]
+        self.assertEqual(sum(isinstance(piece, Arc2D) for piece in path), 4)
+        self.assertAlmostEqual(_length(path), 40 + 2 * pi)
+        for piece in path:
+            if isinstance(piece, Arc2D):
+                self.assertAlmostEqual(piece.arc_length(), pi / 2)
+                self.assertAlmostEqual(piece.radius_cp_sp(), 1)
+        self.assertConnected(path)
+
+    def test_inward_square_shrinks_and_vanishes(self):
+        offsetter = PathOffsetter(self.square)
+        self.assertTrue(offsetter.closed)
+        inner, small, gone = offsetter.offsets([1, 4.9, 5])
+        self.assertEqual(len(inner), 1)
+        self.assertTrue(all(isinstance(piece, Line2D) for piece in inner[0]))
+        self.assertAlmostEqual(_length(inner[0]), 32)
+        self.assertAlmostEqual(_length(small[0]), 0.8)
+        self.assertEqual(gone, [])
+        self.assertConnected(inner[0])
+
+    def test_pocket_splits_into_islands(self):
+        dumbbell = _polygon([(0, 0), (10, 0), (10, 4), (12, 4), (12, 0), (22, 0), (22, 10), (12, 10), (12, 6),
+                             (10, 6), (10, 10), (0, 10)])
+        self.assertEqual(len(offset_path(dumbbell, 0.5)), 1)
+        islands = offset_path(dumbbell, 1.5)
+        self.assertEqual(len(islands), 2)
+        for island in islands:
+            # Each room keeps the quarter arcs turning around the corners of the channel.
+            self.assertEqual(sum(isinstance(piece, Arc2D) for piece in island), 2)
+            self.assertAlmostEqual(_length(island), 26 + 2 * 1.5 * asin(1 / 1.5))
+            self.assertConnected(island)
+        self.assertEqual(offset_path(dumbbell, 5.5), [])
+
+    def test_arcs(self):
+        center = Point2D(0, 0)
+        points = [Point2D(10 * cos(k * pi / 2), 10 * sin(k * pi / 2)) for k in range(4)] + [Point2D(10, -1e-300)]
+        circle = [Arc2D(Point2D(0, 0), points[k], points[k + 1]) for k in range(4)]
+        for distance in (1, -2, 9.5):
+            paths = offset_path(Path2D(circle), distance)
+            self.assertEqual(len(paths), 1)
+            self.assertAlmostEqual(_length(paths[0]), 2 * pi * (10 - distance))
+            for piece in paths[0]:
+                self.assertAlmostEqual(piece.radius_cp_sp(), 10 - distance)
+                self.assertEqual((piece.cp.x, piece.cp.y), (center.x, center.y))
+            self.assertConnected(paths[0])
+        self.assertEqual(offset_path(circle, 10), [])
+        # A clockwise arc gets larger when offset to its left.
+        arc = Arc2D(Point2D(0, 0), Point2D(0, 5), Point2D(5, 0))
+        piece, = offset_path([arc], 1)[0]
+        self.assertAlmostEqual(piece.radius_cp_sp(), 6)
+        self.assertTrue(piece.is_clockwise())
+
+    def test_open_path(self):
+        corner = [Line2D(Point2D(0, 0), Point2D(10, 0)), Line2D(Point2D(10, 0), Point2D(10, 10))]
+        inside, = offset_path(corner, 1)
+        self.assertEqual(len(inside), 2)
+        self.assertAlmostEqual(_length(inside), 18)
+        self.assertConnected(inside, closed=False)
+        outside, = offset_path(corner, -1)
+        self.assertEqual([type(piece) for piece in outside], [Line2D, Arc2D, Line2D])
+        self.assertAlmostEqual(_length(outside), 20 + pi / 2)
+        self.assertConnected(outside, closed=False)
+        # Offsetting a closed contour as an open path keeps the two ends apart.
+        self.assertEqual(len(offset_path(self.square, -1, closed=False)[0]), 7)
+
+    def test_offsets_larger_than_the_path(self):
+        unit = _polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+        for distance in (2, 10, 100):
+            path, = offset_path(unit, -distance)
+            self.assertAlmostEqual(_length(path), 4 + 2 * pi * distance)
+            self.assertConnected(path)
+        # An open stroke offset to both sides, far beyond its own length: inside the corner every
+        # offset piece comes closer than the distance to the other leg.
+        stroke = [Line2D(Point2D(0, 0), Point2D(1, 0)), Line2D(Point2D(1, 0), Point2D(1, 1))]
+        self.assertEqual(offset_path(stroke, 50), [])
+        right, = offset_path(stroke, -50)
+        self.assertAlmostEqual(_length(right), 2 + 25 * pi)
+        self.assertConnected(right, closed=False)
+
+    def test_offsets_keep_their_distance(self):
+        random.seed(5)
+        coords = []
+        for k in range(300):
+            angle = 2 * pi * k / 300
+            radius = 50 + 10 * sin(7 * angle) + random.uniform(-1, 1)
+            coords.append((radius * cos(angle), radius * sin(angle)))
+        contour = _polygon(coords)
+        offsetter = PathOffsetter(contour)
+        sources = offsetter.source
+        for distance, paths in zip((3, 12, -6), offsetter.offsets([3, 12, -6])):
+            self.assertGreater(len(paths), 0)
+            for path in paths:
+                self.assertConnected(path)
+                for piece in path:
+                    for point in (piece.sp, piece.ep):
+                        nearest = min(_distance(source, point.x, point.y) for source in sources)
+                        self.assertAlmostEqual(nearest, abs(distance), delta=1e-7)
+
+    def test_intersect_pieces(self):
+        first = Line2D(Point2D(0, 0), Point2D(4, 4))
+        second = Line2D(Point2D(0, 4), Point2D(4, 0))
+        hit, = intersect_pieces(first, second)
+        self.assertAlmostEqual(hit.x, 2)
+        self.assertAlmostEqual(hit.y, 2)
+        self.assertEqual(intersect_pieces(first, Line2D(Point2D(1, 0), Point2D(5, 4))), [])
+        arc = Arc2D(Point2D(0, 0), Point2D(2, 0), Point2D(-2, 0))
+        hits = intersect_pieces(Line2D(Point2D(-3, 1), Point2D(3, 1)), arc)
+        self.assertEqual(sorted(round(point.x, 9) for point in hits), [round(-sqrt(3), 9), round(sqrt(3), 9)])
+        self.assertEqual(intersect_pieces(Line2D(Point2D(-3, -1), Point2D(3, -1)), arc), [])
+        other = Arc2D(Point2D(2, 0), Point2D(4, 0), Point2D(0, 0))
+        hit, = intersect_pieces(arc, other)
+        self.assertAlmostEqual(hit.x, 1)
+        self.assertAlmostEqual(hit.y, sqrt(3))
+
+    def test_errors(self):
+        with self.assertRaises(TypeError):
+            PathOffsetter([Point2D(0, 0)])
+        with self.assertRaises(TypeError):
+            PathOffsetter(self.square, tolerance='0')
+        with self.assertRaises(ValueError):
+            PathOffsetter(self.square, tolerance=-1)
+        with self.assertRaises(ValueError):
+            PathOffsetter([])
+        with self.assertRaises(ValueError):
+            PathOffsetter([self.square[0], self.square[2]])
+        with self.assertRaises(TypeError):
+            PathOffsetter(self.square).offset('1')
+
+
+if __name__ == '__main__':
+    unittest.main()
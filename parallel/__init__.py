@@ -0,0 +1,2 @@
+from .parallel import BatchExecutor, ParallelExecutor, SharedBuffer, ThreadedExecutor
+__all__ = ['BatchExecutor', 'ParallelExecutor', 'SharedBuffer', 'ThreadedExecutor']
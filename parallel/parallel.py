@@ -0,0 +1,311 @@
+"""
+Parallel execution of the batched kernels over shared buffers.
+
+Columnar geometry is placed once in multiprocessing.shared_memory; workers
+attach to it by name and write their slice of the result into a shared output
+buffer, so coordinates are never pickled.  Only buffer names, index ranges and
+small parameters travel between processes.  ThreadedExecutor offers the same
+API on a thread pool for free-threaded builds and threaded callers.
+"""
+import os
+from abc import ABC, abstractmethod
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from typing import Optional, Self, Sequence
+
+from kernels import kernels
+
+_ITEMSIZE = array('d').itemsize
+
+_RANGE_KERNELS = {
+    "segment_lengths": kernels.segment_lengths,
+    "arc_lengths": kernels.arc_lengths,
+    "transform_points": kernels.transform_points,
+    "line_point_distances": kernels.line_point_distances,
+}
+
+
+class SharedBuffer:
+    def __init__(self, size: int = 0, name: Optional[str] = None):
+        """
+        Create (or attach to) a float64 buffer in shared memory.
+        :param size: Number of floats in the buffer.
+        :param name: Name of an existing buffer to attach to (a new buffer is created if None).
+        """
+        if not isinstance(size, int):
+            raise TypeError("Size must be an integer.")
+        if size < 0:
+            raise ValueError("Size cannot be negative.")
+        self.size = size
+        self._owner = name is None
+        nbytes = max(size, 1) * _ITEMSIZE
+        if name is None:
+            self._shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+        self._bytes = self._shm.buf[:size * _ITEMSIZE]
+        self.view = self._bytes.cast('d')
+
+    @classmethod
+    def from_sequence(cls, values: Sequence[float]) -> Self:
+        """
+        Create a shared buffer holding a copy of a sequence of floats.
+        :param values: The values to copy.
+        :return: A new SharedBuffer.
+        """
+        values = values if isinstance(values, array) and values.typecode == 'd' else array('d', values)
+        buffer = cls(len(values))
+        buffer._bytes[:] = values.tobytes()
+        return buffer
+
+    @property
+    def name(self) -> str:
+        """Get the shared memory name used to attach to the buffer."""
+        return self._shm.name
+
+    @property
+    def spec(self) -> tuple[str, int]:
+        """Get the (name, size) pair a worker needs to attach to the buffer."""
+        return self._shm.name, self.size
+
+    def to_array(self) -> array:
+        """
+        Copy the buffer into a private array.
+        :return: array('d') with the buffer contents.
+        """
+        result = array('d')
+        result.frombytes(self._bytes)
+        return result
+
+    def close(self) -> None:
+        """Detach from the buffer, and free it if it was created here."""
+        if self._shm is None:
+            return
+        self.view.release()
+        self._bytes.release()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+        self._shm = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.size
+
+
+def _run_kernel(kernel_name: str, input_specs: list, output_spec: tuple, start: int, stop: int, extra: tuple) -> None:
+    inputs = [SharedBuffer(size, name) for name, size in input_specs]
+    output = SharedBuffer(output_spec[1], output_spec[0])
+    try:
+        _RANGE_KERNELS[kernel_name](*[buffer.view for buffer in inputs], *extra,
+                                    out=output.view, start=start, stop=stop)
+    finally:
+        for buffer in inputs + [output]:
+            buffer.close()
+
+
+def _run_intersections(segments_spec: tuple, x_range: tuple[float, float]) -> list:
+    segments = SharedBuffer(segments_spec[1], segments_spec[0])
+    try:
+        return kernels.segment_intersections(segments.view, x_range)
+    finally:
+        segments.close()
+
+
+class BatchExecutor(ABC):
+    def __init__(self, workers: Optional[int] = None, min_chunk: int = 4096):
+        """
+        Base class splitting batched kernels into ranges run by a pool of workers.
+        :param workers: Number of workers (os.cpu_count() if None).
+        :param min_chunk: Smallest number of items handed to one worker; smaller jobs run in the caller.
+        """
+        if workers is not None and workers < 1:
+            raise ValueError("Number of workers must be positive.")
+        if min_chunk < 1:
+            raise ValueError("min_chunk must be positive.")
+        self.workers = workers or os.cpu_count() or 1
+        self.min_chunk = min_chunk
+        self._pool = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Stop the workers."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    @abstractmethod
+    def _executor(self):
+        """Get the worker pool, starting it on first use."""
+
+    @abstractmethod
+    def _map_ranges(self, kernel_name: str, inputs: list, ranges: list, out_size: int, extra: tuple) -> array:
+        """Run a range kernel over several ranges on the workers and gather the output."""
+
+    @abstractmethod
+    def _map_strips(self, segments: Sequence[float] | SharedBuffer, bounds: list[float]) -> list:
+        """Find the segment crossings of each vertical strip between consecutive x bounds on the workers."""
+
+    def ranges(self, n: int) -> list[tuple[int, int]]:
+        """
+        Split n items into contiguous ranges, one or more per worker.
+        :param n: Number of items.
+        :return: List of (start, stop) ranges.
+        """
+        chunks = max(1, min(self.workers, n // self.min_chunk))
+        bounds = [n * k // chunks for k in range(chunks + 1)]
+        return [(bounds[k], bounds[k + 1]) for k in range(chunks)]
+
+    def _map(self, kernel_name: str, inputs: list, n: int, out_size: int, extra: tuple = ()) -> array:
+        ranges = self.ranges(n)
+        if len(ranges) == 1:
+            views = [buffer.view if isinstance(buffer, SharedBuffer) else buffer for buffer in inputs]
+            out = array('d', bytes(out_size * _ITEMSIZE))
+            return _RANGE_KERNELS[kernel_name](*views, *extra, out=out)
+        return self._map_ranges(kernel_name, inputs, ranges, out_size, extra)
+
+    def segment_lengths(self, segments: Sequence[float] | SharedBuffer) -> array:
+        """
+        Compute segment lengths in parallel.
+        :param segments: Segment buffer.
+        :return: array('d') with one length per segment.
+        """
+        n = kernels.item_count(segments, kernels.SEGMENT_STRIDE)
+        return self._map("segment_lengths", [segments], n, n)
+
+    def arc_lengths(self, arcs: Sequence[float] | SharedBuffer) -> array:
+        """
+        Compute arc lengths in parallel.
+        :param arcs: Arc buffer.
+        :return: array('d') with one length per arc.
+        """
+        n = kernels.item_count(arcs, kernels.ARC_STRIDE)
+        return self._map("arc_lengths", [arcs], n, n)
+
+    def transform_points(self, points: Sequence[float] | SharedBuffer, matrix: Sequence[float]) -> array:
+        """
+        Apply an affine transformation to a point buffer in parallel.
+        Segment and arc buffers can be passed as point buffers.
+        :param points: Point buffer.
+        :param matrix: Six affine coefficients (a, b, c, d, e, f).
+        :return: array('d') with the transformed points.
+        """
+        if len(matrix) != 6:
+            raise ValueError("Affine matrix must have six coefficients.")
+        n = kernels.item_count(points, kernels.POINT_STRIDE)
+        return self._map("transform_points", [points], n, len(points), (tuple(matrix),))
+
+    def line_point_distances(self, segments: Sequence[float] | SharedBuffer,
+                             points: Sequence[float] | SharedBuffer) -> array:
+        """
+        Compute the distance from point i to the line through segment i in parallel.
+        :param segments: Segment buffer.
+        :param points: Point buffer with one point per segment.
+        :return: array('d') with one distance per pair.
+        """
+        n = kernels.item_count(segments, kernels.SEGMENT_STRIDE)
+        if kernels.item_count(points, kernels.POINT_STRIDE) != n:
+            raise ValueError("Segment and point buffers must hold the same number of items.")
+        return self._map("line_point_distances", [segments, points], n, n)
+
+    def segment_intersections(self, segments: Sequence[float] | SharedBuffer) -> list[tuple[int, int, float, float]]:
+        """
+        Find all crossing segment pairs, one vertical strip of the drawing per task.
+        :param segments: Segment buffer.
+        :return: List of (i, j, x, y) with i < j, sorted by (i, j).
+        """
+        n = kernels.item_count(segments, kernels.SEGMENT_STRIDE)
+        strips = max(1, min(2 * self.workers, n // self.min_chunk))
+        view = segments.view if isinstance(segments, SharedBuffer) else segments
+        if strips == 1:
+            return sorted(kernels.segment_intersections(view))
+        min_x = min(min(view[k], view[k + 2]) for k in range(0, len(view), kernels.SEGMENT_STRIDE))
+        max_x = max(max(view[k], view[k + 2]) for k in range(0, len(view), kernels.SEGMENT_STRIDE))
+        cuts = [min_x + (max_x - min_x) * k / strips for k in range(1, strips)]
+        return sorted(self._map_strips(segments, [-float('inf')] + cuts + [float('inf')]))
+
+
+class ParallelExecutor(BatchExecutor):
+    """
+    Run batched kernels on a pool of worker processes.
+    Inputs that are not already SharedBuffers are copied into shared memory once per call.
+    """
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def _map_ranges(self, kernel_name: str, inputs: list, ranges: list, out_size: int, extra: tuple) -> array:
+        shared = [(buffer, False) if isinstance(buffer, SharedBuffer) else (SharedBuffer.from_sequence(buffer), True)
+                  for buffer in inputs]
+        try:
+            with SharedBuffer(out_size) as out:
+                futures = [self._executor().submit(_run_kernel, kernel_name, [buffer.spec for buffer, _ in shared],
+                                                   out.spec, start, stop, extra)
+                           for start, stop in ranges]
+                for future in futures:
+                    future.result()
+                return out.to_array()
+        finally:
+            for buffer, owned in shared:
+                if owned:
+                    buffer.close()
+
+    def _map_strips(self, segments: Sequence[float] | SharedBuffer, bounds: list[float]) -> list:
+        shared = segments if isinstance(segments, SharedBuffer) else SharedBuffer.from_sequence(segments)
+        try:
+            futures = [self._executor().submit(_run_intersections, shared.spec, (bounds[k], bounds[k + 1]))
+                       for k in range(len(bounds) - 1)]
+            found = []
+            for future in futures:
+                found.extend(future.result())
+            return found
+        finally:
+            if shared is not segments:
+                shared.close()
+
+
+class ThreadedExecutor(BatchExecutor):
+    """
+    Run batched kernels on a pool of threads sharing the caller's buffers.
+    Threads write disjoint ranges of one output array, so nothing is copied.
+    The kernels are pure Python: they scale with the number of threads on
+    free-threaded (no-GIL) builds and are serialized by the GIL elsewhere,
+    where ParallelExecutor is the better choice for CPU-bound batches.
+    """
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        return self._pool
+
+    def _map_ranges(self, kernel_name: str, inputs: list, ranges: list, out_size: int, extra: tuple) -> array:
+        views = [buffer.view if isinstance(buffer, SharedBuffer) else buffer for buffer in inputs]
+        out = array('d', bytes(out_size * _ITEMSIZE))
+        kernel = _RANGE_KERNELS[kernel_name]
+        futures = [self._executor().submit(kernel, *views, *extra, out=out, start=start, stop=stop)
+                   for start, stop in ranges]
+        for future in futures:
+            future.result()
+        return out
+
+    def _map_strips(self, segments: Sequence[float] | SharedBuffer, bounds: list[float]) -> list:
+        view = segments.view if isinstance(segments, SharedBuffer) else segments
+        futures = [self._executor().submit(kernels.segment_intersections, view, (bounds[k], bounds[k + 1]))
+                   for k in range(len(bounds) - 1)]
+        found = []
+        for future in futures:
+            found.extend(future.result())
+        return found
@@ -0,0 +1,124 @@
+import random
+import unittest
+from array import array
+
+from .parallel import BatchExecutor, ParallelExecutor, SharedBuffer, ThreadedExecutor
+from kernels import kernels
+
+
+class TestSharedBuffer(unittest.TestCase):
+    def test_round_trip(self):
+        with SharedBuffer.from_sequence([1.0, 2.0, 3.0]) as buffer:
+            self.assertEqual(len(buffer), 3)
+            self.assertEqual(list(buffer.to_array()), [1.0, 2.0, 3.0])
+            attached = SharedBuffer(buffer.size, buffer.name)
+            attached.view[1] = 5.0
+            attached.close()
+            self.assertEqual(buffer.view[1], 5.0)
+
+    def test_empty_buffer(self):
+        with SharedBuffer(0) as buffer:
+            self.assertEqual(len(buffer.to_array()), 0)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            SharedBuffer(-1)
+
+
+class TestParallelExecutor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        rng = random.Random(7)
+        cls.segments = array('d', (rng.uniform(0, 100) for _ in range(4 * 2000)))
+        cls.executor = ParallelExecutor(workers=2, min_chunk=100)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def test_ranges_cover_all_items(self):
+        ranges = self.executor.ranges(1001)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], 1001)
+        self.assertEqual(len(ranges), 2)
+
+    def test_segment_lengths_match_serial(self):
+        self.assertEqual(self.executor.segment_lengths(self.segments), kernels.segment_lengths(self.segments))
+
+    def test_segment_lengths_from_shared_buffer(self):
+        with SharedBuffer.from_sequence(self.segments) as shared:
+            self.assertEqual(self.executor.segment_lengths(shared), kernels.segment_lengths(self.segments))
+
+    def test_transform_points_match_serial(self):
+        matrix = (0.5, -1.0, 3.0, 1.0, 0.5, -2.0)
+        self.assertEqual(self.executor.transform_points(self.segments, matrix),
+                         kernels.transform_points(self.segments, matrix))
+
+    def test_line_point_distances_match_serial(self):
+        points = self.segments[:len(self.segments) // 2]
+        self.assertEqual(self.executor.line_point_distances(self.segments, points),
+                         kernels.line_point_distances(self.segments, points))
+
+    def test_segment_intersections_match_serial(self):
+        segments = self.segments[:4 * 300]
+        executor = ParallelExecutor(workers=2, min_chunk=50)
+        try:
+            self.assertEqual(executor.segment_intersections(segments),
+                             sorted(kernels.segment_intersections(segments)))
+        finally:
+            executor.shutdown()
+
+    def test_small_job_runs_in_process(self):
+        executor = ParallelExecutor(workers=4, min_chunk=10 ** 6)
+        self.assertEqual(list(executor.segment_lengths(array('d', [0, 0, 3, 4]))), [5.0])
+        self.assertIsNone(executor._pool)
+
+    def test_invalid_workers(self):
+        with self.assertRaises(ValueError):
+            ParallelExecutor(workers=0)
+
+
+class TestThreadedExecutor(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(11)
+        self.segments = array('d', (rng.uniform(0, 100) for _ in range(4 * 1000)))
+        self.executor = ThreadedExecutor(workers=4, min_chunk=100)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_segment_lengths_match_serial(self):
+        self.assertEqual(self.executor.segment_lengths(self.segments), kernels.segment_lengths(self.segments))
+
+    def test_arc_lengths_match_serial(self):
+        arcs = self.segments[:6 * 600]
+        self.assertEqual(self.executor.arc_lengths(arcs), kernels.arc_lengths(arcs))
+
+    def test_transform_points_match_serial(self):
+        matrix = (1.0, 0.0, 5.0, 0.0, 1.0, -5.0)
+        self.assertEqual(self.executor.transform_points(self.segments, matrix),
+                         kernels.transform_points(self.segments, matrix))
+
+    def test_segment_intersections_match_serial(self):
+        segments = self.segments[:4 * 200]
+        executor = ThreadedExecutor(workers=3, min_chunk=20)
+        with executor:
+            self.assertEqual(executor.segment_intersections(segments),
+                             sorted(kernels.segment_intersections(segments)))
+
+    def test_incomplete_executor_cannot_be_created(self):
+        class RangesOnly(BatchExecutor):
+            def _executor(self):
+                return None
+
+            def _map_ranges(self, kernel_name, inputs, ranges, out_size, extra):
+                return array('d')
+
+        with self.assertRaises(TypeError):
+            BatchExecutor()
+        with self.assertRaises(TypeError):
+            RangesOnly()
+
+
+if __name__ == "__main__":
+    unittest.main()
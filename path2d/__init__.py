@@ -0,0 +1,2 @@
+from .path2d import Path2D
+__all__ = ['Path2D']
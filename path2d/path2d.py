@@ -0,0 +1,265 @@
+"""
+Composite paths of Line2D and Arc2D pieces.
+
+A Path2D caches the geometry of its pieces in flat arrays together with the
+cumulative length at the start of every piece, so the piece holding a given
+distance along the path is found by bisection in O(log n).  Batched
+evaluation and sampling walk the index forwards and only bisect when a
+distance falls outside the current piece, which makes sorted distances cost
+O(1) each.
+
+Pieces are read when they are added; call refresh() after moving their
+points.  Arcs are followed from their start point to their end point with
+the sweep of Arc2D (from the start angle to the end angle without crossing
+angle zero).
+"""
+from array import array
+from bisect import bisect_right
+from math import atan2, cos, pi, sin, sqrt
+from typing import Iterable, Iterator, Optional, Self, Sequence
+
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D, TOLERANCE_LENGTH
+from chaining.chaining import Chain
+
+# Floats cached per piece: (x, y, ux, uy) for lines, (cx, cy, radius, start angle) for arcs.
+PIECE_STRIDE = 4
+
+
+def _normalized(angle: float) -> float:
+    return angle + 2 * pi if angle < 0 else angle
+
+
+class Path2D:
+    def __init__(self, pieces: Iterable[Line2D | Arc2D] = (), tolerance: int | float = TOLERANCE_LENGTH):
+        """
+        Initialize a path from pieces placed end to start.
+        :param pieces: Iterable of Line2D and Arc2D instances; each one starts where the previous one ends.
+        :param tolerance: Largest gap allowed between consecutive pieces.
+        """
+        if not isinstance(tolerance, (int, float)):
+            raise TypeError("Tolerance must be a numeric value.")
+        if tolerance < 0:
+            raise ValueError("Tolerance cannot be negative.")
+        self.tolerance = tolerance
+        self.pieces = []
+        self._params = array('d')
+        # Direction of travel of each piece: 0 for lines, +1/-1 for counterclockwise/clockwise arcs.
+        self._turns = array('b')
+        self._starts = array('d', [0.0])
+        for piece in pieces:
+            self.append(piece)
+
+    @classmethod
+    def from_chain(cls, chain: Chain, tolerance: int | float = TOLERANCE_LENGTH) -> Self:
+        """
+        Create a path following a Chain.
+        :param chain: A Chain from chain_entities.
+        :param tolerance: Largest gap allowed between consecutive pieces.
+        :return: A new Path2D.
+        """
+        if not isinstance(chain, Chain):
+            raise TypeError("Argument must be a Chain instance.")
+        return cls(chain.entities, tolerance)
+
+    def append(self, piece: Line2D | Arc2D) -> Self:
+        """
+        Add a piece at the end of the path.
+        :param piece: Line2D or Arc2D starting at the current end of the path.
+        :return: The path itself.
+        """
+        if isinstance(piece, Line2D):
+            sp, ep = piece.points
+        elif isinstance(piece, Arc2D):
+            _, sp, ep = piece.points
+        else:
+            raise TypeError("Pieces must be Line2D or Arc2D instances.")
+        if self.pieces:
+            end = self.end
+            if sqrt((sp.x - end.x) ** 2 + (sp.y - end.y) ** 2) > self.tolerance:
+                raise ValueError("Piece %d does not start where the path ends." % len(self.pieces))
+        self.pieces.append(piece)
+        self._starts.append(self._starts[-1] + self._cache(piece))
+        return self
+
+    def _cache(self, piece: Line2D | Arc2D) -> float:
+        if isinstance(piece, Line2D):
+            sp, ep = piece.points
+            dx, dy = ep.x - sp.x, ep.y - sp.y
+            length = sqrt(dx * dx + dy * dy)
+            if length > 0:
+                dx, dy = dx / length, dy / length
+            self._params.extend((sp.x, sp.y, dx, dy))
+            self._turns.append(0)
+            return length
+        cp, sp, ep = piece.points
+        sx, sy = sp.x - cp.x, sp.y - cp.y
+        radius = sqrt(sx * sx + sy * sy)
+        start = _normalized(atan2(sy, sx))
+        sweep = _normalized(atan2(ep.y - cp.y, ep.x - cp.x)) - start
+        self._params.extend((cp.x, cp.y, radius, start))
+        self._turns.append(1 if sweep > 0 else -1)
+        return radius * abs(sweep)
+
+    def refresh(self) -> None:
+        """Re-read the geometry of every piece after their points have been moved."""
+        pieces = self.pieces
+        self.pieces = []
+        self._params = array('d')
+        self._turns = array('b')
+        self._starts = array('d', [0.0])
+        for piece in pieces:
+            self.append(piece)
+
+    @property
+    def start(self) -> Point2D:
+        """Get the start point of the path."""
+        if not self.pieces:
+            raise ValueError("Path is empty.")
+        return self.pieces[0].sp
+
+    @property
+    def end(self) -> Point2D:
+        """Get the end point of the path."""
+        if not self.pieces:
+            raise ValueError("Path is empty.")
+        return self.pieces[-1].ep
+
+    def is_closed(self) -> bool:
+        """Check if the path ends where it starts."""
+        if not self.pieces:
+            return False
+        start, end = self.start, self.end
+        return sqrt((start.x - end.x) ** 2 + (start.y - end.y) ** 2) <= self.tolerance
+
+    def length(self) -> float:
+        """Get the total length of the path."""
+        return self._starts[-1]
+
+    def piece_start(self, index: int) -> float:
+        """
+        Get the distance along the path at which a piece starts.
+        :param index: Piece index.
+        :return: Cumulative length of the preceding pieces.
+        """
+        if not 0 <= index < len(self.pieces):
+            raise IndexError("Piece index %d out of range." % index)
+        return self._starts[index]
+
+    def locate(self, distance: int | float) -> tuple[int, float]:
+        """
+        Find the piece holding a distance along the path.
+        :param distance: Distance from the start of the path (0 <= distance <= length).
+        :return: (piece index, distance from the start of that piece).
+        """
+        if not isinstance(distance, (int, float)):
+            raise TypeError("Distance must be a numeric value.")
+        starts = self._starts
+        if not self.pieces:
+            raise ValueError("Path is empty.")
+        if not -self.tolerance <= distance <= starts[-1] + self.tolerance:
+            raise ValueError("Distance %g is outside the path [0, %g]." % (distance, starts[-1]))
+        index = min(max(bisect_right(starts, distance) - 1, 0), len(self.pieces) - 1)
+        return index, distance - starts[index]
+
+    def _point(self, index: int, local: float) -> tuple[float, float, float, float]:
+        k = index * PIECE_STRIDE
+        params = self._params
+        turn = self._turns[index]
+        if turn == 0:
+            ux, uy = params[k + 2], params[k + 3]
+            return params[k] + ux * local, params[k + 1] + uy * local, ux, uy
+        radius = params[k + 2]
+        angle = params[k + 3] + turn * local / radius
+        c, s = cos(angle), sin(angle)
+        return params[k] + radius * c, params[k + 1] + radius * s, -turn * s, turn * c
+
+    def point_at_length(self, distance: int | float) -> Point2D:
+        """
+        Get the point at a distance along the path.
+        :param distance: Distance from the start of the path (0 <= distance <= length).
+        :return: Point2D on the path.
+        """
+        x, y, _, _ = self._point(*self.locate(distance))
+        return Point2D(x, y)
+
+    def tangent_at_length(self, distance: int | float) -> Point2D:
+        """
+        Get the direction of travel at a distance along the path.
+        At a joint the direction of the piece starting there is returned.
+        :param distance: Distance from the start of the path (0 <= distance <= length).
+        :return: Unit vector as a Point2D ((0, 0) on a zero-length line).
+        """
+        _, _, tx, ty = self._point(*self.locate(distance))
+        return Point2D(tx, ty)
+
+    def evaluate(self, distances: Sequence[float], out: Optional[Sequence[float]] = None,
+                 tangents: Optional[Sequence[float]] = None) -> Sequence[float]:
+        """
+        Evaluate points, and optionally tangents, at many distances along the path.
+        Sorted distances are located in O(1) each.
+        :param distances: Distances from the start of the path.
+        :param out: Point buffer receiving (x, y) per distance (allocated if None).
+        :param tangents: Optional point buffer receiving the unit tangent per distance.
+        :return: The point buffer.
+        """
+        size = 2 * len(distances)
+        if out is None:
+            out = array('d', bytes(8 * size))
+        if len(out) < size or (tangents is not None and len(tangents) < size):
+            raise ValueError("Output buffer is too small.")
+        starts = self._starts
+        index, low, high = -1, 0.0, -1.0
+        point = self._point
+        for i, distance in enumerate(distances):
+            if not low <= distance < high:
+                index, _ = self.locate(distance)
+                low, high = starts[index], starts[index + 1]
+            x, y, tx, ty = point(index, distance - low)
+            out[2 * i], out[2 * i + 1] = x, y
+            if tangents is not None:
+                tangents[2 * i], tangents[2 * i + 1] = tx, ty
+        return out
+
+    def sample(self, step: int | float, start: int | float = 0.0,
+               stop: Optional[int | float] = None) -> Iterator[tuple[float, float, float, float, float]]:
+        """
+        Stream evenly spaced samples along the path without building a list.
+        The last sample is at stop even when it is closer than step to the previous one.
+        :param step: Distance between samples.
+        :param start: Distance of the first sample.
+        :param stop: Distance of the last sample (the path length if None).
+        :return: Iterator of (distance, x, y, tx, ty) tuples, (tx, ty) being the unit tangent.
+        """
+        if not isinstance(step, (int, float)):
+            raise TypeError("Step must be a numeric value.")
+        if step <= 0:
+            raise ValueError("Step must be positive.")
+        stop = self.length() if stop is None else stop
+        if stop < start:
+            raise ValueError("Stop cannot be smaller than start.")
+        index, local = self.locate(start)
+        self.locate(stop)
+        starts = self._starts
+        last = len(self.pieces) - 1
+        count = int((stop - start) / step)
+        if start + count * step < stop - TOLERANCE_LENGTH:
+            count += 1
+        for n in range(count + 1):
+            distance = stop if n == count else start + n * step
+            while index < last and distance >= starts[index + 1]:
+                index += 1
+            yield (distance,) + self._point(index, distance - starts[index])
+
+    def __len__(self) -> int:
+        return len(self.pieces)
+
+    def __iter__(self) -> Iterator[Line2D | Arc2D]:
+        return iter(self.pieces)
+
+    def __getitem__(self, index: int) -> Line2D | Arc2D:
+        return self.pieces[index]
+
+    def __repr__(self) -> str:
+        return "Path2D(%d pieces, length=%g)" % (len(self.pieces), self.length())
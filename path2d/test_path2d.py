@@ -0,0 +1,106 @@
+import unittest
+from array import array
+from math import pi, sqrt
+
+from .path2d import Path2D
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+from chaining.chaining import chain_entities
+
+
+class TestPath2D(unittest.TestCase):
+    def setUp(self):
+        # Line along x, clockwise quarter arc turning down, line along -y.
+        self.pieces = [Line2D(0, 0, 10, 0),
+                       Arc2D(Point2D(10, -1), Point2D(10, 0), Point2D(11, -1)),
+                       Line2D(11, -1, 11, -5)]
+        self.path = Path2D(self.pieces)
+
+    def assertPoint(self, point, x, y):
+        self.assertAlmostEqual(point.x, x)
+        self.assertAlmostEqual(point.y, y)
+
+    def test_length_matches_pieces(self):
+        expected = 10 + self.pieces[1].arc_length() + 4
+        self.assertAlmostEqual(self.path.length(), expected)
+        self.assertAlmostEqual(self.path.piece_start(2), 10 + pi / 2)
+        self.assertEqual(len(self.path), 3)
+        self.assertIs(self.path[1], self.pieces[1])
+
+    def test_point_and_tangent_at_length(self):
+        self.assertPoint(self.path.point_at_length(5), 5, 0)
+        self.assertPoint(self.path.tangent_at_length(5), 1, 0)
+        quarter = 10 + pi / 4
+        self.assertPoint(self.path.point_at_length(quarter), 10 + sqrt(0.5), -1 + sqrt(0.5))
+        self.assertPoint(self.path.tangent_at_length(quarter), sqrt(0.5), -sqrt(0.5))
+        self.assertPoint(self.path.point_at_length(self.path.length()), 11, -5)
+        self.assertPoint(self.path.tangent_at_length(10), 1, 0)
+
+    def test_counterclockwise_arc(self):
+        path = Path2D([Arc2D(Point2D(0, 0), Point2D(1, 0), Point2D(0, 1))])
+        self.assertAlmostEqual(path.length(), pi / 2)
+        self.assertPoint(path.point_at_length(pi / 4), sqrt(0.5), sqrt(0.5))
+        self.assertPoint(path.tangent_at_length(0), 0, 1)
+        self.assertPoint(path.tangent_at_length(pi / 2), -1, 0)
+
+    def test_locate_uses_piece_boundaries(self):
+        self.assertEqual(self.path.locate(0), (0, 0))
+        index, local = self.path.locate(10 + pi / 2 + 1)
+        self.assertEqual(index, 2)
+        self.assertAlmostEqual(local, 1)
+        with self.assertRaises(ValueError):
+            self.path.locate(-1)
+        with self.assertRaises(ValueError):
+            self.path.locate(self.path.length() + 1)
+        with self.assertRaises(TypeError):
+            self.path.locate("1")
+
+    def test_evaluate_matches_point_at_length(self):
+        distances = [0, 3, 10.5, 11, 14, 2, self.path.length()]
+        tangents = array('d', bytes(16 * len(distances)))
+        points = self.path.evaluate(distances, tangents=tangents)
+        for i, distance in enumerate(distances):
+            point = self.path.point_at_length(distance)
+            self.assertAlmostEqual(points[2 * i], point.x)
+            self.assertAlmostEqual(points[2 * i + 1], point.y)
+            tangent = self.path.tangent_at_length(distance)
+            self.assertAlmostEqual(tangents[2 * i], tangent.x)
+            self.assertAlmostEqual(tangents[2 * i + 1], tangent.y)
+        with self.assertRaises(ValueError):
+            self.path.evaluate(distances, array('d', [0.0]))
+
+    def test_sample_streams_even_spacing(self):
+        samples = list(self.path.sample(1.0))
+        self.assertEqual(len(samples), 17)
+        self.assertEqual([s[0] for s in samples[:3]], [0.0, 1.0, 2.0])
+        self.assertAlmostEqual(samples[-1][0], self.path.length())
+        for distance, x, y, tx, ty in samples:
+            self.assertPoint(self.path.point_at_length(distance), x, y)
+            self.assertAlmostEqual(tx * tx + ty * ty, 1)
+        self.assertEqual([s[0] for s in self.path.sample(2, 1, 5)], [1, 3, 5])
+        with self.assertRaises(ValueError):
+            next(self.path.sample(0))
+
+    def test_rejects_gaps_and_bad_pieces(self):
+        with self.assertRaises(ValueError):
+            Path2D([Line2D(0, 0, 1, 0), Line2D(2, 0, 3, 0)])
+        with self.assertRaises(TypeError):
+            Path2D([Point2D(0, 0)])
+        with self.assertRaises(ValueError):
+            Path2D().point_at_length(0)
+
+    def test_refresh_and_from_chain(self):
+        chains = chain_entities([Line2D(1, 0, 1, 1), Line2D(0, 0, 1, 0)])
+        path = Path2D.from_chain(chains[0])
+        self.assertAlmostEqual(path.length(), 2)
+        self.assertFalse(path.is_closed())
+        line = Line2D(0, 0, 1, 0)
+        path = Path2D([line])
+        line.ep.x = 3
+        path.refresh()
+        self.assertAlmostEqual(path.length(), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
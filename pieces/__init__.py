@@ -0,0 +1,4 @@
+from .pieces import (LINE, ARC, line_record, record, arc_parameter, point_at, tangents, bounds, intersections, emit,
+                     crossers, inside)
+__all__ = ['LINE', 'ARC', 'line_record', 'record', 'arc_parameter', 'point_at', 'tangents', 'bounds', 'intersections',
+           'emit', 'crossers', 'inside']
@@ -0,0 +1,278 @@
+"""
+Piece records: lines and arcs as flat lists for the path algorithms.
+
+Offsetting, boolean operations and hatching split, trim, reverse and
+intersect many pieces, which is cheaper on plain lists than on Line2D and
+Arc2D instances.  A piece record is a list
+
+    [kind, sx, sy, ex, ey, cx, cy, radius, start angle, sweep]
+
+where kind is LINE or ARC, the sweep is signed (positive counterclockwise)
+and the center fields are unused for lines.  Records are converted from
+Line2D and Arc2D with record() and back with emit().
+
+For inside tests, crossers() cuts rings of records into y-monotone parts
+(lines, and arcs split at their top and bottom points) that inside() and
+scanline algorithms intersect with horizontal lines.
+"""
+from math import atan2, cos, hypot, inf, nextafter, pi, sin, sqrt
+from typing import Optional
+
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+
+LINE = 0
+ARC = 1
+TWO_PI = 2 * pi
+_ANGLE_EPSILON = 1e-12
+# Arc ends closer than this to angle zero are treated as lying on it.
+_ZERO_ANGLE = 1e-9
+
+
+def line_record(sx: float, sy: float, ex: float, ey: float) -> list:
+    """
+    Build the record of a line.
+    :param sx: X-coordinate of the start point.
+    :param sy: Y-coordinate of the start point.
+    :param ex: X-coordinate of the end point.
+    :param ey: Y-coordinate of the end point.
+    :return: Piece record.
+    """
+    return [LINE, sx, sy, ex, ey, 0.0, 0.0, 0.0, 0.0, 0.0]
+
+
+def record(piece: Line2D | Arc2D) -> list:
+    """
+    Convert a line or an arc to a piece record.
+    :param piece: Line2D or Arc2D.
+    :return: Piece record; arcs sweep from their start to their end angle without crossing angle zero.
+    """
+    if isinstance(piece, Line2D):
+        sp, ep = piece.points
+        return line_record(sp.x, sp.y, ep.x, ep.y)
+    if isinstance(piece, Arc2D):
+        cp, sp, ep = piece.points
+        start = atan2(sp.y - cp.y, sp.x - cp.x) % TWO_PI
+        end = atan2(ep.y - cp.y, ep.x - cp.x) % TWO_PI
+        return [ARC, sp.x, sp.y, ep.x, ep.y, cp.x, cp.y, hypot(sp.x - cp.x, sp.y - cp.y), start, end - start]
+    raise TypeError("Pieces must be Line2D or Arc2D instances.")
+
+
+def arc_parameter(piece: list, angle: float) -> Optional[float]:
+    """
+    Locate a direction from the center along the sweep of an arc.
+    :param piece: Arc record.
+    :param angle: Direction in radians.
+    :return: Fraction of the sweep in [0, 1], or None when the arc does not reach the direction.
+    """
+    sweep = piece[9]
+    if sweep == 0:
+        return None
+    delta = (angle - piece[8]) % TWO_PI if sweep > 0 else (piece[8] - angle) % TWO_PI
+    if delta > TWO_PI - _ANGLE_EPSILON:
+        delta -= TWO_PI
+    u = delta / abs(sweep)
+    return u if -_ANGLE_EPSILON <= u <= 1 + _ANGLE_EPSILON else None
+
+
+def point_at(piece: list, t: float) -> tuple[float, float]:
+    """
+    Evaluate a piece.
+    :param piece: Piece record.
+    :param t: Parameter, 0 at the start and 1 at the end.
+    :return: The point as (x, y).
+    """
+    if piece[0] == LINE:
+        return piece[1] + t * (piece[3] - piece[1]), piece[2] + t * (piece[4] - piece[2])
+    angle = piece[8] + t * piece[9]
+    return piece[5] + piece[7] * cos(angle), piece[6] + piece[7] * sin(angle)
+
+
+def tangents(piece: list) -> tuple[float, float, float, float]:
+    """
+    Directions of travel along a piece.
+    :param piece: Piece record.
+    :return: Unit directions at the start and at the end as (x, y, x, y).
+    """
+    if piece[0] == LINE:
+        dx, dy = piece[3] - piece[1], piece[4] - piece[2]
+        length = hypot(dx, dy) or 1.0
+        return dx / length, dy / length, dx / length, dy / length
+    turn = 1.0 if piece[9] > 0 else -1.0
+    start, end = piece[8], piece[8] + piece[9]
+    return -turn * sin(start), turn * cos(start), -turn * sin(end), turn * cos(end)
+
+
+def bounds(piece: list) -> tuple[float, float, float, float]:
+    """
+    Bounding box of a piece, including the extreme points of arcs.
+    :param piece: Piece record.
+    :return: (min x, min y, max x, max y).
+    """
+    low_x, high_x = min(piece[1], piece[3]), max(piece[1], piece[3])
+    low_y, high_y = min(piece[2], piece[4]), max(piece[2], piece[4])
+    if piece[0] == ARC:
+        cx, cy, radius = piece[5], piece[6], piece[7]
+        for quarter in range(4):
+            if arc_parameter(piece, quarter * pi / 2) is not None:
+                x, y = cx + radius * cos(quarter * pi / 2), cy + radius * sin(quarter * pi / 2)
+                low_x, high_x = min(low_x, x), max(high_x, x)
+                low_y, high_y = min(low_y, y), max(high_y, y)
+    return low_x, low_y, high_x, high_y
+
+
+def intersections(a: list, b: list) -> list[tuple[float, float, float, float]]:
+    """
+    Intersect two pieces; overlapping collinear lines and concentric arcs report no intersection.
+    :param a: Piece record.
+    :param b: Piece record.
+    :return: Intersections as (parameter on a, parameter on b, x, y).
+    """
+    if a[0] == ARC and b[0] == LINE:
+        return [(t, u, x, y) for u, t, x, y in intersections(b, a)]
+    found = []
+    if a[0] == LINE and b[0] == LINE:
+        rx, ry, sx, sy = a[3] - a[1], a[4] - a[2], b[3] - b[1], b[4] - b[2]
+        den = rx * sy - ry * sx
+        if den == 0:
+            return found
+        qx, qy = b[1] - a[1], b[2] - a[2]
+        t, u = (qx * sy - qy * sx) / den, (qx * ry - qy * rx) / den
+        if -_ANGLE_EPSILON <= t <= 1 + _ANGLE_EPSILON and -_ANGLE_EPSILON <= u <= 1 + _ANGLE_EPSILON:
+            found.append((t, u, a[1] + t * rx, a[2] + t * ry))
+        return found
+    if a[0] == LINE:
+        dx, dy = a[3] - a[1], a[4] - a[2]
+        fx, fy = a[1] - b[5], a[2] - b[6]
+        qa = dx * dx + dy * dy
+        if qa == 0:
+            return found
+        qb = 2 * (fx * dx + fy * dy)
+        qc = fx * fx + fy * fy - b[7] * b[7]
+        disc = qb * qb - 4 * qa * qc
+        if disc < 0:
+            # Tangent lines come out slightly negative.
+            if disc < -1e-12 * qb * qb:
+                return found
+            disc = 0.0
+        root = sqrt(disc)
+        for t in {(-qb - root) / (2 * qa), (-qb + root) / (2 * qa)}:
+            if -_ANGLE_EPSILON <= t <= 1 + _ANGLE_EPSILON:
+                x, y = a[1] + t * dx, a[2] + t * dy
+                u = arc_parameter(b, atan2(y - b[6], x - b[5]))
+                if u is not None:
+                    found.append((t, u, x, y))
+        return found
+    dx, dy = b[5] - a[5], b[6] - a[6]
+    d = hypot(dx, dy)
+    r1, r2 = a[7], b[7]
+    if d == 0 or d > r1 + r2 or d < abs(r1 - r2):
+        return found
+    along = (r1 * r1 - r2 * r2 + d * d) / (2 * d)
+    h = sqrt(max(r1 * r1 - along * along, 0.0))
+    mx, my = a[5] + along * dx / d, a[6] + along * dy / d
+    for x, y in {(mx - h * dy / d, my + h * dx / d), (mx + h * dy / d, my - h * dx / d)}:
+        t = arc_parameter(a, atan2(y - a[6], x - a[5]))
+        u = arc_parameter(b, atan2(y - b[6], x - b[5]))
+        if t is not None and u is not None:
+            found.append((t, u, x, y))
+    return found
+
+
+def _on_zero(point: Point2D, cx: float, cy: float, below: bool) -> Point2D:
+    # Place a point lying on angle zero of a center so that Arc2D reads it as 0 or, when below, as 2 * pi.
+    # The shifted copy is not shared, as the neighbouring piece may need to read the same point as 0.
+    if below:
+        # The step must stay visible in the angle even when cy is zero.
+        return Point2D(point.x, cy - max(cy - nextafter(cy, -inf), abs(point.x - cx) * 1e-300))
+    point.y = cy
+    return point
+
+
+def emit(piece: list, start: Point2D, end: Point2D) -> list[Line2D | Arc2D]:
+    """
+    Convert a piece record back to Line2D and Arc2D.
+    Arcs crossing angle zero are split there, and arc ends on angle zero are nudged by one unit in the last
+    place so that Arc2D reads their direction correctly.
+    :param piece: Piece record.
+    :param start: Start point, shared with the previous piece.
+    :param end: End point, shared with the next piece.
+    :return: The line, or one or two arcs.
+    """
+    if piece[0] == LINE:
+        return [Line2D(start, end)]
+    cx, cy, radius, sweep = piece[5], piece[6], piece[7], piece[9]
+    ccw = sweep > 0
+    first = piece[8] % TWO_PI
+    if ccw and first > TWO_PI - _ZERO_ANGLE:
+        first -= TWO_PI
+    elif not ccw and first < _ZERO_ANGLE:
+        first += TWO_PI
+    last = first + sweep
+    if abs(first) < _ZERO_ANGLE or abs(first - TWO_PI) < _ZERO_ANGLE:
+        start = _on_zero(start, cx, cy, not ccw)
+    if abs(last) < _ZERO_ANGLE or abs(last - TWO_PI) < _ZERO_ANGLE:
+        end = _on_zero(end, cx, cy, ccw)
+    elif last < 0 or last > TWO_PI:
+        # Split where the sweep crosses angle zero.
+        zero = Point2D(cx + radius, cy)
+        arrive, leave = _on_zero(zero, cx, cy, ccw), _on_zero(zero, cx, cy, not ccw)
+        return [Arc2D(Point2D(cx, cy), start, arrive), Arc2D(Point2D(cx, cy), leave, end)]
+    return [Arc2D(Point2D(cx, cy), start, end)]
+
+
+def crossers(rings: list[list]) -> list[tuple]:
+    """
+    Cut rings into y-monotone parts for crossing counts.
+    :param rings: Rings of piece records.
+    :return: (y0, y1, x0, x1) for lines and (y0, y1, cx, cy, radius, side) for arcs, where side is 1 or -1
+             for the right or left half of the circle.
+    """
+    parts = []
+    for ring in rings:
+        for piece in ring:
+            if piece[0] == LINE:
+                if piece[2] != piece[4]:
+                    parts.append((piece[2], piece[4], piece[1], piece[3]))
+                continue
+            cx, cy, radius = piece[5], piece[6], piece[7]
+            cuts = [0.0, 1.0]
+            for extreme in (0.5, 1.5, 2.5, 3.5):
+                u = arc_parameter(piece, extreme * pi)
+                if u is not None and 0 < u < 1:
+                    cuts.append(u)
+            cuts.sort()
+            for u0, u1 in zip(cuts, cuts[1:]):
+                _, y0 = point_at(piece, u0)
+                _, y1 = point_at(piece, u1)
+                if u0 == 0:
+                    y0 = piece[2]
+                if u1 == 1:
+                    y1 = piece[4]
+                if y0 != y1:
+                    mx, _ = point_at(piece, (u0 + u1) / 2)
+                    parts.append((y0, y1, cx, cy, radius, 1.0 if mx > cx else -1.0))
+    return parts
+
+
+def inside(parts: list[tuple], px: float, py: float) -> bool:
+    """
+    Check if a point is inside by the parity of the crossings of the ray going right from it.
+    :param parts: Y-monotone parts from crossers().
+    :param px: X-coordinate.
+    :param py: Y-coordinate.
+    :return: True if the ray crosses the boundary an odd number of times.
+    """
+    odd = False
+    for crosser in parts:
+        y0, y1 = crosser[0], crosser[1]
+        if (y0 > py) != (y1 > py):
+            if len(crosser) == 4:
+                x = crosser[2] + (py - y0) * (crosser[3] - crosser[2]) / (y1 - y0)
+            else:
+                dy = py - crosser[3]
+                x = crosser[2] + crosser[5] * sqrt(max(crosser[4] * crosser[4] - dy * dy, 0.0))
+            if x > px:
+                odd = not odd
+    return odd
@@ -0,0 +1,67 @@
+import unittest
+from math import pi
+
+from .pieces import (LINE, ARC, line_record, record, arc_parameter, point_at, tangents, bounds, intersections, emit,
+                     crossers, inside)
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+
+
+class TestPieces(unittest.TestCase):
+    def setUp(self):
+        # Upper half of the unit circle, counterclockwise from (1, 0) to (-1, 0).
+        self.arc = record(Arc2D(Point2D(0, 0), Point2D(1, 0), Point2D(-1, 0)))
+
+    def test_records(self):
+        line = record(Line2D(1, 2, 3, 4))
+        self.assertEqual(line, [LINE, 1, 2, 3, 4, 0.0, 0.0, 0.0, 0.0, 0.0])
+        self.assertEqual(line, line_record(1, 2, 3, 4))
+        self.assertEqual(self.arc[0], ARC)
+        self.assertAlmostEqual(self.arc[7], 1)
+        self.assertAlmostEqual(self.arc[9], pi)
+        with self.assertRaises(TypeError):
+            record(Point2D(0, 0))
+
+    def test_evaluation(self):
+        self.assertAlmostEqual(arc_parameter(self.arc, pi / 2), 0.5)
+        self.assertIsNone(arc_parameter(self.arc, 3 * pi / 2))
+        x, y = point_at(self.arc, 0.5)
+        self.assertAlmostEqual(x, 0)
+        self.assertAlmostEqual(y, 1)
+        self.assertEqual(point_at(line_record(0, 0, 2, 4), 0.25), (0.5, 1))
+        for value, target in zip(tangents(self.arc), (0, 1, 0, -1)):
+            self.assertAlmostEqual(value, target)
+        for value, target in zip(bounds(self.arc), (-1, 0, 1, 1)):
+            self.assertAlmostEqual(value, target)
+
+    def test_intersections(self):
+        found = intersections(line_record(-2, 0.5, 2, 0.5), self.arc)
+        self.assertEqual(len(found), 2)
+        for t, u, x, y in found:
+            self.assertAlmostEqual(y, 0.5)
+            self.assertAlmostEqual(point_at(self.arc, u)[0], x)
+            self.assertAlmostEqual(-2 + 4 * t, x)
+        self.assertEqual(intersections(line_record(0, 0, 1, 1), line_record(2, 2, 3, 3)), [])
+
+    def test_emit(self):
+        # A full circle crosses angle zero and comes back as two arcs.
+        circle = [ARC, 1, 0, 1, 0, 0, 0, 1, pi, 2 * pi]
+        arcs = emit(circle, Point2D(-1, 0), Point2D(-1, 0))
+        self.assertEqual(len(arcs), 2)
+        self.assertAlmostEqual(sum(abs(record(arc)[9]) for arc in arcs), 2 * pi)
+        self.assertEqual(emit(line_record(0, 0, 1, 1), Point2D(0, 0), Point2D(1, 1)), [Line2D(0, 0, 1, 1)])
+
+    def test_crossing_counts(self):
+        half_disc = [self.arc, line_record(-1, 0, 1, 0)]
+        parts = crossers([half_disc])
+        # The arc is cut at its top; the horizontal line is left out.
+        self.assertEqual(len(parts), 2)
+        self.assertTrue(inside(parts, 0, 0.5))
+        self.assertTrue(inside(parts, 0.5, 0.1))
+        self.assertFalse(inside(parts, 0, 1.5))
+        self.assertFalse(inside(parts, 0.9, 0.9))
+
+
+if __name__ == '__main__':
+    unittest.main()
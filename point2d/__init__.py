@@ -1,2 +1,2 @@
-from .point2d import Point2D
-__all__ = ['Point2D']
+from .point2d import Point2D, IdAllocator
+__all__ = ['Point2D', 'IdAllocator']
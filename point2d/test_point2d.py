@@ -70,6 +70,30 @@ class TestPoint2D(unittest.TestCase):
         self.assertIsInstance(p1.get_id, int)
         self.assertIsInstance(p2.get_id, int)
 
+    def test_id_uniqueness_across_threads(self):
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            batches = list(pool.map(lambda _: [Point2D().get_id for _ in range(2000)], range(8)))
+        ids = [point_id for batch in batches for point_id in batch]
+        self.assertEqual(len(ids), len(set(ids)))
+
+    def test_id_tracking_can_be_disabled(self):
+        Point2D.set_id_tracking(False)
+        try:
+            self.assertIsNone(Point2D(1, 2).get_id)
+        finally:
+            Point2D.set_id_tracking(True)
+        self.assertIsInstance(Point2D(1, 2).get_id, int)
+        with self.assertRaises(TypeError):
+            Point2D.set_id_tracking(1)
+
+    def test_id_allocator_blocks(self):
+        from point2d.point2d import IdAllocator
+        allocator = IdAllocator(block_size=2)
+        self.assertEqual([allocator.next_id() for _ in range(5)], [0, 1, 2, 3, 4])
+        with self.assertRaises(ValueError):
+            IdAllocator(block_size=0)
+
     def test_x_setter_type_error(self):
         p = Point2D()
         with self.assertRaises(TypeError):
@@ -402,6 +426,11 @@ class TestPoint2D(unittest.TestCase):
         self.assertEqual(p_deep1.x, 1)
         self.assertEqual(p_deep1.y, 2)
 
+    def test_sizeof_includes_attributes(self):
+        import sys
+        p = Point2D(1.5, 2.5)
+        self.assertGreater(sys.getsizeof(p), object.__sizeof__(p) + sys.getsizeof(1.5) * 2)
+
     def test_angle_to_rad_and_deg(self):
 
         p1 = Point2D(0, 0)
@@ -0,0 +1,2 @@
+from .polygon2d import Polygon2D, INSIDE, OUTSIDE, BOUNDARY
+__all__ = ['Polygon2D', 'INSIDE', 'OUTSIDE', 'BOUNDARY']
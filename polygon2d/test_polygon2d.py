@@ -0,0 +1,111 @@
+import random
+import unittest
+from array import array
+from math import cos, pi, sin
+
+from .polygon2d import Polygon2D, INSIDE, OUTSIDE, BOUNDARY
+from point2d.point2d import Point2D
+
+
+def _points(*coords):
+    return [Point2D(coords[k], coords[k + 1]) for k in range(0, len(coords), 2)]
+
+
+def _ray_cast(rings, x, y):
+    inside = False
+    for ring in rings:
+        for k in range(len(ring)):
+            a, b = ring[k], ring[(k + 1) % len(ring)]
+            if (a.y > y) != (b.y > y) and x < a.x + (y - a.y) * (b.x - a.x) / (b.y - a.y):
+                inside = not inside
+    return inside
+
+
+class TestPolygon2D(unittest.TestCase):
+    def setUp(self):
+        self.square = Polygon2D(_points(0, 0, 10, 0, 10, 10, 0, 10), [_points(4, 4, 4, 6, 6, 6, 6, 4)])
+
+    def test_layout_and_area(self):
+        self.assertEqual(self.square.ring_count, 2)
+        self.assertEqual(self.square.vertex_count, 8)
+        self.assertEqual(list(self.square.offsets), [0, 4, 8])
+        self.assertAlmostEqual(self.square.area(), 96)
+        self.assertEqual(self.square.bounding_box(), (0, 0, 10, 10))
+        self.assertEqual(self.square.ring(1)[2], Point2D(6, 6))
+
+    def test_closing_vertex_is_optional(self):
+        polygon = Polygon2D(_points(0, 0, 1, 0, 0, 1, 0, 0))
+        self.assertEqual(polygon.vertex_count, 3)
+
+    def test_classify_square_with_hole(self):
+        self.assertEqual(self.square.classify(2, 2), INSIDE)
+        self.assertEqual(self.square.classify(5, 5), OUTSIDE)
+        self.assertEqual(self.square.classify(11, 5), OUTSIDE)
+        self.assertEqual(self.square.classify(5, -1), OUTSIDE)
+        self.assertEqual(self.square.classify(2, 4), INSIDE)
+        for x, y in ((0, 0), (10, 5), (5, 10), (4, 5), (5, 4), (6, 6), (3, 0)):
+            self.assertEqual(self.square.classify(x, y), BOUNDARY, (x, y))
+
+    def test_contains(self):
+        self.assertTrue(self.square.contains(Point2D(1, 1)))
+        self.assertTrue(self.square.contains(Point2D(0, 5)))
+        self.assertFalse(self.square.contains(Point2D(5, 5)))
+        with self.assertRaises(TypeError):
+            self.square.contains((1, 1))
+
+    def test_sloped_edges_and_vertex_rows(self):
+        diamond = Polygon2D(_points(0, -2, 2, 0, 0, 2, -2, 0))
+        self.assertEqual(diamond.classify(0, 0), INSIDE)
+        self.assertEqual(diamond.classify(1, 1), BOUNDARY)
+        self.assertEqual(diamond.classify(-3, 0), OUTSIDE)
+        self.assertEqual(diamond.classify(3, 0), OUTSIDE)
+        self.assertEqual(diamond.classify(1.5, 0), INSIDE)
+        self.assertEqual(diamond.classify(0, 2.5), OUTSIDE)
+
+    def test_batched_matches_ray_casting(self):
+        random.seed(7)
+        star = [Point2D((10 if k % 2 else 4) * cos(k * pi / 8), (10 if k % 2 else 4) * sin(k * pi / 8)) for k in range(16)]
+        hole = _points(-1, -1, 1, -1, 1, 1, -1, 1)
+        polygon = Polygon2D(star, [hole])
+        points = array('d', (random.uniform(-11, 11) for _ in range(4000)))
+        codes = polygon.classify_points(points)
+        for i in range(len(points) // 2):
+            x, y = points[2 * i], points[2 * i + 1]
+            self.assertEqual(codes[i], INSIDE if _ray_cast([star, hole], x, y) else OUTSIDE)
+            self.assertEqual(codes[i], polygon.classify(x, y))
+
+    def test_comb_uses_interval_tree(self):
+        # Every tooth spans the slabs of all the other vertices: the slab index would be quadratic.
+        coords = [0, 0, 2399, 0]
+        for k in reversed(range(1200)):
+            coords += [2 * k + 1, 10 + k * 1e-3, 2 * k, 10 + k * 1e-3]
+            if k:
+                coords += [2 * k, 1 + k * 1e-3, 2 * k - 1, 1 + k * 1e-3]
+        ring = _points(*coords)
+        comb = Polygon2D(ring)
+        self.assertIsNotNone(comb._tree)
+        random.seed(3)
+        for _ in range(300):
+            x, y = random.uniform(-1, 2401), random.uniform(-1, 12)
+            self.assertEqual(comb.classify(x, y), INSIDE if _ray_cast([ring], x, y) else OUTSIDE)
+        self.assertEqual(comb.classify(0, 5), BOUNDARY)
+        self.assertEqual(comb.classify(0.5, 10), BOUNDARY)
+        self.assertEqual(comb.classify(1.5, 1.001), BOUNDARY)
+        self.assertEqual(comb.classify(1.5, 0.5), INSIDE)
+        self.assertEqual(comb.classify(1.5, 5), OUTSIDE)
+        self.assertIsNone(self.square._tree)
+
+    def test_classify_points_range_and_errors(self):
+        out = array('b', [-1] * 3)
+        self.square.classify_points([2, 2, 5, 5, 0, 0], out, 1, 3)
+        self.assertEqual(list(out), [-1, OUTSIDE, BOUNDARY])
+        with self.assertRaises(ValueError):
+            self.square.classify_points([1, 2, 3])
+        with self.assertRaises(ValueError):
+            Polygon2D(_points(0, 0, 1, 1))
+        with self.assertRaises(TypeError):
+            Polygon2D([(0, 0), (1, 0), (0, 1)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,2 @@
+from .profiling import Profiler, active_profiler, enable_from_environment, geometry_classes
+__all__ = ['Profiler', 'active_profiler', 'enable_from_environment', 'geometry_classes']
@@ -0,0 +1,3 @@
+from .profiling import main
+
+raise SystemExit(main())
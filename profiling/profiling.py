@@ -0,0 +1,293 @@
+"""
+Opt-in instrumentation of the geometry classes.
+
+A Profiler wraps every method of Point2D, Line2D and Arc2D while it is
+enabled and restores the original methods when disabled, so nothing is
+measured and nothing is paid when profiling is off.  For each method it
+records call counts, cumulative and self time, and the number of geometry
+objects constructed directly inside the method; constructions are also
+totalled per class.
+
+    with Profiler() as profiler:
+        run_job()
+    print(profiler.to_json())
+    open("job.folded", "w").write(profiler.collapsed_stacks())
+
+A whole program can be profiled without changing it:
+
+    PYVECALGEBRA_PROFILE=job.folded python -m profiling job.py [args]
+    python -m profiling --output job.json -m package.module [args]
+
+enables a process-wide profiler and writes its report at exit to the given
+path (collapsed stacks for *.folded or *.txt, JSON otherwise), or as a
+table on stderr when no path is given or the value is 1/true/yes.  A
+program can also call enable_from_environment() itself once its imports
+are done.  The geometry classes are imported when a profiler is enabled,
+not when this module is, so profiling can never be activated halfway
+through the import of one of them.
+"""
+import argparse
+import atexit
+import functools
+import json
+import os
+import runpy
+import sys
+import threading
+from time import perf_counter
+from typing import Optional, Self
+
+ENV_VAR = "PYVECALGEBRA_PROFILE"
+
+_active_lock = threading.Lock()
+_active = None
+
+
+class Profiler:
+    def __init__(self, classes: Optional[tuple] = None, include_properties: bool = False):
+        """
+        Initialize a profiler for geometry classes.
+        :param classes: Classes to instrument (Point2D, Line2D and Arc2D by default).
+        :param include_properties: Also instrument property getters and setters (such as Point2D.x),
+                                   which is precise but slows hot paths considerably.
+        """
+        self.classes = tuple(classes) if classes is not None else None
+        self.include_properties = include_properties
+        self._originals = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    @property
+    def enabled(self) -> bool:
+        """Check if the profiler is currently instrumenting its classes."""
+        return bool(self._originals)
+
+    def reset(self) -> None:
+        """Discard all recorded measurements."""
+        with self._lock:
+            self._methods = {}
+            self._allocations = {}
+            self._stacks = {}
+
+    def _record(self, label: str, stack: list, elapsed: float, self_time: float) -> None:
+        with self._lock:
+            entry = self._methods.get(label)
+            if entry is None:
+                entry = self._methods[label] = {"calls": 0, "total_time": 0.0, "self_time": 0.0, "allocated": 0}
+            entry["calls"] += 1
+            entry["total_time"] += elapsed
+            entry["self_time"] += self_time
+            path = ";".join([frame[0] for frame in stack] + [label])
+            self._stacks[path] = self._stacks.get(path, 0.0) + self_time
+
+    def _allocated(self, cls_name: str, stack: list) -> None:
+        with self._lock:
+            self._allocations[cls_name] = self._allocations.get(cls_name, 0) + 1
+            if stack:
+                caller = self._methods.setdefault(stack[-1][0], {"calls": 0, "total_time": 0.0,
+                                                                 "self_time": 0.0, "allocated": 0})
+                caller["allocated"] += 1
+
+    def _wrap(self, cls_name: str, name: str, func):
+        label = "%s.%s" % (cls_name, name)
+        local = self._local
+        profiler = self
+        allocates = name == "__init__"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            stack = getattr(local, "stack", None)
+            if stack is None:
+                stack = local.stack = []
+            if allocates:
+                profiler._allocated(cls_name, stack)
+            frame = [label, 0.0]
+            stack.append(frame)
+            start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                stack.pop()
+                if stack:
+                    stack[-1][1] += elapsed
+                profiler._record(label, stack, elapsed, elapsed - frame[1])
+        return wrapper
+
+    def enable(self) -> None:
+        """Instrument the classes; only one profiler can be enabled at a time."""
+        global _active
+        with _active_lock:
+            if _active is self:
+                return
+            if _active is not None:
+                raise RuntimeError("Another Profiler is already enabled.")
+            _active = self
+        if self.classes is None:
+            self.classes = geometry_classes()
+        for cls in self.classes:
+            for name, attribute in list(vars(cls).items()):
+                if isinstance(attribute, (classmethod, staticmethod)):
+                    wrapped = type(attribute)(self._wrap(cls.__name__, name, attribute.__func__))
+                elif isinstance(attribute, property):
+                    if not self.include_properties:
+                        continue
+                    wrapped = property(
+                        self._wrap(cls.__name__, name, attribute.fget) if attribute.fget else None,
+                        self._wrap(cls.__name__, name + ".setter", attribute.fset) if attribute.fset else None,
+                        attribute.fdel, attribute.__doc__)
+                elif callable(attribute) and hasattr(attribute, "__code__"):
+                    wrapped = self._wrap(cls.__name__, name, attribute)
+                else:
+                    continue
+                self._originals.append((cls, name, attribute))
+                setattr(cls, name, wrapped)
+
+    def disable(self) -> None:
+        """Restore the original methods."""
+        global _active
+        for cls, name, attribute in reversed(self._originals):
+            setattr(cls, name, attribute)
+        self._originals = []
+        with _active_lock:
+            if _active is self:
+                _active = None
+
+    def __enter__(self) -> Self:
+        self.enable()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.disable()
+
+    def stats(self) -> dict:
+        """
+        Get the measurements grouped by class.
+        :return: {class: {"allocated", "calls", "total_time", "self_time", "methods": {method: {...}}}}
+                 with times in seconds.
+        """
+        with self._lock:
+            methods = {label: dict(entry) for label, entry in self._methods.items()}
+            allocations = dict(self._allocations)
+        report = {}
+        for label, entry in sorted(methods.items()):
+            cls_name, method = label.split(".", 1)
+            group = report.setdefault(cls_name, {"allocated": 0, "calls": 0, "total_time": 0.0,
+                                                 "self_time": 0.0, "methods": {}})
+            group["methods"][method] = entry
+            group["calls"] += entry["calls"]
+            group["self_time"] += entry["self_time"]
+            group["total_time"] += entry["total_time"]
+        for cls_name, count in allocations.items():
+            report.setdefault(cls_name, {"allocated": 0, "calls": 0, "total_time": 0.0,
+                                         "self_time": 0.0, "methods": {}})["allocated"] = count
+        return report
+
+    def to_json(self, path: Optional[str] = None) -> str:
+        """
+        Export the measurements as JSON.
+        :param path: File to write the report to (optional).
+        :return: The JSON text.
+        """
+        text = json.dumps(self.stats(), indent=2, sort_keys=True)
+        if path is not None:
+            with open(path, "w") as stream:
+                stream.write(text + "\n")
+        return text
+
+    def collapsed_stacks(self, path: Optional[str] = None) -> str:
+        """
+        Export self time per call stack in the collapsed format read by flamegraph tools,
+        one "Class.method;Class.method <microseconds>" line per stack.
+        :param path: File to write the stacks to (optional).
+        :return: The collapsed stack text.
+        """
+        with self._lock:
+            stacks = dict(self._stacks)
+        text = "".join("%s %d\n" % (path_, round(seconds * 1e6)) for path_, seconds in sorted(stacks.items()))
+        if path is not None:
+            with open(path, "w") as stream:
+                stream.write(text)
+        return text
+
+    def format_table(self, limit: Optional[int] = None) -> str:
+        """
+        Format the methods as a text table sorted by self time.
+        :param limit: Maximum number of rows (all if None).
+        :return: The table text.
+        """
+        rows = [(entry["self_time"], cls_name + "." + method, entry)
+                for cls_name, group in self.stats().items() for method, entry in group["methods"].items()]
+        rows.sort(reverse=True)
+        lines = ["%-40s %10s %12s %12s %10s" % ("method", "calls", "total ms", "self ms", "allocated")]
+        for _, label, entry in rows[:limit]:
+            lines.append("%-40s %10d %12.3f %12.3f %10d" % (label, entry["calls"], entry["total_time"] * 1e3,
+                                                            entry["self_time"] * 1e3, entry["allocated"]))
+        return "\n".join(lines)
+
+
+def geometry_classes() -> tuple:
+    """Get the classes instrumented by default: Point2D, Line2D and Arc2D."""
+    from point2d.point2d import Point2D
+    from line2d.line2d import Line2D
+    from arc2d.arc2d import Arc2D
+    return Point2D, Line2D, Arc2D
+
+
+def active_profiler() -> Optional[Profiler]:
+    """Get the currently enabled profiler, if any."""
+    return _active
+
+
+def _write_report(profiler: Profiler, target: str) -> None:
+    profiler.disable()
+    if target.lower() in ("1", "true", "yes"):
+        print(profiler.format_table(), file=sys.stderr)
+    elif target.endswith((".folded", ".txt")):
+        profiler.collapsed_stacks(target)
+    else:
+        profiler.to_json(target)
+
+
+def enable_from_environment() -> Optional[Profiler]:
+    """
+    Enable a process-wide profiler if PYVECALGEBRA_PROFILE is set; its report is written at exit.
+    :return: The enabled profiler, or None if the variable is unset or empty.
+    """
+    target = os.environ.get(ENV_VAR, "")
+    if not target or target.lower() in ("0", "false", "no") or _active is not None:
+        return None
+    return _enable_with_report(target)
+
+
+def _enable_with_report(target: str) -> Profiler:
+    profiler = Profiler()
+    profiler.enable()
+    atexit.register(_write_report, profiler, target)
+    return profiler
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Command line entry point: run a script or module with a process-wide profiler.
+    :param argv: Arguments (sys.argv[1:] if None).
+    :return: Process exit status.
+    """
+    parser = argparse.ArgumentParser(prog="python -m profiling",
+                                     description="Run a Python program with the geometry classes profiled.")
+    parser.add_argument("--output", help="report path (default: $%s, or a table on stderr)" % ENV_VAR)
+    parser.add_argument("-m", dest="module", action="store_true", help="run the target as a module")
+    parser.add_argument("target", help="script path, or module name with -m")
+    parser.add_argument("args", nargs=argparse.REMAINDER, help="arguments passed to the program")
+    args = parser.parse_args(argv)
+    target = args.output or os.environ.get(ENV_VAR, "")
+    if _active is None:
+        _enable_with_report("1" if target.lower() in ("", "0", "false", "no") else target)
+    sys.argv = [args.target] + args.args
+    if args.module:
+        runpy.run_module(args.target, run_name="__main__", alter_sys=True)
+    else:
+        sys.path.insert(0, os.path.dirname(os.path.abspath(args.target)))
+        runpy.run_path(args.target, run_name="__main__")
+    return 0
@@ -0,0 +1,107 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from .profiling import Profiler, active_profiler
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+
+
+class TestProfiling(unittest.TestCase):
+    def test_methods_restored_when_disabled(self):
+        original = Line2D.length
+        original_create = vars(Arc2D)["create_from_sp_mp_ep"]
+        with Profiler() as profiler:
+            self.assertIsNot(Line2D.length, original)
+            self.assertTrue(profiler.enabled)
+            self.assertIs(active_profiler(), profiler)
+        self.assertIs(Line2D.length, original)
+        self.assertIs(vars(Arc2D)["create_from_sp_mp_ep"], original_create)
+        self.assertFalse(profiler.enabled)
+        self.assertIsNone(active_profiler())
+
+    def test_counts_calls_and_allocations(self):
+        with Profiler() as profiler:
+            line = Line2D(Point2D(0, 0), Point2D(3, 4))
+            for _ in range(5):
+                line.length()
+            Point2D(1, 1) + Point2D(2, 2)
+        stats = profiler.stats()
+        self.assertEqual(stats["Line2D"]["methods"]["length"]["calls"], 5)
+        self.assertEqual(stats["Line2D"]["allocated"], 1)
+        self.assertEqual(stats["Point2D"]["allocated"], 5)
+        self.assertEqual(stats["Point2D"]["methods"]["__add__"]["allocated"], 1)
+        entry = stats["Line2D"]["methods"]["length"]
+        self.assertGreaterEqual(entry["total_time"], entry["self_time"])
+
+    def test_nested_calls_in_collapsed_stacks(self):
+        with Profiler() as profiler:
+            Arc2D.create_from_sp_mp_ep(Point2D(1, 0), Point2D(0, 1), Point2D(-1, 0))
+        stacks = profiler.collapsed_stacks().splitlines()
+        self.assertTrue(stacks)
+        for line in stacks:
+            path, micros = line.rsplit(" ", 1)
+            self.assertGreaterEqual(int(micros), 0)
+        self.assertTrue(any(line.startswith("Arc2D.create_from_sp_mp_ep;") for line in stacks))
+
+    def test_json_export(self):
+        with Profiler() as profiler:
+            Point2D(1, 2).distance_to(Point2D(4, 6))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "report.json")
+            profiler.to_json(path)
+            with open(path) as stream:
+                report = json.load(stream)
+        self.assertEqual(report["Point2D"]["methods"]["distance_to"]["calls"], 1)
+
+    def test_properties_only_when_requested(self):
+        with Profiler() as profiler:
+            Point2D(1, 2).x
+        self.assertNotIn("x", profiler.stats()["Point2D"]["methods"])
+        with Profiler(include_properties=True) as profiler:
+            Point2D(1, 2).x
+        self.assertEqual(profiler.stats()["Point2D"]["methods"]["x"]["calls"], 1)
+
+    def test_single_active_profiler(self):
+        with Profiler():
+            with self.assertRaises(RuntimeError):
+                Profiler().enable()
+
+    def _run(self, args, target, code):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "profile.folded")
+            script = os.path.join(tmpdir, "job.py")
+            with open(script, "w") as stream:
+                stream.write(code)
+            env = dict(os.environ, PYTHONPATH=root)
+            if target:
+                env["PYVECALGEBRA_PROFILE"] = path
+            subprocess.run([sys.executable] + [script if arg == "job.py" else arg for arg in args], env=env,
+                           check=True, capture_output=True)
+            if not os.path.exists(path):
+                return None
+            with open(path) as stream:
+                return stream.read()
+
+    def test_environment_variable_writes_report(self):
+        code = "from line2d.line2d import Line2D\nLine2D(0, 0, 3, 4).length()\n"
+        report = self._run(["-m", "profiling", "job.py"], True, code)
+        self.assertIn("Line2D.length", report)
+        self.assertIn("Line2D.__init__", report)
+
+    def test_importing_any_class_first_with_variable_set(self):
+        # Plain imports never activate profiling, so no class is imported while another is half-initialized.
+        for first in ("import line2d", "import arc2d", "from line2d.line2d import Line2D", "import point2d"):
+            code = first + "\nfrom arc2d.arc2d import Arc2D\nArc2D.create_from_sp_mp_ep\n"
+            self.assertIsNone(self._run(["job.py"], True, code))
+        code = ("import line2d\nfrom profiling import enable_from_environment\nenable_from_environment()\n"
+                "from point2d.point2d import Point2D\nPoint2D(0, 0).distance_to(Point2D(1, 1))\n")
+        self.assertIn("Point2D.distance_to", self._run(["job.py"], True, code))
+
+if __name__ == '__main__':
+    unittest.main()
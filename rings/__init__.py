@@ -0,0 +1,2 @@
+from .rings import Rings, ring_metrics, ring_areas, ring_orientations, COUNTERCLOCKWISE, CLOCKWISE, DEGENERATE
+__all__ = ['Rings', 'ring_metrics', 'ring_areas', 'ring_orientations', 'COUNTERCLOCKWISE', 'CLOCKWISE', 'DEGENERATE']
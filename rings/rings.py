@@ -0,0 +1,237 @@
+"""
+Metrics of many polygon rings stored in a ragged layout.
+
+Rings are kept as one flat coordinate buffer [x, y, x, y, ...] holding the
+vertices of every ring one after the other, and an offsets buffer where
+ring r spans vertices offsets[r] to offsets[r + 1] (the layout of
+Polygon2D.coords/offsets).  Rings are implicitly closed.
+
+ring_metrics computes the signed area, centroid, perimeter, orientation and
+second moments of area of every ring in a single pass over the edges.  As
+with the kernels module, results go to caller-supplied or freshly allocated
+array('d') buffers and a [start, stop) range of rings can be processed
+separately.  Each ring is translated to its first vertex before summing,
+which keeps the shoelace terms accurate far from the origin.
+"""
+from array import array
+from math import sqrt
+from typing import Iterable, Optional, Self, Sequence
+
+from point2d.point2d import Point2D
+
+COUNTERCLOCKWISE = 1
+CLOCKWISE = -1
+DEGENERATE = 0
+
+METRIC_NAMES = ('area', 'perimeter', 'cx', 'cy', 'ixx', 'iyy', 'ixy')
+
+
+class Rings:
+    def __init__(self, coords: Optional[Sequence[float]] = None, offsets: Optional[Sequence[int]] = None):
+        """
+        Initialize a ragged ring collection.
+        :param coords: Flat vertex buffer (empty if None).
+        :param offsets: Ring offsets starting with 0 and ending with the vertex count ([0] if None).
+        """
+        self.coords = array('d') if coords is None else array('d', coords)
+        self.offsets = array('q', [0]) if offsets is None else array('q', offsets)
+        if len(self.coords) % 2 != 0:
+            raise ValueError("Buffer length must be a multiple of 2.")
+        if not self.offsets or self.offsets[0] != 0 or self.offsets[-1] != len(self.coords) // 2:
+            raise ValueError("Offsets must start at 0 and end at the vertex count.")
+        if any(self.offsets[r] > self.offsets[r + 1] for r in range(len(self.offsets) - 1)):
+            raise ValueError("Offsets must be non-decreasing.")
+
+    @classmethod
+    def from_rings(cls, rings: Iterable[Sequence[Point2D]]) -> Self:
+        """
+        Pack rings of Point2D vertices.
+        :param rings: Iterable of vertex sequences; repeating the first vertex at the end is optional.
+        :return: A new Rings instance.
+        """
+        packed = cls()
+        for ring in rings:
+            packed.append(ring)
+        return packed
+
+    @classmethod
+    def from_polygons(cls, polygons: Iterable) -> Self:
+        """
+        Pack the rings of Polygon2D instances, outer rings and holes alike.
+        :param polygons: Iterable of Polygon2D instances.
+        :return: A new Rings instance.
+        """
+        packed = cls()
+        for polygon in polygons:
+            base = len(packed.coords) // 2
+            packed.coords.extend(polygon.coords)
+            packed.offsets.extend(base + offset for offset in polygon.offsets[1:])
+        return packed
+
+    def append(self, ring: Sequence[Point2D]) -> int:
+        """
+        Add a ring.
+        :param ring: Sequence of Point2D vertices.
+        :return: Index of the new ring.
+        """
+        points = list(ring)
+        if not all(isinstance(point, Point2D) for point in points):
+            raise TypeError("Rings must contain Point2D instances.")
+        if len(points) > 1 and points[0].x == points[-1].x and points[0].y == points[-1].y:
+            points.pop()
+        for point in points:
+            self.coords.append(point.x)
+            self.coords.append(point.y)
+        self.offsets.append(len(self.coords) // 2)
+        return len(self.offsets) - 2
+
+    @property
+    def ring_count(self) -> int:
+        """Get the number of rings."""
+        return len(self.offsets) - 1
+
+    def ring(self, index: int) -> list[Point2D]:
+        """
+        Get the vertices of a ring.
+        :param index: Ring index.
+        :return: List of Point2D instances.
+        """
+        if not 0 <= index < len(self.offsets) - 1:
+            raise IndexError("Ring index %d out of range." % index)
+        coords = self.coords
+        return [Point2D(coords[2 * v], coords[2 * v + 1]) for v in range(self.offsets[index], self.offsets[index + 1])]
+
+    def metrics(self) -> dict[str, array]:
+        """Compute ring_metrics for every ring."""
+        return ring_metrics(self.coords, self.offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __repr__(self) -> str:
+        return "Rings(%d rings, %d vertices)" % (len(self.offsets) - 1, len(self.coords) // 2)
+
+
+def _outputs(out: Optional[dict], size: int) -> dict:
+    out = {} if out is None else out
+    for name in METRIC_NAMES:
+        if name not in out:
+            out[name] = array('d', bytes(8 * size))
+        elif len(out[name]) < size:
+            raise ValueError("Output buffer %r is too small." % name)
+    return out
+
+
+def ring_metrics(coords: Sequence[float], offsets: Sequence[int], out: Optional[dict] = None,
+                 start: int = 0, stop: Optional[int] = None) -> dict[str, Sequence[float]]:
+    """
+    Compute the metrics of every ring in one pass.
+    Area and moments are signed: positive for counterclockwise rings, negative for clockwise ones,
+    so holes given clockwise subtract when the values of a polygon's rings are summed.
+    Moments are taken about the ring centroid: ixx = integral of y^2, iyy = integral of x^2 and
+    ixy = integral of x*y over the ring.  Rings with zero area get their vertex mean as centroid
+    and zero moments.
+    :param coords: Flat vertex buffer.
+    :param offsets: Ring offsets.
+    :param out: Dict of output buffers keyed by the names in METRIC_NAMES (missing ones are allocated).
+    :param start: First ring to process.
+    :param stop: One past the last ring to process (all rings if None).
+    :return: Dict of buffers with one float per ring for each name in METRIC_NAMES.
+    """
+    n = len(offsets) - 1
+    out = _outputs(out, n)
+    area_out, perimeter_out, cx_out, cy_out = out['area'], out['perimeter'], out['cx'], out['cy']
+    ixx_out, iyy_out, ixy_out = out['ixx'], out['iyy'], out['ixy']
+    stop = n if stop is None else stop
+    for r in range(start, stop):
+        first, last = offsets[r], offsets[r + 1]
+        if last <= first:
+            area_out[r] = perimeter_out[r] = cx_out[r] = cy_out[r] = ixx_out[r] = iyy_out[r] = ixy_out[r] = 0.0
+            continue
+        ox, oy = coords[2 * first], coords[2 * first + 1]
+        # The first vertex is the local origin, so the edges touching it add no shoelace terms.
+        twice = sx = sy = sxx = syy = sxy = perimeter = mean_x = mean_y = 0.0
+        x0, y0 = 0.0, 0.0
+        for v in range(first + 1, last):
+            x1, y1 = coords[2 * v] - ox, coords[2 * v + 1] - oy
+            cross = x0 * y1 - x1 * y0
+            twice += cross
+            sx += cross * (x0 + x1)
+            sy += cross * (y0 + y1)
+            sxx += cross * (x0 * x0 + x0 * x1 + x1 * x1)
+            syy += cross * (y0 * y0 + y0 * y1 + y1 * y1)
+            sxy += cross * (x0 * y1 + 2 * x0 * y0 + 2 * x1 * y1 + x1 * y0)
+            perimeter += sqrt((x1 - x0) * (x1 - x0) + (y1 - y0) * (y1 - y0))
+            mean_x += x1
+            mean_y += y1
+            x0, y0 = x1, y1
+        perimeter += sqrt(x0 * x0 + y0 * y0)
+        area = twice / 2
+        area_out[r] = area
+        perimeter_out[r] = perimeter
+        if area == 0:
+            count = last - first
+            cx_out[r], cy_out[r] = ox + mean_x / count, oy + mean_y / count
+            ixx_out[r] = iyy_out[r] = ixy_out[r] = 0.0
+            continue
+        cx, cy = sx / (6 * area), sy / (6 * area)
+        cx_out[r], cy_out[r] = ox + cx, oy + cy
+        # Parallel-axis theorem from the local origin to the centroid.
+        ixx_out[r] = syy / 12 - area * cy * cy
+        iyy_out[r] = sxx / 12 - area * cx * cx
+        ixy_out[r] = sxy / 24 - area * cx * cy
+    return out
+
+
+def ring_areas(coords: Sequence[float], offsets: Sequence[int], out: Optional[Sequence[float]] = None,
+               start: int = 0, stop: Optional[int] = None) -> Sequence[float]:
+    """
+    Compute the signed shoelace area of every ring (positive for counterclockwise rings).
+    :param coords: Flat vertex buffer.
+    :param offsets: Ring offsets.
+    :param out: Output buffer with one float per ring (allocated if None).
+    :param start: First ring to process.
+    :param stop: One past the last ring to process (all rings if None).
+    :return: The output buffer.
+    """
+    n = len(offsets) - 1
+    if out is None:
+        out = array('d', bytes(8 * n))
+    elif len(out) < n:
+        raise ValueError("Output buffer is too small.")
+    stop = n if stop is None else stop
+    for r in range(start, stop):
+        first, last = offsets[r], offsets[r + 1]
+        twice = 0.0
+        if last > first:
+            ox, oy = coords[2 * first], coords[2 * first + 1]
+            x0, y0 = 0.0, 0.0
+            for v in range(first + 1, last):
+                x1, y1 = coords[2 * v] - ox, coords[2 * v + 1] - oy
+                twice += x0 * y1 - x1 * y0
+                x0, y0 = x1, y1
+        out[r] = twice / 2
+    return out
+
+
+def ring_orientations(coords: Sequence[float], offsets: Sequence[int], out: Optional[Sequence[int]] = None,
+                      start: int = 0, stop: Optional[int] = None) -> Sequence[int]:
+    """
+    Get the orientation of every ring.
+    :param coords: Flat vertex buffer.
+    :param offsets: Ring offsets.
+    :param out: Output buffer with one entry per ring (array('b') allocated if None).
+    :param start: First ring to process.
+    :param stop: One past the last ring to process (all rings if None).
+    :return: The output buffer of COUNTERCLOCKWISE, CLOCKWISE and DEGENERATE codes.
+    """
+    n = len(offsets) - 1
+    if out is None:
+        out = array('b', bytes(n))
+    elif len(out) < n:
+        raise ValueError("Output buffer is too small.")
+    stop = n if stop is None else stop
+    areas = ring_areas(coords, offsets, start=start, stop=stop)
+    for r in range(start, stop):
+        out[r] = COUNTERCLOCKWISE if areas[r] > 0 else CLOCKWISE if areas[r] < 0 else DEGENERATE
+    return out
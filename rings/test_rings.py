@@ -0,0 +1,83 @@
+import unittest
+from array import array
+
+from .rings import Rings, ring_metrics, ring_areas, ring_orientations, COUNTERCLOCKWISE, CLOCKWISE, DEGENERATE
+from point2d.point2d import Point2D
+from polygon2d.polygon2d import Polygon2D
+
+
+def _points(*coords):
+    return [Point2D(coords[k], coords[k + 1]) for k in range(0, len(coords), 2)]
+
+
+class TestRings(unittest.TestCase):
+    def setUp(self):
+        # 4 x 2 rectangle far from the origin, the same rectangle clockwise, a right triangle, a degenerate ring.
+        self.rings = Rings.from_rings([_points(1000, 500, 1004, 500, 1004, 502, 1000, 502),
+                                       _points(0, 0, 0, 2, 4, 2, 4, 0),
+                                       _points(0, 0, 3, 0, 0, 3, 0, 0),
+                                       _points(0, 0, 1, 1, 2, 2)])
+
+    def test_layout(self):
+        self.assertEqual(self.rings.ring_count, 4)
+        self.assertEqual(list(self.rings.offsets), [0, 4, 8, 11, 14])
+        self.assertEqual(self.rings.ring(2), _points(0, 0, 3, 0, 0, 3))
+        with self.assertRaises(IndexError):
+            self.rings.ring(4)
+        with self.assertRaises(ValueError):
+            Rings([0, 0, 1, 1], [0, 3])
+        with self.assertRaises(TypeError):
+            Rings.from_rings([[(0, 0), (1, 0), (0, 1)]])
+
+    def test_rectangle_metrics(self):
+        metrics = self.rings.metrics()
+        self.assertAlmostEqual(metrics['area'][0], 8)
+        self.assertAlmostEqual(metrics['perimeter'][0], 12)
+        self.assertAlmostEqual(metrics['cx'][0], 1002)
+        self.assertAlmostEqual(metrics['cy'][0], 501)
+        self.assertAlmostEqual(metrics['ixx'][0], 4 * 2 ** 3 / 12)
+        self.assertAlmostEqual(metrics['iyy'][0], 2 * 4 ** 3 / 12)
+        self.assertAlmostEqual(metrics['ixy'][0], 0)
+
+    def test_clockwise_ring_is_negative(self):
+        metrics = self.rings.metrics()
+        self.assertAlmostEqual(metrics['area'][1], -8)
+        self.assertAlmostEqual(metrics['perimeter'][1], 12)
+        self.assertAlmostEqual(metrics['cx'][1], 2)
+        self.assertAlmostEqual(metrics['cy'][1], 1)
+        self.assertAlmostEqual(metrics['ixx'][1], -4 * 2 ** 3 / 12)
+
+    def test_triangle_and_degenerate(self):
+        metrics = self.rings.metrics()
+        self.assertAlmostEqual(metrics['area'][2], 4.5)
+        self.assertAlmostEqual(metrics['cx'][2], 1)
+        self.assertAlmostEqual(metrics['cy'][2], 1)
+        # Right triangle with legs b = h = 3: Ixx = Iyy = b*h^3/36, Ixy = -b^2*h^2/72 about the centroid.
+        self.assertAlmostEqual(metrics['ixx'][2], 81 / 36)
+        self.assertAlmostEqual(metrics['iyy'][2], 81 / 36)
+        self.assertAlmostEqual(metrics['ixy'][2], -81 / 72)
+        self.assertEqual(metrics['area'][3], 0)
+        self.assertAlmostEqual(metrics['cx'][3], 1)
+        self.assertEqual(list(ring_orientations(self.rings.coords, self.rings.offsets)),
+                         [COUNTERCLOCKWISE, CLOCKWISE, COUNTERCLOCKWISE, DEGENERATE])
+
+    def test_areas_and_ranges(self):
+        areas = ring_areas(self.rings.coords, self.rings.offsets)
+        self.assertEqual([round(a, 9) for a in areas], [8, -8, 4.5, 0])
+        out = {'area': array('d', [-1.0] * 4)}
+        ring_metrics(self.rings.coords, self.rings.offsets, out, 1, 2)
+        self.assertEqual(list(out['area']), [-1.0, -8.0, -1.0, -1.0])
+        self.assertIn('ixy', out)
+        with self.assertRaises(ValueError):
+            ring_areas(self.rings.coords, self.rings.offsets, array('d', [0.0]))
+
+    def test_from_polygons(self):
+        polygon = Polygon2D(_points(0, 0, 10, 0, 10, 10, 0, 10), [_points(4, 4, 4, 6, 6, 6, 6, 4)])
+        rings = Rings.from_polygons([polygon, polygon])
+        self.assertEqual(list(rings.offsets), [0, 4, 8, 12, 16])
+        areas = ring_areas(rings.coords, rings.offsets)
+        self.assertAlmostEqual(sum(areas[:2]), polygon.area())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,2 @@
+from .service import GeometryClient, GeometryService
+__all__ = ['GeometryClient', 'GeometryService']
@@ -0,0 +1,329 @@
+"""
+Request-coalescing asyncio geometry service.
+
+Clients send newline-delimited JSON requests over a Unix socket or a TCP
+connection and may pipeline as many requests as they like:
+
+    {"id": 1, "op": "distance", "line": [x1, y1, x2, y2], "point": [x, y]}
+    {"id": 2, "op": "intersection", "line": [x1, y1, x2, y2], "other": [x1, y1, x2, y2]}
+    {"id": 3, "op": "arc_3p", "sp": [x, y], "mp": [x, y], "ep": [x, y]}
+    {"id": 4, "op": "arc_rd", "sp": [x, y], "ep": [x, y], "radius": r, "cw": true}
+
+Each response echoes the id together with a result or an error:
+
+    {"id": 1, "result": 2.5}
+    {"id": 2, "result": {"status": 1, "point": [x, y]}}
+    {"id": 3, "result": {"cp": [x, y], "sp": [x, y], "ep": [x, y]}}     (null if no arc exists)
+    {"id": 5, "error": "Unknown op 'foo'."}
+
+Requests arriving within batch_window seconds of each other are collected per
+operation and evaluated by one call of the matching batched kernel, so the
+per-request cost is parsing and a future, not a Line2D/Arc2D method call.
+"""
+import asyncio
+import json
+from array import array
+from math import isnan
+from typing import Optional, Self
+
+from kernels import kernels
+
+
+def _coords(value, size: int, field: str) -> list[float]:
+    if not isinstance(value, (list, tuple)) or len(value) != size or \
+            not all(isinstance(coord, (int, float)) and not isinstance(coord, bool) for coord in value):
+        raise ValueError("Field '%s' must be a list of %d numbers." % (field, size))
+    return [float(coord) for coord in value]
+
+
+def _number(value, field: str) -> float:
+    if not isinstance(value, (int, float)) or isinstance(value, bool):
+        raise ValueError("Field '%s' must be a number." % field)
+    return float(value)
+
+
+def _parse_distance(request: dict) -> tuple:
+    return _coords(request.get("line"), 4, "line"), _coords(request.get("point"), 2, "point")
+
+
+def _parse_intersection(request: dict) -> tuple:
+    return _coords(request.get("line"), 4, "line"), _coords(request.get("other"), 4, "other")
+
+
+def _parse_arc_3p(request: dict) -> tuple:
+    return (_coords(request.get("sp"), 2, "sp") + _coords(request.get("mp"), 2, "mp") +
+            _coords(request.get("ep"), 2, "ep"),)
+
+
+def _parse_arc_rd(request: dict) -> tuple:
+    if not isinstance(request.get("cw"), bool):
+        raise ValueError("Field 'cw' must be a boolean.")
+    return (_coords(request.get("sp"), 2, "sp") + _coords(request.get("ep"), 2, "ep") +
+            [_number(request.get("radius"), "radius"), float(request["cw"])],)
+
+
+def _run_distance(batch: list) -> list:
+    segments = array('d')
+    points = array('d')
+    for line, point in batch:
+        segments.extend(line)
+        points.extend(point)
+    return list(kernels.line_point_distances(segments, points))
+
+
+def _run_intersection(batch: list) -> list:
+    segments_a = array('d')
+    segments_b = array('d')
+    for line, other in batch:
+        segments_a.extend(line)
+        segments_b.extend(other)
+    out = kernels.line_intersections(segments_a, segments_b)
+    return [{"status": int(out[3 * i]), "point": [out[3 * i + 1], out[3 * i + 2]]} for i in range(len(batch))]
+
+
+def _arc_results(batch: list, centers, ends: tuple[int, int]) -> list:
+    results = []
+    for i, (params,) in enumerate(batch):
+        cx, cy = centers[2 * i], centers[2 * i + 1]
+        if isnan(cx):
+            results.append(None)
+        else:
+            results.append({"cp": [cx, cy], "sp": params[0:2], "ep": params[ends[0]:ends[1]]})
+    return results
+
+
+def _run_arc_3p(batch: list) -> list:
+    params = array('d')
+    for (values,) in batch:
+        params.extend(values)
+    return _arc_results(batch, kernels.arc_centers_3p(params), (4, 6))
+
+
+def _run_arc_rd(batch: list) -> list:
+    params = array('d')
+    for (values,) in batch:
+        params.extend(values)
+    return _arc_results(batch, kernels.arc_centers_rd(params), (2, 4))
+
+
+OPERATIONS = {
+    "distance": (_parse_distance, _run_distance),
+    "intersection": (_parse_intersection, _run_intersection),
+    "arc_3p": (_parse_arc_3p, _run_arc_3p),
+    "arc_rd": (_parse_arc_rd, _run_arc_rd),
+}
+
+
+class GeometryService:
+    def __init__(self, batch_window: float = 0.002, max_batch: int = 4096):
+        """
+        Initialize a geometry service that coalesces concurrent requests.
+        :param batch_window: Seconds to wait for more requests after the first one of a batch.
+        :param max_batch: Number of pending requests of one operation that triggers an immediate flush.
+        """
+        if batch_window < 0:
+            raise ValueError("batch_window cannot be negative.")
+        if max_batch < 1:
+            raise ValueError("max_batch must be positive.")
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.batches_run = 0
+        self.requests_served = 0
+        self._pending = {}
+        self._timer = None
+
+    async def submit(self, op: str, request: dict):
+        """
+        Queue one request and wait for its result.
+        :param op: Operation name (one of OPERATIONS).
+        :param request: The request fields.
+        :return: The operation result.
+        """
+        if op not in OPERATIONS:
+            raise ValueError("Unknown op '%s'." % op)
+        params = OPERATIONS[op][0](request)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        pending = self._pending.setdefault(op, [])
+        pending.append((params, future))
+        if len(pending) >= self.max_batch:
+            self._flush_op(op)
+        elif self._timer is None:
+            self._timer = loop.call_later(self.batch_window, self.flush)
+        return await future
+
+    def flush(self) -> None:
+        """Evaluate every pending request now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for op in list(self._pending):
+            self._flush_op(op)
+
+    def _flush_op(self, op: str) -> None:
+        entries = self._pending.pop(op, [])
+        if not entries:
+            return
+        run = OPERATIONS[op][1]
+        self.batches_run += 1
+        self.requests_served += len(entries)
+        try:
+            results = run([params for params, _ in entries])
+        except Exception as error:
+            if len(entries) == 1:
+                if not entries[0][1].done():
+                    entries[0][1].set_exception(error)
+                return
+            # Re-run the requests one by one, so that only the bad one fails.
+            for params, future in entries:
+                self._settle(future, run, params)
+            return
+        for (_, future), result in zip(entries, results):
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    def _settle(future: asyncio.Future, run, params: tuple) -> None:
+        try:
+            result = run([params])[0]
+        except Exception as error:
+            if not future.done():
+                future.set_exception(error)
+            return
+        if not future.done():
+            future.set_result(result)
+
+    async def _answer(self, line: bytes, writer: asyncio.StreamWriter) -> None:
+        request_id = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object.")
+            request_id = request.get("id")
+            response = {"id": request_id, "result": await self.submit(request.get("op"), request)}
+        except Exception as error:
+            # Every request gets a reply, or its client would wait forever.
+            response = {"id": request_id, "error": str(error) or type(error).__name__}
+        if not writer.is_closing():
+            writer.write((json.dumps(response) + "\n").encode())
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve one connection until the client closes it.
+        :param reader: Stream reader of the connection.
+        :param writer: Stream writer of the connection.
+        """
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                task = asyncio.ensure_future(self._answer(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.Server:
+        """
+        Start serving on a TCP socket.
+        :param host: Interface to bind (localhost by default).
+        :param port: Port to bind (0 picks a free port).
+        :return: The running asyncio.Server.
+        """
+        return await asyncio.start_server(self.handle_client, host, port)
+
+    async def start_unix(self, path: str) -> asyncio.Server:
+        """
+        Start serving on a Unix domain socket.
+        :param path: Socket file path.
+        :return: The running asyncio.Server.
+        """
+        return await asyncio.start_unix_server(self.handle_client, path)
+
+
+class GeometryClient:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        Initialize a pipelining client on an open connection.
+        Use GeometryClient.connect_tcp or GeometryClient.connect_unix to create one.
+        """
+        self._reader = reader
+        self._writer = writer
+        self._next_id = 0
+        self._waiting = {}
+        self._receiver = asyncio.ensure_future(self._receive())
+
+    @classmethod
+    async def connect_tcp(cls, host: str, port: int) -> Self:
+        """Connect to a service listening on TCP."""
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    @classmethod
+    async def connect_unix(cls, path: str) -> Self:
+        """Connect to a service listening on a Unix domain socket."""
+        reader, writer = await asyncio.open_unix_connection(path)
+        return cls(reader, writer)
+
+    async def _receive(self) -> None:
+        while True:
+            line = await self._reader.readline()
+            if not line:
+                break
+            response = json.loads(line)
+            future = self._waiting.pop(response.get("id"), None)
+            if future is None or future.done():
+                continue
+            if "error" in response:
+                future.set_exception(ValueError(response["error"]))
+            else:
+                future.set_result(response["result"])
+        for future in self._waiting.values():
+            if not future.done():
+                future.set_exception(ConnectionError("Connection closed by the service."))
+        self._waiting.clear()
+
+    async def request(self, op: str, **fields):
+        """
+        Send one request and wait for its result.
+        :param op: Operation name.
+        :param fields: Request fields.
+        :return: The operation result.
+        """
+        self._next_id += 1
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[self._next_id] = future
+        self._writer.write((json.dumps(dict(fields, id=self._next_id, op=op)) + "\n").encode())
+        await self._writer.drain()
+        return await future
+
+    async def distance(self, line: list[float], point: list[float]) -> float:
+        """Distance from a point to the line through a segment, as Line2D.distance_to_point()."""
+        return await self.request("distance", line=line, point=point)
+
+    async def intersection(self, line: list[float], other: list[float]) -> dict:
+        """Intersection of two segments, as Line2D.intersection_with_line()."""
+        return await self.request("intersection", line=line, other=other)
+
+    async def arc_3p(self, sp: list[float], mp: list[float], ep: list[float]) -> Optional[dict]:
+        """Arc through start, mid and end points, as Arc2D.create_from_sp_mp_ep()."""
+        return await self.request("arc_3p", sp=sp, mp=mp, ep=ep)
+
+    async def arc_rd(self, sp: list[float], ep: list[float], radius: float, cw: bool) -> Optional[dict]:
+        """Arc from end points, radius and direction, as Arc2D.create_from_sp_ep_rd_cw()."""
+        return await self.request("arc_rd", sp=sp, ep=ep, radius=radius, cw=cw)
+
+    async def close(self) -> None:
+        """Close the connection."""
+        self._writer.close()
+        await self._writer.wait_closed()
+        await self._receiver
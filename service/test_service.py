@@ -0,0 +1,114 @@
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from .service import OPERATIONS, GeometryClient, GeometryService
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+
+
+class TestGeometryService(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.service = GeometryService(batch_window=0.01)
+        self.server = await self.service.start_tcp()
+        host, port = self.server.sockets[0].getsockname()[:2]
+        self.client = await GeometryClient.connect_tcp(host, port)
+
+    async def asyncTearDown(self):
+        await self.client.close()
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def test_concurrent_distances_are_batched(self):
+        lines = [[0, 0, 10, 0], [0, 0, 0, 10], [0, 0, 1, 1]]
+        points = [[3, 4], [3, 4], [1, 0]]
+        results = await asyncio.gather(*[self.client.distance(line, point)
+                                         for line, point in zip(lines * 20, points * 20)])
+        for line, point, result in zip(lines, points, results):
+            self.assertAlmostEqual(result, Line2D(*line).distance_to_point(Point2D(*point)))
+        self.assertEqual(self.service.requests_served, 60)
+        self.assertLess(self.service.batches_run, 60)
+
+    async def test_intersection(self):
+        result = await self.client.intersection([0, 0, 4, 4], [0, 4, 4, 0])
+        self.assertEqual(result["status"], 1)
+        self.assertAlmostEqual(result["point"][0], 2)
+        self.assertAlmostEqual(result["point"][1], 2)
+        parallel = await self.client.intersection([0, 0, 1, 0], [0, 1, 1, 1])
+        self.assertEqual(parallel, {"status": 0, "point": [0, 0]})
+
+    async def test_arc_3p(self):
+        result = await self.client.arc_3p([1, 0], [0, 1], [-1, 0])
+        self.assertAlmostEqual(result["cp"][0], 0)
+        self.assertAlmostEqual(result["cp"][1], 0)
+        self.assertEqual(result["ep"], [-1, 0])
+        self.assertIsNone(await self.client.arc_3p([0, 0], [1, 1], [2, 2]))
+
+    async def test_arc_rd_matches_arc2d(self):
+        expected_ok, expected = Arc2D.create_from_sp_ep_rd_cw(Point2D(0, 0), Point2D(2, 0), 2, True)
+        result = await self.client.arc_rd([0, 0], [2, 0], 2, True)
+        self.assertTrue(expected_ok)
+        self.assertAlmostEqual(result["cp"][0], expected.cp.x)
+        self.assertAlmostEqual(result["cp"][1], expected.cp.y)
+        self.assertIsNone(await self.client.arc_rd([0, 0], [10, 0], 1, True))
+
+    async def test_invalid_requests(self):
+        with self.assertRaises(ValueError):
+            await self.client.request("unknown")
+        with self.assertRaises(ValueError):
+            await self.client.distance([0, 0, 1], [0, 0])
+
+    async def test_bad_request_fails_alone(self):
+        parse, run = OPERATIONS["distance"]
+
+        def failing(batch):
+            if any(point == [13.0, 13.0] for _, point in batch):
+                raise OverflowError("Numerical result out of range")
+            return run(batch)
+
+        with patch.dict(OPERATIONS, {"distance": (parse, failing)}):
+            results = await asyncio.wait_for(asyncio.gather(
+                self.client.distance([0, 0, 1, 0], [0, 2]),
+                self.client.distance([0, 0, 1, 0], [13, 13]),
+                self.client.distance([0, 0, 1, 0], [0, 3]), return_exceptions=True), 5)
+        self.assertEqual(results[0], 2.0)
+        self.assertIsInstance(results[1], ValueError)
+        self.assertIn("out of range", str(results[1]))
+        self.assertEqual(results[2], 3.0)
+        # Huge coordinates give no arc instead of an overflow.
+        results = await asyncio.wait_for(asyncio.gather(
+            self.client.arc_3p([1, 0], [0, 1], [-1, 0]),
+            self.client.arc_3p([1e200, 0], [0, 1e200], [-1e200, 0])), 5)
+        self.assertAlmostEqual(results[0]["cp"][0], 0)
+        self.assertIsNone(results[1])
+
+    async def test_max_batch_flushes_immediately(self):
+        service = GeometryService(batch_window=60, max_batch=2)
+        results = await asyncio.wait_for(asyncio.gather(
+            service.submit("distance", {"line": [0, 0, 1, 0], "point": [0, 2]}),
+            service.submit("distance", {"line": [0, 0, 1, 0], "point": [0, 3]})), 5)
+        self.assertEqual(results, [2.0, 3.0])
+        service.flush()
+
+
+@unittest.skipUnless(hasattr(asyncio, "start_unix_server"), "Unix sockets are not available")
+class TestGeometryServiceUnixSocket(unittest.IsolatedAsyncioTestCase):
+    async def test_unix_socket(self):
+        path = os.path.join(tempfile.mkdtemp(), "geometry.sock")
+        server = await GeometryService().start_unix(path)
+        client = await GeometryClient.connect_unix(path)
+        try:
+            self.assertEqual(await client.distance([0, 0, 1, 0], [5, 7]), 7)
+        finally:
+            await client.close()
+            server.close()
+            await server.wait_closed()
+            os.remove(path)
+            os.rmdir(os.path.dirname(path))
+
+
+if __name__ == "__main__":
+    unittest.main()
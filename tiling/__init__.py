@@ -0,0 +1,2 @@
+from .tiling import TileGrid, TiledGeometry, read_geometry_file, write_geometry_file
+__all__ = ['TileGrid', 'TiledGeometry', 'read_geometry_file', 'write_geometry_file']
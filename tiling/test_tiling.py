@@ -0,0 +1,134 @@
+import os
+import tempfile
+import unittest
+from math import pi
+
+from .tiling import TileGrid, TiledGeometry, read_geometry_file, write_geometry_file
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+
+
+class TestTileGrid(unittest.TestCase):
+    def test_tile_of(self):
+        grid = TileGrid(10)
+        self.assertEqual(grid.tile_of(5, 5), (0, 0))
+        self.assertEqual(grid.tile_of(-0.5, 25), (-1, 2))
+
+    def test_tile_bounds(self):
+        grid = TileGrid(10, (1, 1))
+        self.assertEqual(grid.tile_bounds((1, 0)), (11, 1, 21, 11))
+
+    def test_tiles_overlapping(self):
+        grid = TileGrid(10)
+        self.assertEqual(sorted(grid.tiles_overlapping((5, 5, 15, 5))), [(0, 0), (1, 0)])
+
+    def test_invalid_tile_size(self):
+        with self.assertRaises(ValueError):
+            TileGrid(0)
+        with self.assertRaises(TypeError):
+            TileGrid("10")
+
+
+class TestTiledGeometry(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "input.geo")
+        self.entities = [
+            Line2D(0, 0, 25, 0),        # crosses two tile borders
+            Line2D(12, -5, 12, 5),      # crosses record 0 at (12, 0)
+            Line2D(1, 1, 2, 2),
+            Line2D(2, 2, 1, 1),         # duplicate of record 2, reversed
+            Line2D(3, 3, 3, 3),         # degenerate
+            Arc2D(Point2D(5, 5), Point2D(6, 5), Point2D(5, 6)),
+        ]
+        write_geometry_file(self.path, self.entities)
+
+    def tearDown(self):
+        for name in os.listdir(self.tmpdir):
+            os.remove(os.path.join(self.tmpdir, name))
+        os.rmdir(self.tmpdir)
+
+    def test_round_trip(self):
+        entities = list(read_geometry_file(self.path))
+        self.assertEqual(len(entities), len(self.entities))
+        self.assertEqual(entities[0], self.entities[0])
+        self.assertIsInstance(entities[5], Arc2D)
+        self.assertEqual(entities[5].cp, Point2D(5, 5))
+
+    def test_partition_replicates_border_crossing_entities(self):
+        with TiledGeometry(self.path, 10, max_buffered=2) as tiled:
+            tiled.partition()
+            holders = [key for key in tiled.tiles()
+                       if any(record_no == 0 for record_no, _, _ in tiled.load_tile(key))]
+            owners = [key for key in tiled.tiles()
+                      if any(record_no == 0 and owned for record_no, _, owned in tiled.load_tile(key))]
+        self.assertEqual(sorted(holders), [(0, 0), (1, 0), (2, 0)])
+        self.assertEqual(owners, [(0, 0)])
+
+    def test_measure_counts_each_entity_once(self):
+        with TiledGeometry(self.path, 10) as tiled:
+            count, total = tiled.measure()
+        self.assertEqual(count, 6)
+        expected = 25 + 10 + 2 * 2 ** 0.5 + pi / 2
+        self.assertAlmostEqual(total, expected)
+
+    def test_intersections_reported_once(self):
+        with TiledGeometry(self.path, 10) as tiled:
+            found = list(tiled.intersections())
+        self.assertEqual(len(found), 1)
+        record_a, record_b, point = found[0]
+        self.assertEqual((record_a, record_b), (0, 1))
+        self.assertAlmostEqual(point.x, 12)
+        self.assertAlmostEqual(point.y, 0)
+
+    def test_transform(self):
+        output = os.path.join(self.tmpdir, "moved.geo")
+
+        def move(entity):
+            if isinstance(entity, Line2D):
+                entity.translate_dxdy(100, 0)
+            return entity
+        with TiledGeometry(self.path, 10) as tiled:
+            written = tiled.transform(output, move)
+        self.assertEqual(written, 6)
+        self.assertIn(Line2D(100, 0, 125, 0), list(read_geometry_file(output)))
+
+    def test_simplify_drops_degenerate_and_duplicates(self):
+        output = os.path.join(self.tmpdir, "simple.geo")
+        with TiledGeometry(self.path, 10) as tiled:
+            written = tiled.simplify(output)
+        self.assertEqual(written, 4)
+        self.assertEqual(sum(1 for entity in read_geometry_file(output) if entity == Line2D(1, 1, 2, 2)), 1)
+
+    def test_simplify_matches_near_duplicates(self):
+        path = os.path.join(self.tmpdir, "near.geo")
+        output = os.path.join(self.tmpdir, "simple.geo")
+        write_geometry_file(path, [
+            Line2D(5, 0.0004, 8, 0.0004),
+            Line2D(5, 0.0006, 8, 0.0006),       # rounds to other cells than record 0
+            Line2D(1, 9.9999, 5, 9.9999),
+            Line2D(5, 10.0001, 1, 10.0001),     # reversed, in the tile above record 2
+            Line2D(1, 9.9999, 5, 9.998),        # one end too far from record 2
+            Arc2D(Point2D(0, 19.9996), Point2D(3, 19.9996), Point2D(0, 22.9996)),
+            Arc2D(Point2D(0, 20.0004), Point2D(3, 20.0004), Point2D(0, 23.0004)),
+        ])
+        with TiledGeometry(path, 10) as tiled:
+            tiled.partition()
+            self.assertEqual(tiled.simplify(output, tolerance=1e-3), 4)
+        kept = list(read_geometry_file(output))
+        self.assertEqual(kept[:3], [Line2D(5, 0.0004, 8, 0.0004), Line2D(1, 9.9999, 5, 9.9999),
+                                    Line2D(1, 9.9999, 5, 9.998)])
+        self.assertIsInstance(kept[3], Arc2D)
+        self.assertEqual(kept[3].cp, Point2D(0, 19.9996))
+
+    def test_close_removes_workdir(self):
+        tiled = TiledGeometry(self.path, 10)
+        tiled.partition()
+        workdir = tiled.workdir
+        tiled.close()
+        self.assertFalse(os.path.exists(workdir))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,370 @@
+"""
+Out-of-core tiled processing of Line2D/Arc2D geometry files.
+
+A geometry file is a plain text file with one entity per line:
+
+    L x1 y1 x2 y2            a Line2D from (x1, y1) to (x2, y2)
+    A cx cy sx sy ex ey      an Arc2D with center, start and end points
+
+Blank lines and lines starting with '#' are ignored.
+
+TiledGeometry streams such a file once and spills every entity into each
+square tile its bounding box overlaps, so only one tile has to be held in
+memory at a time.  Entities crossing a tile border are therefore present in
+several tiles; every operation picks exactly one tile to report them from:
+
+    - per-entity work (transform, measure) runs in the owner tile, the tile
+      that contains the start point of the entity;
+    - intersections run in the tile that contains the crossing, which both
+      lines are guaranteed to overlap;
+    - duplicate removal runs in the owner tile after partitioning with a
+      margin of the tolerance, so every entity whose end points lie within
+      the tolerance of the owner's start point is present in that tile too.
+"""
+import os
+import shutil
+import tempfile
+from math import floor, hypot
+from typing import Callable, Iterable, Iterator, Optional, Self
+
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+
+
+def format_entity(entity: Line2D | Arc2D) -> str:
+    """
+    Format a Line2D or Arc2D as a geometry file record.
+    :param entity: The entity to format.
+    :return: The record without a trailing newline.
+    """
+    if isinstance(entity, Line2D):
+        return "L %r %r %r %r" % tuple(map(float, entity.to_tuple()))
+    if isinstance(entity, Arc2D):
+        cp, sp, ep = entity.points
+        return "A %r %r %r %r %r %r" % tuple(map(float, (cp.x, cp.y, sp.x, sp.y, ep.x, ep.y)))
+    raise TypeError("Entity must be a Line2D or Arc2D instance.")
+
+
+def parse_entity(fields: list[str]) -> Line2D | Arc2D:
+    """
+    Parse the fields of a geometry file record.
+    :param fields: The whitespace separated fields of the record.
+    :return: A new Line2D or Arc2D instance.
+    """
+    if fields[0] == "L" and len(fields) == 5:
+        return Line2D(*map(float, fields[1:]))
+    if fields[0] == "A" and len(fields) == 7:
+        cx, cy, sx, sy, ex, ey = map(float, fields[1:])
+        return Arc2D(Point2D(cx, cy), Point2D(sx, sy), Point2D(ex, ey))
+    raise ValueError("Malformed geometry record: %s" % " ".join(fields))
+
+
+def write_geometry_file(path: str, entities: Iterable[Line2D | Arc2D]) -> int:
+    """
+    Write entities to a geometry file.
+    :param path: Destination file path.
+    :param entities: Iterable of Line2D and Arc2D instances.
+    :return: The number of records written.
+    """
+    count = 0
+    with open(path, "w") as stream:
+        for entity in entities:
+            stream.write(format_entity(entity) + "\n")
+            count += 1
+    return count
+
+
+def read_geometry_file(path: str) -> Iterator[Line2D | Arc2D]:
+    """
+    Stream the entities of a geometry file one record at a time.
+    :param path: Source file path.
+    :return: An iterator over Line2D and Arc2D instances.
+    """
+    with open(path) as stream:
+        for line in stream:
+            fields = line.split()
+            if not fields or fields[0].startswith("#"):
+                continue
+            yield parse_entity(fields)
+
+
+def entity_length(entity: Line2D | Arc2D) -> float:
+    """
+    Get the length of a Line2D or the arc length of an Arc2D.
+    :param entity: The entity to measure.
+    :return: Length as a float.
+    """
+    if isinstance(entity, Arc2D):
+        return entity.arc_length()
+    return entity.length()
+
+
+class TileGrid:
+    def __init__(self, tile_size: float, origin: tuple[float, float] = (0.0, 0.0)):
+        """
+        Initialize a regular grid of square tiles.
+        :param tile_size: Side length of a tile (must be positive).
+        :param origin: Corner of tile (0, 0).
+        """
+        if not isinstance(tile_size, (int, float)):
+            raise TypeError("Tile size must be a numeric value.")
+        if tile_size <= 0:
+            raise ValueError("Tile size must be positive.")
+        self.tile_size = tile_size
+        self.origin = origin
+
+    def tile_of(self, x: float, y: float) -> tuple[int, int]:
+        """
+        Get the key of the tile containing a coordinate.
+        :param x: X-coordinate.
+        :param y: Y-coordinate.
+        :return: Tile key as (column, row).
+        """
+        return (floor((x - self.origin[0]) / self.tile_size),
+                floor((y - self.origin[1]) / self.tile_size))
+
+    def tile_bounds(self, key: tuple[int, int]) -> tuple[float, float, float, float]:
+        """
+        Get the bounds of a tile.
+        :param key: Tile key as (column, row).
+        :return: (min_x, min_y, max_x, max_y) of the tile.
+        """
+        min_x = self.origin[0] + key[0] * self.tile_size
+        min_y = self.origin[1] + key[1] * self.tile_size
+        return min_x, min_y, min_x + self.tile_size, min_y + self.tile_size
+
+    def tiles_overlapping(self, bbox: tuple[float, float, float, float]) -> Iterator[tuple[int, int]]:
+        """
+        Iterate over the keys of all tiles overlapping a bounding box.
+        :param bbox: (min_x, min_y, max_x, max_y).
+        :return: An iterator over tile keys.
+        """
+        col0, row0 = self.tile_of(bbox[0], bbox[1])
+        col1, row1 = self.tile_of(bbox[2], bbox[3])
+        for col in range(col0, col1 + 1):
+            for row in range(row0, row1 + 1):
+                yield col, row
+
+
+class TiledGeometry:
+    def __init__(self, path: str, tile_size: float, origin: tuple[float, float] = (0.0, 0.0),
+                 workdir: Optional[str] = None, max_buffered: int = 10000):
+        """
+        Prepare tiled processing of a geometry file.
+        :param path: Source geometry file.
+        :param tile_size: Side length of a tile.
+        :param origin: Corner of tile (0, 0).
+        :param workdir: Directory for tile spill files (a temporary directory is used by default).
+        :param max_buffered: Number of records buffered in memory before spilling to disk.
+        """
+        if max_buffered <= 0:
+            raise ValueError("max_buffered must be positive.")
+        self.path = path
+        self.grid = TileGrid(tile_size, origin)
+        self.max_buffered = max_buffered
+        self._owns_workdir = workdir is None
+        self.workdir = tempfile.mkdtemp(prefix="pyvecalgebra_tiles_") if workdir is None else workdir
+        self._tiles = set()
+        self._partitioned = False
+        self._margin = 0.0
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Remove the spill files (and the work directory if it was created here)."""
+        if self._owns_workdir:
+            shutil.rmtree(self.workdir, ignore_errors=True)
+        else:
+            for key in self._tiles:
+                path = self._tile_path(key)
+                if os.path.exists(path):
+                    os.remove(path)
+        self._tiles = set()
+        self._partitioned = False
+
+    def _tile_path(self, key: tuple[int, int]) -> str:
+        return os.path.join(self.workdir, "tile_%d_%d.geo" % key)
+
+    def _flush(self, buffers: dict) -> None:
+        for key, records in buffers.items():
+            with open(self._tile_path(key), "a") as stream:
+                stream.writelines(records)
+            self._tiles.add(key)
+        buffers.clear()
+
+    def partition(self, margin: float = 0.0) -> int:
+        """
+        Stream the source file once and spill every entity into the tiles it overlaps.
+        :param margin: Grow every bounding box by this distance before spilling.
+        :return: The number of non-empty tiles.
+        """
+        if margin < 0:
+            raise ValueError("Margin cannot be negative.")
+        if self._partitioned:
+            self.close()
+            if self._owns_workdir:
+                os.makedirs(self.workdir)
+        buffers = {}
+        buffered = 0
+        for record_no, entity in enumerate(read_geometry_file(self.path)):
+            owner = self.grid.tile_of(entity.sp.x, entity.sp.y)
+            record = format_entity(entity)
+            box = entity.bounding_box()
+            for key in self.grid.tiles_overlapping((box[0] - margin, box[1] - margin,
+                                                    box[2] + margin, box[3] + margin)):
+                buffers.setdefault(key, []).append("%d %d %s\n" % (record_no, key == owner, record))
+                buffered += 1
+            if buffered >= self.max_buffered:
+                self._flush(buffers)
+                buffered = 0
+        self._flush(buffers)
+        self._partitioned = True
+        self._margin = margin
+        return len(self._tiles)
+
+    def tiles(self) -> list[tuple[int, int]]:
+        """
+        Get the keys of all non-empty tiles.
+        :return: Sorted list of tile keys.
+        """
+        if not self._partitioned:
+            self.partition()
+        return sorted(self._tiles)
+
+    def load_tile(self, key: tuple[int, int]) -> list[tuple[int, Line2D | Arc2D, bool]]:
+        """
+        Load the entities of a single tile.
+        :param key: Tile key as (column, row).
+        :return: List of (record_no, entity, owned) tuples.
+        """
+        if key not in self._tiles:
+            return []
+        entities = []
+        with open(self._tile_path(key)) as stream:
+            for line in stream:
+                fields = line.split()
+                entities.append((int(fields[0]), parse_entity(fields[2:]), fields[1] == "1"))
+        return entities
+
+    def map_tiles(self, func: Callable) -> Iterator:
+        """
+        Apply a function to each tile in turn, holding one tile in memory at a time.
+        :param func: Callable taking (key, entities) as returned by load_tile.
+        :return: An iterator over the results of func.
+        """
+        for key in self.tiles():
+            yield func(key, self.load_tile(key))
+
+    def transform(self, output_path: str, func: Callable[[Line2D | Arc2D], Line2D | Arc2D]) -> int:
+        """
+        Apply a per-entity transformation and write the result to a geometry file.
+        Each entity is transformed exactly once, in its owner tile.
+        :param output_path: Destination geometry file.
+        :param func: Callable mapping an entity to its transformed entity.
+        :return: The number of records written.
+        """
+        def owned_results():
+            for key in self.tiles():
+                for _, entity, owned in self.load_tile(key):
+                    if owned:
+                        yield func(entity)
+        return write_geometry_file(output_path, owned_results())
+
+    def measure(self) -> tuple[int, float]:
+        """
+        Count the entities and sum their lengths.
+        :return: A tuple (count, total_length).
+        """
+        count = 0
+        total = 0.0
+        for key in self.tiles():
+            for _, entity, owned in self.load_tile(key):
+                if owned:
+                    count += 1
+                    total += entity_length(entity)
+        return count, total
+
+    def intersections(self) -> Iterator[tuple[int, int, Point2D]]:
+        """
+        Find all crossings between Line2D entities.
+        A crossing is reported only by the tile that contains it, so pairs
+        replicated into several tiles are reported once.
+        :return: An iterator over (record_a, record_b, point) with record_a < record_b.
+        """
+        for key in self.tiles():
+            lines = [(entity.bounding_box(), record_no, entity)
+                     for record_no, entity, _ in self.load_tile(key) if isinstance(entity, Line2D)]
+            lines.sort(key=lambda item: item[0][0])
+            for i, (box_a, record_a, line_a) in enumerate(lines):
+                for box_b, record_b, line_b in lines[i + 1:]:
+                    if box_b[0] > box_a[2]:
+                        break
+                    if box_b[1] > box_a[3] or box_b[3] < box_a[1]:
+                        continue
+                    status, point = line_a.intersection_with_line(line_b)
+                    if status != 1:
+                        continue
+                    # Clamp into the shared bounding box so that rounding cannot move the
+                    # reference point into a tile that does not hold both lines.
+                    ref_x = min(max(point.x, box_a[0], box_b[0]), box_a[2], box_b[2])
+                    ref_y = min(max(point.y, box_a[1], box_b[1]), box_a[3], box_b[3])
+                    if self.grid.tile_of(ref_x, ref_y) == key:
+                        yield min(record_a, record_b), max(record_a, record_b), point
+
+    def simplify(self, output_path: str, tolerance: float = 1e-9) -> int:
+        """
+        Write a copy of the source without degenerate and duplicate entities.
+        Entities shorter than the tolerance are dropped.  Entities of the same kind
+        whose end points (and arc centers) lie within the tolerance of each other,
+        in either direction, are duplicates; an entity is dropped when it duplicates
+        one with a lower record number.  The source is partitioned again with a
+        margin of the tolerance if needed.
+        :param output_path: Destination geometry file.
+        :param tolerance: Snapping tolerance for lengths and coordinates.
+        :return: The number of records written.
+        """
+        if tolerance <= 0:
+            raise ValueError("Tolerance must be positive.")
+        if not self._partitioned or self._margin < tolerance:
+            self.partition(tolerance)
+
+        def cell(point):
+            return floor(point.x / tolerance), floor(point.y / tolerance)
+
+        def near(p, q):
+            return hypot(p.x - q.x, p.y - q.y) <= tolerance
+
+        def duplicates(a, b):
+            if isinstance(a, Arc2D) != isinstance(b, Arc2D):
+                return False
+            if isinstance(a, Arc2D) and not near(a.cp, b.cp):
+                return False
+            return (near(a.sp, b.sp) and near(a.ep, b.ep)) or (near(a.sp, b.ep) and near(a.ep, b.sp))
+
+        def kept_entities():
+            for key in self.tiles():
+                entities = [(record_no, entity, owned) for record_no, entity, owned in self.load_tile(key)
+                            if entity_length(entity) >= tolerance]
+                # Index both end points by tolerance-sized cells; an end point within the
+                # tolerance of a point lies in the point's cell or one of its 8 neighbours.
+                cells = {}
+                for item in entities:
+                    for point in {cell(item[1].sp), cell(item[1].ep)}:
+                        cells.setdefault(point, []).append(item)
+                kept = []
+                for record_no, entity, owned in entities:
+                    if not owned:
+                        continue
+                    col, row = cell(entity.sp)
+                    if not any(other_no < record_no and duplicates(entity, other)
+                               for dc in (-1, 0, 1) for dr in (-1, 0, 1)
+                               for other_no, other, _ in cells.get((col + dc, row + dr), ())):
+                        kept.append((record_no, entity))
+                for _, entity in sorted(kept, key=lambda item: item[0]):
+                    yield entity
+        return write_geometry_file(output_path, kept_entities())
@@ -0,0 +1,2 @@
+from .toolpath import TravelPlan, optimize_travel
+__all__ = ['TravelPlan', 'optimize_travel']
@@ -0,0 +1,100 @@
+import random
+import unittest
+from math import hypot
+
+from .toolpath import optimize_travel
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+from chaining.chaining import chain_entities
+
+
+def _random_segments(count, seed=1, size=100.0):
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        x, y = rng.uniform(0, size), rng.uniform(0, size)
+        lines.append(Line2D(Point2D(x, y), Point2D(x + rng.uniform(-2, 2), y + rng.uniform(-2, 2))))
+    return lines
+
+
+def _travel(paths, origin=(0.0, 0.0)):
+    x, y = origin
+    total = 0.0
+    for path in paths:
+        total += hypot(path.sp.x - x, path.sp.y - y) if not hasattr(path, "start") else \
+            hypot(path.start.x - x, path.start.y - y)
+        end = path.ep if not hasattr(path, "end") else path.end
+        x, y = end.x, end.y
+    return total
+
+
+def _naive_greedy(lines):
+    remaining = set(range(len(lines)))
+    x, y = 0.0, 0.0
+    order = []
+    while remaining:
+        best = min(remaining, key=lambda k: min((hypot(lines[k].sp.x - x, lines[k].sp.y - y), k),
+                                                (hypot(lines[k].ep.x - x, lines[k].ep.y - y), k)))
+        flipped = hypot(lines[best].ep.x - x, lines[best].ep.y - y) < hypot(lines[best].sp.x - x, lines[best].sp.y - y)
+        order.append(best)
+        end = lines[best].sp if flipped else lines[best].ep
+        x, y = end.x, end.y
+        remaining.remove(best)
+    return order
+
+
+class TestToolpath(unittest.TestCase):
+    def test_plan_is_permutation_and_reduces_travel(self):
+        lines = _random_segments(500)
+        plan = optimize_travel(lines)
+        self.assertEqual(sorted(plan.order), list(range(500)))
+        self.assertAlmostEqual(plan.travel_before, _travel(lines))
+        self.assertAlmostEqual(plan.travel_after, _travel(plan.apply(lines)))
+        self.assertLess(plan.travel_after, plan.travel_before / 5)
+        self.assertGreater(plan.saving, 0.8)
+
+    def test_greedy_matches_naive_nearest_neighbour(self):
+        lines = _random_segments(200, seed=5)
+        plan = optimize_travel(lines, window=0)
+        self.assertEqual(plan.order, _naive_greedy(lines))
+
+    def test_local_search_improves_greedy(self):
+        lines = _random_segments(400, seed=9)
+        greedy = optimize_travel(lines, window=0)
+        refined = optimize_travel(lines, window=8)
+        self.assertLessEqual(refined.travel_after, greedy.travel_after)
+
+    def test_reversal(self):
+        lines = [Line2D(Point2D(10, 0), Point2D(1, 0)), Line2D(Point2D(20, 0), Point2D(11, 0))]
+        plan = optimize_travel(lines)
+        self.assertEqual(plan.order, [0, 1])
+        self.assertEqual(plan.reversed, [True, True])
+        self.assertAlmostEqual(plan.travel_after, 2)
+        arranged = plan.apply(lines)
+        self.assertEqual(arranged[0].sp, Point2D(1, 0))
+        self.assertEqual(lines[0].sp, Point2D(10, 0))
+        fixed = optimize_travel(lines, allow_reverse=False)
+        self.assertEqual(fixed.reversed, [False, False])
+        self.assertEqual(fixed.order, [1, 0])
+        self.assertAlmostEqual(fixed.travel_after, 20 + 1)
+
+    def test_chains_arcs_and_origin(self):
+        pieces = [Line2D(Point2D(5, 5), Point2D(6, 5)), Line2D(Point2D(6, 5), Point2D(6, 6)),
+                  Arc2D(Point2D(0, 0), Point2D(1, 0), Point2D(0, 1))]
+        chains = chain_entities(pieces)
+        plan = optimize_travel(chains, origin=Point2D(6, 7))
+        arranged = plan.apply(chains)
+        self.assertEqual(arranged[0].start, Point2D(6, 6))
+        self.assertAlmostEqual(plan.travel_after, _travel(arranged, (6, 7)))
+
+    def test_empty_and_errors(self):
+        self.assertEqual(optimize_travel([]).order, [])
+        with self.assertRaises(TypeError):
+            optimize_travel([Point2D(0, 0)])
+        with self.assertRaises(ValueError):
+            optimize_travel(_random_segments(3), window=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,256 @@
+"""
+Travel-order optimization for toolpaths.
+
+Given paths to cut (chains, lines or arcs), optimize_travel chooses the order
+and direction in which to cut them so that the rapid travel between the end
+of one path and the start of the next is short:
+
+1. greedy nearest neighbour from the origin, using a uniform grid over the
+   path end points so each step inspects only nearby cells;
+2. windowed 2-opt: reversing a run of up to `window` consecutive paths
+   (which also flips each of them) when that shortens the two links at its
+   ends;
+3. windowed or-opt: moving a block of one to three paths, possibly flipped,
+   to a better position at most `window` places away.
+
+Closed paths are entered and left at their start point.  When reversal is
+not allowed only or-opt moves without flipping are used.
+"""
+from math import floor, hypot, sqrt
+from typing import Optional, Sequence
+
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+from chaining.chaining import Chain
+
+_GAIN_EPSILON = 1e-12
+
+
+def _end_points(path) -> tuple[float, float, float, float]:
+    if isinstance(path, Chain):
+        start, end = path.start, path.end
+    elif isinstance(path, (Line2D, Arc2D)):
+        start, end = path.sp, path.ep
+    else:
+        raise TypeError("Paths must be Chain, Line2D or Arc2D instances.")
+    return start.x, start.y, end.x, end.y
+
+
+class TravelPlan:
+    def __init__(self, order: list[int], reversed_flags: list[bool], travel_before: float, travel_after: float):
+        """
+        Initialize a travel plan.
+        :param order: Path indices in cutting order.
+        :param reversed_flags: True for each position whose path is cut backwards.
+        :param travel_before: Travel length of the input order and directions.
+        :param travel_after: Travel length of the plan.
+        """
+        self.order = order
+        self.reversed = reversed_flags
+        self.travel_before = travel_before
+        self.travel_after = travel_after
+
+    @property
+    def saving(self) -> float:
+        """Get the fraction of the input travel removed by the plan."""
+        return 1 - self.travel_after / self.travel_before if self.travel_before > 0 else 0.0
+
+    def apply(self, paths: Sequence) -> list:
+        """
+        Arrange paths according to the plan.
+        Reversed lines and arcs are returned as reversed copies sharing their points;
+        reversed chains as new chains of reversed copies.  Inputs are not modified.
+        :param paths: The paths the plan was computed for.
+        :return: Paths in cutting order and direction.
+        """
+        arranged = []
+        for index, flipped in zip(self.order, self.reversed):
+            path = paths[index]
+            if flipped:
+                if isinstance(path, Chain):
+                    path = Chain(list(path.entities), list(path.indices), list(path.reversed), path.closed).reverse()
+                elif isinstance(path, Line2D):
+                    path = Line2D(path.ep, path.sp)
+                else:
+                    path = Arc2D(path.cp, path.ep, path.sp)
+            arranged.append(path)
+        return arranged
+
+    def __repr__(self) -> str:
+        return "TravelPlan(%d paths, travel %g -> %g)" % (len(self.order), self.travel_before, self.travel_after)
+
+
+class _Sequence:
+    """Oriented path sequence keeping the entry and exit point of every position."""
+
+    def __init__(self, ends: list, order: list[int], flips: list[bool], origin: tuple[float, float]):
+        self.order = order
+        self.flips = flips
+        self.origin = origin
+        self.entries = [(e[2], e[3]) if flip else (e[0], e[1]) for e, flip in zip(map(ends.__getitem__, order), flips)]
+        self.exits = [(e[0], e[1]) if flip else (e[2], e[3]) for e, flip in zip(map(ends.__getitem__, order), flips)]
+
+    def reverse(self, i: int, j: int) -> None:
+        """Reverse positions i..j, flipping each path."""
+        self.order[i:j + 1] = self.order[i:j + 1][::-1]
+        self.flips[i:j + 1] = [not flag for flag in self.flips[i:j + 1][::-1]]
+        self.entries[i:j + 1], self.exits[i:j + 1] = self.exits[i:j + 1][::-1], self.entries[i:j + 1][::-1]
+
+    def move(self, i: int, j: int, at: int, flip: bool) -> None:
+        """Move positions i..j so that the block starts at position at of the remaining sequence."""
+        for name in ("order", "flips", "entries", "exits"):
+            items = getattr(self, name)
+            block = items[i:j + 1]
+            del items[i:j + 1]
+            items[at:at] = block
+        if flip:
+            self.reverse(at, at + j - i)
+
+    def travel(self) -> float:
+        total = 0.0
+        x, y = self.origin
+        for (ax, ay), (bx, by) in zip(self.entries, self.exits):
+            total += hypot(ax - x, ay - y)
+            x, y = bx, by
+        return total
+
+
+def _dist(a: tuple[float, float], b: Optional[tuple[float, float]]) -> float:
+    return 0.0 if b is None else hypot(b[0] - a[0], b[1] - a[1])
+
+
+def _greedy(ends: list, origin: tuple[float, float], allow_reverse: bool) -> tuple[list[int], list[bool]]:
+    n = len(ends)
+    xs = [e[0] for e in ends] + ([e[2] for e in ends] if allow_reverse else [])
+    ys = [e[1] for e in ends] + ([e[3] for e in ends] if allow_reverse else [])
+    min_x, min_y = min(xs), min(ys)
+    width, height = max(xs) - min_x, max(ys) - min_y
+    cell = max(sqrt(width * height / len(xs)) if width > 0 and height > 0 else max(width, height) / len(xs), 1e-12)
+    columns, rows = int(width / cell) + 1, int(height / cell) + 1
+    grid = {}
+    keys = []
+    for k in range(len(xs)):
+        key = (floor((xs[k] - min_x) / cell), floor((ys[k] - min_y) / cell))
+        grid.setdefault(key, []).append(k)
+        keys.append(key)
+    order, flips = [], []
+    x, y = origin
+    for _ in range(n):
+        cx, cy = floor((x - min_x) / cell), floor((y - min_y) / cell)
+        best, best_d = -1, float('inf')
+        # Start at the first ring touching the grid; once a ring would cover more cells than are
+        # still occupied, scanning the occupied cells directly is cheaper.
+        ring = max(0, -cx, cx - columns, -cy, cy - rows)
+        while True:
+            if (2 * ring + 1) ** 2 > 4 * len(grid):
+                for members in grid.values():
+                    for k in members:
+                        d = hypot(xs[k] - x, ys[k] - y)
+                        if d < best_d or (d == best_d and k < best):
+                            best, best_d = k, d
+                break
+            for gx in range(max(cx - ring, 0), min(cx + ring, columns) + 1):
+                for gy in ((cy - ring, cy + ring) if abs(gx - cx) != ring else range(cy - ring, cy + ring + 1)):
+                    for k in grid.get((gx, gy), ()):
+                        d = hypot(xs[k] - x, ys[k] - y)
+                        if d < best_d or (d == best_d and k < best):
+                            best, best_d = k, d
+            if best >= 0 and best_d <= ring * cell:
+                break
+            ring += 1
+        path, flipped = (best - n, True) if best >= n else (best, False)
+        order.append(path)
+        flips.append(flipped)
+        for k in ((path, path + n) if allow_reverse else (path,)):
+            members = grid[keys[k]]
+            members.remove(k)
+            if not members:
+                del grid[keys[k]]
+        sx, sy, ex, ey = ends[path]
+        x, y = (sx, sy) if flipped else (ex, ey)
+    return order, flips
+
+
+def _two_opt(seq: _Sequence, window: int) -> bool:
+    improved = False
+    entries, exits = seq.entries, seq.exits
+    n = len(entries)
+    for i in range(n):
+        before = exits[i - 1] if i else seq.origin
+        for j in range(i, min(n, i + window)):
+            after = entries[j + 1] if j + 1 < n else None
+            old = _dist(before, entries[i]) + _dist(exits[j], after)
+            new = _dist(before, exits[j]) + _dist(entries[i], after)
+            if new < old - _GAIN_EPSILON:
+                seq.reverse(i, j)
+                improved = True
+    return improved
+
+
+def _or_opt(seq: _Sequence, window: int, allow_reverse: bool) -> bool:
+    improved = False
+    entries, exits = seq.entries, seq.exits
+    n = len(entries)
+    for length in (1, 2, 3):
+        i = 0
+        while i + length <= n:
+            last = i + length - 1
+            before = exits[i - 1] if i else seq.origin
+            after = entries[last + 1] if last + 1 < n else None
+            hx, hy = entries[i]
+            tx, ty = exits[last]
+            removal = _dist(before, (hx, hy)) + _dist((tx, ty), after) - _dist(before, after)
+            best_gain, best_k, best_flip = _GAIN_EPSILON, None, False
+            for k in range(max(-1, i - 1 - window), min(n - 1, last + window) + 1):
+                if i - 1 <= k <= last:
+                    continue
+                ax, ay = exits[k] if k >= 0 else seq.origin
+                if k + 1 < n:
+                    bx, by = entries[k + 1]
+                    base = hypot(bx - ax, by - ay)
+                    gain = removal + base - hypot(hx - ax, hy - ay) - hypot(bx - tx, by - ty)
+                    flipped = removal + base - hypot(tx - ax, ty - ay) - hypot(bx - hx, by - hy)
+                else:
+                    gain = removal - hypot(hx - ax, hy - ay)
+                    flipped = removal - hypot(tx - ax, ty - ay)
+                if gain > best_gain:
+                    best_gain, best_k, best_flip = gain, k, False
+                if allow_reverse and flipped > best_gain:
+                    best_gain, best_k, best_flip = flipped, k, True
+            if best_k is not None:
+                seq.move(i, last, best_k + 1 if best_k < i else best_k + 1 - length, best_flip)
+                improved = True
+            else:
+                i += 1
+    return improved
+
+
+def optimize_travel(paths: Sequence, origin: Optional[Point2D] = None, allow_reverse: bool = True,
+                    window: int = 8, max_passes: int = 4) -> TravelPlan:
+    """
+    Choose the cutting order and direction of paths to shorten the travel between them.
+    :param paths: Sequence of Chain, Line2D or Arc2D instances.
+    :param origin: Tool position before the first path (the origin if None).
+    :param allow_reverse: Allow cutting paths from their end point.
+    :param window: Largest distance, in positions, of the 2-opt and or-opt moves (0 keeps the greedy order).
+    :param max_passes: Maximum number of local-search passes.
+    :return: A TravelPlan with the travel length before and after optimization.
+    """
+    if window < 0 or max_passes < 0:
+        raise ValueError("window and max_passes cannot be negative.")
+    if origin is not None and not isinstance(origin, Point2D):
+        raise TypeError("Origin must be a Point2D instance.")
+    start = (0.0, 0.0) if origin is None else (origin.x, origin.y)
+    ends = [_end_points(path) for path in paths]
+    if not ends:
+        return TravelPlan([], [], 0.0, 0.0)
+    before = _Sequence(ends, list(range(len(ends))), [False] * len(ends), start).travel()
+    order, flips = _greedy(ends, start, allow_reverse)
+    seq = _Sequence(ends, order, flips, start)
+    if window > 0:
+        for _ in range(max_passes):
+            improved = _two_opt(seq, window) if allow_reverse else False
+            if not _or_opt(seq, window, allow_reverse) and not improved:
+                break
+    return TravelPlan(seq.order, seq.flips, before, seq.travel())
@@ -0,0 +1,2 @@
+from .topology import Topology2D
+__all__ = ['Topology2D']
@@ -0,0 +1,98 @@
+import unittest
+from math import pi
+
+from .topology import Topology2D
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+from mesh.mesh import Mesh2D
+
+
+def _polyline(*coords, closed=True):
+    points = [Point2D(x, y) for x, y in coords]
+    if closed:
+        points.append(points[0])
+    return [Line2D(points[k], points[k + 1]) for k in range(len(points) - 1)]
+
+
+class TestTopology2D(unittest.TestCase):
+    def test_square_with_diagonal(self):
+        lines = _polyline((0, 0), (2, 0), (2, 2), (0, 2)) + [Line2D(Point2D(0, 0), Point2D(2, 2))]
+        topology = Topology2D(lines)
+        self.assertEqual(topology.vertex_count, 4)
+        self.assertEqual(topology.edge_count, 5)
+        self.assertEqual(topology.face_count, 3)
+        bounded = topology.bounded_faces()
+        self.assertEqual(sorted(topology.face_area(f) for f in bounded), [2.0, 2.0])
+        outer = [f for f in range(topology.face_count) if not topology.is_bounded(f)]
+        self.assertEqual(len(outer), 1)
+        self.assertAlmostEqual(topology.face_area(outer[0]), -4.0)
+        self.assertEqual(topology.adjacent_faces(bounded[0]), {bounded[1], outer[0]})
+
+    def test_half_edge_invariants(self):
+        lines = _polyline((0, 0), (3, 0), (3, 3), (0, 3)) + _polyline((3, 0), (6, 0), (6, 3), (3, 3), closed=False)
+        topology = Topology2D(lines)
+        for h in range(2 * topology.edge_count):
+            self.assertEqual(topology.prev(topology.next(h)), h)
+            self.assertEqual(topology.destination(h), topology.origin(topology.next(h)))
+            self.assertEqual(topology.twin(topology.twin(h)), h)
+        self.assertEqual(sorted(topology.face_area(f) for f in topology.bounded_faces()), [9.0, 9.0])
+
+    def test_outgoing_sorted_counterclockwise(self):
+        center = Point2D(0, 0)
+        lines = [Line2D(center, Point2D(x, y)) for x, y in ((0, 1), (1, 0), (-1, 0), (0, -1))]
+        topology = Topology2D(lines)
+        directions = [topology.vertex(topology.destination(h)) for h in topology.outgoing(0)]
+        self.assertEqual([(p.x, p.y) for p in directions], [(1, 0), (0, 1), (-1, 0), (0, -1)])
+
+    def test_dangling_edge_does_not_change_area(self):
+        lines = _polyline((0, 0), (4, 0), (4, 4), (0, 4)) + [Line2D(Point2D(4, 4), Point2D(2, 2))]
+        topology = Topology2D(lines)
+        self.assertEqual([topology.face_area(f) for f in topology.bounded_faces()], [16.0])
+
+    def test_half_disk_with_arc(self):
+        arc = Arc2D(Point2D(0, 0), Point2D(1, 0), Point2D(-1, 0))
+        topology = Topology2D([Line2D(Point2D(-1, 0), Point2D(1, 0)), arc])
+        self.assertEqual(topology.face_count, 2)
+        areas = sorted(topology.face_area(f) for f in range(topology.face_count))
+        self.assertAlmostEqual(areas[0], -pi / 2)
+        self.assertAlmostEqual(areas[1], pi / 2)
+
+    def test_arc_tangent_to_line_ordering(self):
+        # A quarter arc and a line both leave (0, 0) heading north; the arc bends west.
+        arc = Arc2D(Point2D(-1, 0), Point2D(0, 0), Point2D(-1, 1))
+        lines = [Line2D(Point2D(0, 0), Point2D(0, 1)), Line2D(Point2D(0, 1), Point2D(-1, 1))]
+        topology = Topology2D(lines + [arc])
+        bounded = topology.bounded_faces()
+        self.assertEqual(len(bounded), 1)
+        self.assertAlmostEqual(topology.face_area(bounded[0]), 1 - pi / 4)
+
+    def test_sources_and_snapping(self):
+        lines = [Line2D(Point2D(0, 0), Point2D(1, 0)), Line2D(Point2D(1, 0), Point2D(1, 0)),
+                 Line2D(Point2D(1 + 1e-12, 0), Point2D(1, 1))]
+        topology = Topology2D(lines)
+        self.assertEqual(topology.edge_count, 2)
+        self.assertEqual([topology.source(h) for h in (0, 2)], [0, 2])
+        self.assertEqual(topology.vertex_count, 3)
+
+    def test_from_mesh(self):
+        mesh = Mesh2D.from_entities(_polyline((0, 0), (1, 0), (1, 1), (0, 1)))
+        topology = Topology2D.from_mesh(mesh)
+        self.assertEqual([topology.face_area(f) for f in topology.bounded_faces()], [1.0])
+        mesh.add_segment(0, 0)
+        with self.assertRaises(ValueError):
+            Topology2D.from_mesh(mesh)
+        with self.assertRaises(TypeError):
+            Topology2D([Point2D(0, 0)])
+
+    def test_grid_faces(self):
+        n = 20
+        lines = [Line2D(Point2D(i, j), Point2D(i + 1, j)) for i in range(n) for j in range(n + 1)]
+        lines += [Line2D(Point2D(i, j), Point2D(i, j + 1)) for i in range(n + 1) for j in range(n)]
+        topology = Topology2D(lines)
+        self.assertEqual(len(topology.bounded_faces()), n * n)
+        self.assertTrue(all(abs(topology.face_area(f) - 1) < 1e-12 for f in topology.bounded_faces()))
+
+
+if __name__ == '__main__':
+    unittest.main()
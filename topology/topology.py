@@ -0,0 +1,302 @@
+"""
+Half-edge (DCEL) planar topology of noded Line2D/Arc2D networks.
+
+Entities must only meet at their end points (split them at intersections
+first).  End points are merged through the Mesh2D snapping grid, every
+entity becomes an edge with two opposite half-edges, and the half-edges
+leaving each vertex are sorted counterclockwise by their departure tangent;
+arcs leaving in the same direction as another edge are ordered by signed
+curvature.  Linking every incoming half-edge to the outgoing one just
+clockwise of its twin traces each face with the face on its left, so
+bounded faces have a positive signed area and the outer boundary of every
+connected component a negative one.
+
+Building takes O(n log n) for n edges: one grid lookup per end point and
+one sort per vertex.
+"""
+from array import array
+from math import atan2, pi, sqrt
+from typing import Iterable, Optional, Self
+
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D, TOLERANCE_LENGTH
+from mesh.mesh import Mesh2D
+
+TOLERANCE_TANGENT = 1e-10
+
+
+def _angle(dx: float, dy: float) -> float:
+    angle = atan2(dy, dx)
+    if angle < 0:
+        angle += 2 * pi
+    return 0.0 if angle >= 2 * pi - TOLERANCE_TANGENT else angle
+
+
+class Topology2D:
+    def __init__(self, entities: Iterable[Line2D | Arc2D] = (), tolerance: int | float = TOLERANCE_LENGTH):
+        """
+        Build the half-edge topology of a noded set of lines and arcs.
+        Entities that collapse to a single vertex after snapping are skipped.
+        :param entities: Iterable of Line2D and Arc2D instances meeting only at their end points.
+        :param tolerance: Distance below which end points are merged.
+        """
+        mesh = Mesh2D(tolerance)
+        sources = []
+        for position, entity in enumerate(entities):
+            if isinstance(entity, Line2D):
+                sp, ep = entity.points
+                start, end = mesh.snap_vertex(sp.x, sp.y), mesh.snap_vertex(ep.x, ep.y)
+                if start != end:
+                    mesh.add_segment(start, end)
+                    sources.append((0, position))
+            elif isinstance(entity, Arc2D):
+                cp, sp, ep = entity.points
+                start, end = mesh.snap_vertex(sp.x, sp.y), mesh.snap_vertex(ep.x, ep.y)
+                if start != end:
+                    mesh.add_arc(mesh.add_vertex(cp.x, cp.y), start, end)
+                    sources.append((1, position))
+            else:
+                raise TypeError("Entities must be Line2D or Arc2D instances.")
+        mesh.release_index()
+        segment_sources = [position for kind, position in sources if kind == 0]
+        arc_sources = [position for kind, position in sources if kind == 1]
+        self._build(mesh, segment_sources + arc_sources)
+
+    @classmethod
+    def from_mesh(cls, mesh: Mesh2D) -> Self:
+        """
+        Build the topology of a Mesh2D; edge k is segment k, followed by the arcs.
+        Arc centers need not be vertices of the network.
+        :param mesh: A noded Mesh2D.
+        :return: A new Topology2D.
+        """
+        if not isinstance(mesh, Mesh2D):
+            raise TypeError("Argument must be a Mesh2D instance.")
+        indices = mesh.segment_indices
+        for k in range(0, len(indices), 2):
+            if indices[k] == indices[k + 1]:
+                raise ValueError("Segment %d starts and ends at the same vertex." % (k // 2))
+        for k in range(0, len(mesh.arc_indices), 3):
+            if mesh.arc_indices[k + 1] == mesh.arc_indices[k + 2]:
+                raise ValueError("Arc %d starts and ends at the same vertex." % (k // 3))
+        topology = cls.__new__(cls)
+        topology._build(mesh, list(range(mesh.segment_count + mesh.arc_count)))
+        return topology
+
+    def _build(self, mesh: Mesh2D, sources: list) -> None:
+        self.mesh = mesh
+        self.sources = sources
+        coords = mesh.coords
+        segments = mesh.segment_indices
+        arcs = mesh.arc_indices
+        self.segment_count = len(segments) // 2
+        edge_count = self.segment_count + len(arcs) // 3
+        origin = array('q', bytes(16 * edge_count))
+        # Signed sweep of each arc edge (0 for segments) and departure keys of each half-edge.
+        sweeps = array('d', bytes(8 * edge_count))
+        keys = [None] * (2 * edge_count)
+        for k in range(self.segment_count):
+            u, v = segments[2 * k], segments[2 * k + 1]
+            origin[2 * k], origin[2 * k + 1] = u, v
+            dx = coords[2 * v] - coords[2 * u]
+            dy = coords[2 * v + 1] - coords[2 * u + 1]
+            keys[2 * k] = (_angle(dx, dy), 0.0)
+            keys[2 * k + 1] = (_angle(-dx, -dy), 0.0)
+        for a in range(len(arcs) // 3):
+            k = self.segment_count + a
+            c, u, v = arcs[3 * a], arcs[3 * a + 1], arcs[3 * a + 2]
+            origin[2 * k], origin[2 * k + 1] = u, v
+            cx, cy = coords[2 * c], coords[2 * c + 1]
+            sx, sy = coords[2 * u] - cx, coords[2 * u + 1] - cy
+            ex, ey = coords[2 * v] - cx, coords[2 * v + 1] - cy
+            sweep = _angle(ex, ey) - _angle(sx, sy)
+            sweeps[k] = sweep
+            curvature = 1.0 / sqrt(sx * sx + sy * sy)
+            if sweep > 0:
+                keys[2 * k] = (_angle(-sy, sx), curvature)
+                keys[2 * k + 1] = (_angle(ey, -ex), -curvature)
+            else:
+                keys[2 * k] = (_angle(sy, -sx), -curvature)
+                keys[2 * k + 1] = (_angle(-ey, ex), curvature)
+        self._origin = origin
+        self._sweeps = sweeps
+
+        outgoing = [[] for _ in range(mesh.vertex_count)]
+        for h in range(2 * edge_count):
+            outgoing[origin[h]].append(h)
+        nxt = array('q', bytes(16 * edge_count))
+        for edges in outgoing:
+            if len(edges) > 1:
+                edges.sort(key=keys.__getitem__)
+                start = 0
+                for i in range(1, len(edges) + 1):
+                    if i == len(edges) or keys[edges[i]][0] - keys[edges[start]][0] >= TOLERANCE_TANGENT:
+                        if i - start > 1:
+                            edges[start:i] = sorted(edges[start:i], key=lambda h: keys[h][1])
+                        start = i
+            for i, h in enumerate(edges):
+                nxt[h ^ 1] = edges[i - 1]
+        self._outgoing = outgoing
+        self._next = nxt
+        prev = array('q', bytes(16 * edge_count))
+        for h in range(2 * edge_count):
+            prev[nxt[h]] = h
+        self._prev = prev
+
+        face = array('q', [-1]) * (2 * edge_count)
+        self._face_start = []
+        self._face_area = []
+        for first in range(2 * edge_count):
+            if face[first] != -1:
+                continue
+            f = len(self._face_start)
+            area = 0.0
+            h = first
+            while face[h] == -1:
+                face[h] = f
+                area += self._area_term(h)
+                h = nxt[h]
+            self._face_start.append(first)
+            self._face_area.append(area)
+        self._face = face
+
+    def _area_term(self, h: int) -> float:
+        coords = self.mesh.coords
+        u, v = self._origin[h], self._origin[h ^ 1]
+        px, py = coords[2 * u], coords[2 * u + 1]
+        qx, qy = coords[2 * v], coords[2 * v + 1]
+        k = h >> 1
+        if k < self.segment_count:
+            return 0.5 * (px * qy - qx * py)
+        c = self.mesh.arc_indices[3 * (k - self.segment_count)]
+        cx, cy = coords[2 * c], coords[2 * c + 1]
+        sweep = self._sweeps[k] if h & 1 == 0 else -self._sweeps[k]
+        r2 = (px - cx) * (px - cx) + (py - cy) * (py - cy)
+        return 0.5 * (cx * (qy - py) - cy * (qx - px) + r2 * sweep)
+
+    @property
+    def vertex_count(self) -> int:
+        """Get the number of vertices (including arc centers)."""
+        return self.mesh.vertex_count
+
+    @property
+    def edge_count(self) -> int:
+        """Get the number of edges."""
+        return len(self._origin) // 2
+
+    @property
+    def face_count(self) -> int:
+        """Get the number of faces, counting the outer boundary of each connected component."""
+        return len(self._face_start)
+
+    def vertex(self, v: int) -> Point2D:
+        """
+        Get the position of a vertex.
+        :param v: Vertex index.
+        :return: Point2D view of the vertex.
+        """
+        return self.mesh.vertex(v)
+
+    def source(self, h: int) -> int:
+        """
+        Get the index, in the input sequence, of the entity a half-edge belongs to.
+        :param h: Half-edge index.
+        :return: Entity index (edge index for topologies built from a mesh).
+        """
+        return self.sources[h >> 1]
+
+    def is_arc(self, h: int) -> bool:
+        """Check if a half-edge runs along an arc."""
+        return h >> 1 >= self.segment_count
+
+    def origin(self, h: int) -> int:
+        """Get the vertex a half-edge leaves from."""
+        return self._origin[h]
+
+    def destination(self, h: int) -> int:
+        """Get the vertex a half-edge arrives at."""
+        return self._origin[h ^ 1]
+
+    @staticmethod
+    def twin(h: int) -> int:
+        """Get the opposite half-edge."""
+        return h ^ 1
+
+    def next(self, h: int) -> int:
+        """Get the half-edge following h around its face."""
+        return self._next[h]
+
+    def prev(self, h: int) -> int:
+        """Get the half-edge preceding h around its face."""
+        return self._prev[h]
+
+    def face(self, h: int) -> int:
+        """Get the face on the left of a half-edge."""
+        return self._face[h]
+
+    def outgoing(self, v: int) -> list[int]:
+        """
+        Get the half-edges leaving a vertex in counterclockwise order.
+        :param v: Vertex index.
+        :return: List of half-edge indices.
+        """
+        return list(self._outgoing[v])
+
+    def face_half_edges(self, f: int) -> list[int]:
+        """
+        Get the boundary of a face.
+        :param f: Face index.
+        :return: Half-edges in boundary order (counterclockwise for bounded faces).
+        """
+        first = self._face_start[f]
+        boundary = [first]
+        h = self._next[first]
+        while h != first:
+            boundary.append(h)
+            h = self._next[h]
+        return boundary
+
+    def face_vertices(self, f: int) -> list[int]:
+        """
+        Get the vertices along the boundary of a face.
+        :param f: Face index.
+        :return: Vertex indices in boundary order.
+        """
+        return [self._origin[h] for h in self.face_half_edges(f)]
+
+    def face_area(self, f: int) -> float:
+        """
+        Get the signed area enclosed by a face boundary, arcs included.
+        :param f: Face index.
+        :return: Positive area for bounded faces, negative or zero for outer boundaries.
+        """
+        return self._face_area[f]
+
+    def is_bounded(self, f: int) -> bool:
+        """Check if a face is a bounded region rather than the outer boundary of a component."""
+        return self._face_area[f] > 0
+
+    def bounded_faces(self) -> list[int]:
+        """Get the indices of all bounded regions."""
+        return [f for f, area in enumerate(self._face_area) if area > 0]
+
+    def adjacent_faces(self, f: int) -> set[int]:
+        """
+        Get the faces sharing an edge with a face.
+        :param f: Face index.
+        :return: Set of face indices (without f itself).
+        """
+        return {self._face[h ^ 1] for h in self.face_half_edges(f)} - {f}
+
+    def find_half_edge(self, u: int, v: int) -> Optional[int]:
+        """
+        Find a half-edge from vertex u to vertex v.
+        :param u: Origin vertex.
+        :param v: Destination vertex.
+        :return: Half-edge index, or None if the vertices are not adjacent.
+        """
+        for h in self._outgoing[u]:
+            if self._origin[h ^ 1] == v:
+                return h
+        return None
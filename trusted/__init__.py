@@ -0,0 +1,2 @@
+from .trusted import is_trusted, set_trusted, trusted_mode
+__all__ = ['is_trusted', 'set_trusted', 'trusted_mode']
@@ -0,0 +1,152 @@
+import random
+import threading
+import unittest
+
+from trusted import trusted
+from trusted.trusted import is_trusted, set_trusted, trusted_mode
+from point2d.point2d import Point2D
+from line2d.line2d import Line2D
+from arc2d.arc2d import Arc2D
+
+
+class TestTrusted(unittest.TestCase):
+    def tearDown(self):
+        set_trusted(False)
+
+    def test_default_is_safe(self):
+        self.assertFalse(is_trusted())
+        with self.assertRaises(TypeError):
+            Line2D("a", "b")
+        with self.assertRaises(TypeError):
+            Point2D(1, 2).distance_to((3, 4))
+
+    def test_context_manager_restores_mode(self):
+        with trusted_mode():
+            self.assertTrue(is_trusted())
+            with trusted_mode(False):
+                self.assertFalse(is_trusted())
+            self.assertTrue(is_trusted())
+        self.assertFalse(is_trusted())
+
+    def test_context_manager_restores_after_error(self):
+        with self.assertRaises(RuntimeError):
+            with trusted_mode():
+                raise RuntimeError("boom")
+        self.assertFalse(is_trusted())
+
+    def test_set_trusted_is_process_wide(self):
+        set_trusted(True)
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(is_trusted()))
+        thread.start()
+        thread.join()
+        self.assertEqual(seen, [True])
+
+    def test_overlapping_blocks_in_threads(self):
+        # A enters, B enters, A exits, B exits: neither may leave the other's mode behind.
+        a_entered, b_entered, a_exited = threading.Event(), threading.Event(), threading.Event()
+        seen = {}
+
+        def first():
+            with trusted_mode():
+                a_entered.set()
+                b_entered.wait()
+            seen["a"] = is_trusted()
+            a_exited.set()
+
+        def second():
+            a_entered.wait()
+            with trusted_mode(False):
+                b_entered.set()
+                a_exited.wait()
+                seen["b inside"] = is_trusted()
+            seen["b"] = is_trusted()
+
+        threads = [threading.Thread(target=first), threading.Thread(target=second)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(seen, {"a": False, "b inside": False, "b": False})
+        self.assertFalse(is_trusted())
+        with trusted_mode():
+            other = []
+            thread = threading.Thread(target=lambda: other.append(is_trusted()))
+            thread.start()
+            thread.join()
+            self.assertEqual(other, [False])
+
+    def test_set_trusted_keeps_overrides(self):
+        with trusted_mode(False):
+            set_trusted(True)
+            self.assertFalse(is_trusted())
+            with self.assertRaises(TypeError):
+                Line2D("a", "b")
+        self.assertTrue(is_trusted())
+        set_trusted(False)
+        with trusted_mode():
+            set_trusted(False)
+            self.assertTrue(is_trusted())
+
+    def test_armed_only_while_trust_is_possible(self):
+        self.assertFalse(trusted.armed)
+        with trusted_mode():
+            self.assertTrue(trusted.armed)
+            with trusted_mode(False):
+                self.assertTrue(trusted.armed)
+        self.assertFalse(trusted.armed)
+        with trusted_mode(False):
+            self.assertFalse(trusted.armed)
+        set_trusted(True)
+        self.assertTrue(trusted.armed)
+
+    def test_set_trusted_type_error(self):
+        with self.assertRaises(TypeError):
+            set_trusted(1)
+        with self.assertRaises(TypeError):
+            with trusted_mode("yes"):
+                pass
+
+    def test_validation_skipped(self):
+        with trusted_mode():
+            line = Line2D("a", "b")
+            self.assertEqual(line.sp, "a")
+
+    def test_conversions_kept(self):
+        with trusted_mode():
+            arc = Arc2D((0, 0), (1, 0), (0, 1))
+            self.assertIsInstance(arc.cp, Point2D)
+            self.assertAlmostEqual(arc.arc_length(), 3.141592653589793 / 2)
+            arc = Arc2D([0, 0], [2, 0], [0, 2])
+            self.assertAlmostEqual(arc.arc_length(), 3.141592653589793)
+
+    def test_value_checks_kept(self):
+        line = Line2D(Point2D(0, 0), Point2D(0, 0))
+        with trusted_mode():
+            with self.assertRaises(ValueError):
+                line.unit_vector()
+            with self.assertRaises(ValueError):
+                Line2D(Point2D(0, 0), Point2D(1, 0)).interpolate(2)
+
+    def test_results_match_safe_mode(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            coords = [rng.uniform(-50, 50) for _ in range(8)]
+            results = []
+            for trusted in (False, True):
+                with trusted_mode(trusted):
+                    p1, p2, p3, p4 = (Point2D(coords[k], coords[k + 1]) for k in range(0, 8, 2))
+                    line = Line2D(p1, p2)
+                    other = Line2D(p3, p4)
+                    status, point = line.intersection_with_line(other)
+                    results.append((
+                        p1.distance_to(p3), (p1 + p2).x, (p1 - p2).y, (p1 * 2.5).x,
+                        line.length(), line.angle(), line.distance_to_point(p3),
+                        line.point_at_length(1.5).x, line.interpolate(0.25).y,
+                        status, point.x, point.y, Line2D(p1, p2).set_length(3.0).ep.x,
+                        Arc2D(p1, p2, p3).arc_length()))
+            self.assertEqual(results[0], results[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
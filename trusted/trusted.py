@@ -0,0 +1,86 @@
+"""
+Process-wide trusted-input mode.
+
+The geometry classes validate every argument by default.  Pipelines that
+already guarantee their inputs are Point2D/Line2D/Arc2D instances with
+numeric coordinates can switch to trusted mode, in which the hot methods of
+point2d, line2d and arc2d skip their isinstance and None checks and call
+each other without validating again:
+
+    with trusted_mode():
+        total = sum(line.length() for line in lines)
+
+Invalid input in trusted mode is not detected: it fails later with an
+arbitrary exception or gives a wrong result.
+
+The process-wide default is a plain flag, changed by set_trusted.
+trusted_mode overrides it for the current thread or asyncio task only,
+through one context variable, so overlapping blocks in different threads
+cannot leave each other's mode behind and set_trusted does not end them.
+The geometry classes test armed first, which is False unless trusted mode
+is the default or a trusted block is running somewhere, so the default
+safe path never looks up the context variable.
+"""
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+_default = False
+_override = ContextVar("trusted", default=None)
+_lock = threading.Lock()
+_blocks = 0
+# Read by the geometry classes as `armed and is_trusted()` on every validated call.
+armed = False
+
+
+def _rearm() -> None:
+    global armed
+    armed = _default or _blocks > 0
+
+
+def is_trusted() -> bool:
+    """
+    Check if trusted mode is enabled in the current context.
+    :return: True if argument validation is skipped, False otherwise.
+    """
+    override = _override.get()
+    return _default if override is None else override
+
+
+def set_trusted(trusted: bool) -> None:
+    """
+    Enable or disable trusted mode for the whole process; trusted_mode blocks keep their own mode.
+    :param trusted: True to skip argument validation, False to restore it.
+    """
+    global _default
+    if not isinstance(trusted, bool):
+        raise TypeError("trusted must be a bool")
+    with _lock:
+        _default = trusted
+        _rearm()
+
+
+@contextmanager
+def trusted_mode(trusted: bool = True) -> Iterator[None]:
+    """
+    Enable (or disable) trusted mode inside a with block and restore the previous mode afterwards.
+    The mode applies to the current thread or asyncio task only.
+    :param trusted: Mode used inside the block.
+    """
+    global _blocks
+    if not isinstance(trusted, bool):
+        raise TypeError("trusted must be a bool")
+    if trusted:
+        with _lock:
+            _blocks += 1
+            _rearm()
+    token = _override.set(trusted)
+    try:
+        yield
+    finally:
+        _override.reset(token)
+        if trusted:
+            with _lock:
+                _blocks -= 1
+                _rearm()